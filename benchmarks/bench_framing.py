@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+bench_framing.py — Deframing throughput of HDLCCodec / KISSCodec on a synthetic capture.
+
+Usage: python benchmarks/bench_framing.py [--megabytes N] [--chunk BYTES] [--ports N]
+
+Builds a multi-megabyte stream of random packets (sizes 19..500, so FLAG/FEND/escape bytes
+occur naturally), framed with the codec's own encoder (KISS frames spread across --ports
+ports), then feeds it back in --chunk sized reads like a serial/TCP read loop. Reports MB/s
+of wire bytes and frames/s, and checks every frame came back intact.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from framing import HDLCCodec, KISSCodec  # noqa: E402
+
+
+def _packets(rng: random.Random, total: int) -> list[bytes]:
+    out, size = [], 0
+    while size < total:
+        p = rng.randbytes(rng.randint(19, 500))
+        out.append(p)
+        size += len(p)
+    return out
+
+
+def _run(label: str, stream: bytes, chunk: int, feed) -> list:
+    frames = []
+    t0 = time.perf_counter_ns()
+    for i in range(0, len(stream), chunk):
+        frames.extend(feed(stream[i : i + chunk]))
+    secs = (time.perf_counter_ns() - t0) / 1e9
+    print(f"{label:<8} {len(stream) / secs / 1e6:>9.2f} MB/s {len(frames) / secs:>12,.0f} frames/s ({len(stream) / 1e6:.1f} MB, chunk {chunk})")
+    return frames
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark HDLC/KISS deframing throughput.")
+    ap.add_argument("--megabytes", type=float, default=8.0, help="Approximate payload volume")
+    ap.add_argument("--chunk", type=int, default=4096, help="Read size fed to the codec")
+    ap.add_argument("--ports", type=int, default=4, help="KISS ports to spread frames across")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    packets = _packets(rng, int(args.megabytes * 1e6))
+    ports = [i % args.ports for i in range(len(packets))]
+
+    hdlc_stream = b"".join(HDLCCodec.encode(p) for p in packets)
+    frames = _run("HDLC", hdlc_stream, args.chunk, HDLCCodec().feed)
+    if frames != packets:
+        print("MISMATCH: HDLC frames differ from encoded packets", file=sys.stderr)
+        return 1
+
+    kiss_stream = b"".join(KISSCodec.encode(p, port) for p, port in zip(packets, ports))
+    frames = _run("KISS", kiss_stream, args.chunk, KISSCodec().feed)
+    if [bytes(f.data) for f in frames] != packets or [f.port for f in frames] != ports:
+        print("MISMATCH: KISS frames differ from encoded packets", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
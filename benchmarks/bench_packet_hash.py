@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+bench_packet_hash.py — Packet-hash dedup path: hashable_part + sha256 vs incremental packet_hash.
+
+Usage: python benchmarks/bench_packet_hash.py [--packets N] [--size BYTES]
+
+Reports ns per packet (perf_counter_ns over the whole stream) and transient allocation per
+packet (tracemalloc peak above baseline for a single call) for:
+- sha256(hashable_part(raw, header_type)).digest()      (concatenates b0 + raw[2:] / raw[18:])
+- packet_hash(raw, header_type)                          (masked flag byte + memoryview tail)
+and the 16-byte truncated variants.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+import generate_vectors as gv  # noqa: E402
+
+
+def _ns_per_packet(fn, packets: list[tuple[bytes, int]]) -> float:
+    t0 = time.perf_counter_ns()
+    for raw, header_type in packets:
+        fn(raw, header_type)
+    return (time.perf_counter_ns() - t0) / len(packets)
+
+
+def _peak_alloc_bytes(fn, raw: bytes, header_type: int) -> int:
+    fn(raw, header_type)  # warm caches outside the measurement
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = fn(raw, header_type)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak - base
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark packet hashing paths.")
+    ap.add_argument("--packets", type=int, default=200000, help="Packets per run")
+    ap.add_argument("--size", type=int, default=500, help="Packet size in bytes (MTU)")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    packets = []
+    for _ in range(args.packets):
+        raw = bytearray(rng.randbytes(args.size))
+        raw[0] &= 0x7F
+        packets.append((bytes(raw), 2 if raw[0] & 0x40 else 1))
+
+    cases = [
+        ("sha256(hashable_part)", lambda raw, ht: hashlib.sha256(gv.hashable_part(raw, ht)).digest()),
+        ("packet_hash", gv.packet_hash),
+        ("truncated(hashable_part)", lambda raw, ht: gv.truncated_hash_16_bytes(gv.hashable_part(raw, ht))),
+        ("truncated_packet_hash", gv.truncated_packet_hash),
+    ]
+    for (_, ref), (_, fast) in ((cases[0], cases[1]), (cases[2], cases[3])):
+        if any(ref(raw, ht) != fast(raw, ht) for raw, ht in packets[:1000]):
+            print("MISMATCH: incremental hash differs from hashable_part path", file=sys.stderr)
+            return 1
+
+    print(f"{'path':<26} {'ns/pkt':>10} {'alloc B/pkt':>12}")
+    for label, fn in cases:
+        ns = _ns_per_packet(fn, packets)
+        alloc = _peak_alloc_bytes(fn, *packets[0])
+        print(f"{label:<26} {ns:>10.0f} {alloc:>12}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+bench_ssot_load.py — SSOT load time per loader: ruamel round-trip, PyYAML pure/C, parse cache.
+
+Usage: python benchmarks/bench_ssot_load.py [--ssot PATH] [--repeat R]
+
+Each row is the best of R loads of the SSOT from disk (read + parse):
+- ruamel rt:        ruamel.yaml YAML() round-trip (only used for extract_refs --fill write-back)
+- ruamel safe:      ruamel.yaml YAML(typ="safe")
+- pyyaml SafeLoader: pure-Python PyYAML
+- pyyaml CSafeLoader: libyaml (skipped when PyYAML was built without it)
+- cache cold:       ssot_loader.load_yaml_bytes into an empty cache dir (parse + pickle write)
+- cache warm:       ssot_loader.load_yaml_bytes with the entry present (read + hash + unpickle)
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "tools"))
+
+import ssot_loader  # noqa: E402
+
+
+def _loaders(path: Path, cache_root: Path) -> list[tuple[str, Callable[[], Any] | None]]:
+    import yaml
+
+    def ruamel(typ: str | None) -> Callable[[], Any] | None:
+        try:
+            from ruamel.yaml import YAML
+        except ImportError:
+            return None
+
+        def run() -> Any:
+            y = YAML(typ=typ) if typ else YAML()
+            with open(path, encoding="utf-8") as f:
+                return y.load(f)
+
+        return run
+
+    def pyyaml(loader: type | None) -> Callable[[], Any] | None:
+        if loader is None:
+            return None
+        return lambda: yaml.load(path.read_bytes().decode("utf-8"), Loader=loader)
+
+    cold_runs = iter(range(1_000_000))
+
+    def cache_cold() -> Any:
+        return ssot_loader.load_yaml_bytes(path, cache_root / f"cold{next(cold_runs)}")
+
+    warm_dir = cache_root / "warm"
+    ssot_loader.load_yaml_bytes(path, warm_dir)
+    return [
+        ("ruamel rt", ruamel(None)),
+        ("ruamel safe", ruamel("safe")),
+        ("pyyaml SafeLoader", pyyaml(yaml.SafeLoader)),
+        ("pyyaml CSafeLoader", pyyaml(getattr(yaml, "CSafeLoader", None))),
+        ("cache cold", cache_cold),
+        ("cache warm", lambda: ssot_loader.load_yaml_bytes(path, warm_dir)),
+    ]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark SSOT loading: ruamel, PyYAML pure/C, parse cache cold/warm.")
+    ap.add_argument("--ssot", default=str(REPO_ROOT / "spec" / "reticulum-wire-format.ssot.yaml"))
+    ap.add_argument("--repeat", type=int, default=10, help="Loads per loader (best is reported)")
+    args = ap.parse_args()
+
+    path = Path(args.ssot)
+    cache_root = Path(tempfile.mkdtemp(prefix="ssot-load-bench-"))
+    try:
+        rows = _loaders(path, cache_root)
+        print(f"{path.name}: {path.stat().st_size:,} bytes, libyaml {'yes' if ssot_loader.safe_loader().__name__ == 'CSafeLoader' else 'no'}")
+        print(f"{'loader':<20} {'ms':>10} {'speedup':>9}")
+        base = None
+        for label, fn in rows:
+            if fn is None:
+                print(f"{label:<20} {'skipped':>10}")
+                continue
+            best = None
+            for _ in range(args.repeat):
+                t0 = time.perf_counter_ns()
+                fn()
+                elapsed = time.perf_counter_ns() - t0
+                best = elapsed if best is None else min(best, elapsed)
+            base = base or best
+            print(f"{label:<20} {best / 1e6:>10.2f} {base / best:>8.1f}x")
+    finally:
+        shutil.rmtree(cache_root, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+bench_vendor_index.py — Vendor reference work over the full SSOT: per-ref read_text vs VendorIndex.
+
+Usage: python benchmarks/bench_vendor_index.py [--vendor DIR] [--lines N] [--repeat R]
+
+For every reference in the SSOT, runs what the three tools do with it:
+- verify: slice lines [start, end] and check the symbol is in the slice (validate_ssot, extract_refs)
+- render: excerpt, ±10-line context and excerpt sha256 (compile_ssot)
+- fill:   deterministic window for the symbol (extract_refs --fill; AST parse for .py files)
+once with the previous per-reference read_text()/splitlines()/ast.parse() helpers and once
+through one shared VendorIndex. Reports wall time, file reads, bytes read and AST parses.
+
+Uses vendor/reticulum-source when present; otherwise a synthetic tree with every referenced
+file (N lines of Python, at least as long as the largest referenced line).
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "tools"))
+
+from symbol_index import fill_window  # noqa: E402
+from vendor_index import VendorIndex  # noqa: E402
+
+
+def _legacy_excerpt(content: str, start: int, end: int) -> list[str]:
+    """The excerpt as compile_ssot read it before VendorIndex: normalise newlines, split, slice (1-indexed inclusive)."""
+    lines = content.replace("\r\n", "\n").replace("\r", "\n").splitlines()
+    return lines[max(0, start - 1) : min(len(lines), end)]
+
+
+def _legacy_excerpt_sha256(content: str, start: int, end: int) -> str:
+    """sha256 of the normalised excerpt with line endings, as compile_ssot computed it before VendorIndex."""
+    lines = content.replace("\r\n", "\n").replace("\r", "\n").splitlines(keepends=True)
+    return hashlib.sha256("".join(lines[max(0, start - 1) : min(len(lines), end)]).encode("utf-8")).hexdigest()
+
+
+def _legacy_fill(content: str, relpath: str, symbol: str) -> tuple[int, int] | None:
+    """The --fill window as extract_refs found it before VendorIndex: one ast.parse and line scan per reference."""
+    lines = content.splitlines()
+    assignment = re.compile(r"^\s*" + re.escape(symbol) + r"\s*=")
+
+    def defs() -> list[tuple[int, int]]:
+        try:
+            tree = ast.parse(content)
+        except SyntaxError:
+            return []
+        kinds = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+        return [(n.lineno, n.end_lineno or n.lineno) for n in ast.walk(tree) if isinstance(n, kinds) and n.name == symbol]
+
+    return fill_window(
+        relpath,
+        len(lines),
+        defs,
+        lambda: [i + 1 for i, line in enumerate(lines) if assignment.match(line)],
+        lambda: [i + 1 for i, line in enumerate(lines) if symbol in line],
+    )[0]
+
+
+def _refs(ssot_path: Path) -> list[dict]:
+    import yaml
+
+    with open(ssot_path, encoding="utf-8") as f:
+        atoms = yaml.safe_load(f).get("atoms") or []
+    return [ref for a in atoms for ref in a.get("references") or [] if (ref.get("lines") or {}).get("end")]
+
+
+def _synthetic_vendor(root: Path, refs: list[dict], n_lines: int) -> None:
+    sizes: dict[str, int] = {}
+    for ref in refs:
+        sizes[ref["file"]] = max(sizes.get(ref["file"], n_lines), int(ref["lines"]["end"]) + 20)
+    for relpath, size in sizes.items():
+        path = root / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        body = []
+        for i in range(size):
+            body.append(f"def func_{i}(x):" if i % 10 == 0 else f"    value_{i} = x + {i}  # padding")
+        path.write_text("\n".join(body) + "\n", encoding="utf-8")
+
+
+class _Counters:
+    def __init__(self) -> None:
+        self.reads = 0
+        self.bytes = 0
+        self.parses = 0
+
+
+def _per_ref(vendor_root: Path, refs: list[dict], c: _Counters) -> None:
+    real_parse = ast.parse
+
+    def counting_parse(*args, **kwargs):
+        c.parses += 1
+        return real_parse(*args, **kwargs)
+
+    def read(relpath: str) -> str:
+        content = (vendor_root / relpath).read_text(encoding="utf-8", errors="replace")
+        c.reads += 1
+        c.bytes += len(content)
+        return content
+
+    ast.parse = counting_parse
+    try:
+        for ref in refs:
+            relpath, symbol = ref["file"], ref.get("symbol", "")
+            start, end = int(ref["lines"]["start"]), int(ref["lines"]["end"])
+            for _ in range(2):  # validate_ssot, then extract_refs
+                lines = read(relpath).replace("\r\n", "\n").splitlines()
+                _ = symbol in "\n".join(lines[start - 1 : end])
+            content = read(relpath)
+            all_lines = content.replace("\r\n", "\n").replace("\r", "\n").splitlines()
+            _legacy_excerpt(content, start, end)
+            _ = all_lines[max(1, start - 10) - 1 : min(len(all_lines), end + 10)]
+            _legacy_excerpt_sha256(content, start, end)
+            if symbol:
+                _legacy_fill(read(relpath), relpath, symbol)
+    finally:
+        ast.parse = real_parse
+
+
+def _indexed(vendor_root: Path, refs: list[dict], c: _Counters) -> None:
+    real_parse = ast.parse
+
+    def counting_parse(*args, **kwargs):
+        c.parses += 1
+        return real_parse(*args, **kwargs)
+
+    ast.parse = counting_parse
+    try:
+        with VendorIndex(vendor_root) as index:
+            for ref in refs:
+                relpath, symbol = ref["file"], ref.get("symbol", "")
+                start, end = int(ref["lines"]["start"]), int(ref["lines"]["end"])
+                vf = index.get(relpath)
+                for _ in range(2):
+                    _ = symbol in vf.text(start, end)
+                vf.lines(start, end)
+                vf.lines(max(1, start - 10), min(vf.n_lines, end + 10))
+                vf.excerpt_sha256(start, end)
+                if symbol:
+                    fill_window(relpath, vf.n_lines, lambda: vf.def_ranges(symbol), lambda: vf.assignment_lines(symbol), lambda: vf.substring_lines(symbol))
+            c.reads, c.bytes = index.files_loaded, index.bytes_loaded
+    finally:
+        ast.parse = real_parse
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark per-reference vendor reads vs VendorIndex.")
+    ap.add_argument("--ssot", default=str(REPO_ROOT / "spec" / "reticulum-wire-format.ssot.yaml"))
+    ap.add_argument("--vendor", default=str(REPO_ROOT / "vendor" / "reticulum-source"))
+    ap.add_argument("--lines", type=int, default=3000, help="Lines per synthetic vendor file")
+    ap.add_argument("--repeat", type=int, default=5, help="Runs per path (best is reported)")
+    args = ap.parse_args()
+
+    refs = _refs(Path(args.ssot))
+    vendor_root = Path(args.vendor)
+    tmp = None
+    if not vendor_root.is_dir():
+        tmp = tempfile.TemporaryDirectory(prefix="vendor-bench-")
+        vendor_root = Path(tmp.name)
+        _synthetic_vendor(vendor_root, refs, args.lines)
+        print(f"vendor checkout not found; using synthetic tree ({args.lines} lines per file)")
+    print(f"{len(refs)} references in {len({r['file'] for r in refs})} files")
+    print(f"{'path':<12} {'ms':>10} {'reads':>8} {'bytes read':>12} {'ast parses':>11}")
+    try:
+        for label, fn in (("per-ref", _per_ref), ("VendorIndex", _indexed)):
+            best = None
+            for _ in range(args.repeat):
+                c = _Counters()
+                t0 = time.perf_counter_ns()
+                fn(vendor_root, refs, c)
+                elapsed = time.perf_counter_ns() - t0
+                best = elapsed if best is None else min(best, elapsed)
+            print(f"{label:<12} {best / 1e6:>10.2f} {c.reads:>8} {c.bytes:>12,} {c.parses:>11}")
+    finally:
+        if tmp is not None:
+            tmp.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+bench_verify_jobs.py — Reference verification scaling with --jobs (extract_refs.verify_refs).
+
+Usage: python benchmarks/bench_verify_jobs.py [--files F] [--lines N] [--refs R] [--jobs 1,2,4] [--repeat R]
+
+Builds a synthetic vendor tree (F Python files of N lines) and R references spread over it,
+a tree the size of the whole RNS package rather than the current SSOT, then times
+verify_refs with a cold VendorIndex for each job count (default: powers of two up to the
+CPU count). Each row is the best of R runs: wall time, refs/s and speedup over jobs=1.
+Results are checked to be identical, in order, for every job count.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "tools"))
+
+import extract_refs  # noqa: E402
+from vendor_index import VendorIndex  # noqa: E402
+
+
+def _synthetic(root: Path, n_files: int, n_lines: int, n_refs: int) -> list[dict]:
+    for f in range(n_files):
+        path = root / "RNS" / f"Module{f}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        body = [f"def func_{f}_{i}(x):" if i % 10 == 0 else f"    value_{f}_{i} = x + {i}  # padding" for i in range(n_lines)]
+        path.write_text("\n".join(body) + "\n", encoding="utf-8")
+    rng = random.Random(0)
+    refs = []
+    for _ in range(n_refs):
+        f, i = rng.randrange(n_files), rng.randrange(1, n_lines, 10)
+        refs.append({"file": f"RNS/Module{f}.py", "symbol": f"func_{f}_{i - 1}", "lines": {"start": i, "end": i + 9}})
+    return refs
+
+
+def _job_counts(spec: str | None) -> list[int]:
+    if spec:
+        return [int(j) for j in spec.split(",")]
+    cpus, counts = os.cpu_count() or 1, [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    return counts if counts[-1] == cpus else counts + [cpus]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark parallel reference verification by job count.")
+    ap.add_argument("--files", type=int, default=300, help="Synthetic vendor files")
+    ap.add_argument("--lines", type=int, default=4000, help="Lines per file")
+    ap.add_argument("--refs", type=int, default=6000, help="References")
+    ap.add_argument("--jobs", help="Comma-separated job counts (default: 1, 2, 4, ... up to the CPU count)")
+    ap.add_argument("--repeat", type=int, default=3, help="Runs per job count (best is reported)")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="verify-bench-") as tmp:
+        root = Path(tmp)
+        refs = _synthetic(root, args.files, args.lines, args.refs)
+        print(f"{len(refs)} references in {args.files} files of {args.lines} lines; {os.cpu_count()} CPUs")
+        print(f"{'jobs':>5} {'ms':>10} {'refs/s':>10} {'speedup':>8}")
+        expected = base = None
+        for jobs in _job_counts(args.jobs):
+            best = None
+            for _ in range(args.repeat):
+                t0 = time.perf_counter_ns()
+                results = extract_refs.verify_refs(root, refs, "bench", VendorIndex(root), jobs=jobs)
+                elapsed = time.perf_counter_ns() - t0
+                best = elapsed if best is None else min(best, elapsed)
+            if expected is None:
+                expected, base = results, best
+            elif results != expected:
+                print(f"jobs={jobs}: results differ from jobs=1", file=sys.stderr)
+                return 1
+            print(f"{jobs:>5} {best / 1e6:>10.1f} {len(refs) / (best / 1e9):>10,.0f} {base / best:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+suite.py — Benchmark suite for the reference primitives and tools, with a stored baseline.
+
+Every case is timed with time.perf_counter_ns: the loop count is calibrated so one repeat
+takes at least --min-time seconds, the repeat is run --repeat times, and the fastest repeat
+gives ns per operation. Tool cases run the script end-to-end in a subprocess (outputs go to
+a temporary directory, result and render caches are disabled) and are recorded as skipped when the tool exits non-zero, e.g.
+without a vendor checkout.
+
+Usage:
+    python benchmarks/suite.py                              # run and print
+    python benchmarks/suite.py --save benchmarks/baseline.json
+    python benchmarks/suite.py --compare benchmarks/baseline.json [--threshold 0.25]
+    python benchmarks/suite.py --only ifac --list
+
+--compare exits 1 when any case is slower than baseline * (1 + threshold).
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import json
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TOOLS_DIR = REPO_ROOT / "tools"
+VECTORS_DIR = REPO_ROOT / "tests" / "vectors"
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+sys.path.insert(0, str(TOOLS_DIR))
+
+import generate_vectors as gv  # noqa: E402
+from atom_registry import AtomRegistry  # noqa: E402
+from framing import HDLCCodec, KISSCodec  # noqa: E402
+
+
+class SkipCase(Exception):
+    """Raised by a case setup when the case cannot run here (reason in the message)."""
+
+
+# -----------------------------
+# Cases: name -> setup() returning a zero-argument callable to time
+# -----------------------------
+
+CASES: dict[str, Callable[[], Callable[[], Any]]] = {}
+
+
+def case(name: str) -> Callable:
+    def register(setup: Callable[[], Callable[[], Any]]) -> Callable[[], Callable[[], Any]]:
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+def _packet(size: int = 500, seed: int = 0) -> bytes:
+    raw = bytearray(random.Random(seed).randbytes(size))
+    raw[0] &= 0x3F  # canonical HEADER_1
+    return bytes(raw)
+
+
+@case("hashable_part")
+def _hashable_part():
+    raw = _packet()
+    return lambda: gv.hashable_part(raw, 1)
+
+
+@case("packet_hash")
+def _packet_hash():
+    raw = _packet()
+    return lambda: gv.packet_hash(raw, 1)
+
+
+@case("truncated_hash_16_bytes")
+def _truncated_hash():
+    data = _packet()
+    return lambda: gv.truncated_hash_16_bytes(data)
+
+
+@case("encode_signalling_bytes")
+def _encode_signalling():
+    return lambda: gv.encode_signalling_bytes(500, 1)
+
+
+@case("decode_signalling_bytes")
+def _decode_signalling():
+    raw = gv.encode_signalling_bytes(500, 1)
+    return lambda: gv.decode_signalling_bytes(raw)
+
+
+@case("hkdf_sha256")
+def _hkdf():
+    ikm, salt = b"\x01" * 16, b"\x11" * 32
+    return lambda: gv.hkdf_sha256(ikm, salt, b"", 516)
+
+
+@case("ifac_mask_transform")
+def _ifac_mask():
+    raw, ifac, key = _packet(), b"\xa5" * 16, b"\x11" * 32
+    return lambda: gv.ifac_mask_transform(raw, ifac, key)
+
+
+@case("ifac_unmask_transform")
+def _ifac_unmask():
+    ifac, key = b"\xa5" * 16, b"\x11" * 32
+    wire = gv.ifac_mask_transform(_packet(), ifac, key)
+    return lambda: gv.ifac_unmask_transform(wire, len(ifac), key)
+
+
+@case("ifac_mask_batch_1k")
+def _ifac_mask_batch():
+    ifac, key = b"\xa5" * 16, b"\x11" * 32
+    items = [(_packet(seed=i), ifac, key) for i in range(1000)]
+    return lambda: gv.ifac_mask_batch(items)
+
+
+@case("ifac_unmask_batch_1k")
+def _ifac_unmask_batch():
+    ifac, key = b"\xa5" * 16, b"\x11" * 32
+    items = [(w, len(ifac), key) for w in gv.ifac_mask_batch([(_packet(seed=i), ifac, key) for i in range(1000)])]
+    return lambda: gv.ifac_unmask_batch(items)
+
+
+@case("link_id_from_linkrequest")
+def _link_id():
+    try:
+        atoms = AtomRegistry.from_ssot(gv.load_yaml(REPO_ROOT / "spec" / "reticulum-wire-format.ssot.yaml"))
+    except SystemExit as e:
+        raise SkipCase(str(e)) from e
+    ecpubsize = atoms.constant_int("RNS.LNK.CONST.ECPUBSIZE")
+    part = b"\x00" * (ecpubsize + 3)  # hashable part with 3 signalling bytes: stripped to ECPUBSIZE
+    return lambda: gv.link_id_from_hashable_part(part, len(part), ecpubsize)
+
+
+@case("hdlc_deframe_64k")
+def _hdlc_deframe():
+    stream = b"".join(HDLCCodec.encode(_packet(seed=i)) for i in range(128))
+    return lambda: HDLCCodec().feed(stream)
+
+
+@case("kiss_deframe_64k")
+def _kiss_deframe():
+    stream = b"".join(KISSCodec.encode(_packet(seed=i), i % 4) for i in range(128))
+    return lambda: KISSCodec().feed(stream)
+
+
+@case("load_vectors_yaml")
+def _load_vectors():
+    try:
+        import yaml
+    except ImportError as e:
+        raise SkipCase("PyYAML not installed") from e
+    paths = sorted(VECTORS_DIR.glob("*.yaml"))
+
+    def run() -> list:
+        out = []
+        for p in paths:
+            with open(p, encoding="utf-8") as f:
+                out.append(yaml.safe_load(f))
+        return out
+
+    return run
+
+
+@case("load_vectors_rvec")
+def _load_vectors_rvec():
+    import vector_corpus
+
+    paths = sorted(VECTORS_DIR.glob(f"*{vector_corpus.SUFFIX}"))
+    if not paths:
+        raise SkipCase("no .rvec vector files; run tools/generate_vectors.py")
+    return lambda: [vector_corpus.read(p) for p in paths]
+
+
+@case("spectral_native_lint")
+def _spectral_native():
+    try:
+        import yaml
+    except ImportError as e:
+        raise SkipCase("PyYAML not installed") from e
+    import spectral_rules
+
+    with open(REPO_ROOT / "spec" / "reticulum-wire-format.ssot.yaml", encoding="utf-8") as f:
+        doc = yaml.safe_load(f)
+    rules = spectral_rules.load_ruleset(REPO_ROOT / "spec" / "rules" / "spectral.ssot.yaml")
+    return lambda: spectral_rules.lint(doc, rules)
+
+
+@case("ssot_load_csafe")
+def _ssot_load_csafe():
+    import ssot_loader
+
+    try:
+        ssot_loader.safe_loader()
+    except ImportError as e:
+        raise SkipCase("PyYAML not installed") from e
+    path = REPO_ROOT / "spec" / "reticulum-wire-format.ssot.yaml"
+    return lambda: ssot_loader.load_yaml_bytes(path, cache_dir=None)
+
+
+@case("ssot_load_cached")
+def _ssot_load_cached():
+    import ssot_loader
+
+    try:
+        ssot_loader.safe_loader()
+    except ImportError as e:
+        raise SkipCase("PyYAML not installed") from e
+    path = REPO_ROOT / "spec" / "reticulum-wire-format.ssot.yaml"
+    cache_dir = Path(tempfile.mkdtemp(prefix="ssot-load-bench-"))
+    atexit.register(shutil.rmtree, cache_dir, True)
+    ssot_loader.load_yaml_bytes(path, cache_dir)
+    return lambda: ssot_loader.load_yaml_bytes(path, cache_dir)
+
+
+def _tool_case(script: str, *args: str) -> Callable[[], Callable[[], Any]]:
+    def setup() -> Callable[[], Any]:
+        tmp = tempfile.mkdtemp(prefix="ssot-bench-")
+        atexit.register(shutil.rmtree, tmp, True)
+        argv = [sys.executable, str(TOOLS_DIR / script), *(a.format(tmp=tmp) for a in args)]
+        first = subprocess.run(argv, cwd=str(REPO_ROOT), capture_output=True, text=True)
+        if first.returncode != 0:
+            reason = (first.stderr.strip().splitlines() or [f"exit {first.returncode}"])[0]
+            raise SkipCase(f"{script} exited {first.returncode}: {reason}")
+        return lambda: subprocess.run(argv, cwd=str(REPO_ROOT), capture_output=True, check=True)
+
+    return setup
+
+
+CASES["tool:validate_ssot"] = _tool_case("validate_ssot.py", "--no-cache")
+CASES["tool:compile_ssot"] = _tool_case("compile_ssot.py", "--out-dir", "{tmp}", "--no-cache")
+CASES["tool:generate_vectors"] = _tool_case("generate_vectors.py", "--vectors-dir", "{tmp}")
+
+
+# -----------------------------
+# Timing + baseline comparison
+# -----------------------------
+
+
+def measure(fn: Callable[[], Any], min_time: float, repeat: int) -> dict[str, Any]:
+    """Calibrate loops so one repeat takes >= min_time seconds; return best ns/op over repeats."""
+    loops = 1
+    while True:
+        t0 = time.perf_counter_ns()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter_ns() - t0
+        if elapsed >= min_time * 1e9 or loops >= 1 << 24:
+            break
+        loops *= 10 if elapsed < min_time * 1e8 else 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter_ns()
+        for _ in range(loops):
+            fn()
+        best = min(best, time.perf_counter_ns() - t0)
+    return {"ns_per_op": round(best / loops, 1), "loops": loops}
+
+
+def run_cases(names: list[str], min_time: float, repeat: int) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    for name in names:
+        try:
+            fn = CASES[name]()
+        except SkipCase as e:
+            results[name] = {"skipped": str(e)}
+            print(f"{name:<28} {'skipped':>14}  {e}")
+            continue
+        results[name] = measure(fn, min_time, repeat)
+        print(f"{name:<28} {results[name]['ns_per_op']:>14,.1f} ns/op  ({results[name]['loops']} loops)")
+    return results
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Regressions: cases measured in both runs whose ns/op exceeds baseline * (1 + threshold)."""
+    regressions = []
+    base_results = baseline.get("results") or {}
+    for name, cur in results.items():
+        base = base_results.get(name) or {}
+        if "ns_per_op" not in cur or "ns_per_op" not in base:
+            continue
+        ratio = cur["ns_per_op"] / base["ns_per_op"] if base["ns_per_op"] else 1.0
+        status = "REGRESSION" if ratio > 1 + threshold else "ok"
+        print(f"{name:<28} {base['ns_per_op']:>14,.1f} -> {cur['ns_per_op']:>14,.1f} ns/op  x{ratio:.2f}  {status}")
+        if status != "ok":
+            regressions.append(f"{name}: {base['ns_per_op']} -> {cur['ns_per_op']} ns/op (x{ratio:.2f}, threshold x{1 + threshold:.2f})")
+    return regressions
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark reference primitives and tools.")
+    ap.add_argument("--only", action="append", default=[], help="Run cases whose name contains this substring (repeatable)")
+    ap.add_argument("--list", action="store_true", help="List case names and exit")
+    ap.add_argument("--save", metavar="PATH", help="Write results as a JSON baseline")
+    ap.add_argument("--compare", metavar="PATH", nargs="?", const=str(DEFAULT_BASELINE), help="Compare against a baseline; exit 1 on regression")
+    ap.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown fraction for --compare (default 0.25)")
+    ap.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per repeat")
+    ap.add_argument("--repeat", type=int, default=5, help="Repeats per case (best is kept)")
+    args = ap.parse_args()
+
+    names = [n for n in CASES if not args.only or any(s in n for s in args.only)]
+    if args.list:
+        print("\n".join(names))
+        return 0
+    if not names:
+        print("No benchmark cases match --only", file=sys.stderr)
+        return 1
+
+    results = run_cases(names, args.min_time, args.repeat)
+    doc = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+            "min_time": args.min_time,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.save:
+        Path(args.save).write_text(json.dumps(doc, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    if args.compare:
+        path = Path(args.compare)
+        if not path.is_file():
+            print(f"Baseline not found: {path}", file=sys.stderr)
+            return 1
+        baseline = json.loads(path.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold)
+        for r in regressions:
+            print(f"regression: {r}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
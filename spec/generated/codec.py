@@ -0,0 +1,332 @@
+"""
+codec.py — Struct codecs for SSOT layout atoms (generated by tools/compile_ssot.py; do not edit).
+
+Fixed fields in layout order: 1- and 2-byte fields are big-endian unsigned ints, longer fields bytes.
+A trailing length-0 field is the variable-length tail: unpack_from returns it as a memoryview of
+the remaining bytes; pack_into writes it after the fixed part. pack_into returns bytes written.
+"""
+
+import struct
+
+
+HEADER_1 = struct.Struct(">BB16sB")
+HEADER_1_FIELDS = ('flags', 'hops', 'destination_hash', 'context')
+
+
+def header_1_unpack_from(buf, offset=0):
+    """RNS.PKT.LAYOUT.HEADER_1 -> (flags, hops, destination_hash, context)."""
+    return HEADER_1.unpack_from(buf, offset)
+
+
+def header_1_pack_into(buf, offset, flags, hops, destination_hash, context):
+    """Write RNS.PKT.LAYOUT.HEADER_1 into buf at offset."""
+    HEADER_1.pack_into(buf, offset, flags, hops, destination_hash, context)
+    return HEADER_1.size
+
+
+HEADER_2 = struct.Struct(">BB16s16sB")
+HEADER_2_FIELDS = ('flags', 'hops', 'transport_id', 'destination_hash', 'context')
+
+
+def header_2_unpack_from(buf, offset=0):
+    """RNS.PKT.LAYOUT.HEADER_2 -> (flags, hops, transport_id, destination_hash, context)."""
+    return HEADER_2.unpack_from(buf, offset)
+
+
+def header_2_pack_into(buf, offset, flags, hops, transport_id, destination_hash, context):
+    """Write RNS.PKT.LAYOUT.HEADER_2 into buf at offset."""
+    HEADER_2.pack_into(buf, offset, flags, hops, transport_id, destination_hash, context)
+    return HEADER_2.size
+
+
+PROOF_EXPLICIT = struct.Struct(">32s64s")
+PROOF_EXPLICIT_FIELDS = ('packet_hash', 'signature')
+
+
+def proof_explicit_unpack_from(buf, offset=0):
+    """RNS.PKT.LAYOUT.PROOF_EXPLICIT -> (packet_hash, signature)."""
+    return PROOF_EXPLICIT.unpack_from(buf, offset)
+
+
+def proof_explicit_pack_into(buf, offset, packet_hash, signature):
+    """Write RNS.PKT.LAYOUT.PROOF_EXPLICIT into buf at offset."""
+    PROOF_EXPLICIT.pack_into(buf, offset, packet_hash, signature)
+    return PROOF_EXPLICIT.size
+
+
+PROOF_IMPLICIT = struct.Struct(">64s")
+PROOF_IMPLICIT_FIELDS = ('signature',)
+
+
+def proof_implicit_unpack_from(buf, offset=0):
+    """RNS.PKT.LAYOUT.PROOF_IMPLICIT -> (signature)."""
+    return PROOF_IMPLICIT.unpack_from(buf, offset)
+
+
+def proof_implicit_pack_into(buf, offset, signature):
+    """Write RNS.PKT.LAYOUT.PROOF_IMPLICIT into buf at offset."""
+    PROOF_IMPLICIT.pack_into(buf, offset, signature)
+    return PROOF_IMPLICIT.size
+
+
+LINKREQUEST_PAYLOAD = struct.Struct(">32s32s3s")
+LINKREQUEST_PAYLOAD_FIELDS = ('initiator_x25519', 'initiator_ed25519', 'signalling')
+
+
+def linkrequest_payload_unpack_from(buf, offset=0):
+    """RNS.LNK.LAYOUT.LINKREQUEST_PAYLOAD -> (initiator_x25519, initiator_ed25519, signalling)."""
+    return LINKREQUEST_PAYLOAD.unpack_from(buf, offset)
+
+
+def linkrequest_payload_pack_into(buf, offset, initiator_x25519, initiator_ed25519, signalling):
+    """Write RNS.LNK.LAYOUT.LINKREQUEST_PAYLOAD into buf at offset."""
+    LINKREQUEST_PAYLOAD.pack_into(buf, offset, initiator_x25519, initiator_ed25519, signalling)
+    return LINKREQUEST_PAYLOAD.size
+
+
+LINKPROOF_PAYLOAD = struct.Struct(">64s32s3s")
+LINKPROOF_PAYLOAD_FIELDS = ('signature', 'responder_x25519', 'signalling')
+
+
+def linkproof_payload_unpack_from(buf, offset=0):
+    """RNS.LNK.LAYOUT.LINKPROOF_PAYLOAD -> (signature, responder_x25519, signalling)."""
+    return LINKPROOF_PAYLOAD.unpack_from(buf, offset)
+
+
+def linkproof_payload_pack_into(buf, offset, signature, responder_x25519, signalling):
+    """Write RNS.LNK.LAYOUT.LINKPROOF_PAYLOAD into buf at offset."""
+    LINKPROOF_PAYLOAD.pack_into(buf, offset, signature, responder_x25519, signalling)
+    return LINKPROOF_PAYLOAD.size
+
+
+TOKEN = struct.Struct(">16s")
+TOKEN_FIELDS = ('iv', 'ciphertext')
+
+
+def token_unpack_from(buf, offset=0):
+    """RNS.PKT.LAYOUT.TOKEN -> (iv, ciphertext)."""
+    return TOKEN.unpack_from(buf, offset) + (memoryview(buf)[offset + TOKEN.size :],)
+
+
+def token_pack_into(buf, offset, iv, ciphertext):
+    """Write RNS.PKT.LAYOUT.TOKEN into buf at offset."""
+    TOKEN.pack_into(buf, offset, iv)
+    end = offset + TOKEN.size + len(ciphertext)
+    buf[offset + TOKEN.size : end] = ciphertext
+    return end - offset
+
+
+ANNOUNCE_WITH_RATCHET = struct.Struct(">64s10s10s32s64s")
+ANNOUNCE_WITH_RATCHET_FIELDS = ('public_key', 'name_hash', 'random_hash', 'ratchet_key', 'signature', 'app_data')
+
+
+def announce_with_ratchet_unpack_from(buf, offset=0):
+    """RNS.PKT.LAYOUT.ANNOUNCE_WITH_RATCHET -> (public_key, name_hash, random_hash, ratchet_key, signature, app_data)."""
+    return ANNOUNCE_WITH_RATCHET.unpack_from(buf, offset) + (memoryview(buf)[offset + ANNOUNCE_WITH_RATCHET.size :],)
+
+
+def announce_with_ratchet_pack_into(buf, offset, public_key, name_hash, random_hash, ratchet_key, signature, app_data):
+    """Write RNS.PKT.LAYOUT.ANNOUNCE_WITH_RATCHET into buf at offset."""
+    ANNOUNCE_WITH_RATCHET.pack_into(buf, offset, public_key, name_hash, random_hash, ratchet_key, signature)
+    end = offset + ANNOUNCE_WITH_RATCHET.size + len(app_data)
+    buf[offset + ANNOUNCE_WITH_RATCHET.size : end] = app_data
+    return end - offset
+
+
+ANNOUNCE_WITHOUT_RATCHET = struct.Struct(">64s10s10s64s")
+ANNOUNCE_WITHOUT_RATCHET_FIELDS = ('public_key', 'name_hash', 'random_hash', 'signature', 'app_data')
+
+
+def announce_without_ratchet_unpack_from(buf, offset=0):
+    """RNS.PKT.LAYOUT.ANNOUNCE_WITHOUT_RATCHET -> (public_key, name_hash, random_hash, signature, app_data)."""
+    return ANNOUNCE_WITHOUT_RATCHET.unpack_from(buf, offset) + (memoryview(buf)[offset + ANNOUNCE_WITHOUT_RATCHET.size :],)
+
+
+def announce_without_ratchet_pack_into(buf, offset, public_key, name_hash, random_hash, signature, app_data):
+    """Write RNS.PKT.LAYOUT.ANNOUNCE_WITHOUT_RATCHET into buf at offset."""
+    ANNOUNCE_WITHOUT_RATCHET.pack_into(buf, offset, public_key, name_hash, random_hash, signature)
+    end = offset + ANNOUNCE_WITHOUT_RATCHET.size + len(app_data)
+    buf[offset + ANNOUNCE_WITHOUT_RATCHET.size : end] = app_data
+    return end - offset
+
+
+LINKCLOSE_PAYLOAD = struct.Struct(">16s")
+LINKCLOSE_PAYLOAD_FIELDS = ('link_id',)
+
+
+def linkclose_payload_unpack_from(buf, offset=0):
+    """RNS.LNK.LAYOUT.LINKCLOSE_PAYLOAD -> (link_id)."""
+    return LINKCLOSE_PAYLOAD.unpack_from(buf, offset)
+
+
+def linkclose_payload_pack_into(buf, offset, link_id):
+    """Write RNS.LNK.LAYOUT.LINKCLOSE_PAYLOAD into buf at offset."""
+    LINKCLOSE_PAYLOAD.pack_into(buf, offset, link_id)
+    return LINKCLOSE_PAYLOAD.size
+
+
+LINKIDENTIFY_PAYLOAD = struct.Struct(">64s64s")
+LINKIDENTIFY_PAYLOAD_FIELDS = ('public_key', 'signature')
+
+
+def linkidentify_payload_unpack_from(buf, offset=0):
+    """RNS.LNK.LAYOUT.LINKIDENTIFY_PAYLOAD -> (public_key, signature)."""
+    return LINKIDENTIFY_PAYLOAD.unpack_from(buf, offset)
+
+
+def linkidentify_payload_pack_into(buf, offset, public_key, signature):
+    """Write RNS.LNK.LAYOUT.LINKIDENTIFY_PAYLOAD into buf at offset."""
+    LINKIDENTIFY_PAYLOAD.pack_into(buf, offset, public_key, signature)
+    return LINKIDENTIFY_PAYLOAD.size
+
+
+CHANNEL_ENVELOPE = struct.Struct(">HHH")
+CHANNEL_ENVELOPE_FIELDS = ('msgtype', 'sequence', 'length', 'data')
+
+
+def channel_envelope_unpack_from(buf, offset=0):
+    """RNS.CHN.LAYOUT.CHANNEL_ENVELOPE -> (msgtype, sequence, length, data)."""
+    return CHANNEL_ENVELOPE.unpack_from(buf, offset) + (memoryview(buf)[offset + CHANNEL_ENVELOPE.size :],)
+
+
+def channel_envelope_pack_into(buf, offset, msgtype, sequence, length, data):
+    """Write RNS.CHN.LAYOUT.CHANNEL_ENVELOPE into buf at offset."""
+    CHANNEL_ENVELOPE.pack_into(buf, offset, msgtype, sequence, length)
+    end = offset + CHANNEL_ENVELOPE.size + len(data)
+    buf[offset + CHANNEL_ENVELOPE.size : end] = data
+    return end - offset
+
+
+PATH_REQUEST_CLIENT = struct.Struct(">16s16s")
+PATH_REQUEST_CLIENT_FIELDS = ('destination_hash', 'request_tag')
+
+
+def path_request_client_unpack_from(buf, offset=0):
+    """RNS.TRN.LAYOUT.PATH_REQUEST_CLIENT -> (destination_hash, request_tag)."""
+    return PATH_REQUEST_CLIENT.unpack_from(buf, offset)
+
+
+def path_request_client_pack_into(buf, offset, destination_hash, request_tag):
+    """Write RNS.TRN.LAYOUT.PATH_REQUEST_CLIENT into buf at offset."""
+    PATH_REQUEST_CLIENT.pack_into(buf, offset, destination_hash, request_tag)
+    return PATH_REQUEST_CLIENT.size
+
+
+PATH_REQUEST_TRANSPORT = struct.Struct(">16s16s16s")
+PATH_REQUEST_TRANSPORT_FIELDS = ('destination_hash', 'requesting_transport_id', 'request_tag')
+
+
+def path_request_transport_unpack_from(buf, offset=0):
+    """RNS.TRN.LAYOUT.PATH_REQUEST_TRANSPORT -> (destination_hash, requesting_transport_id, request_tag)."""
+    return PATH_REQUEST_TRANSPORT.unpack_from(buf, offset)
+
+
+def path_request_transport_pack_into(buf, offset, destination_hash, requesting_transport_id, request_tag):
+    """Write RNS.TRN.LAYOUT.PATH_REQUEST_TRANSPORT into buf at offset."""
+    PATH_REQUEST_TRANSPORT.pack_into(buf, offset, destination_hash, requesting_transport_id, request_tag)
+    return PATH_REQUEST_TRANSPORT.size
+
+
+TUNNEL_SYNTHESIS = struct.Struct(">64s32s16s64s")
+TUNNEL_SYNTHESIS_FIELDS = ('public_key', 'interface_hash', 'random_hash', 'signature')
+
+
+def tunnel_synthesis_unpack_from(buf, offset=0):
+    """RNS.TRN.LAYOUT.TUNNEL_SYNTHESIS -> (public_key, interface_hash, random_hash, signature)."""
+    return TUNNEL_SYNTHESIS.unpack_from(buf, offset)
+
+
+def tunnel_synthesis_pack_into(buf, offset, public_key, interface_hash, random_hash, signature):
+    """Write RNS.TRN.LAYOUT.TUNNEL_SYNTHESIS into buf at offset."""
+    TUNNEL_SYNTHESIS.pack_into(buf, offset, public_key, interface_hash, random_hash, signature)
+    return TUNNEL_SYNTHESIS.size
+
+
+RESOURCE_ADV = struct.Struct(">")
+RESOURCE_ADV_FIELDS = ('payload',)
+
+
+def resource_adv_unpack_from(buf, offset=0):
+    """RNS.RES.LAYOUT.RESOURCE_ADV -> (payload)."""
+    return RESOURCE_ADV.unpack_from(buf, offset) + (memoryview(buf)[offset + RESOURCE_ADV.size :],)
+
+
+def resource_adv_pack_into(buf, offset, payload):
+    """Write RNS.RES.LAYOUT.RESOURCE_ADV into buf at offset."""
+    RESOURCE_ADV.pack_into(buf, offset)
+    end = offset + RESOURCE_ADV.size + len(payload)
+    buf[offset + RESOURCE_ADV.size : end] = payload
+    return end - offset
+
+
+RESOURCE_REQ = struct.Struct(">B4s32s")
+RESOURCE_REQ_FIELDS = ('hashmap_exhausted', 'last_map_hash', 'resource_hash', 'requested_hashes')
+
+
+def resource_req_unpack_from(buf, offset=0):
+    """RNS.RES.LAYOUT.RESOURCE_REQ -> (hashmap_exhausted, last_map_hash, resource_hash, requested_hashes)."""
+    return RESOURCE_REQ.unpack_from(buf, offset) + (memoryview(buf)[offset + RESOURCE_REQ.size :],)
+
+
+def resource_req_pack_into(buf, offset, hashmap_exhausted, last_map_hash, resource_hash, requested_hashes):
+    """Write RNS.RES.LAYOUT.RESOURCE_REQ into buf at offset."""
+    RESOURCE_REQ.pack_into(buf, offset, hashmap_exhausted, last_map_hash, resource_hash)
+    end = offset + RESOURCE_REQ.size + len(requested_hashes)
+    buf[offset + RESOURCE_REQ.size : end] = requested_hashes
+    return end - offset
+
+
+RESOURCE_HMU = struct.Struct(">32s")
+RESOURCE_HMU_FIELDS = ('resource_hash', 'packed_hashmap')
+
+
+def resource_hmu_unpack_from(buf, offset=0):
+    """RNS.RES.LAYOUT.RESOURCE_HMU -> (resource_hash, packed_hashmap)."""
+    return RESOURCE_HMU.unpack_from(buf, offset) + (memoryview(buf)[offset + RESOURCE_HMU.size :],)
+
+
+def resource_hmu_pack_into(buf, offset, resource_hash, packed_hashmap):
+    """Write RNS.RES.LAYOUT.RESOURCE_HMU into buf at offset."""
+    RESOURCE_HMU.pack_into(buf, offset, resource_hash)
+    end = offset + RESOURCE_HMU.size + len(packed_hashmap)
+    buf[offset + RESOURCE_HMU.size : end] = packed_hashmap
+    return end - offset
+
+
+RESOURCE_PRF = struct.Struct(">32s32s")
+RESOURCE_PRF_FIELDS = ('resource_hash', 'proof')
+
+
+def resource_prf_unpack_from(buf, offset=0):
+    """RNS.RES.LAYOUT.RESOURCE_PRF -> (resource_hash, proof)."""
+    return RESOURCE_PRF.unpack_from(buf, offset)
+
+
+def resource_prf_pack_into(buf, offset, resource_hash, proof):
+    """Write RNS.RES.LAYOUT.RESOURCE_PRF into buf at offset."""
+    RESOURCE_PRF.pack_into(buf, offset, resource_hash, proof)
+    return RESOURCE_PRF.size
+
+
+# atom id -> (Struct, field names, unpack_from, pack_into)
+LAYOUTS = {
+    "RNS.PKT.LAYOUT.HEADER_1": (HEADER_1, HEADER_1_FIELDS, header_1_unpack_from, header_1_pack_into),
+    "RNS.PKT.LAYOUT.HEADER_2": (HEADER_2, HEADER_2_FIELDS, header_2_unpack_from, header_2_pack_into),
+    "RNS.PKT.LAYOUT.PROOF_EXPLICIT": (PROOF_EXPLICIT, PROOF_EXPLICIT_FIELDS, proof_explicit_unpack_from, proof_explicit_pack_into),
+    "RNS.PKT.LAYOUT.PROOF_IMPLICIT": (PROOF_IMPLICIT, PROOF_IMPLICIT_FIELDS, proof_implicit_unpack_from, proof_implicit_pack_into),
+    "RNS.LNK.LAYOUT.LINKREQUEST_PAYLOAD": (LINKREQUEST_PAYLOAD, LINKREQUEST_PAYLOAD_FIELDS, linkrequest_payload_unpack_from, linkrequest_payload_pack_into),
+    "RNS.LNK.LAYOUT.LINKPROOF_PAYLOAD": (LINKPROOF_PAYLOAD, LINKPROOF_PAYLOAD_FIELDS, linkproof_payload_unpack_from, linkproof_payload_pack_into),
+    "RNS.PKT.LAYOUT.TOKEN": (TOKEN, TOKEN_FIELDS, token_unpack_from, token_pack_into),
+    "RNS.PKT.LAYOUT.ANNOUNCE_WITH_RATCHET": (ANNOUNCE_WITH_RATCHET, ANNOUNCE_WITH_RATCHET_FIELDS, announce_with_ratchet_unpack_from, announce_with_ratchet_pack_into),
+    "RNS.PKT.LAYOUT.ANNOUNCE_WITHOUT_RATCHET": (ANNOUNCE_WITHOUT_RATCHET, ANNOUNCE_WITHOUT_RATCHET_FIELDS, announce_without_ratchet_unpack_from, announce_without_ratchet_pack_into),
+    "RNS.LNK.LAYOUT.LINKCLOSE_PAYLOAD": (LINKCLOSE_PAYLOAD, LINKCLOSE_PAYLOAD_FIELDS, linkclose_payload_unpack_from, linkclose_payload_pack_into),
+    "RNS.LNK.LAYOUT.LINKIDENTIFY_PAYLOAD": (LINKIDENTIFY_PAYLOAD, LINKIDENTIFY_PAYLOAD_FIELDS, linkidentify_payload_unpack_from, linkidentify_payload_pack_into),
+    "RNS.CHN.LAYOUT.CHANNEL_ENVELOPE": (CHANNEL_ENVELOPE, CHANNEL_ENVELOPE_FIELDS, channel_envelope_unpack_from, channel_envelope_pack_into),
+    "RNS.TRN.LAYOUT.PATH_REQUEST_CLIENT": (PATH_REQUEST_CLIENT, PATH_REQUEST_CLIENT_FIELDS, path_request_client_unpack_from, path_request_client_pack_into),
+    "RNS.TRN.LAYOUT.PATH_REQUEST_TRANSPORT": (PATH_REQUEST_TRANSPORT, PATH_REQUEST_TRANSPORT_FIELDS, path_request_transport_unpack_from, path_request_transport_pack_into),
+    "RNS.TRN.LAYOUT.TUNNEL_SYNTHESIS": (TUNNEL_SYNTHESIS, TUNNEL_SYNTHESIS_FIELDS, tunnel_synthesis_unpack_from, tunnel_synthesis_pack_into),
+    "RNS.RES.LAYOUT.RESOURCE_ADV": (RESOURCE_ADV, RESOURCE_ADV_FIELDS, resource_adv_unpack_from, resource_adv_pack_into),
+    "RNS.RES.LAYOUT.RESOURCE_REQ": (RESOURCE_REQ, RESOURCE_REQ_FIELDS, resource_req_unpack_from, resource_req_pack_into),
+    "RNS.RES.LAYOUT.RESOURCE_HMU": (RESOURCE_HMU, RESOURCE_HMU_FIELDS, resource_hmu_unpack_from, resource_hmu_pack_into),
+    "RNS.RES.LAYOUT.RESOURCE_PRF": (RESOURCE_PRF, RESOURCE_PRF_FIELDS, resource_prf_unpack_from, resource_prf_pack_into),
+}
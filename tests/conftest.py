@@ -0,0 +1,151 @@
+"""
+Shared test setup: tools/ on sys.path for every test module, the `load_yaml` fixture (safe_load,
+skips without PyYAML) and vector-level collection for the conformance suite (tests/test_vectors.py).
+
+A test marked @pytest.mark.vectors("<family>", keys=(...)) that takes a `vector` argument is run
+once per vector of that family having all the keys, with the vector's name as test id
+(test_ifac_on_wire_match[canonical19_ifac1_key0]).
+Vectors come from tests/vectors/<family>.rvec when present, else <family>.yaml, each family
+read once per session; --random-vectors DIR appends the JSONL shards of a
+generate_vectors.py --random run (index.json order).
+
+--vector-shard=K/N keeps every N-th vector of each family starting at the K-th (1 <= K <= N),
+so N workers with K = 1..N together run every vector exactly once. Other tests are unaffected.
+The terminal summary reports, per family, the vector cases run and their throughput.
+"""
+
+from __future__ import annotations
+
+import functools
+import sys
+from pathlib import Path
+
+import pytest
+
+VECTORS_DIR = Path(__file__).resolve().parent / "vectors"
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "tools"))
+
+import random_vectors  # noqa: E402
+import vector_corpus  # noqa: E402
+
+_FAMILY_PROPERTY = "vector_family"
+
+
+def _load_yaml(path: Path):
+    """Load YAML with safe loader only. Do not use yaml.load() without Loader= — use safe_load."""
+    try:
+        import yaml
+
+        with open(path, encoding="utf-8") as f:
+            return yaml.safe_load(f)
+    except ImportError:
+        pytest.skip("PyYAML required")
+
+
+@functools.lru_cache(maxsize=None)
+def load_family(family: str) -> dict | None:
+    """Committed vector document of a family: the .rvec when present, else the YAML (None if neither)."""
+    rvec = VECTORS_DIR / f"{family}{vector_corpus.SUFFIX}"
+    if rvec.is_file():
+        return vector_corpus.read(rvec)
+    path = VECTORS_DIR / f"{family}.yaml"
+    return _load_yaml(path) if path.is_file() else None
+
+
+def parse_shard(spec: str | None) -> tuple[int, int]:
+    """'K/N' -> (K, N) with 1 <= K <= N; None -> (1, 1)."""
+    if not spec:
+        return 1, 1
+    try:
+        k, n = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise pytest.UsageError(f"--vector-shard must be K/N, got {spec!r}") from None
+    if not 1 <= k <= n:
+        raise pytest.UsageError(f"--vector-shard needs 1 <= K <= N, got {spec!r}")
+    return k, n
+
+
+class VectorCorpus:
+    """Per-session vector selection (fixtures + random corpus, sharded) and throughput counters."""
+
+    def __init__(self, config: pytest.Config) -> None:
+        self.shard = parse_shard(config.getoption("vector_shard"))
+        random_dir = config.getoption("random_vectors")
+        self.random_dir = Path(random_dir) if random_dir else None
+        self.stats: dict[str, list[float]] = {}  # family -> [cases, seconds]
+
+    @functools.lru_cache(maxsize=None)
+    def vectors(self, family: str) -> list[dict]:
+        doc = load_family(family) or {}
+        vectors = list(doc.get("vectors") or [])
+        if self.random_dir is not None:
+            vectors.extend(random_vectors.iter_vectors(self.random_dir, family))
+        return vectors
+
+    def select(self, family: str, keys: tuple[str, ...] = ()) -> list[dict]:
+        """This shard's vectors of the family that have every key in keys."""
+        k, n = self.shard
+        return [v for v in self.vectors(family)[k - 1 :: n] if all(key in v for key in keys)]
+
+    @pytest.hookimpl
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        if report.when != "call":
+            return
+        family = dict(report.user_properties).get(_FAMILY_PROPERTY)
+        if family is not None:
+            entry = self.stats.setdefault(family, [0, 0.0])
+            entry[0] += 1
+            entry[1] += report.duration
+
+    @pytest.hookimpl
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if not self.stats:
+            return
+        k, n = self.shard
+        terminalreporter.write_sep("-", f"vector throughput (shard {k}/{n})")
+        for family, (cases, seconds) in sorted(self.stats.items()):
+            rate = f"{cases / seconds:>12,.0f} cases/s" if seconds else f"{'-':>12} cases/s"
+            terminalreporter.write_line(f"{family:<28} {int(cases):>9,} cases {seconds:>9.3f} s {rate}")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("vectors", "conformance vectors")
+    group.addoption("--vector-shard", metavar="K/N", help="Run only the K-th of N interleaved slices of each vector family")
+    group.addoption("--random-vectors", metavar="DIR", help="Also run the vectors of a generate_vectors.py --random directory")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers", "vectors(family, keys=()): run the test once per vector of the family that has the keys (argument `vector`)")
+    config.pluginmanager.register(VectorCorpus(config), "vector-corpus")
+
+
+def _corpus(config: pytest.Config) -> VectorCorpus:
+    return config.pluginmanager.get_plugin("vector-corpus")
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    marker = metafunc.definition.get_closest_marker("vectors")
+    if marker is None or "vector" not in metafunc.fixturenames:
+        return
+    vectors = _corpus(metafunc.config).select(marker.args[0], tuple(marker.kwargs.get("keys", ())))
+    metafunc.parametrize("vector", vectors, ids=[str(v.get("name") or "unnamed") for v in vectors])
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    for item in items:
+        marker = item.get_closest_marker("vectors")
+        if marker is not None:
+            item.user_properties.append((_FAMILY_PROPERTY, marker.args[0]))
+
+
+@pytest.fixture(scope="session")
+def load_yaml():
+    """_load_yaml: a YAML file through yaml.safe_load (the test is skipped without PyYAML)."""
+    return _load_yaml
+
+
+@pytest.fixture(scope="session")
+def vector_family():
+    """load_family: the committed vector document of a family (unsharded)."""
+    return load_family
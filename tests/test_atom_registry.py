@@ -0,0 +1,71 @@
+"""
+Atom registry tests (tools/atom_registry.py).
+
+- Lookup by id and every grouping (kind, tag, id prefix, vendor file) agree with a linear scan
+  of the repo SSOT, in document order.
+- Typed accessors: constant_int / layout_fields values, and ValueError naming the atom for
+  unknown ids, missing values and non-integer constants.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from atom_registry import AtomRegistry, id_prefix
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SSOT_PATH = REPO_ROOT / "spec" / "reticulum-wire-format.ssot.yaml"
+
+
+@pytest.fixture(scope="module")
+def atoms(load_yaml):
+    return load_yaml(SSOT_PATH)["atoms"]
+
+
+@pytest.fixture(scope="module")
+def registry(atoms):
+    return AtomRegistry(atoms)
+
+
+def test_lookup_by_id(atoms, registry):
+    assert len(registry) == len(atoms)
+    assert list(registry) == atoms
+    for a in atoms:
+        assert a["id"] in registry
+        assert registry[a["id"]] is a
+    assert registry.get("RNS.NOPE") is None
+    with pytest.raises(KeyError):
+        registry["RNS.NOPE"]
+
+
+def test_groupings_match_linear_scan(atoms, registry):
+    for kind in registry.kinds():
+        assert list(registry.by_kind(kind)) == [a for a in atoms if a.get("kind") == kind]
+    assert registry.tags() == ["context"]
+    assert list(registry.by_tag("context")) == [a for a in atoms if "context" in (a.get("tags") or [])]
+    assert {"RNS.PKT", "RNS.LNK", "RNS.RES"} <= set(registry.prefixes())
+    for prefix in registry.prefixes():
+        assert list(registry.by_prefix(prefix)) == [a for a in atoms if id_prefix(a["id"]) == prefix]
+    for relpath in registry.files():
+        expected = [a for a in atoms if any(r.get("file") == relpath for r in a.get("references") or [])]
+        assert list(registry.by_file(relpath)) == expected
+    assert registry.by_kind("missing") == () and registry.by_file("missing.py") == ()
+
+
+def test_typed_accessors(registry):
+    assert registry.constant_int("RNS.LNK.CONST.ECPUBSIZE") == 64
+    assert registry.constant_int("RNS.LNK.CONST.LINK_MTU_SIZE") == 3
+    fields = registry.layout_fields("RNS.PKT.LAYOUT.HEADER_1")
+    assert fields[0]["offset"] == 0 and all("name" in f for f in fields)
+    assert isinstance(registry.value_number("RNS.IFAC.CONST.IFAC_SALT"), str)
+
+
+def test_typed_accessor_errors(registry):
+    with pytest.raises(ValueError, match="RNS.NOPE"):
+        registry.constant_int("RNS.NOPE")
+    with pytest.raises(ValueError, match="not an integer"):
+        registry.constant_int("RNS.IFAC.CONST.IFAC_SALT")
+    with pytest.raises(ValueError, match="no layout.fields"):
+        registry.layout_fields("RNS.LNK.CONST.ECPUBSIZE")
+    with pytest.raises(ValueError, match="no value.number"):
+        AtomRegistry([{"id": "RNS.X.CONST.Y", "kind": "constant"}]).value_number("RNS.X.CONST.Y")
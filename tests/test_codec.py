@@ -0,0 +1,93 @@
+"""
+Generated codec tests: spec/generated/codec.py (rendered by tools/compile_ssot.py).
+
+- codec.py is current: re-rendering from the SSOT is byte-identical, and manifest.json covers it.
+- One codec per kind: layout atom; struct sizes equal the layout's fixed span.
+- pack_into/unpack_from round-trip, including variable-length tails.
+- Fields are laid out by offset whatever their document order; a variable-length field before the
+  end or an overlap without allow_overlap is an error naming the layout atom.
+"""
+
+import hashlib
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+from compile_ssot import _codec_struct, render_codec
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SSOT_PATH = REPO_ROOT / "spec" / "reticulum-wire-format.ssot.yaml"
+GENERATED_DIR = REPO_ROOT / "spec" / "generated"
+
+
+@pytest.fixture(scope="module")
+def atoms(load_yaml):
+    return load_yaml(SSOT_PATH)["atoms"]
+
+
+@pytest.fixture(scope="module")
+def codec():
+    spec = importlib.util.spec_from_file_location("ssot_codec", GENERATED_DIR / "codec.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_codec_is_current(atoms):
+    """Rendering is deterministic and the committed codec.py matches the SSOT and manifest hash."""
+    rendered = render_codec(atoms)
+    assert rendered == render_codec(atoms)
+    committed = (GENERATED_DIR / "codec.py").read_text(encoding="utf-8")
+    assert committed == rendered, "spec/generated/codec.py is stale; run tools/compile_ssot.py"
+    manifest = json.loads((GENERATED_DIR / "manifest.json").read_text(encoding="utf-8"))
+    digest = hashlib.sha256((GENERATED_DIR / "codec.py").read_bytes()).hexdigest()
+    assert manifest["generated_files"]["codec.py"] == digest
+
+
+def test_every_layout_atom_has_codec(atoms, codec):
+    layout_atoms = [a for a in atoms if a.get("kind") == "layout"]
+    assert set(codec.LAYOUTS) == {a["id"] for a in layout_atoms}
+    for a in layout_atoms:
+        st, names, _, _ = codec.LAYOUTS[a["id"]]
+        fields = a["layout"]["fields"]
+        assert st.size == max(f["offset"] + f["length"] for f in fields), a["id"]
+        assert names == tuple(f["name"] for f in fields), a["id"]
+
+
+def test_header_round_trip(codec):
+    buf = bytearray(codec.HEADER_2.size + 4)
+    n = codec.header_2_pack_into(buf, 0, 0x41, 2, b"\x11" * 16, b"\x22" * 16, 0x0A)
+    assert n == 35
+    assert codec.header_2_unpack_from(bytes(buf)) == (0x41, 2, b"\x11" * 16, b"\x22" * 16, 0x0A)
+
+
+def test_tail_round_trip(codec):
+    """CHANNEL_ENVELOPE: >H msgtype/sequence/length + data tail returned as a memoryview."""
+    buf = bytearray(64)
+    n = codec.channel_envelope_pack_into(buf, 3, 0xF000, 7, 5, b"hello")
+    assert n == 11
+    assert bytes(buf[3:14]) == bytes.fromhex("f00000070005") + b"hello"
+    msgtype, seq, length, data = codec.channel_envelope_unpack_from(bytes(buf[:14]), 3)
+    assert (msgtype, seq, length) == (0xF000, 7, 5)
+    assert isinstance(data, memoryview) and bytes(data) == b"hello"
+
+
+def _field(name, offset, length, **kw):
+    return {"name": name, "offset": offset, "length": length, **kw}
+
+
+def test_struct_follows_offsets():
+    ordered = [_field("a", 0, 1), _field("b", 1, 2), _field("c", 5, 16), _field("tail", 21, 0)]
+    assert _codec_struct("X", ordered) == (">BH2x16s", ["a", "b", "c"], "tail")
+    assert _codec_struct("X", ordered[::-1]) == _codec_struct("X", ordered)
+    overlap = ordered[:3] + [_field("b_low", 2, 1, allow_overlap=True, overlap_with=["b"])]
+    assert _codec_struct("X", overlap) == (">BH2x16s", ["a", "b", "c"], None)
+
+
+def test_struct_rejects_misplaced_fields():
+    with pytest.raises(ValueError, match="layout atom RNS.X.LAYOUT.Y: variable-length field data at offset 2"):
+        _codec_struct("RNS.X.LAYOUT.Y", [_field("a", 0, 2), _field("data", 2, 0), _field("b", 2, 1)])
+    with pytest.raises(ValueError, match="layout atom RNS.X.LAYOUT.Y: field b at offset 1 overlaps"):
+        _codec_struct("RNS.X.LAYOUT.Y", [_field("a", 0, 2), _field("b", 1, 1)])
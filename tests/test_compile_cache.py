@@ -0,0 +1,91 @@
+"""
+compile_ssot per-atom render cache tests (tools/compile_ssot.py render_spec / RenderCache).
+
+Uses the real SSOT atoms against a synthetic vendor tree (every referenced file, numbered lines):
+- Cold cache, warm cache and --no-cache rendering are byte-identical, excerpts_sha256 included.
+- Editing one atom re-renders only that atom; editing a vendor file re-renders only its referrers.
+- A corrupt cache entry is treated as a miss.
+- The cache key's tool version covers the vendor readers the renderer goes through.
+"""
+
+import copy
+from pathlib import Path
+
+import pytest
+
+import compile_ssot
+from compile_ssot import RenderCache, render_spec
+from vendor_index import VendorIndex
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SSOT_PATH = REPO_ROOT / "spec" / "reticulum-wire-format.ssot.yaml"
+
+
+@pytest.fixture(scope="module")
+def atoms(load_yaml):
+    return load_yaml(SSOT_PATH)["atoms"]
+
+
+@pytest.fixture
+def vendor_root(tmp_path, atoms):
+    root = tmp_path / "vendor"
+    spans: dict[str, int] = {}
+    for a in atoms:
+        for ref in a.get("references") or []:
+            end = int((ref.get("lines") or {}).get("end") or 0)
+            spans[ref["file"]] = max(spans.get(ref["file"], 0), end)
+    for fpath, end in spans.items():
+        path = root / fpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("".join(f"line {i} of {fpath}\r\n" for i in range(1, end + 15)), encoding="utf-8")
+    return root
+
+
+def test_cached_render_is_byte_identical(tmp_path, atoms, vendor_root):
+    expected = render_spec("reticulum-wire-format", atoms, VendorIndex(vendor_root), None)
+    assert expected[1], "synthetic vendor tree should produce excerpts"
+    cache = RenderCache(tmp_path / "cache")
+    cold = render_spec("reticulum-wire-format", atoms, VendorIndex(vendor_root), cache)
+    assert (cache.hits, cache.misses) == (0, len(atoms))
+    warm_cache = RenderCache(tmp_path / "cache")
+    warm = render_spec("reticulum-wire-format", atoms, VendorIndex(vendor_root), warm_cache)
+    assert (warm_cache.hits, warm_cache.misses) == (len(atoms), 0)
+    assert cold == expected
+    assert warm == expected
+
+
+def test_one_atom_edit_rerenders_one_atom(tmp_path, atoms, vendor_root):
+    render_spec("reticulum-wire-format", atoms, VendorIndex(vendor_root), RenderCache(tmp_path / "cache"))
+    edited = copy.deepcopy(atoms)
+    edited[3]["statement"] = edited[3]["statement"] + " (edited)"
+    cache = RenderCache(tmp_path / "cache")
+    text, excerpts = render_spec("reticulum-wire-format", edited, VendorIndex(vendor_root), cache)
+    assert (cache.hits, cache.misses) == (len(atoms) - 1, 1)
+    assert (text, excerpts) == render_spec("reticulum-wire-format", edited, VendorIndex(vendor_root), None)
+
+
+def test_vendor_edit_rerenders_referrers(tmp_path, atoms, vendor_root):
+    render_spec("reticulum-wire-format", atoms, VendorIndex(vendor_root), RenderCache(tmp_path / "cache"))
+    fpath = next(ref["file"] for a in atoms for ref in a.get("references") or [])
+    referrers = sum(1 for a in atoms if any(r.get("file") == fpath for r in a.get("references") or []))
+    target = vendor_root / fpath
+    target.write_text("# changed\n" + target.read_text(encoding="utf-8"), encoding="utf-8")
+    cache = RenderCache(tmp_path / "cache")
+    result = render_spec("reticulum-wire-format", atoms, VendorIndex(vendor_root), cache)
+    assert cache.misses == referrers
+    assert result == render_spec("reticulum-wire-format", atoms, VendorIndex(vendor_root), None)
+
+
+def test_corrupt_entry_is_a_miss(tmp_path, atoms):
+    cache = RenderCache(tmp_path / "cache")
+    expected = render_spec("reticulum-wire-format", atoms, None, cache)
+    for entry in (tmp_path / "cache").rglob("*.json"):
+        entry.write_text("{not json", encoding="utf-8")
+    cache = RenderCache(tmp_path / "cache")
+    assert render_spec("reticulum-wire-format", atoms, None, cache) == expected
+    assert cache.misses == len(atoms)
+
+
+def test_tool_version_covers_vendor_readers():
+    assert {"compile_ssot.py", "vendor_index.py", "vendor_git.py"} <= set(compile_ssot._TOOL_SOURCES)
+    assert all((REPO_ROOT / "tools" / name).is_file() for name in compile_ssot._TOOL_SOURCES)
@@ -0,0 +1,110 @@
+"""
+Conformance runner tests (tools/conformance_run.py against tools/conformance_reference.py).
+
+- The reference stand-in passes every committed vector over both pipe protocols, in one process.
+- Random corpora stream in several pipelined batches per op and pass.
+- A corrupted op is reported per vector with expected and actual values; the run fails.
+- Ops the implementation does not announce are counted as skipped; a crash or early exit fails the run.
+- Binary messages round-trip raw bytes through the .rvec encoding.
+"""
+
+import io
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import conformance_run as cr
+import random_vectors
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+VECTORS_DIR = REPO_ROOT / "tests" / "vectors"
+REFERENCE = [sys.executable, str(REPO_ROOT / "tools" / "conformance_reference.py")]
+COMMITTED = [f for f in cr.FAMILIES if (VECTORS_DIR / f"{f}.yaml").is_file()]
+
+
+def _run(cmd, protocol="jsonl", random_dir=None, vectors_dir=VECTORS_DIR, families=cr.FAMILIES, **kw) -> cr.Runner:
+    runner = cr.Runner(cmd, protocol, **kw)
+    runner.run([(f, cr.iter_vectors(f, vectors_dir, random_dir)) for f in families])
+    return runner
+
+
+@pytest.mark.parametrize("protocol", cr.PROTOCOLS)
+def test_reference_passes_committed_vectors(protocol):
+    runner = _run(REFERENCE + ["--protocol", protocol], protocol)
+    assert runner.ok, (runner.failure, runner.reports)
+    assert set(runner.stats) == set(cr.FAMILIES)
+    for family in COMMITTED:
+        assert runner.stats[family].cases > 0 and runner.stats[family].unsupported == 0, family
+    assert runner.stats["signalling_bytes"].cases == sum(len(cr._signalling_cases(v)) for v in cr.iter_vectors("signalling_bytes", VECTORS_DIR, None))
+
+
+def test_random_corpus_pipelined(tmp_path):
+    random_vectors.generate_random(tmp_path, 300, 5, random_vectors.Limits(), shard_size=128)
+    runner = _run(REFERENCE, random_dir=tmp_path, vectors_dir=None, families=random_vectors.FAMILIES, batch=64, window=3)
+    assert runner.ok, (runner.failure, runner.reports)
+    assert runner.stats["hashable_part"].cases == 300
+    assert runner.stats["ifac_masking"].cases == 600  # mask and unmask per vector
+    assert runner.stats["signalling_bytes"].cases == 600  # encode and decode per vector
+
+
+def test_corrupted_op_reported():
+    runner = _run(REFERENCE + ["--corrupt", "kiss_encode"], families=("kiss_framing", "hashable_part"), max_report=2)
+    assert not runner.ok and runner.failure is None
+    assert runner.stats["kiss_framing"].mismatches == sum(1 for v in cr.iter_vectors("kiss_framing", VECTORS_DIR, None) if "data_hex" in v)
+    assert runner.stats["hashable_part"].mismatches == 0
+    assert len(runner.reports) == 2
+    assert runner.reports[0].startswith("kiss_framing/encode_plain kiss_encode: encoded_hex: expected 'c000")
+
+
+def test_unsupported_ops_skipped():
+    runner = _run(REFERENCE + ["--ops", "hashable_part"], families=("hashable_part", "ifac_masking"))
+    assert runner.ok
+    assert runner.stats["ifac_masking"].cases == 0
+    assert runner.stats["ifac_masking"].unsupported == 8  # mask and unmask of the 4 committed vectors
+
+
+def test_implementation_failures(tmp_path):
+    runner = _run([sys.executable, "-c", "import sys; sys.stdin.readline(); sys.exit(3)"], families=("hashable_part",))
+    assert not runner.ok and "did not answer hello" in runner.failure and "status 3" in runner.failure
+
+    half = tmp_path / "half.py"
+    half.write_text(
+        "import json, sys\n"
+        f"sys.path.insert(0, {str(REPO_ROOT / 'tools')!r})\n"
+        "from conformance_reference import answer, make_ops\n"
+        "from random_vectors import Limits\n"
+        "OPS = make_ops(Limits())\n"
+        "for i, line in enumerate(sys.stdin):\n"
+        "    if i == 2:\n"
+        "        sys.exit(0)\n"
+        "    print(json.dumps(answer(json.loads(line), OPS)), flush=True)\n",
+        encoding="utf-8",
+    )
+    runner = _run([sys.executable, str(half)], families=("signalling_bytes",), batch=10)
+    assert not runner.ok and runner.failure.startswith("implementation stopped after 1 of")
+
+
+def test_binary_message_roundtrip():
+    msg = {"batch": 7, "op": "hdlc_deframe", "items": [{"stream_hex": "7e00ff7e", "chunk_sizes": [1, 3]}, {"stream_hex": "", "chunk_sizes": []}]}
+    buf = io.BytesIO()
+    cr.write_message(buf, msg, "binary")
+    cr.write_message(buf, {"batch": 0, "op": "hello", "items": []}, "binary")
+    buf.seek(0)
+    assert cr.read_message(buf, "binary") == msg
+    assert cr.read_message(buf, "binary") == {"batch": 0, "op": "hello", "items": []}
+    assert cr.read_message(buf, "binary") is None
+
+
+def test_cli_exit_status():
+    ok = subprocess.run([sys.executable, "tools/conformance_run.py", "--families", "link_id_from_linkrequest"], cwd=REPO_ROOT, capture_output=True, text=True)
+    assert ok.returncode == 0 and "link_id_from_linkrequest" in ok.stdout
+    bad = subprocess.run(
+        [sys.executable, "tools/conformance_run.py", "--families", "link_id_from_linkrequest", "--impl", f"{sys.executable} tools/conformance_reference.py --corrupt link_id"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert bad.returncode == 1 and "link_id_hex: expected" in bad.stderr
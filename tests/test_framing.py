@@ -0,0 +1,115 @@
+"""
+Streaming framing codec tests: tools/framing.py against tests/vectors/hdlc_framing.yaml and kiss_framing.yaml.
+
+- Feeding stream_hex in the vector's chunk_sizes yields expected_frames_hex in order.
+- The same holds for every single split point and for byte-by-byte feeding.
+- encode() matches expected_encoded_hex and round-trips through feed().
+- KISS frame data is a zero-copy slice when the frame has no escapes; feed_ports() demuxes by port.
+"""
+
+
+import pytest
+
+from framing import HDLCCodec, KISSCodec
+
+
+def _feed_chunks(codec, stream: bytes, sizes) -> list:
+    frames, pos = [], 0
+    for n in sizes:
+        frames.extend(codec.feed(stream[pos : pos + n]))
+        pos += n
+    return frames
+
+
+@pytest.fixture(scope="module")
+def hdlc_vectors(vector_family):
+    return (vector_family("hdlc_framing") or {}).get("vectors") or []
+
+
+def test_hdlc_codec_vector_chunks(hdlc_vectors):
+    for v in hdlc_vectors:
+        if "stream_hex" not in v:
+            continue
+        frames = _feed_chunks(HDLCCodec(), bytes.fromhex(v["stream_hex"]), v["chunk_sizes"])
+        assert [f.hex() for f in frames] == v["expected_frames_hex"], v["name"]
+
+
+def test_hdlc_codec_every_split_point(hdlc_vectors):
+    for v in hdlc_vectors:
+        if "stream_hex" not in v:
+            continue
+        stream = bytes.fromhex(v["stream_hex"])
+        for cut in range(len(stream) + 1):
+            frames = _feed_chunks(HDLCCodec(), stream, [cut, len(stream) - cut])
+            assert [f.hex() for f in frames] == v["expected_frames_hex"], f"{v['name']} split at {cut}"
+        frames = _feed_chunks(HDLCCodec(), stream, [1] * len(stream))
+        assert [f.hex() for f in frames] == v["expected_frames_hex"], f"{v['name']} byte-by-byte"
+
+
+def test_hdlc_codec_encode(hdlc_vectors):
+    for v in hdlc_vectors:
+        if "frame_hex" not in v:
+            continue
+        frame = bytes.fromhex(v["frame_hex"])
+        encoded = HDLCCodec.encode(frame)
+        assert encoded.hex() == v["expected_encoded_hex"], v["name"]
+        assert HDLCCodec().feed(encoded) == [frame], v["name"]
+
+
+def test_hdlc_codec_keeps_partial_frame():
+    codec = HDLCCodec()
+    assert codec.feed(b"\x7eabc") == []
+    assert codec.pending() == 4
+    assert codec.feed(b"d\x7e") == [b"abcd"]
+    assert codec.pending() == 1
+    codec.reset()
+    assert codec.feed(b"xyz\x7e") == [] and codec.feed(b"q\x7e") == [b"q"]
+
+
+@pytest.fixture(scope="module")
+def kiss_vectors(vector_family):
+    return (vector_family("kiss_framing") or {}).get("vectors") or []
+
+
+def _kiss_dicts(frames) -> list:
+    return [{"port": f.port, "command": f.command, "data_hex": bytes(f.data).hex()} for f in frames]
+
+
+def test_kiss_codec_vector_chunks(kiss_vectors):
+    for v in kiss_vectors:
+        if "stream_hex" not in v:
+            continue
+        frames = _feed_chunks(KISSCodec(), bytes.fromhex(v["stream_hex"]), v["chunk_sizes"])
+        assert _kiss_dicts(frames) == v["expected_frames"], v["name"]
+
+
+def test_kiss_codec_every_split_point(kiss_vectors):
+    for v in kiss_vectors:
+        if "stream_hex" not in v:
+            continue
+        stream = bytes.fromhex(v["stream_hex"])
+        for cut in range(len(stream) + 1):
+            frames = _feed_chunks(KISSCodec(), stream, [cut, len(stream) - cut])
+            assert _kiss_dicts(frames) == v["expected_frames"], f"{v['name']} split at {cut}"
+        frames = _feed_chunks(KISSCodec(), stream, [1] * len(stream))
+        assert _kiss_dicts(frames) == v["expected_frames"], f"{v['name']} byte-by-byte"
+
+
+def test_kiss_codec_encode(kiss_vectors):
+    for v in kiss_vectors:
+        if "data_hex" not in v:
+            continue
+        data = bytes.fromhex(v["data_hex"])
+        encoded = KISSCodec.encode(data, v["port"], v["command"])
+        assert encoded.hex() == v["expected_encoded_hex"], v["name"]
+        assert _kiss_dicts(KISSCodec().feed(encoded)) == [{"port": v["port"], "command": v["command"], "data_hex": v["data_hex"]}]
+
+
+def test_kiss_codec_zero_copy_and_demux():
+    a, b = b"\x01" * 20, b"\x02\xc0" * 10
+    stream = KISSCodec.encode(a, 0) + KISSCodec.encode(b, 1) + KISSCodec.encode(a, 1) + KISSCodec.encode(b"\x05", 0, 1)
+    frames = KISSCodec().feed(stream)
+    assert frames[0].data.obj is stream  # unescaped frame: slice of the input chunk
+    assert bytes(frames[1].data) == b
+    by_port = KISSCodec().feed_ports(stream)
+    assert {p: [bytes(d) for d in ds] for p, ds in by_port.items()} == {0: [a], 1: [b, a]}
@@ -0,0 +1,159 @@
+"""
+Differential fuzzer tests (tools/fuzz_vendor.py).
+
+- The reference against itself never diverges, and every generated or mutated input stays in its target's domain.
+- A planted bug is found, minimized to one canonical input and reported once, the same for any worker count.
+- --iterations runs are reproducible for a seed.
+- Divergences become fuzz_vendor.yaml vectors (merged by name, with .rvec) that conformance_run.py replays;
+  an input the vendor rejects is replayed as a case that expects an error item.
+- Committed fuzz vectors (outputs and rejections) hold for the reference; with vendor/reticulum-source checked out, the vendor
+  code paths agree with the reference on the committed vectors.
+"""
+
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import conformance_run
+import fuzz_vendor as fv
+import vector_corpus
+from conformance_reference import answer, make_ops
+from random_vectors import Limits
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+LIMITS = Limits()
+OPS = make_ops(LIMITS)
+VENDOR_ROOT = REPO_ROOT / "vendor" / "reticulum-source"
+
+
+class FlagMaskBug(fv.Reference):
+    """HEADER_1 hashable part keeping flag bit 4 (mask 0x1F instead of 0x0F)."""
+
+    def hashable_part(self, x):
+        packet = x["packet_hex"]
+        if x["header_type"] == 1:
+            return bytes([packet[0] & 0x1F]) + packet[2:]
+        return super().hashable_part(x)
+
+
+class HeaderTwoRejectBug(fv.Reference):
+    """Rejects every HEADER_2 packet, which the reference accepts."""
+
+    def hashable_part(self, x):
+        if x["header_type"] == 2:
+            raise ValueError("HEADER_2 not supported")
+        return super().hashable_part(x)
+
+
+def _task(impl=fv.Reference, worker=0, targets=fv.TARGETS, iterations=400, seed=3):
+    return fv.Task(worker, seed, targets, LIMITS, impl, iterations=iterations, seeds=fv.seed_corpus(targets, REPO_ROOT / "tests" / "vectors"))
+
+
+def test_reference_self_check_and_domains():
+    result = fv.fuzz_worker(_task())
+    for target, res in result.items():
+        assert res["execs"] == 400 and res["divergent"] == 0 and not res["divergences"], target
+    fields = fv.target_fields(LIMITS)
+    for target in fv.TARGETS:
+        fz = fv.Fuzzer(target, fields[target], fv.Reference(LIMITS), fv.Reference(LIMITS), random.Random(target))
+        fz.corpus = [fz.generate() for _ in range(8)]
+        for _ in range(500):
+            x = fz.mutate(fz.rng.choice(fz.corpus))
+            assert fz.in_domain(x), (target, x)
+            fz.corpus.append(x)
+
+
+def test_planted_bug_minimized_once():
+    merged = fv.fuzz([_task(FlagMaskBug, worker=k, targets=("hashable_part", "link_id"), iterations=1500) for k in range(2)], jobs=2)
+    assert merged["link_id"]["divergent"] == 0
+    hp = merged["hashable_part"]
+    assert hp["divergent"] > 0
+    (key, (x, ref, got)), = hp["divergences"].items()
+    assert x == {"packet_hex": bytes([0x10]) + bytes(LIMITS.header_minsize - 1), "header_type": 1}
+    assert ref == ("ok", bytes(LIMITS.header_minsize - 1)) and got[1][0] == 0x10
+    sequential = fv.fuzz([_task(FlagMaskBug, worker=k, targets=("hashable_part", "link_id"), iterations=1500) for k in range(2)], jobs=1)
+    assert set(sequential["hashable_part"]["divergences"]) == {key}
+    assert sequential["hashable_part"]["execs"] == hp["execs"]
+
+
+def test_reproducible_and_seeded():
+    def corpus(seed):
+        task = _task(FlagMaskBug, targets=("hashable_part", "ifac_unmask"), iterations=300, seed=seed)
+        res = fv.fuzz_worker(task)
+        return {t: (r["execs"], r["divergent"], sorted(r["divergences"])) for t, r in res.items()}
+
+    assert corpus(5) == corpus(5)
+
+    def inputs(seed, worker):
+        fz = fv.Fuzzer("ifac_mask", fv.target_fields(LIMITS)["ifac_mask"], fv.Reference(LIMITS), fv.Reference(LIMITS), fv.shard_rng(seed, "ifac_mask", worker))
+        return [fz.next_input() for _ in range(5)]
+
+    assert inputs(5, 0) == inputs(5, 0) != inputs(6, 0) != inputs(5, 1)
+
+
+def test_divergence_vectors_replay(tmp_path):
+    merged = fv.fuzz([_task(FlagMaskBug, targets=("hashable_part",), iterations=600)], jobs=1)
+    vectors = [fv.divergence_vector(k, "hashable_part", *div) for k, div in merged["hashable_part"]["divergences"].items()]
+    path = tmp_path / fv.VECTORS_NAME
+    assert fv.write_vectors(path, vectors, "abc") == 1
+    assert fv.write_vectors(path, vectors, "abc") == 0
+    doc = vector_corpus.read(path.with_suffix(vector_corpus.SUFFIX))
+    (v,) = doc["vectors"]
+    assert v["expected"]["hashable_hex"].startswith("10") and v["reference"]["hashable_hex"].startswith("00")
+    ((op, inputs, expected),) = conformance_run.CASES["fuzz_vendor"](v)
+    (got,) = answer({"batch": 1, "op": op, "items": [inputs]}, OPS)["items"]
+    assert got != expected  # the reference stand-in reproduces the divergence
+
+
+def test_rejection_vectors_replay(tmp_path):
+    merged = fv.fuzz([_task(HeaderTwoRejectBug, targets=("hashable_part",), iterations=300)], jobs=1)
+    vectors = [fv.divergence_vector(k, "hashable_part", *div) for k, div in merged["hashable_part"]["divergences"].items()]
+    assert vectors and all(v["expected_reject"] == "ValueError" and "reference" in v for v in vectors)
+    both_reject = {"name": "both_reject", "op": "signalling_decode", "input": {"bytes_hex": "00"}, "expected_reject": "ValueError"}
+    fv.write_vectors(tmp_path / fv.VECTORS_NAME, vectors + [both_reject], "abc")
+    runner = conformance_run.Runner([sys.executable, str(REPO_ROOT / "tools" / "conformance_reference.py")])
+    runner.run([("fuzz_vendor", conformance_run.iter_vectors("fuzz_vendor", tmp_path, None))])
+    stats = runner.stats["fuzz_vendor"]
+    assert runner.failure is None and stats.cases == len(vectors) + 1 and stats.errors == 0
+    assert stats.mismatches == len(vectors)  # the reference stand-in accepts what the vendor rejected
+    assert all("expected an error (ValueError), got {'hashable_hex'" in line for line in runner.reports)
+
+
+@pytest.mark.vectors("fuzz_vendor", keys=("expected",))
+def test_committed_fuzz_vectors_hold_for_reference(vector):
+    """A committed divergence is a fixed bug: the reference now gives the vendor's output."""
+    (got,) = answer({"batch": 1, "op": vector["op"], "items": [vector["input"]]}, OPS)["items"]
+    assert got == vector["expected"], f"reference still diverges from the vendor on {vector['name']}"
+
+
+@pytest.mark.vectors("fuzz_vendor", keys=("expected_reject",))
+def test_committed_fuzz_rejections_hold_for_reference(vector):
+    """A committed rejection divergence is a fixed bug: the reference now rejects the input too."""
+    (got,) = answer({"batch": 1, "op": vector["op"], "items": [vector["input"]]}, OPS)["items"]
+    assert "error" in got, f"reference still accepts what the vendor rejects on {vector['name']}"
+
+
+@pytest.mark.skipif(not (VENDOR_ROOT / "RNS").is_dir(), reason="vendor/reticulum-source not checked out")
+def test_vendor_agrees_on_committed_vectors():
+    vendor = fv.VendorImpl(LIMITS, VENDOR_ROOT)
+    fields = fv.target_fields(LIMITS)
+    for target, seeds in fv.seed_corpus(fv.TARGETS, REPO_ROOT / "tests" / "vectors").items():
+        fz = fv.Fuzzer(target, fields[target], fv.Reference(LIMITS), vendor, random.Random(0))
+        for x in filter(fz.in_domain, seeds):
+            diverges, ref, got = fz.run(x)
+            assert not diverges, (target, x, ref, got)
+
+
+def test_cli_reference_self_check():
+    proc = subprocess.run(
+        [sys.executable, "tools/fuzz_vendor.py", "--impl", "reference", "--iterations", "50", "--jobs", "1", "--targets", "signalling_encode,link_id"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert "execs/s" in proc.stdout and "signalling_encode" in proc.stdout
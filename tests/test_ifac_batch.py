@@ -0,0 +1,56 @@
+"""
+Batched IFAC engine tests: ifac_mask_batch / ifac_unmask_batch in tools/generate_vectors.py.
+
+- Bit-identical to the committed ifac_masking.yaml fixtures, in input order.
+- Bit-identical to the per-packet reference transforms on randomised (seeded) inputs.
+"""
+
+import random
+
+import pytest
+
+import generate_vectors as gv
+
+
+def test_ifac_batch_matches_vectors(vector_family):
+    """Batch mask/unmask over all fixture vectors at once must reproduce expected_on_wire_hex / recovered canonical."""
+    data = vector_family("ifac_masking")
+    vectors = data.get("vectors") or []
+    assert vectors
+    mask_items = [
+        (bytes.fromhex(v["canonical_packet_hex"]), bytes.fromhex(v["ifac_bytes_hex"]), bytes.fromhex(v["ifac_key_hex"]))
+        for v in vectors
+    ]
+    on_wire = gv.ifac_mask_batch(mask_items)
+    assert [b.hex() for b in on_wire] == [v["expected_on_wire_hex"] for v in vectors]
+    unmask_items = [
+        (bytes.fromhex(v["expected_on_wire_hex"]), len(bytes.fromhex(v["ifac_bytes_hex"])), bytes.fromhex(v["ifac_key_hex"]))
+        for v in vectors
+    ]
+    recovered = gv.ifac_unmask_batch(unmask_items)
+    assert [b.hex() for b in recovered] == [v["expected_recovered_canonical_hex"] for v in vectors]
+
+
+def test_ifac_batch_matches_reference_transforms():
+    """Seeded random packets (mixed keys, IFAC sizes 1..64, lengths 3..500) match the per-packet functions."""
+    rng = random.Random(1)
+    keys = [rng.randbytes(32) for _ in range(3)]
+    items = []
+    for _ in range(200):
+        canonical = rng.randbytes(rng.randint(3, 500))
+        canonical = bytes([canonical[0] & 0x7F]) + canonical[1:]  # canonical packets never carry the IFAC bit
+        items.append((canonical, rng.randbytes(rng.randint(1, 64)), rng.choice(keys)))
+    on_wire = gv.ifac_mask_batch(items)
+    assert on_wire == [gv.ifac_mask_transform(c, i, k) for c, i, k in items]
+    unmask_items = [(w, len(i), k) for w, (_, i, k) in zip(on_wire, items)]
+    assert gv.ifac_unmask_batch(unmask_items) == [gv.ifac_unmask_transform(w, n, k) for w, n, k in unmask_items]
+    assert gv.ifac_unmask_batch(unmask_items) == [c for c, _, _ in items]
+
+
+def test_ifac_unmask_batch_rejects_like_reference():
+    """Short input and missing IFAC flag raise ValueError, as in ifac_unmask_transform."""
+    key = b"\x00" * 32
+    with pytest.raises(ValueError):
+        gv.ifac_unmask_batch([(b"\x80\x00\x00", 1, key)])
+    with pytest.raises(ValueError):
+        gv.ifac_unmask_batch([(b"\x00" * 20, 1, key)])
@@ -0,0 +1,41 @@
+"""
+Incremental packet hashing tests: packet_hash / truncated_packet_hash in tools/generate_vectors.py.
+
+- Match expected_sha256_hex of hashable_part.yaml for bytes, bytearray and memoryview input.
+- Match sha256(hashable_part(...)) on seeded random packets, including short packets.
+"""
+
+import hashlib
+import random
+
+import generate_vectors as gv
+
+
+def test_packet_hash_matches_vectors(vector_family):
+    data = vector_family("hashable_part")
+    vectors = data.get("vectors") or []
+    assert vectors
+    for v in vectors:
+        raw = bytes.fromhex(v["packet_hex"])
+        for buf in (raw, bytearray(raw), memoryview(raw)):
+            assert gv.packet_hash(buf, v["header_type"]).hex() == v["expected_sha256_hex"], v["name"]
+            assert gv.truncated_packet_hash(buf, v["header_type"]).hex() == v["expected_sha256_hex"][:32], v["name"]
+
+
+def test_packet_hash_matches_hashable_part():
+    """Header type from flags bit 6 by default; explicit header_type and short packets follow hashable_part."""
+    rng = random.Random(4)
+    for size in list(range(0, 40)) + [rng.randint(40, 500) for _ in range(100)]:
+        raw = rng.randbytes(size)
+        for header_type in (1, 2):
+            expected = hashlib.sha256(gv.hashable_part(raw, header_type)).digest()
+            assert gv.packet_hash(raw, header_type) == expected
+        if size:
+            implied = 2 if raw[0] & 0x40 else 1
+            assert gv.packet_hash(raw) == hashlib.sha256(gv.hashable_part(raw, implied)).digest()
+
+
+def test_packet_hash_accepts_non_byte_memoryview():
+    raw = bytes(range(40))
+    wide = memoryview(raw).cast("H")
+    assert gv.packet_hash(wide, 1) == gv.packet_hash(raw, 1)
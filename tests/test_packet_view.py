@@ -0,0 +1,87 @@
+"""
+PacketView tests: accessors generated from RNS.PKT.LAYOUT.HEADER_1 / HEADER_2 (tools/packet_view.py).
+
+- Field set and offsets follow the SSOT layout atoms (no drift).
+- Field reads return ints or memoryview slices of the original buffer (no copy).
+- hashable_part fixtures: masked flags + bytes after hops/transport_id match the view.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from packet_view import header_layouts, packet_view_class
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SSOT_PATH = REPO_ROOT / "spec" / "reticulum-wire-format.ssot.yaml"
+
+
+@pytest.fixture(scope="module")
+def ssot(load_yaml):
+    return load_yaml(SSOT_PATH)
+
+
+@pytest.fixture(scope="module")
+def PacketView(ssot):
+    return packet_view_class(ssot)
+
+
+def test_fields_follow_ssot_layouts(ssot, PacketView):
+    """Every layout field of both header atoms is an accessor; header sizes match the layouts."""
+    layouts = header_layouts(ssot)
+    for fields in layouts.values():
+        for name, _, _ in fields:
+            assert name in PacketView.FIELDS
+    assert PacketView.HEADER_SIZE == {1: 19, 2: 35}
+
+
+def test_header_1_fields(PacketView):
+    raw = bytes([0x21, 0x03]) + bytes(range(16)) + bytes([0x0A]) + b"payload"
+    v = PacketView(raw)
+    assert v.header_type == 1
+    assert v.flags == 0x21
+    assert v.hops == 3
+    assert v.transport_id is None
+    assert bytes(v.destination_hash) == bytes(range(16))
+    assert v.context == 0x0A
+    assert bytes(v.payload) == b"payload"
+
+
+def test_header_2_fields(PacketView):
+    raw = bytes([0x40, 0x01]) + b"\x11" * 16 + b"\x22" * 16 + bytes([0xFE])
+    v = PacketView(raw)
+    assert v.header_type == 2
+    assert bytes(v.transport_id) == b"\x11" * 16
+    assert bytes(v.destination_hash) == b"\x22" * 16
+    assert v.context == 0xFE
+    assert len(v.payload) == 0
+
+
+def test_fields_do_not_copy(PacketView):
+    """Multi-byte fields are views over the caller's buffer: writes to the buffer show through."""
+    buf = bytearray(40)
+    buf[0] = 0x40
+    v = PacketView(buf)
+    dest, payload = v.destination_hash, v.payload
+    assert isinstance(dest, memoryview) and isinstance(payload, memoryview)
+    assert dest.obj is buf and payload.obj is buf
+    buf[18] = 0xAB
+    buf[35] = 0xCD
+    assert dest[0] == 0xAB and payload[0] == 0xCD
+
+
+def test_short_packet_rejected(PacketView):
+    with pytest.raises(ValueError):
+        PacketView(b"\x00" * 18)
+    with pytest.raises(ValueError):
+        PacketView(b"\x40" + b"\x00" * 33)
+
+
+def test_view_matches_hashable_part_vectors(PacketView, vector_family):
+    """hashable part == (flags & 0x0F) + everything after hops (HEADER_1) or after transport_id (HEADER_2)."""
+    data = vector_family("hashable_part")
+    for v in data.get("vectors") or []:
+        view = PacketView(bytes.fromhex(v["packet_hex"]), header_type=v["header_type"])
+        start = 18 if view.header_type == 2 else 2
+        hashable = bytes([view.flags & 0x0F]) + bytes(view.raw[start:])
+        assert hashable.hex() == v["expected_hashable_hex"], v["name"]
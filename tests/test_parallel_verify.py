@@ -0,0 +1,79 @@
+"""
+Parallel reference verification tests (extract_refs.verify_refs, validate_ssot.check_atoms).
+
+A synthetic vendor tree with many files and references, some of them broken:
+- verify_refs and process_refs with jobs > 1 give the same results, in the same order, as jobs=1.
+- check_atoms with jobs > 1 matches the in-process results atom for atom.
+- Below PARALLEL_MIN_REFS, or for an index over git objects, no worker pool is started.
+"""
+
+import random
+from pathlib import Path
+
+import pytest
+
+import extract_refs
+import validate_ssot
+from vendor_index import VendorIndex
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+N_FILES = 12
+N_LINES = 60
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "vendor"
+    for f in range(N_FILES):
+        path = root / "RNS" / f"Mod{f}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("".join(f"NAME_{f}_{i} = {i}\n" for i in range(1, N_LINES + 1)), encoding="utf-8")
+    rng = random.Random(7)
+    atoms = []
+    for a in range(80):
+        refs = []
+        for _ in range(rng.randint(1, 3)):
+            f, line = rng.randrange(N_FILES + 1), rng.randint(1, N_LINES + 5)  # file N_FILES is missing
+            symbol = f"NAME_{f}_{line if rng.random() < 0.8 else line + 1}"
+            refs.append({"file": f"RNS/Mod{f}.py", "symbol": symbol, "lines": {"start": line, "end": line}})
+        atoms.append({"id": f"RNS.PKT.CONST.A{a}", "kind": "constant", "references": refs})
+    return root, {"manifest": {"repo_revision": "abc"}, "atoms": atoms}
+
+
+@pytest.fixture
+def small_threshold(monkeypatch):
+    monkeypatch.setattr(extract_refs, "PARALLEL_MIN_REFS", 10)
+
+
+def test_verify_refs_parallel_matches_sequential(tree, small_threshold):
+    root, data = tree
+    refs = [ref for atom in data["atoms"] for ref in atom["references"]]
+    sequential = extract_refs.verify_refs(root, refs, "abc", VendorIndex(root))
+    assert any(ok for ok, _ in sequential) and not all(ok for ok, _ in sequential)
+    assert extract_refs.verify_refs(root, refs, "abc", VendorIndex(root), jobs=3) == sequential
+    errors = extract_refs.process_refs(data, root, index=VendorIndex(root))[0]
+    assert extract_refs.process_refs(data, root, index=VendorIndex(root), jobs=3)[0] == errors
+
+
+def test_check_atoms_parallel_matches_sequential(tree, small_threshold):
+    root, data = tree
+    schema = validate_ssot.ssot_schema.load(REPO_ROOT / validate_ssot.SCHEMA_RELPATH)
+    sequential = validate_ssot.check_atoms(data["atoms"], VendorIndex(root), "abc", schema)
+    assert any(r["refs"] for r in sequential) and any(r["schema"] for r in sequential)
+    assert validate_ssot.check_atoms(data["atoms"], VendorIndex(root), "abc", schema, jobs=3) == sequential
+
+
+def test_small_or_git_runs_in_process(tree, monkeypatch):
+    root, data = tree
+    refs = [ref for atom in data["atoms"] for ref in atom["references"]]
+    monkeypatch.setattr(extract_refs, "ProcessPoolExecutor", None)  # any pool would fail
+    monkeypatch.setattr(validate_ssot, "ProcessPoolExecutor", None)
+    assert len(refs) < extract_refs.PARALLEL_MIN_REFS
+    extract_refs.verify_refs(root, refs, "abc", VendorIndex(root), jobs=4)
+    validate_ssot.check_atoms(data["atoms"], VendorIndex(root), "abc", jobs=4)
+    monkeypatch.setattr(extract_refs, "PARALLEL_MIN_REFS", 10)
+    index = VendorIndex(root)
+    index.revision = "abc"
+    extract_refs.verify_refs(root, refs, "abc", index, jobs=4)
+    validate_ssot.check_atoms(data["atoms"], index, "abc", jobs=4)
@@ -0,0 +1,103 @@
+"""
+Profiling tests (tools/profiling.py, --profile on the SSOT tools).
+
+- Spans nest and become Chrome trace "X" events with a peak-RSS counter; spans opened in pool threads
+  through in_context() nest under the submitting span and do not add to the wall time.
+- The summary lists phases in start order and the slowest atoms/references first.
+- Without a session span() is a shared no-op and nothing is recorded.
+- generate_vectors --profile writes a loadable trace with one span per generator and output file.
+"""
+
+import io
+import json
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import profiling
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_session_writes_nested_trace(tmp_path):
+    trace_path = tmp_path / "trace.json"
+    summary = io.StringIO()
+    with profiling.session(trace_path, "tool", stream=summary) as prof:
+        assert profiling.enabled()
+        with profiling.span("load"):
+            with profiling.span("RNS.PKT.CONST.A", "atom"):
+                time.sleep(0.002)
+            with profiling.span("RNS/Packet.py", "ref", lines="10-12", atom="RNS.PKT.CONST.A"):
+                pass
+    assert not profiling.enabled()
+    depths = {name: depth for _, name, depth, *_ in prof.spans}
+    assert depths == {"tool": 0, "load": 1, "RNS.PKT.CONST.A": 2, "RNS/Packet.py": 2}
+    trace = json.loads(trace_path.read_text(encoding="utf-8"))
+    spans = {e["name"]: e for e in trace["traceEvents"] if e["ph"] == "X"}
+    assert spans["RNS.PKT.CONST.A"]["cat"] == "atom" and spans["RNS.PKT.CONST.A"]["dur"] >= 2000
+    assert spans["load"]["ts"] <= spans["RNS.PKT.CONST.A"]["ts"]
+    assert spans["RNS/Packet.py"]["args"] == {"lines": "10-12", "atom": "RNS.PKT.CONST.A"}
+    assert any(e["ph"] == "C" and e["name"] == "peak_rss" for e in trace["traceEvents"])
+    assert "RNS.PKT.CONST.A" in summary.getvalue() and "profile: trace written to" in summary.getvalue()
+
+
+def test_summary_orders_slowest_first():
+    prof = profiling.Profiler("tool")
+    with prof.span("tool"):
+        with prof.span("check_atoms"):
+            for aid, delay in (("A.FAST", 0), ("A.SLOW", 0.003), ("A.MID", 0.001)):
+                with prof.span(aid, "atom"):
+                    time.sleep(delay)
+    lines = prof.summary(top=2).splitlines()
+    assert lines[0].startswith("profile: ")
+    assert lines[2].endswith("  check_atoms")
+    assert "slowest atoms (top 2 of 3" in lines[3]
+    assert lines[4].endswith("  A.SLOW") and lines[5].endswith("  A.MID")
+    assert len(lines) == 6
+
+
+def test_thread_pool_spans_nest_under_submitter():
+    prof = profiling.Profiler("tool")
+
+    def work(rev):
+        with prof.span("validate", revision=rev):
+            time.sleep(0.05)
+
+    t0 = time.perf_counter_ns()
+    with prof.span("tool"):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(profiling.in_context(work), ("A", "B")))
+    elapsed = time.perf_counter_ns() - t0
+    assert sorted((name, depth) for _, name, depth, *_ in prof.spans) == [("tool", 0), ("validate", 1), ("validate", 1)]
+    lines = prof.summary().splitlines()
+    assert "in 1 top-level span(s)" in lines[0]
+    assert float(lines[0].split()[1]) <= elapsed / 1e6 + 0.05  # one wall span, not the sum; summary rounds to 0.1 ms
+    assert sum(line.endswith("  validate (revision=A)") or line.endswith("  validate (revision=B)") for line in lines) == 2
+
+
+def test_disabled_is_noop(tmp_path):
+    assert not profiling.enabled()
+    assert profiling.span("x") is profiling.span("y", "atom", lines="1-2")
+    with profiling.session(None, "tool") as prof:
+        assert prof is None
+        with profiling.span("x"):
+            pass
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_generate_vectors_profile(tmp_path):
+    trace_path = tmp_path / "trace.json"
+    proc = subprocess.run(
+        [sys.executable, str(REPO_ROOT / "tools" / "generate_vectors.py"), "--vectors-dir", str(tmp_path / "vectors"), "--profile", str(trace_path)],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert "gen_signalling_vectors" in proc.stderr and "hdlc_framing.yaml" in proc.stderr
+    names = {e["name"] for e in json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"] if e["ph"] == "X"}
+    assert {"generate_vectors", "load_ssot", "gen_hashable_part_vectors", "kiss_framing.yaml"} <= names
+    for path in (REPO_ROOT / "tests" / "vectors").glob("*.*"):
+        assert (tmp_path / "vectors" / path.name).read_bytes() == path.read_bytes()
@@ -0,0 +1,91 @@
+"""
+Seeded random vector tests (tools/random_vectors.py, generate_vectors.py --random).
+
+- The same seed gives byte-identical shards and index for any worker count; another seed differs.
+- A shorter run's shards are prefixes of a longer run's (shard streams do not depend on N).
+- index.json records each shard's sha256; verify_index reports edits and missing shards.
+- Every random vector agrees with the scalar reference transforms.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+
+import generate_vectors as gv
+import random_vectors
+
+LIMITS = random_vectors.Limits()
+
+
+def _tree(root: Path) -> dict[str, bytes]:
+    return {str(p.relative_to(root)): p.read_bytes() for p in sorted(root.rglob("*")) if p.is_file()}
+
+
+def _vectors(root: Path, family: str) -> list[dict]:
+    return [json.loads(line) for p in sorted((root / family).glob("*.jsonl")) for line in p.read_text(encoding="utf-8").splitlines()]
+
+
+@pytest.fixture(scope="module")
+def run(tmp_path_factory):
+    root = tmp_path_factory.mktemp("random") / "seq"
+    random_vectors.generate_random(root, 250, 7, LIMITS, jobs=1, shard_size=100)
+    return root
+
+
+def test_same_seed_identical_for_any_job_count(run, tmp_path):
+    index = random_vectors.generate_random(tmp_path / "par", 250, 7, LIMITS, jobs=2, shard_size=100)
+    assert _tree(tmp_path / "par") == _tree(run)
+    assert [len(f["shards"]) for f in index["families"].values()] == [3] * len(random_vectors.FAMILIES)
+    random_vectors.generate_random(tmp_path / "other", 250, 8, LIMITS, shard_size=100)
+    assert _tree(tmp_path / "other")["hashable_part/hashable_part-00000.jsonl"] != _tree(run)["hashable_part/hashable_part-00000.jsonl"]
+
+
+def test_shorter_run_is_prefix(run, tmp_path):
+    random_vectors.generate_random(tmp_path, 150, 7, LIMITS, shard_size=100, families=("ifac_masking",))
+    short, full = _tree(tmp_path), _tree(run)
+    assert short["ifac_masking/ifac_masking-00000.jsonl"] == full["ifac_masking/ifac_masking-00000.jsonl"]
+    assert full["ifac_masking/ifac_masking-00001.jsonl"].startswith(short["ifac_masking/ifac_masking-00001.jsonl"])
+    random_vectors.generate_random(tmp_path, 50, 7, LIMITS, shard_size=100, families=("ifac_masking",))
+    assert sorted(p.name for p in (tmp_path / "ifac_masking").iterdir()) == ["ifac_masking-00000.jsonl"]
+
+
+def test_index_sha256(run, tmp_path):
+    index = json.loads((run / "index.json").read_text(encoding="utf-8"))
+    assert index["seed"] == 7 and index["limits"]["mtu"] == LIMITS.mtu
+    for family in index["families"].values():
+        assert sum(s["count"] for s in family["shards"]) == family["count"] == 250
+        for shard in family["shards"]:
+            assert hashlib.sha256((run / shard["file"]).read_bytes()).hexdigest() == shard["sha256"]
+    assert random_vectors.verify_index(run) == []
+    random_vectors.generate_random(tmp_path, 20, 7, LIMITS, families=("signalling_bytes",))
+    (tmp_path / "signalling_bytes" / "signalling_bytes-00000.jsonl").write_text("{}\n", encoding="utf-8")
+    assert random_vectors.verify_index(tmp_path) == ["signalling_bytes/signalling_bytes-00000.jsonl: sha256 mismatch"]
+
+
+def test_vectors_match_reference(run):
+    for v in _vectors(run, "hashable_part"):
+        packet = bytes.fromhex(v["packet_hex"])
+        assert len(packet) <= LIMITS.mtu and (packet[0] & 0x40 != 0) == (v["header_type"] == 2)
+        assert gv.sha256_hex(bytes.fromhex(v["expected_hashable_hex"])) == v["expected_sha256_hex"]
+        assert gv.hashable_part(packet, v["header_type"]).hex() == v["expected_hashable_hex"]
+    for v in _vectors(run, "signalling_bytes"):
+        assert gv.decode_signalling_bytes(bytes.fromhex(v["expected_bytes_hex"])) == (v["expected_mtu"], v["expected_mode"])
+    for v in _vectors(run, "link_id_from_linkrequest"):
+        part = bytes.fromhex(v["hashable_part_before_strip_hex"])
+        assert v["data_len"] in (64, 67) and len(part) == v["data_len"]
+        assert hashlib.sha256(part[:64]).digest()[:16].hex() == v["expected_link_id_hex"]
+    sizes = set()
+    for v in _vectors(run, "ifac_masking"):
+        canonical, ifac, key = (bytes.fromhex(v[k]) for k in ("canonical_packet_hex", "ifac_bytes_hex", "ifac_key_hex"))
+        sizes.add(len(ifac))
+        assert 1 <= len(ifac) <= 64 and len(canonical) + len(ifac) <= LIMITS.mtu
+        assert gv.ifac_mask_transform(canonical, ifac, key).hex() == v["expected_on_wire_hex"]
+        assert v["expected_recovered_canonical_hex"] == v["canonical_packet_hex"]
+    assert len(sizes) > 30
+
+
+def test_unknown_family(tmp_path):
+    with pytest.raises(ValueError, match="unknown vector families: nope"):
+        random_vectors.generate_random(tmp_path, 1, 0, LIMITS, families=("nope",))
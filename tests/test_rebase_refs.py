@@ -0,0 +1,173 @@
+"""
+Reference rebasing tests (tools/rebase_refs.py) against a throwaway git repository.
+
+- Shifted references keep byte-identical excerpts at NEW; unchanged ones keep their lines.
+- Ranges overlapping a hunk (or with lines inserted inside) are reported as changed and
+  widened over the replacement; removed ranges and deleted files are reported as deleted.
+- Renamed files carry references to the new path.
+- Exhaustive check: for every range in a randomly edited file, an excerpt-preserving edit is
+  never reported as changed, and shifted excerpts are identical.
+- CLI: rewrites the SSOT (manifest.repo_revision and source_of_truth commit) and re-verifies
+  only changed references.
+"""
+
+import os
+import random
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import rebase_refs
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not on PATH")
+
+OLD_PY = "".join(f"LINE_{i} = {i}\n" for i in range(1, 41))
+
+
+def _git(root: Path, *args: str) -> str:
+    env = dict(os.environ, GIT_AUTHOR_NAME="t", GIT_AUTHOR_EMAIL="t@t", GIT_COMMITTER_NAME="t", GIT_COMMITTER_EMAIL="t@t")
+    return subprocess.run(["git", "-C", str(root), *args], capture_output=True, text=True, check=True, env=env).stdout.strip()
+
+
+def _commit(root: Path, files: dict[str, str | None]) -> str:
+    for relpath, text in files.items():
+        path = root / relpath
+        if text is None:
+            _git(root, "rm", "-q", relpath)
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+        _git(root, "add", relpath)
+    _git(root, "commit", "-q", "-m", "c", "--allow-empty")
+    return _git(root, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "vendor"
+    root.mkdir()
+    _git(root, "init", "-q")
+    return root
+
+
+def _lines(text: str, start: int, end: int) -> list[str]:
+    return text.splitlines()[start - 1 : end]
+
+
+def _ref(relpath, start, end, symbol="LINE"):
+    return {"file": relpath, "symbol": symbol, "role": "definition", "lines": {"start": start, "end": end}}
+
+
+def test_shift_change_delete_rename(repo):
+    old = _commit(repo, {"a.py": OLD_PY, "gone.py": "X = 1\n", "moved.py": OLD_PY})
+    new_lines = OLD_PY.splitlines()
+    new_lines[0:0] = ["# one", "# two", "# three"]  # +3 before everything
+    new_lines[3 + 19] = "LINE_20 = 2000"  # change old line 20
+    del new_lines[3 + 29 : 3 + 32]  # delete old lines 30-32
+    new_py = "\n".join(new_lines) + "\n"
+    new = _commit(repo, {"a.py": new_py, "gone.py": None})
+    _git(repo, "mv", "moved.py", "renamed.py")
+    new = _commit(repo, {})
+
+    data = {
+        "atoms": [
+            {"id": "SHIFT", "references": [_ref("a.py", 5, 8)]},
+            {"id": "CHANGE", "references": [_ref("a.py", 18, 22)]},
+            {"id": "PARTIAL", "references": [_ref("a.py", 28, 31)]},
+            {"id": "REMOVED", "references": [_ref("a.py", 30, 32)]},
+            {"id": "AFTER", "references": [_ref("a.py", 35, 40)]},
+            {"id": "GONE", "references": [_ref("gone.py", 1, 1)]},
+            {"id": "MOVED", "references": [_ref("moved.py", 2, 3)]},
+        ]
+    }
+    diffs = rebase_refs.parse_unified_diff(rebase_refs.git_diff(repo, old, new))
+    results = {r.atom_id: r for r in rebase_refs.rebase_refs(data, diffs)}
+    assert {k: r.status for k, r in results.items()} == {
+        "SHIFT": "shifted",
+        "CHANGE": "changed",
+        "PARTIAL": "changed",
+        "REMOVED": "deleted",
+        "AFTER": "unchanged",  # +3 and -3 lines before it
+        "GONE": "deleted",
+        "MOVED": "shifted",
+    }
+    assert results["SHIFT"].new == ("a.py", 8, 11)
+    assert results["CHANGE"].new == ("a.py", 21, 25)
+    assert results["PARTIAL"].new == ("a.py", 31, 32)
+    assert results["AFTER"].new == ("a.py", 35, 40)
+    assert results["MOVED"].new == ("renamed.py", 2, 3)
+    assert data["atoms"][6]["references"][0]["file"] == "renamed.py"
+    for name in ("SHIFT", "AFTER"):
+        _, s, e = results[name].old
+        _, ns, ne = results[name].new
+        assert _lines(OLD_PY, s, e) == _lines(new_py, ns, ne)
+
+
+def test_random_edits_against_brute_force(repo):
+    rng = random.Random(1234)
+    old_lines = [f"l{i}" for i in range(1, 61)]
+    old = _commit(repo, {"f.txt": "\n".join(old_lines) + "\n"})
+    for _ in range(6):
+        new_lines = list(old_lines)
+        origin = list(range(1, len(old_lines) + 1))  # old line number per new line, None if new
+        for _ in range(rng.randint(1, 4)):
+            pos = rng.randint(0, len(new_lines) - 1)
+            op = rng.choice(("insert", "delete", "replace"))
+            if op == "insert":
+                new_lines[pos:pos] = ["new"] * rng.randint(1, 3)
+                origin[pos:pos] = [None] * (len(new_lines) - len(origin))
+            elif op == "delete" and len(new_lines) > 10:
+                del new_lines[pos : pos + 2], origin[pos : pos + 2]
+            else:
+                new_lines[pos], origin[pos] = f"changed{pos}", None
+        new = _commit(repo, {"f.txt": "\n".join(new_lines) + "\n"})
+        diffs = rebase_refs.parse_unified_diff(rebase_refs.git_diff(repo, old, new))
+        for start in range(1, 61):
+            for end in range(start, min(61, start + 6)):
+                data = {"atoms": [{"id": "A", "references": [_ref("f.txt", start, end)]}]}
+                (r,) = rebase_refs.rebase_refs(data, diffs)
+                survivors = [i for i, o in enumerate(origin) if o is not None and start <= o <= end]
+                intact = len(survivors) == end - start + 1 and survivors == list(range(survivors[0], survivors[0] + len(survivors)))
+                if r.status in ("shifted", "unchanged"):
+                    assert intact, (start, end, r)
+                    assert new_lines[r.new[1] - 1 : r.new[2]] == old_lines[start - 1 : end]
+                elif r.status == "changed":
+                    assert not intact or r.new[2] - r.new[1] != end - start
+                    for i in survivors:
+                        assert r.new[1] <= i + 1 <= r.new[2]
+                else:
+                    assert not survivors
+        old_lines, old = new_lines, new
+
+
+def test_cli_rewrites_ssot(repo, tmp_path):
+    pytest.importorskip("ruamel.yaml")
+    old = _commit(repo, {"a.py": OLD_PY})
+    new = _commit(repo, {"a.py": "# header\n" + OLD_PY.replace("LINE_20 = 20", "LINE_20 = 21")})
+    ssot = tmp_path / "ssot.yaml"
+    ssot.write_text(
+        "spec_meta:\n  source_of_truth:\n    revision:\n"
+        f"      commit: \"{old}\"  # pinned\n"
+        f"manifest:\n  repo_revision: \"{old}\"\n"
+        "atoms:\n"
+        "  - id: A\n    references:\n      - file: a.py\n        symbol: LINE_5\n        lines: {start: 5, end: 5}\n"
+        "  - id: B\n    references:\n      - file: a.py\n        symbol: LINE_20\n        lines: {start: 20, end: 20}\n",
+        encoding="utf-8",
+    )
+    out = subprocess.run(
+        [sys.executable, str(REPO_ROOT / "tools" / "rebase_refs.py"), old, new, "--ssot", str(ssot), "--vendor", str(repo)],
+        capture_output=True,
+        text=True,
+    )
+    assert out.returncode == 0, out.stderr
+    assert "2 references: 0 unchanged, 1 shifted, 1 changed, 0 deleted" in out.stdout
+    assert out.stderr.count("\n") == 1 and out.stderr.startswith("B ref a.py:20-20 -> a.py:21-21 (LINE_20): excerpt changed")
+    text = ssot.read_text(encoding="utf-8")
+    assert text.count(new) == 2 and old not in text and "# pinned" in text
+    assert "lines: {start: 6, end: 6}" in text and "lines: {start: 21, end: 21}" in text
@@ -0,0 +1,143 @@
+"""
+Native Spectral engine tests (tools/spectral_rules.py against spec/rules/spectral.ssot.yaml).
+
+- The clean fixture and the repo SSOT have no findings.
+- Each mutated fixture yields exactly the expected (rule, path) findings, including Spectral's
+  JavaScript semantics ([] is truthy, `$` does not match before a trailing newline) and
+  closest-existing-path reporting for missing fields.
+- Cross-check: the Spectral CLI reports identical findings on every case (skipped unless the
+  `spectral` CLI is on PATH, as in CI).
+"""
+
+import copy
+import shutil
+from pathlib import Path
+
+import pytest
+
+import spectral_rules
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+RULESET_PATH = REPO_ROOT / "spec" / "rules" / "spectral.ssot.yaml"
+
+
+def _set(path, value):
+    def mutate(doc):
+        target = doc
+        for k in path[:-1]:
+            target = target[k]
+        target[path[-1]] = value
+
+    return mutate
+
+
+def _delete(path):
+    def mutate(doc):
+        target = doc
+        for k in path[:-1]:
+            target = target[k]
+        del target[path[-1]]
+
+    return mutate
+
+
+def _append_atom(atom):
+    return lambda doc: doc["atoms"].append(atom)
+
+
+REF = ("atoms", 0, "references", 0)
+
+# name -> (mutation, expected {(code, path)})
+CASES = {
+    "clean": (lambda doc: None, set()),
+    "no_spec_meta": (_delete(("spec_meta",)), {("spec-meta-required", ())}),
+    "no_manifest": (_delete(("manifest",)), {("manifest-required", ())}),
+    "empty_repo_revision": (_set(("manifest", "repo_revision"), ""), {("manifest-repo-revision-required", ("manifest", "repo_revision"))}),
+    "bad_id": (_set(("atoms", 0, "id"), "RNS.PKT.CONST.lower"), {("atom-id-pattern", ("atoms", 0, "id"))}),
+    "no_id": (_delete(("atoms", 0, "id")), {("atom-id-present", ("atoms", 0))}),
+    "statement_no_full_stop": (_set(("atoms", 0, "statement"), "Min header 19 bytes"), {("statement-ends-with-full-stop", ("atoms", 0, "statement"))}),
+    "statement_trailing_newline": (_set(("atoms", 0, "statement"), "Min header 19 bytes.\n"), {("statement-ends-with-full-stop", ("atoms", 0, "statement"))}),
+    "bad_role": (_set(REF + ("role",), "definitions"), {("references-role-enum", REF + ("role",))}),
+    "dotdot_file": (_set(REF + ("file",), "RNS/../x.py"), {("references-file-no-dotdot", REF + ("file",))}),
+    "absolute_file": (_set(REF + ("file",), "/RNS/x.py"), {("references-file-relative", REF + ("file",))}),
+    "ref_repo_revision": (_set(REF + ("repo_revision",), "abc"), {("references-no-repo-revision", REF + ("repo_revision",))}),
+    "ref_excerpt_hash": (_set(REF + ("excerpt_hash",), "a" * 64), {("references-no-excerpt-hash", REF + ("excerpt_hash",))}),
+    "constant_no_value": (_delete(("atoms", 0, "value")), {("constant-has-value", ("atoms", 0))}),
+    "layout_without_layout": (
+        _append_atom({"id": "RNS.PKT.LAYOUT.X", "kind": "layout", "statement": "X."}),
+        {("layout-has-fields", ("atoms", 1))},
+    ),
+    "layout_empty_fields_is_truthy": (
+        _append_atom({"id": "RNS.PKT.LAYOUT.X", "kind": "layout", "statement": "X.", "layout": {"fields": []}}),
+        set(),
+    ),
+    "layout_missing_fields": (
+        _append_atom({"id": "RNS.PKT.LAYOUT.X", "kind": "layout", "statement": "X.", "layout": {"endianness": "big"}}),
+        {("layout-has-fields", ("atoms", 1, "layout"))},
+    ),
+    "algorithm_empty_steps": (
+        _append_atom({"id": "RNS.PKT.ALG.X", "kind": "algorithm", "statement": "X.", "algorithm": {"steps": None}}),
+        {("algorithm-has-steps", ("atoms", 1, "algorithm", "steps"))},
+    ),
+    "behaviour_empty_statement": (
+        _append_atom({"id": "RNS.TRN.BEHAV.X", "kind": "behaviour", "statement": ""}),
+        {("behaviour-has-statement", ("atoms", 1, "statement")), ("statement-ends-with-full-stop", ("atoms", 1, "statement"))},
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def rules(load_yaml):
+    load_yaml(RULESET_PATH)
+    return spectral_rules.load_ruleset(RULESET_PATH)
+
+
+@pytest.fixture(scope="module")
+def clean_doc(load_yaml):
+    return load_yaml(FIXTURES_DIR / "ssot_vnext_clean.yaml")
+
+
+def _case_doc(clean_doc, name):
+    doc = copy.deepcopy(clean_doc)
+    CASES[name][0](doc)
+    return doc
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_native_findings(rules, clean_doc, name):
+    findings = spectral_rules.lint(_case_doc(clean_doc, name), rules)
+    assert {(f.code, f.path) for f in findings} == CASES[name][1]
+    assert all(f.severity == "error" for f in findings)
+
+
+def test_repo_ssot_is_clean(rules, load_yaml):
+    assert spectral_rules.lint(load_yaml(REPO_ROOT / "spec" / "reticulum-wire-format.ssot.yaml"), rules) == []
+
+
+def test_jsonpath_subset():
+    doc = {"a": [{"k": "x", "v": 1}, {"k": "y", "v": 2}, {"v": 3}], "b": {"c": {"d": 4}}}
+    assert spectral_rules.compile_jsonpath("$.a[?(@.k=='y')].v")(doc) == [(2, ("a", 1, "v"))]
+    assert spectral_rules.compile_jsonpath("$.a[?(@.k != 'y')]")(doc) == [(doc["a"][0], ("a", 0)), (doc["a"][2], ("a", 2))]
+    assert spectral_rules.compile_jsonpath("$.a[-1].v")(doc) == [(3, ("a", 2, "v"))]
+    assert spectral_rules.compile_jsonpath("$['b'].*.d")(doc) == [(4, ("b", "c", "d"))]
+    assert spectral_rules.compile_jsonpath("$.missing[*]")(doc) == []
+    with pytest.raises(ValueError):
+        spectral_rules.compile_jsonpath("$..deep")
+
+
+def test_unsupported_function_rejected():
+    with pytest.raises(ValueError, match="unsupported function"):
+        spectral_rules.compile_ruleset({"rules": {"r": {"given": "$", "then": {"function": "schema"}}}})
+
+
+@pytest.mark.skipif(shutil.which("spectral") is None, reason="Spectral CLI not on PATH")
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_node_engine_matches_native(rules, clean_doc, tmp_path, name):
+    import yaml
+
+    doc = _case_doc(clean_doc, name)
+    path = tmp_path / f"{name}.yaml"
+    path.write_text(yaml.safe_dump(doc, sort_keys=False, allow_unicode=True), encoding="utf-8")
+    node = spectral_rules.run_spectral_cli(path, RULESET_PATH, cwd=REPO_ROOT, timeout=120)
+    assert spectral_rules.diff_findings(spectral_rules.lint(doc, rules), node) == []
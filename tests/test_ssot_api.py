@@ -0,0 +1,50 @@
+"""
+Toolchain API tests (tools/ssot.py).
+
+- load() parses once; the SSOT object carries raw bytes (sha256) and one shared VendorIndex.
+- generate_vectors(doc) is byte-identical to the committed tests/vectors.
+- validate(doc) runs in-process: no subprocess (extract_refs, Spectral CLI) with the native engine.
+"""
+
+import filecmp
+import hashlib
+import subprocess
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SSOT_PATH = REPO_ROOT / "spec" / "reticulum-wire-format.ssot.yaml"
+
+pytest.importorskip("yaml")
+pytest.importorskip("ruamel.yaml")
+
+import ssot  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def doc():
+    return ssot.load(SSOT_PATH)
+
+
+def test_load(doc):
+    assert doc.sha256 == hashlib.sha256(SSOT_PATH.read_bytes()).hexdigest()
+    assert doc.atoms and all("id" in a for a in doc.atoms)
+    assert doc.index is doc.index
+
+
+def test_generate_vectors_matches_committed(doc, tmp_path):
+    assert ssot.generate_vectors(doc, tmp_path) == 0
+    written = sorted(p.name for p in tmp_path.glob("*.yaml"))
+    assert written
+    for name in written:
+        assert filecmp.cmp(tmp_path / name, REPO_ROOT / "tests" / "vectors" / name, shallow=False), name
+
+
+def test_validate_is_in_process(doc, monkeypatch):
+    def no_subprocess(*args, **kwargs):
+        raise AssertionError(f"unexpected subprocess: {args[0] if args else kwargs}")
+
+    monkeypatch.setattr(subprocess, "run", no_subprocess)
+    errors = ssot.validate(doc)
+    assert not any(e.startswith(("Spectral", "JSON Schema")) for e in errors), errors
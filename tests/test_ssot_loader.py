@@ -0,0 +1,57 @@
+"""
+Fast SSOT loader tests (tools/ssot_loader.py).
+
+- CSafeLoader and the pure-Python SafeLoader build identical trees for the repo SSOT.
+- A warm parse-cache load returns the same tree as the cold parse, as an independent copy.
+- Changed content gets a new cache entry; a corrupt entry is re-parsed and rewritten.
+"""
+
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SSOT_PATH = REPO_ROOT / "spec" / "reticulum-wire-format.ssot.yaml"
+
+yaml = pytest.importorskip("yaml")
+
+import ssot_loader  # noqa: E402
+
+
+def test_c_and_pure_loaders_agree():
+    if not hasattr(yaml, "CSafeLoader"):
+        pytest.skip("PyYAML built without libyaml")
+    text = SSOT_PATH.read_text(encoding="utf-8")
+    assert yaml.load(text, Loader=yaml.CSafeLoader) == yaml.load(text, Loader=yaml.SafeLoader)
+
+
+def test_warm_load_matches_cold(tmp_path):
+    raw, cold = ssot_loader.load_yaml_bytes(SSOT_PATH, tmp_path)
+    assert raw == SSOT_PATH.read_bytes()
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+    _, warm = ssot_loader.load_yaml_bytes(SSOT_PATH, tmp_path)
+    assert warm == cold == ssot_loader.parse_yaml(raw)
+    warm["atoms"].clear()
+    assert ssot_loader.load_yaml(SSOT_PATH, tmp_path) == cold
+
+
+def test_changed_content_new_entry(tmp_path):
+    src = tmp_path / "doc.yaml"
+    cache = tmp_path / "cache"
+    src.write_text("a: 1\n", encoding="utf-8")
+    assert ssot_loader.load_yaml(src, cache) == {"a": 1}
+    src.write_text("a: 2\n", encoding="utf-8")
+    assert ssot_loader.load_yaml(src, cache) == {"a": 2}
+    assert len(list(cache.glob("*.pickle"))) == 2
+
+
+def test_corrupt_entry_reparsed(tmp_path):
+    src = tmp_path / "doc.yaml"
+    cache = tmp_path / "cache"
+    src.write_text("a: [1, 2]\n", encoding="utf-8")
+    ssot_loader.load_yaml(src, cache)
+    (entry,) = cache.glob("*.pickle")
+    entry.write_bytes(b"not a pickle")
+    assert ssot_loader.load_yaml(src, cache) == {"a": [1, 2]}
+    assert ssot_loader.load_yaml(src, cache) == {"a": [1, 2]}
+    assert entry.read_bytes() != b"not a pickle"
@@ -1,63 +1,100 @@
 """
 Schema tests: manifest.repo_revision, no repo_revision/excerpt_hash in atoms.
 
+The schema is compiled once for the module (tools/ssot_schema.py).
 - New payload (manifest, refs without repo_revision/excerpt_hash) passes schema.
-- ref.repo_revision or ref.excerpt_hash → schema validation fails.
+- ref.repo_revision or ref.excerpt_hash → schema validation fails, naming the atom.
+- Every error is reported in one pass, document-level first, and the compiled validator agrees
+  with jsonschema.validate on the real SSOT and on broken payloads.
 """
 
+import copy
 import json
 from pathlib import Path
 
 import pytest
 
+import ssot_schema
 
 FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
 REPO_ROOT = Path(__file__).resolve().parent.parent
 SCHEMA_PATH = REPO_ROOT / "spec" / "schema" / "reticulum-wire-format.ssot.schema.json"
 
 
-def _load_yaml(path: Path):
-    try:
-        import yaml
-        with open(path, encoding="utf-8") as f:
-            return yaml.safe_load(f)
-    except ImportError:
-        pytest.skip("PyYAML required")
+@pytest.fixture(scope="module")
+def schema():
+    return ssot_schema.load(SCHEMA_PATH)
 
 
-def test_new_payload_passes_schema():
+@pytest.fixture(scope="module")
+def clean(load_yaml):
+    return load_yaml(FIXTURES_DIR / "ssot_vnext_clean.yaml")
+
+
+@pytest.fixture
+def data(clean):
+    return copy.deepcopy(clean)
+
+
+def test_new_payload_passes_schema(schema, data):
     """Payload with manifest.repo_revision and refs without repo_revision/excerpt_hash passes JSON schema."""
-    path = FIXTURES_DIR / "ssot_vnext_clean.yaml"
-    data = _load_yaml(path)
     assert data is not None
     assert data.get("manifest", {}).get("repo_revision") == "286a78ef8c58ca4503af2b0211b3a2d7e385467c"
-    with open(SCHEMA_PATH, encoding="utf-8") as f:
-        schema = json.load(f)
-    import jsonschema
-    jsonschema.validate(instance=data, schema=schema)
+    assert schema.errors(data) == []
 
 
-def test_new_payload_rejects_ref_repo_revision():
+def test_new_payload_rejects_ref_repo_revision(schema, data):
     """Schema rejects ref.repo_revision (additionalProperties)."""
-    path = FIXTURES_DIR / "ssot_vnext_clean.yaml"
-    data = _load_yaml(path)
-    assert data is not None
     data["atoms"][0]["references"][0]["repo_revision"] = "286a78ef8c58ca4503af2b0211b3a2d7e385467c"
-    with open(SCHEMA_PATH, encoding="utf-8") as f:
-        schema = json.load(f)
-    import jsonschema
-    with pytest.raises(jsonschema.ValidationError):
-        jsonschema.validate(instance=data, schema=schema)
+    (error,) = schema.errors(data)
+    assert error.startswith("RNS.PKT.CONST.HEADER_MINSIZE: $.references[0]: ") and "'repo_revision'" in error
 
 
-def test_new_payload_rejects_ref_excerpt_hash():
+def test_new_payload_rejects_ref_excerpt_hash(schema, data):
     """Schema rejects ref.excerpt_hash (additionalProperties)."""
-    path = FIXTURES_DIR / "ssot_vnext_clean.yaml"
-    data = _load_yaml(path)
-    assert data is not None
     data["atoms"][0]["references"][0]["excerpt_hash"] = "a" * 64
-    with open(SCHEMA_PATH, encoding="utf-8") as f:
-        schema = json.load(f)
+    (error,) = schema.errors(data)
+    assert error.startswith("RNS.PKT.CONST.HEADER_MINSIZE: $.references[0]: ") and "'excerpt_hash'" in error
+
+
+def test_all_errors_reported_with_atom_ids(schema, data):
+    data["spec_meta"]["ssot_version"] = "x"
+    second = copy.deepcopy(data["atoms"][0])
+    second["id"] = "RNS.PKT.CONST.SECOND"
+    del second["statement"]
+    data["atoms"][0]["kind"] = "nope"
+    data["atoms"].append(second)
+    errors = schema.errors(data)
+    assert len(errors) == 3
+    assert errors[0].startswith("$.spec_meta.ssot_version: 'x' does not match")
+    assert errors[1].startswith("RNS.PKT.CONST.HEADER_MINSIZE: $.kind: 'nope' is not one of")
+    assert errors[2] == "RNS.PKT.CONST.SECOND: $: 'statement' is a required property"
+    assert schema.document_errors({"spec_meta": {}, "manifest": {}, "atoms": "x"})
+
+
+def test_agrees_with_jsonschema_validate(schema, clean, load_yaml):
     import jsonschema
-    with pytest.raises(jsonschema.ValidationError):
-        jsonschema.validate(instance=data, schema=schema)
+
+    with open(SCHEMA_PATH, encoding="utf-8") as f:
+        raw_schema = json.load(f)
+    real = load_yaml(REPO_ROOT / "spec" / "reticulum-wire-format.ssot.yaml")
+    broken = copy.deepcopy(clean)
+    broken["atoms"][0]["references"] = []
+    for doc, valid in ((real, True), (clean, True), (broken, False)):
+        assert (schema.errors(doc) == []) is valid
+        if valid:
+            jsonschema.validate(instance=doc, schema=raw_schema)
+        else:
+            with pytest.raises(jsonschema.ValidationError):
+                jsonschema.validate(instance=doc, schema=raw_schema)
+    assert ssot_schema.load(SCHEMA_PATH) is schema
+
+
+def test_inline_refs():
+    root = {
+        "$defs": {"a": {"type": "string"}, "node": {"properties": {"next": {"$ref": "#/$defs/node"}}}},
+        "properties": {"x": {"$ref": "#/$defs/a", "minLength": 1}, "y": {"$ref": "#/$defs/node"}},
+    }
+    inlined = ssot_schema.inline_refs(root, root)
+    assert inlined["properties"]["x"] == {"minLength": 1, "allOf": [{"type": "string"}]}
+    assert inlined["properties"]["y"] == {"properties": {"next": {"$ref": "#/$defs/node"}}}
@@ -0,0 +1,138 @@
+"""
+Persistent symbol index tests (tools/symbol_index.py, extract_refs --fill).
+
+- SymbolIndex.fill gives the ranges written out in FILLED for every file and symbol.
+- A saved index answers a new run without parsing any vendor file; a changed file is re-indexed;
+  another repo_revision gets its own index.
+- Parallel indexing (jobs > 1) builds the same records as in-process indexing.
+- process_refs(fill=True) fills unique symbols and reports every ambiguous or missing symbol
+  in one pass, with candidate lines.
+"""
+
+import copy
+
+import pytest
+
+import extract_refs
+from symbol_index import SymbolIndex
+from vendor_index import VendorFile
+
+PY_SOURCE = '''"""Module."""
+MTU = 500
+HEADER_MINSIZE  = 2 + 1 + 16
+
+
+class Packet:
+    HEADER_1 = 0x00
+    HEADER_2 = 0x01
+
+    def pack(self):
+        return self.MTU
+
+
+def pack():
+    return Packet.HEADER_1
+'''
+
+FILES = {
+    "RNS/Packet.py": PY_SOURCE,
+    "RNS/Link.py": PY_SOURCE.replace("Packet", "Link").replace("MTU = 500", "ECPUBSIZE = 64"),
+    "docs/notes.txt": "MTU is 500\nno symbol here\nMTU again\n",
+}
+SYMBOLS = ["MTU", "HEADER_MINSIZE", "Packet", "Link", "pack", "HEADER_1", "ECPUBSIZE", "missing", "x = 1"]
+REV = "a" * 40
+# (relpath, symbol) -> fill window; every other pair is ambiguous or not found
+FILLED = {
+    ("RNS/Packet.py", "MTU"): (1, 4),
+    ("RNS/Packet.py", "HEADER_MINSIZE"): (1, 5),
+    ("RNS/Packet.py", "Packet"): (6, 11),
+    ("RNS/Packet.py", "HEADER_1"): (5, 9),
+    ("RNS/Link.py", "MTU"): (9, 13),
+    ("RNS/Link.py", "HEADER_MINSIZE"): (1, 5),
+    ("RNS/Link.py", "Link"): (6, 11),
+    ("RNS/Link.py", "HEADER_1"): (5, 9),
+    ("RNS/Link.py", "ECPUBSIZE"): (1, 4),
+}
+
+
+@pytest.fixture
+def vendor(tmp_path):
+    root = tmp_path / "vendor"
+    for relpath, text in FILES.items():
+        (root / relpath).parent.mkdir(parents=True, exist_ok=True)
+        (root / relpath).write_text(text, encoding="utf-8")
+    return root
+
+
+def _wanted():
+    return {relpath: set(SYMBOLS) for relpath in FILES}
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_fill_windows(vendor, tmp_path, jobs):
+    with SymbolIndex(vendor, REV, tmp_path / "cache") as symbols:
+        symbols.prepare(_wanted(), jobs)
+        for relpath in FILES:
+            for symbol in SYMBOLS:
+                assert symbols.fill(relpath, symbol)[0] == FILLED.get((relpath, symbol)), (relpath, symbol)
+
+
+def test_parallel_records_match_serial(vendor, tmp_path):
+    serial = SymbolIndex(vendor, REV, None)
+    parallel = SymbolIndex(vendor, REV, None)
+    serial.prepare(_wanted(), 1)
+    parallel.prepare(_wanted(), 4)
+    assert serial._files == parallel._files
+
+
+def test_saved_index_needs_no_parse(vendor, tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    with SymbolIndex(vendor, REV, cache) as symbols:
+        symbols.prepare(_wanted())
+        first = {(r, s): symbols.fill(r, s) for r in FILES for s in SYMBOLS}
+        symbols.save()
+    assert (cache / f"{REV}.pickle").is_file()
+
+    def no_parse(self):
+        raise AssertionError("vendor file re-parsed")
+
+    monkeypatch.setattr(VendorFile, "def_table", no_parse)
+    monkeypatch.setattr(VendorFile, "assignment_table", no_parse)
+    with SymbolIndex(vendor, REV, cache) as symbols:
+        symbols.prepare(_wanted())
+        assert {(r, s): symbols.fill(r, s) for r in FILES for s in SYMBOLS} == first
+        assert symbols.files_indexed == 0
+    with SymbolIndex(vendor, "b" * 40, cache) as other:
+        assert other._files == {}
+
+
+def test_changed_file_reindexed(vendor, tmp_path):
+    cache = tmp_path / "cache"
+    with SymbolIndex(vendor, REV, cache) as symbols:
+        assert symbols.fill("RNS/Packet.py", "MTU")[0] == (1, 4)
+        symbols.save()
+    (vendor / "RNS" / "Packet.py").write_text("\n\n\n\n\n" + PY_SOURCE, encoding="utf-8")
+    with SymbolIndex(vendor, REV, cache) as symbols:
+        assert symbols.fill("RNS/Packet.py", "MTU")[0] == (5, 9)
+        assert symbols.files_indexed == 1
+
+
+def test_process_refs_reports_every_ambiguous_symbol(vendor, tmp_path):
+    data = {
+        "manifest": {"repo_revision": REV},
+        "atoms": [
+            {"id": "RNS.PKT.CONST.MTU", "references": [{"file": "RNS/Packet.py", "symbol": "MTU", "role": "definition"}]},
+            {"id": "RNS.PKT.ALG.PACK", "references": [{"file": "RNS/Packet.py", "symbol": "pack", "role": "definition"}]},
+            {"id": "RNS.PKT.CONST.X", "references": [{"file": "docs/notes.txt", "symbol": "MTU", "role": "usage"}]},
+            {"id": "RNS.PKT.CONST.Y", "references": [{"file": "RNS/Link.py", "symbol": "missing", "role": "usage"}]},
+        ],
+    }
+    filled = copy.deepcopy(data)
+    errors, modified = extract_refs.process_refs(filled, vendor, fill=True, jobs=2, cache_dir=tmp_path / "cache")
+    assert modified
+    assert filled["atoms"][0]["references"][0]["lines"] == {"start": 1, "end": 4}
+    assert errors == [
+        "RNS.PKT.ALG.PACK ref RNS/Packet.py: symbol 'pack' is ambiguous: def/class at lines 10-11, 14-15; specify lines manually.",
+        "RNS.PKT.CONST.X ref docs/notes.txt: symbol 'MTU' is ambiguous: occurs on lines 1, 3; specify lines manually.",
+        "RNS.PKT.CONST.Y ref RNS/Link.py: symbol 'missing' not found; specify lines manually.",
+    ]
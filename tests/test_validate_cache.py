@@ -0,0 +1,130 @@
+"""
+validate_ssot result cache tests (tools/validate_ssot.py validate(cache_dir=...)).
+
+Uses the real SSOT against a scratch repo root (schema, Spectral ruleset and generated manifest
+copied) with a synthetic vendor tree in which one referenced file is missing, so there are errors:
+- Cold cache, warm cache and no cache give the same errors; a warm run checks no atom.
+- Editing one atom re-checks only that atom; editing a vendor file re-checks only its referrers.
+- Changing a global input (the Spectral ruleset) misses the run entry but reuses every atom.
+- The tool version hashes every tools/ module validate_ssot imports, directly or not.
+"""
+
+import ast
+import copy
+import shutil
+from pathlib import Path
+
+import pytest
+
+import validate_ssot
+from vendor_index import VendorIndex
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SSOT_PATH = REPO_ROOT / "spec" / "reticulum-wire-format.ssot.yaml"
+
+pytest.importorskip("jsonschema")
+
+
+@pytest.fixture(scope="module")
+def data(load_yaml):
+    return load_yaml(SSOT_PATH)
+
+
+@pytest.fixture
+def repo_root(tmp_path, data):
+    root = tmp_path / "repo"
+    for rel in (validate_ssot.SCHEMA_RELPATH, validate_ssot.RULESET_RELPATH, validate_ssot.MANIFEST_RELPATH):
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(REPO_ROOT / rel, root / rel)
+    spans: dict[str, int] = {}
+    for a in data["atoms"]:
+        for ref in a.get("references") or []:
+            end = int((ref.get("lines") or {}).get("end") or 0)
+            spans[ref["file"]] = max(spans.get(ref["file"], 0), end)
+    for fpath, end in sorted(spans.items())[1:]:  # first file left missing
+        path = root / "vendor" / "reticulum-source" / fpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("".join(f"line {i} of {fpath}\n" for i in range(1, end + 3)), encoding="utf-8")
+    return root
+
+
+@pytest.fixture
+def checked(monkeypatch):
+    """Atom ids passed to check_atom."""
+    ids: list[str] = []
+    real = validate_ssot.check_atom
+
+    def counting(atom, *args):
+        ids.append(atom.get("id"))
+        return real(atom, *args)
+
+    monkeypatch.setattr(validate_ssot, "check_atom", counting)
+    return ids
+
+
+def _validate(data, repo_root, cache_dir=None):
+    index = VendorIndex(repo_root / "vendor" / "reticulum-source")
+    return validate_ssot.validate(data, repo_root, SSOT_PATH, SSOT_PATH.read_bytes(), "native", index, cache_dir)
+
+
+def test_cached_result_is_identical(tmp_path, data, repo_root, checked):
+    expected = _validate(data, repo_root)
+    assert any(e.startswith("extract_refs: ") for e in expected)
+    checked.clear()
+    assert _validate(data, repo_root, tmp_path / "cache") == expected
+    assert len(checked) == len(data["atoms"])
+    checked.clear()
+    assert _validate(data, repo_root, tmp_path / "cache") == expected
+    assert checked == []
+
+
+def test_one_atom_edit_rechecks_one_atom(tmp_path, data, repo_root, checked):
+    _validate(data, repo_root, tmp_path / "cache")
+    edited = copy.deepcopy(data)
+    edited["atoms"][3]["references"][0]["lines"] = {"start": 2, "end": 1}
+    edited["atoms"][4]["id"] = edited["atoms"][5]["id"]
+    checked.clear()
+    errors = _validate(edited, repo_root, tmp_path / "cache")
+    assert checked == [edited["atoms"][3]["id"], edited["atoms"][4]["id"]]
+    assert f"Duplicate atom id: {edited['atoms'][5]['id']}" in errors
+    assert errors == _validate(edited, repo_root)
+
+
+def test_vendor_edit_rechecks_referrers(tmp_path, data, repo_root, checked):
+    _validate(data, repo_root, tmp_path / "cache")
+    atoms = data["atoms"]
+    fpath = sorted({ref["file"] for a in atoms for ref in a.get("references") or []})[1]
+    referrers = [a["id"] for a in atoms if any(r.get("file") == fpath for r in a.get("references") or [])]
+    target = repo_root / "vendor" / "reticulum-source" / fpath
+    target.write_text("# changed\n" + target.read_text(encoding="utf-8"), encoding="utf-8")
+    checked.clear()
+    errors = _validate(data, repo_root, tmp_path / "cache")
+    assert checked == referrers
+    assert errors == _validate(data, repo_root)
+
+
+def test_global_input_change_reuses_atoms(tmp_path, data, repo_root, checked):
+    expected = _validate(data, repo_root, tmp_path / "cache")
+    ruleset = repo_root / validate_ssot.RULESET_RELPATH
+    ruleset.write_text(ruleset.read_text(encoding="utf-8") + "\n# comment\n", encoding="utf-8")
+    checked.clear()
+    assert _validate(data, repo_root, tmp_path / "cache") == expected
+    assert checked == []
+    assert len(list((tmp_path / "cache" / "run").rglob("*.json"))) == 2
+
+
+def test_tool_version_covers_imported_modules():
+    tools = REPO_ROOT / "tools"
+    local = {p.stem for p in tools.glob("*.py")}
+    seen, todo = set(), ["validate_ssot"]
+    while todo:
+        name = todo.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        for node in ast.walk(ast.parse((tools / f"{name}.py").read_text(encoding="utf-8"))):
+            if isinstance(node, ast.Import):
+                todo.extend(a.name for a in node.names if a.name in local)
+            elif isinstance(node, ast.ImportFrom) and node.module in local:
+                todo.append(node.module)
+    assert {f"{name}.py" for name in seen - {"profiling"}} == set(validate_ssot._TOOL_SOURCES)
@@ -0,0 +1,44 @@
+"""
+Vector-level collection tests (tests/conftest.py).
+
+- Vector tests are collected once per vector, with the vector name as id.
+- --vector-shard=K/N slices are disjoint and together cover the unsharded collection.
+- --random-vectors adds the vectors of a generate_vectors.py --random directory; bad shard specs are usage errors.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import random_vectors
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _collect(*args: str) -> tuple[int, list[str]]:
+    proc = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-o", "addopts=", "-q", "-p", "no:cacheprovider", "tests/test_vectors.py", *args],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+    )
+    return proc.returncode, [line for line in proc.stdout.splitlines() if line.startswith("tests/")]
+
+
+def test_ids_and_shards(tmp_path):
+    code, full = _collect()
+    assert code == 0
+    assert "tests/test_vectors.py::test_ifac_on_wire_match[canonical19_ifac1_key0]" in full
+    assert "tests/test_vectors.py::test_signalling_decode[decode_mtu500_mode3]" in full
+    assert not any("test_signalling_decode[encode_" in nodeid for nodeid in full)  # keys= filter
+    shards = [set(_collect(f"--vector-shard={k}/3")[1]) for k in (1, 2, 3)]
+    common = shards[0] & shards[1] & shards[2]  # tests without vectors run in every shard
+    assert common and all("test_family_has_vectors" in n or "test_binary_matches_yaml" in n for n in common)
+    assert sum(len(s - common) for s in shards) == len(set().union(*shards) - common)  # vector cases are disjoint
+    assert set().union(*shards) == set(full)
+
+    random_vectors.generate_random(tmp_path, 5, 1, random_vectors.Limits(), families=("link_id_from_linkrequest",))
+    code, with_random = _collect("--random-vectors", str(tmp_path))
+    assert code == 0 and "tests/test_vectors.py::test_link_id_strip_rule[random_4]" in with_random
+    assert len(with_random) == len(full) + 5 * 2
+    assert _collect("--vector-shard=0/2")[0] != 0
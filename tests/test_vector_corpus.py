@@ -0,0 +1,56 @@
+"""
+Binary vector corpus tests (tools/vector_corpus.py).
+
+- Documents round-trip exactly: None, bools, big ints, text, lists and nested maps; "_hex"
+  strings come back as the same hex (or bytes with as_hex=False); non-canonical hex stays text.
+- VectorFile gives random access and the equivalence hash of the document.
+- Foreign, truncated or unsupported input raises.
+"""
+
+
+import pytest
+
+import vector_corpus
+
+DOC = {
+    "meta": {"note": "n", "flag": 0x7E, "big": 2**70, "neg": -(2**64), "none": None},
+    "vectors": [
+        {"name": "a", "packet_hex": "00ff10", "ok": True, "chunk_sizes": [1, 2]},
+        {"name": "b", "packet_hex": "", "expected_frames_hex": ["7e", "7d5e"], "ok": False},
+        {"name": "c", "packet_hex": "ABCD", "odd_hex": "abc", "expected_frames": [{"port": 0, "data_hex": "00"}]},
+    ],
+}
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "doc.rvec"
+    vector_corpus.write(DOC, path)
+    assert vector_corpus.read(path) == DOC
+    raw = vector_corpus.read(path, as_hex=False)["vectors"]
+    assert raw[0]["packet_hex"] == b"\x00\xff\x10" and raw[1]["expected_frames_hex"] == [b"\x7e", b"\x7d\x5e"]
+    assert raw[2]["packet_hex"] == "ABCD" and raw[2]["odd_hex"] == "abc"  # kept as text
+    assert vector_corpus.read(path, as_hex=False)["vectors"][2]["expected_frames"][0]["data_hex"] == b"\x00"
+    vector_corpus.write({"vectors": []}, path)
+    assert vector_corpus.read(path) == {"vectors": []}
+
+
+def test_vector_file_random_access(tmp_path):
+    path = tmp_path / "doc.rvec"
+    vector_corpus.write(DOC, path)
+    with vector_corpus.VectorFile(path) as vf:
+        assert len(vf) == 3 and vf[2] == DOC["vectors"][2] and vf[-3]["name"] == "a"
+        assert vf.meta == DOC["meta"] and [v["name"] for v in vf] == ["a", "b", "c"]
+        assert vf.equivalence == vector_corpus.equivalence_hash(DOC)
+    assert vector_corpus.equivalence_hash({"vectors": [{"b": 1, "a": 2}]}) == vector_corpus.equivalence_hash({"vectors": [{"a": 2, "b": 1}]})
+
+
+def test_rejects_bad_input(tmp_path):
+    path = tmp_path / "bad.rvec"
+    for content in (b"", b"RVEX" + bytes(40), vector_corpus.dumps(DOC)[:-1], vector_corpus.dumps(DOC) + b"\0"):
+        path.write_bytes(content)
+        with pytest.raises(ValueError):
+            vector_corpus.VectorFile(path)
+    with pytest.raises(TypeError):
+        vector_corpus.dumps({"vectors": [{"x": 1.5}]})
+    with pytest.raises(ValueError, match="only meta and vectors"):
+        vector_corpus.dumps({"vectors": [], "extra": 1})
@@ -4,7 +4,10 @@ CI runs: pytest -q
 Tests MUST fail if required expected fields are missing.
 Real assertions: hashable bytes, SHA-256, link_id stability (including strip rule),
 signalling encode/decode, IFAC round-trip and on-wire/unmask.
-Tests consume only fixtures; no generator or vendor imports.
+Tests consume only fixtures; no generator or vendor imports (tools/vector_corpus.py only reads them).
+Each test runs once per vector (tests/conftest.py: ids are vector names, --vector-shard=K/N,
+--random-vectors DIR); families are read once per session, from <family>.rvec when present,
+else <family>.yaml, and the .rvec must carry the equivalence hash of the YAML next to it.
 """
 
 import hashlib
@@ -13,20 +16,31 @@ from pathlib import Path
 
 import pytest
 
+import vector_corpus
+
 VECTORS_DIR = Path(__file__).resolve().parent / "vectors"
-REPO_ROOT = Path(__file__).resolve().parent.parent
 ECPUBSIZE = 64
+FAMILIES = ("hashable_part", "ifac_masking", "link_id_from_linkrequest", "signalling_bytes", "hdlc_framing", "kiss_framing")
+
 
+@pytest.mark.parametrize("family", FAMILIES)
+def test_family_has_vectors(family, vector_family):
+    """Every family file exists and holds at least one vector."""
+    data = vector_family(family)
+    assert data is not None, f"{family}.yaml missing"
+    assert len(data.get("vectors") or []) >= 1, f"at least one {family} vector required"
 
-def _load_yaml(path: Path):
-    """Load YAML with safe loader only. Do not use yaml.load() without Loader= — use safe_load."""
-    try:
-        import yaml
 
-        with open(path, encoding="utf-8") as f:
-            return yaml.safe_load(f)
-    except ImportError:
-        pytest.skip("PyYAML required for vector tests")
+@pytest.mark.parametrize("path", sorted(VECTORS_DIR.glob("*.yaml")), ids=lambda p: p.stem)
+def test_binary_matches_yaml(path, load_yaml):
+    """Every <family>.rvec holds the same document as its YAML (equivalence hash and content)."""
+    rvec = path.with_suffix(vector_corpus.SUFFIX)
+    if not rvec.is_file():
+        pytest.skip(f"no {rvec.name}")
+    doc = load_yaml(path)
+    with vector_corpus.VectorFile(rvec) as vf:
+        assert vf.equivalence == vector_corpus.equivalence_hash(doc), f"{rvec.name} is stale; run tools/generate_vectors.py"
+    assert vector_corpus.read(rvec) == doc
 
 
 def _hashable_part(packet_bytes: bytes, header_type: int) -> bytes:
@@ -88,225 +102,247 @@ def _ifac_unmask_transform(on_wire: bytes, ifac_size: int, ifac_key: bytes) -> b
 # --- hashable_part ---
 
 
-def test_hashable_part_vectors_required_fields():
+@pytest.mark.vectors("hashable_part")
+def test_hashable_part_vectors_required_fields(vector):
     """All hashable_part vectors must have expected_hashable_hex and expected_sha256_hex."""
-    data = _load_yaml(VECTORS_DIR / "hashable_part.yaml")
-    assert data is not None, "hashable_part.yaml missing"
-    vectors = data.get("vectors") or []
-    assert len(vectors) >= 1, "at least one hashable_part vector required"
-    for v in vectors:
-        assert v.get("expected_hashable_hex"), f"vector {v.get('name')} missing expected_hashable_hex"
-        assert v.get("expected_sha256_hex"), f"vector {v.get('name')} missing expected_sha256_hex"
+    assert vector.get("expected_hashable_hex"), f"vector {vector.get('name')} missing expected_hashable_hex"
+    assert vector.get("expected_sha256_hex"), f"vector {vector.get('name')} missing expected_sha256_hex"
 
 
-def test_hashable_part_hashable_bytes_match():
+@pytest.mark.vectors("hashable_part", keys=("packet_hex", "expected_hashable_hex"))
+def test_hashable_part_hashable_bytes_match(vector):
     """Computed hashable part must match expected_hashable_hex."""
-    data = _load_yaml(VECTORS_DIR / "hashable_part.yaml")
-    if not data:
-        pytest.skip("no hashable_part.yaml")
-    for v in data.get("vectors") or []:
-        packet_hex = v.get("packet_hex")
-        expected_hex = v.get("expected_hashable_hex")
-        if not packet_hex or not expected_hex:
-            continue
-        packet = bytes.fromhex(packet_hex)
-        header_type = v.get("header_type", 1)
-        computed = _hashable_part(packet, header_type)
-        assert computed.hex() == expected_hex, f"hashable bytes mismatch for {v.get('name')}"
+    packet = bytes.fromhex(vector["packet_hex"])
+    header_type = vector.get("header_type", 1)
+    computed = _hashable_part(packet, header_type)
+    assert computed.hex() == vector["expected_hashable_hex"], f"hashable bytes mismatch for {vector.get('name')}"
 
 
-def test_hashable_part_sha256_matches():
+@pytest.mark.vectors("hashable_part")
+def test_hashable_part_sha256_matches(vector):
     """SHA-256 of expected_hashable_hex must equal expected_sha256_hex."""
-    data = _load_yaml(VECTORS_DIR / "hashable_part.yaml")
-    if not data:
-        pytest.skip("no hashable_part.yaml")
-    for v in data.get("vectors") or []:
-        expected_hex = v.get("expected_hashable_hex")
-        expected_sha = v.get("expected_sha256_hex")
-        assert expected_hex, f"vector {v.get('name')} missing expected_hashable_hex"
-        assert expected_sha, f"vector {v.get('name')} missing expected_sha256_hex"
-        raw = bytes.fromhex(expected_hex)
-        digest = hashlib.sha256(raw).hexdigest()
-        assert digest == expected_sha, f"SHA-256 mismatch for {v.get('name')}"
+    expected_hex = vector.get("expected_hashable_hex")
+    expected_sha = vector.get("expected_sha256_hex")
+    assert expected_hex, f"vector {vector.get('name')} missing expected_hashable_hex"
+    assert expected_sha, f"vector {vector.get('name')} missing expected_sha256_hex"
+    digest = hashlib.sha256(bytes.fromhex(expected_hex)).hexdigest()
+    assert digest == expected_sha, f"SHA-256 mismatch for {vector.get('name')}"
 
 
 # --- ifac_masking ---
 
 
 IFAC_KEY_BYTES = 32  # Vectors use 32-byte ifac_key (mask derivation salt).
+IFAC_FIELDS = ("canonical_packet_hex", "ifac_bytes_hex", "ifac_key_hex", "expected_on_wire_hex", "expected_recovered_canonical_hex")
 
 
-def test_ifac_masking_required_fields():
+@pytest.mark.vectors("ifac_masking")
+def test_ifac_masking_required_fields(vector):
     """All IFAC vectors must have canonical_packet_hex, ifac_bytes_hex, ifac_key_hex, expected_on_wire_hex, expected_recovered_canonical_hex."""
-    data = _load_yaml(VECTORS_DIR / "ifac_masking.yaml")
-    assert data is not None
-    vectors = data.get("vectors") or []
-    assert len(vectors) >= 1
-    for v in vectors:
-        assert v.get("canonical_packet_hex"), f"vector {v.get('name')} missing canonical_packet_hex"
-        assert v.get("ifac_bytes_hex"), f"vector {v.get('name')} missing ifac_bytes_hex"
-        assert v.get("ifac_key_hex"), f"vector {v.get('name')} missing ifac_key_hex"
-        assert v.get("expected_on_wire_hex"), f"vector {v.get('name')} missing expected_on_wire_hex"
-        assert v.get("expected_recovered_canonical_hex"), (
-            f"vector {v.get('name')} missing expected_recovered_canonical_hex"
-        )
-        ifac_key_bytes = bytes.fromhex(v["ifac_key_hex"])
-        assert len(ifac_key_bytes) == IFAC_KEY_BYTES, (
-            f"vector {v.get('name')}: ifac_key_hex must decode to {IFAC_KEY_BYTES} bytes, got {len(ifac_key_bytes)}"
-        )
-        ifac_bytes = bytes.fromhex(v["ifac_bytes_hex"])
-        assert len(ifac_bytes) >= 1, f"vector {v.get('name')}: ifac_bytes_hex must be at least 1 byte"
+    for field in IFAC_FIELDS:
+        assert vector.get(field), f"vector {vector.get('name')} missing {field}"
+    ifac_key_bytes = bytes.fromhex(vector["ifac_key_hex"])
+    assert len(ifac_key_bytes) == IFAC_KEY_BYTES, (
+        f"vector {vector.get('name')}: ifac_key_hex must decode to {IFAC_KEY_BYTES} bytes, got {len(ifac_key_bytes)}"
+    )
+    ifac_bytes = bytes.fromhex(vector["ifac_bytes_hex"])
+    assert len(ifac_bytes) >= 1, f"vector {vector.get('name')}: ifac_bytes_hex must be at least 1 byte"
+
+
+@pytest.mark.vectors("ifac_masking")
+def test_ifac_masking_recovered_equals_canonical(vector):
+    """expected_recovered_canonical_hex must equal canonical_packet_hex (round-trip consistency)."""
+    canonical = vector.get("canonical_packet_hex")
+    recovered = vector.get("expected_recovered_canonical_hex")
+    assert canonical, f"vector {vector.get('name')} missing canonical_packet_hex"
+    assert recovered, f"vector {vector.get('name')} missing expected_recovered_canonical_hex"
+    assert recovered == canonical, f"IFAC round-trip: recovered must equal canonical for {vector.get('name')}"
 
 
-def test_ifac_masking_recovered_equals_canonical():
-    """expected_recovered_canonical_hex must equal canonical_packet_hex (round-trip consistency)."""
-    data = _load_yaml(VECTORS_DIR / "ifac_masking.yaml")
-    if not data:
-        pytest.skip("no ifac_masking.yaml")
-    for v in data.get("vectors") or []:
-        canonical = v.get("canonical_packet_hex")
-        recovered = v.get("expected_recovered_canonical_hex")
-        assert canonical, f"vector {v.get('name')} missing canonical_packet_hex"
-        assert recovered, f"vector {v.get('name')} missing expected_recovered_canonical_hex"
-        assert recovered == canonical, f"IFAC round-trip: recovered must equal canonical for {v.get('name')}"
-
-
-def test_ifac_on_wire_match():
+@pytest.mark.vectors("ifac_masking", keys=IFAC_FIELDS[:4])
+def test_ifac_on_wire_match(vector):
     """Computed on-wire bytes (mask transform) must match expected_on_wire_hex."""
-    data = _load_yaml(VECTORS_DIR / "ifac_masking.yaml")
-    if not data:
-        pytest.skip("no ifac_masking.yaml")
-    for v in data.get("vectors") or []:
-        canonical_hex = v.get("canonical_packet_hex")
-        ifac_hex = v.get("ifac_bytes_hex")
-        key_hex = v.get("ifac_key_hex")
-        expected_hex = v.get("expected_on_wire_hex")
-        if not all((canonical_hex, ifac_hex, key_hex, expected_hex)):
-            continue
-        canonical = bytes.fromhex(canonical_hex)
-        ifac = bytes.fromhex(ifac_hex)
-        key = bytes.fromhex(key_hex)
-        on_wire = _ifac_mask_transform(canonical, ifac, key)
-        assert on_wire.hex() == expected_hex, f"IFAC on-wire mismatch for {v.get('name')}"
+    canonical = bytes.fromhex(vector["canonical_packet_hex"])
+    ifac = bytes.fromhex(vector["ifac_bytes_hex"])
+    key = bytes.fromhex(vector["ifac_key_hex"])
+    on_wire = _ifac_mask_transform(canonical, ifac, key)
+    assert on_wire.hex() == vector["expected_on_wire_hex"], f"IFAC on-wire mismatch for {vector.get('name')}"
 
 
-def test_ifac_unmask_match():
+@pytest.mark.vectors("ifac_masking", keys=IFAC_FIELDS[1:])
+def test_ifac_unmask_match(vector):
     """Computed recovered canonical (unmask transform) must match expected_recovered_canonical_hex."""
-    data = _load_yaml(VECTORS_DIR / "ifac_masking.yaml")
-    if not data:
-        pytest.skip("no ifac_masking.yaml")
-    for v in data.get("vectors") or []:
-        on_wire_hex = v.get("expected_on_wire_hex")
-        ifac_hex = v.get("ifac_bytes_hex")
-        key_hex = v.get("ifac_key_hex")
-        expected_recovered = v.get("expected_recovered_canonical_hex")
-        if not all((on_wire_hex, ifac_hex, key_hex, expected_recovered)):
-            continue
-        on_wire = bytes.fromhex(on_wire_hex)
-        ifac_size = len(bytes.fromhex(ifac_hex))
-        key = bytes.fromhex(key_hex)
-        recovered = _ifac_unmask_transform(on_wire, ifac_size, key)
-        assert recovered.hex() == expected_recovered, f"IFAC unmask mismatch for {v.get('name')}"
+    on_wire = bytes.fromhex(vector["expected_on_wire_hex"])
+    ifac_size = len(bytes.fromhex(vector["ifac_bytes_hex"]))
+    key = bytes.fromhex(vector["ifac_key_hex"])
+    recovered = _ifac_unmask_transform(on_wire, ifac_size, key)
+    assert recovered.hex() == vector["expected_recovered_canonical_hex"], f"IFAC unmask mismatch for {vector.get('name')}"
 
 
 # --- link_id_from_linkrequest ---
 
 
-def test_link_id_required_fields():
+@pytest.mark.vectors("link_id_from_linkrequest")
+def test_link_id_required_fields(vector):
     """link_id vectors must have expected_link_id_hex and (hashable_part_before_strip_hex or hashable_part_hex)."""
-    data = _load_yaml(VECTORS_DIR / "link_id_from_linkrequest.yaml")
-    assert data is not None
-    vectors = data.get("vectors") or []
-    assert len(vectors) >= 1
-    for v in vectors:
-        assert v.get("expected_link_id_hex"), f"vector {v.get('name')} missing expected_link_id_hex"
-        part_hex = v.get("hashable_part_before_strip_hex") or v.get("hashable_part_hex")
-        assert part_hex, f"vector {v.get('name')} missing hashable_part_before_strip_hex or hashable_part_hex"
+    assert vector.get("expected_link_id_hex"), f"vector {vector.get('name')} missing expected_link_id_hex"
+    part_hex = vector.get("hashable_part_before_strip_hex") or vector.get("hashable_part_hex")
+    assert part_hex, f"vector {vector.get('name')} missing hashable_part_before_strip_hex or hashable_part_hex"
 
 
-def test_link_id_strip_rule():
+@pytest.mark.vectors("link_id_from_linkrequest")
+def test_link_id_strip_rule(vector):
     """Link ID = first 16 bytes of SHA-256(stripped). When data_len > 64, strip last (data_len - 64) bytes."""
-    data = _load_yaml(VECTORS_DIR / "link_id_from_linkrequest.yaml")
-    if not data:
-        pytest.skip("no link_id_from_linkrequest.yaml")
-    for v in data.get("vectors") or []:
-        part_hex = (v.get("hashable_part_before_strip_hex") or v.get("hashable_part_hex") or "").strip()
-        expected_id_raw = (v.get("expected_link_id_hex") or "").strip()
-        if not part_hex or not expected_id_raw:
-            continue
-        if len(expected_id_raw) < 32:
-            pytest.fail(
-                f"vector {v.get('name')}: expected_link_id_hex must be at least 32 hex chars, got {len(expected_id_raw)}"
-            )
-        expected_id = expected_id_raw[:32]
-        part = bytes.fromhex(part_hex)
-        data_len = v.get("data_len")
-        if data_len is not None:
-            assert len(part) == data_len, (
-                f"vector {v.get('name')}: data_len must equal len(hashable_part_before_strip): "
-                f"data_len={data_len}, len(part)={len(part)}"
-            )
-        if data_len is not None and data_len > ECPUBSIZE:
-            diff = data_len - ECPUBSIZE
-            stripped = part[:-diff]
-        else:
-            stripped = part
-        link_id_hex = hashlib.sha256(stripped).digest()[:16].hex()
-        assert link_id_hex == expected_id, f"link_id mismatch for {v.get('name')}"
+    v = vector
+    part_hex = (v.get("hashable_part_before_strip_hex") or v.get("hashable_part_hex") or "").strip()
+    expected_id_raw = (v.get("expected_link_id_hex") or "").strip()
+    if not part_hex or not expected_id_raw:
+        pytest.skip(f"vector {v.get('name')} has no hashable part or link_id")
+    if len(expected_id_raw) < 32:
+        pytest.fail(
+            f"vector {v.get('name')}: expected_link_id_hex must be at least 32 hex chars, got {len(expected_id_raw)}"
+        )
+    expected_id = expected_id_raw[:32]
+    part = bytes.fromhex(part_hex)
+    data_len = v.get("data_len")
+    if data_len is not None:
+        assert len(part) == data_len, (
+            f"vector {v.get('name')}: data_len must equal len(hashable_part_before_strip): "
+            f"data_len={data_len}, len(part)={len(part)}"
+        )
+    if data_len is not None and data_len > ECPUBSIZE:
+        diff = data_len - ECPUBSIZE
+        stripped = part[:-diff]
+    else:
+        stripped = part
+    link_id_hex = hashlib.sha256(stripped).digest()[:16].hex()
+    assert link_id_hex == expected_id, f"link_id mismatch for {v.get('name')}"
 
 
 # --- signalling_bytes ---
 
 
-def test_signalling_required_fields():
+@pytest.mark.vectors("signalling_bytes")
+def test_signalling_required_fields(vector):
     """Encode vectors need mtu, mode, expected_bytes_hex; decode vectors need bytes_hex, expected_mtu, expected_mode."""
-    data = _load_yaml(VECTORS_DIR / "signalling_bytes.yaml")
-    assert data is not None
-    vectors = data.get("vectors") or []
-    assert len(vectors) >= 1
-    for v in vectors:
-        if "expected_bytes_hex" in v:
-            assert v.get("expected_bytes_hex"), f"vector {v.get('name')} has empty expected_bytes_hex"
-        if "bytes_hex" in v and "expected_mtu" in v:
-            assert v.get("expected_mtu") is not None, f"vector {v.get('name')} missing expected_mtu"
-            assert v.get("expected_mode") is not None, f"vector {v.get('name')} missing expected_mode"
-
-
-def test_signalling_decode():
+    v = vector
+    if "expected_bytes_hex" in v:
+        assert v.get("expected_bytes_hex"), f"vector {v.get('name')} has empty expected_bytes_hex"
+    if "bytes_hex" in v and "expected_mtu" in v:
+        assert v.get("expected_mtu") is not None, f"vector {v.get('name')} missing expected_mtu"
+        assert v.get("expected_mode") is not None, f"vector {v.get('name')} missing expected_mode"
+
+
+@pytest.mark.vectors("signalling_bytes", keys=("bytes_hex", "expected_mtu", "expected_mode"))
+def test_signalling_decode(vector):
     """Decode bytes_hex -> MTU and Mode must match expected_mtu and expected_mode; re-encode must match original 3 bytes."""
-    data = _load_yaml(VECTORS_DIR / "signalling_bytes.yaml")
-    if not data:
-        pytest.skip("no signalling_bytes.yaml")
-    for v in data.get("vectors") or []:
-        if "bytes_hex" not in v or "expected_mtu" not in v or "expected_mode" not in v:
-            continue
-        raw = bytes.fromhex(v["bytes_hex"])
-        assert len(raw) == 3, f"signalling must be 3 bytes for {v.get('name')}"
-        byte0, byte1, byte2 = raw[0], raw[1], raw[2]
-        mode = (byte0 >> 5) & 0x07
-        mtu = ((byte0 & 0x1F) << 16) | (byte1 << 8) | byte2
-        assert mtu == v["expected_mtu"], f"MTU decode mismatch for {v.get('name')}"
-        assert mode == v["expected_mode"], f"Mode decode mismatch for {v.get('name')}"
-        # Re-encode must match original 3 bytes
-        re_byte0 = (mode << 5) | (mtu >> 16)
-        re_byte1 = (mtu >> 8) & 0xFF
-        re_byte2 = mtu & 0xFF
-        re_encoded = bytes([re_byte0, re_byte1, re_byte2])
-        assert re_encoded == raw, f"signalling re-encode must match bytes_hex for {v.get('name')}"
-
-
-def test_signalling_encode():
+    v = vector
+    raw = bytes.fromhex(v["bytes_hex"])
+    assert len(raw) == 3, f"signalling must be 3 bytes for {v.get('name')}"
+    byte0, byte1, byte2 = raw[0], raw[1], raw[2]
+    mode = (byte0 >> 5) & 0x07
+    mtu = ((byte0 & 0x1F) << 16) | (byte1 << 8) | byte2
+    assert mtu == v["expected_mtu"], f"MTU decode mismatch for {v.get('name')}"
+    assert mode == v["expected_mode"], f"Mode decode mismatch for {v.get('name')}"
+    # Re-encode must match original 3 bytes
+    re_byte0 = (mode << 5) | (mtu >> 16)
+    re_byte1 = (mtu >> 8) & 0xFF
+    re_byte2 = mtu & 0xFF
+    re_encoded = bytes([re_byte0, re_byte1, re_byte2])
+    assert re_encoded == raw, f"signalling re-encode must match bytes_hex for {v.get('name')}"
+
+
+@pytest.mark.vectors("signalling_bytes", keys=("mtu", "mode", "expected_bytes_hex"))
+def test_signalling_encode(vector):
     """Encode mtu+mode -> 3 bytes must match expected_bytes_hex."""
-    data = _load_yaml(VECTORS_DIR / "signalling_bytes.yaml")
-    if not data:
-        pytest.skip("no signalling_bytes.yaml")
-    for v in data.get("vectors") or []:
-        if "mtu" not in v or "mode" not in v or "expected_bytes_hex" not in v:
+    mtu = int(vector["mtu"]) & 0x1FFFFF
+    mode = int(vector["mode"]) & 0x07
+    byte0 = (mode << 5) | (mtu >> 16)
+    byte1 = (mtu >> 8) & 0xFF
+    byte2 = mtu & 0xFF
+    encoded = bytes([byte0, byte1, byte2]).hex()
+    assert encoded == vector["expected_bytes_hex"], f"signalling encode mismatch for {vector.get('name')}"
+
+
+# --- hdlc_framing ---
+
+
+def _hdlc_unescape(data: bytes) -> bytes:
+    """Spec: 0x7D 0x5E -> 0x7E, then 0x7D 0x5D -> 0x7D."""
+    return data.replace(b"\x7d\x5e", b"\x7e").replace(b"\x7d\x5d", b"\x7d")
+
+
+@pytest.mark.vectors("hdlc_framing")
+def test_hdlc_framing_required_fields(vector):
+    """Encode vectors need frame_hex + expected_encoded_hex; deframe vectors need stream_hex, chunk_sizes, expected_frames_hex."""
+    v = vector
+    if "frame_hex" in v:
+        assert v.get("expected_encoded_hex"), f"vector {v.get('name')} missing expected_encoded_hex"
+    else:
+        assert v.get("stream_hex"), f"vector {v.get('name')} missing stream_hex"
+        assert v.get("chunk_sizes"), f"vector {v.get('name')} missing chunk_sizes"
+        assert "expected_frames_hex" in v, f"vector {v.get('name')} missing expected_frames_hex"
+        assert sum(v["chunk_sizes"]) == len(bytes.fromhex(v["stream_hex"])), (
+            f"vector {v.get('name')}: chunk_sizes must sum to stream length"
+        )
+
+
+@pytest.mark.vectors("hdlc_framing", keys=("frame_hex",))
+def test_hdlc_encode(vector):
+    """FLAG + escape(ESC first, then FLAG) + FLAG must match expected_encoded_hex; unescape must invert it."""
+    frame = bytes.fromhex(vector["frame_hex"])
+    escaped = frame.replace(b"\x7d", b"\x7d\x5d").replace(b"\x7e", b"\x7d\x5e")
+    encoded = b"\x7e" + escaped + b"\x7e"
+    assert encoded.hex() == vector["expected_encoded_hex"], f"HDLC encode mismatch for {vector.get('name')}"
+    assert _hdlc_unescape(encoded[1:-1]) == frame, f"HDLC unescape must invert encode for {vector.get('name')}"
+
+
+@pytest.mark.vectors("hdlc_framing", keys=("stream_hex",))
+def test_hdlc_deframe_whole_stream(vector):
+    """Frames between consecutive FLAGs, unescaped, empty frames dropped, must match expected_frames_hex."""
+    parts = bytes.fromhex(vector["stream_hex"]).split(b"\x7e")[1:-1]
+    frames = [_hdlc_unescape(p).hex() for p in parts if p]
+    assert frames == vector["expected_frames_hex"], f"HDLC deframe mismatch for {vector.get('name')}"
+
+
+# --- kiss_framing ---
+
+
+def _kiss_unescape(data: bytes) -> bytes:
+    """Spec: 0xDB 0xDC -> 0xC0, then 0xDB 0xDD -> 0xDB."""
+    return data.replace(b"\xdb\xdc", b"\xc0").replace(b"\xdb\xdd", b"\xdb")
+
+
+@pytest.mark.vectors("kiss_framing")
+def test_kiss_framing_required_fields(vector):
+    """Encode vectors need data_hex, port, command, expected_encoded_hex; deframe vectors need stream_hex, chunk_sizes, expected_frames."""
+    v = vector
+    if "data_hex" in v:
+        assert v.get("expected_encoded_hex"), f"vector {v.get('name')} missing expected_encoded_hex"
+        assert v.get("port") is not None, f"vector {v.get('name')} missing port"
+        assert v.get("command") is not None, f"vector {v.get('name')} missing command"
+    else:
+        assert v.get("stream_hex"), f"vector {v.get('name')} missing stream_hex"
+        assert v.get("chunk_sizes"), f"vector {v.get('name')} missing chunk_sizes"
+        assert "expected_frames" in v, f"vector {v.get('name')} missing expected_frames"
+
+
+@pytest.mark.vectors("kiss_framing", keys=("data_hex",))
+def test_kiss_encode(vector):
+    """FEND + escape(FESC first, then FEND) of (port<<4|command) + data + FEND must match expected_encoded_hex."""
+    body = bytes([(vector["port"] << 4) | vector["command"]]) + bytes.fromhex(vector["data_hex"])
+    escaped = body.replace(b"\xdb", b"\xdb\xdd").replace(b"\xc0", b"\xdb\xdc")
+    encoded = b"\xc0" + escaped + b"\xc0"
+    assert encoded.hex() == vector["expected_encoded_hex"], f"KISS encode mismatch for {vector.get('name')}"
+
+
+@pytest.mark.vectors("kiss_framing", keys=("stream_hex",))
+def test_kiss_deframe_whole_stream(vector):
+    """Frames between consecutive FENDs, unescaped, split into port/command nibbles and data, must match expected_frames."""
+    frames = []
+    for part in bytes.fromhex(vector["stream_hex"]).split(b"\xc0")[1:-1]:
+        if not part:
             continue
-        mtu = int(v["mtu"]) & 0x1FFFFF
-        mode = int(v["mode"]) & 0x07
-        byte0 = (mode << 5) | (mtu >> 16)
-        byte1 = (mtu >> 8) & 0xFF
-        byte2 = mtu & 0xFF
-        encoded = bytes([byte0, byte1, byte2]).hex()
-        assert encoded == v["expected_bytes_hex"], f"signalling encode mismatch for {v.get('name')}"
+        raw = _kiss_unescape(part)
+        frames.append({"port": raw[0] >> 4, "command": raw[0] & 0x0F, "data_hex": raw[1:].hex()})
+    assert frames == vector["expected_frames"], f"KISS deframe mismatch for {vector.get('name')}"
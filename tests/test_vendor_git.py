@@ -0,0 +1,122 @@
+"""
+Git-object vendor backend tests (tools/vendor_git.py) against a throwaway git repository.
+
+- GitBlobStore reads blobs at any commit through one cat-file process; repeated reads are served
+  from memory, blobs unchanged between commits are held once; missing paths and trees are None.
+- GitVendorIndex agrees with a working-tree VendorIndex on lines and excerpt digests.
+- Reference verification against two revisions runs concurrently on one store.
+- compile_spec renders excerpts at manifest.repo_revision from git objects while the working tree
+  is checked out elsewhere, and rejects an index at another revision.
+"""
+
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+import compile_ssot
+import extract_refs
+from vendor_git import GitBlobStore, GitVendorIndex
+from vendor_index import VendorIndex
+
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not on PATH")
+
+V1 = "MTU = 500\nHEADER_MINSIZE = 19\n\n\ndef pack():\n    return MTU\n"
+V2 = "# moved down\n\n" + V1.replace("MTU = 500", "MTU = 1200")
+STATIC = "unchanged\r\nfile\n"
+
+
+def _git(root: Path, *args: str) -> str:
+    env = dict(os.environ, GIT_AUTHOR_NAME="t", GIT_AUTHOR_EMAIL="t@t", GIT_COMMITTER_NAME="t", GIT_COMMITTER_EMAIL="t@t")
+    return subprocess.run(["git", "-C", str(root), *args], capture_output=True, text=True, check=True, env=env).stdout.strip()
+
+
+@pytest.fixture
+def vendor(tmp_path):
+    root = tmp_path / "vendor" / "reticulum-source"
+    (root / "RNS").mkdir(parents=True)
+    _git(root, "init", "-q")
+    commits = []
+    for text in (V1, V2):
+        (root / "RNS" / "Packet.py").write_text(text, encoding="utf-8")
+        (root / "RNS" / "static.txt").write_bytes(STATIC.encode())
+        _git(root, "add", "-A")
+        _git(root, "commit", "-q", "-m", "c")
+        commits.append(_git(root, "rev-parse", "HEAD"))
+    return root, commits
+
+
+def test_blob_store_reads_any_commit(vendor):
+    root, (c1, c2) = vendor
+    with GitBlobStore(root) as store:
+        assert store.resolve("HEAD") == c2 and store.resolve("HEAD~1") == c1
+        assert store.resolve("no-such-rev") is None
+        assert store.read(c1, "RNS/Packet.py") == V1.encode()
+        assert store.read(c2, "RNS/Packet.py") == V2.encode()
+        assert store.read(c1, "RNS/missing.py") is None
+        assert store.read(c1, "RNS") is None
+        pid = store._proc.pid
+        queries = store.queries
+        assert store.read(c1, "RNS/Packet.py") == V1.encode()
+        assert store.queries == queries
+        assert store.read(c1, "RNS/static.txt") is store.read(c2, "RNS/static.txt")
+        assert store._proc.pid == pid
+
+
+def test_git_index_matches_working_tree(vendor):
+    root, (_, c2) = vendor
+    with GitBlobStore(root) as store:
+        git_index = GitVendorIndex(store, "HEAD")
+        assert git_index.revision == c2 and git_index.root == root
+        with VendorIndex(root) as tree:
+            for relpath in ("RNS/Packet.py", "RNS/static.txt"):
+                a, b = git_index.get(relpath), tree.get(relpath)
+                assert a.n_lines == b.n_lines
+                assert a.lines(1, a.n_lines) == b.lines(1, b.n_lines)
+                assert a.excerpt_sha256(1, 3) == b.excerpt_sha256(1, 3)
+                assert a.blob_id == b.blob_id
+        assert not git_index.is_file("RNS/missing.py")
+        with pytest.raises(ValueError):
+            GitVendorIndex(store, "no-such-rev")
+
+
+def test_verify_two_revisions_concurrently(vendor):
+    root, (c1, c2) = vendor
+    data = {
+        "manifest": {"repo_revision": c1},
+        "atoms": [{"id": "RNS.PKT.CONST.MTU", "references": [{"file": "RNS/Packet.py", "symbol": "MTU = 500", "lines": {"start": 1, "end": 1}}]}],
+    }
+    with GitBlobStore(root) as store:
+        indexes = [GitVendorIndex(store, c) for c in (c1, c2)]
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(lambda ix: extract_refs.process_refs(data, root, index=ix)[0], indexes))
+    assert results[0] == []
+    assert len(results[1]) == 1 and "symbol 'MTU = 500' not found in lines [1,1]" in results[1][0]
+
+
+def test_compile_from_git_objects(vendor, tmp_path):
+    root, (c1, c2) = vendor
+    repo_root = tmp_path
+    data = {
+        "spec_meta": {"spec_id": "t", "ssot_version": "0.0.1"},
+        "manifest": {"repo_revision": c1},
+        "atoms": [
+            {
+                "id": "RNS.PKT.CONST.MTU",
+                "kind": "constant",
+                "statement": "MTU.",
+                "value": {"number": 500, "unit": "bytes"},
+                "references": [{"file": "RNS/Packet.py", "symbol": "MTU", "role": "definition", "lines": {"start": 1, "end": 1}}],
+            }
+        ],
+    }
+    assert _git(root, "rev-parse", "HEAD") == c2
+    with GitBlobStore(root) as store:
+        out = tmp_path / "out"
+        assert compile_ssot.compile_spec(data, b"ssot", repo_root, out, index=GitVendorIndex(store, c1)) == 0
+        assert "MTU = 500" in (out / "reticulum-wire-format.md").read_text(encoding="utf-8")
+        assert compile_ssot.compile_spec(data, b"ssot", repo_root, tmp_path / "out2", index=GitVendorIndex(store, c2)) == 1
@@ -0,0 +1,137 @@
+"""
+VendorIndex tests (tools/vendor_index.py).
+
+VendorIndex must agree with the str-based excerpt helpers in extract_refs.py (read_text +
+splitlines) on every line range and excerpt digest, and give the def/assignment/substring
+tables and symbol_index.fill_window ranges written out below, including files with CRLF,
+form feeds, no trailing newline, invalid UTF-8 and empty files.
+"""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import extract_refs
+from symbol_index import fill_window
+from vendor_index import VendorIndex
+
+PY_SOURCE = '''"""Module."""
+MTU = 500
+HEADER_MINSIZE  = 2 + 1 + 16
+HEADER_MINSIZE == 0
+TRUNCATED_HASHLENGTH = 128
+
+
+class Packet:
+    HEADER_1 = 0x00
+    HEADER_2 = 0x01
+
+    def pack(self):
+        return self.MTU
+
+    async def pack_async(self):
+        return None
+
+
+def pack():
+    return Packet.HEADER_1  # second pack, ambiguous
+'''
+
+FILES = {
+    "RNS/Packet.py": PY_SOURCE.encode(),
+    "RNS/Crlf.py": PY_SOURCE.replace("\n", "\r\n").encode(),
+    "RNS/NoTrailingNewline.py": PY_SOURCE.rstrip("\n").encode(),
+    "RNS/FormFeed.py": PY_SOURCE.replace("\n\n\nclass", "\n\x0c\nclass").encode(),
+    "docs/notes.txt": b"MTU is 500\nno symbol here\n\xff\xfe invalid MTU bytes\nlast line without newline",
+    "docs/empty.txt": b"",
+}
+# symbol: (def/class ranges, assignment lines, substring lines, fill window) in PY_SOURCE
+PY_SYMBOLS = {
+    "MTU": ([], [2], [2, 13], (1, 4)),
+    "HEADER_MINSIZE": ([], [3, 4], [3, 4], None),  # "HEADER_MINSIZE == 0" reads as a second assignment
+    "TRUNCATED_HASHLENGTH": ([], [5], [5], (3, 7)),
+    "Packet": ([(8, 16)], [], [8, 20], (8, 16)),
+    "pack": ([(19, 20), (12, 13)], [], [12, 15, 19, 20], None),
+    "pack_async": ([(15, 16)], [], [15], (15, 16)),
+    "HEADER_1": ([], [9], [9, 20], (7, 11)),
+    "HEADER_2": ([], [10], [10], (8, 12)),
+    "missing": ([], [], [], None),
+    "invalid": ([], [], [], None),
+    "HEADER_MINSIZE  = 2": ([], [], [3], (1, 5)),
+    "Packet.HEADER_1": ([], [], [20], (18, 20)),
+}
+# ast counts the form feed line as part of the blank line before it, splitlines does not:
+# def/class blocks after it start one line earlier.
+FORM_FEED_SYMBOLS = {
+    **PY_SYMBOLS,
+    "Packet": ([(7, 15)], [], [8, 20], (7, 15)),
+    "pack": ([(18, 19), (11, 12)], [], [12, 15, 19, 20], None),
+    "pack_async": ([(14, 15)], [], [15], (14, 15)),
+}
+# symbol: (substring lines, fill window) in the text files; symbols not listed do not occur
+TEXT_SYMBOLS = {
+    "docs/notes.txt": {"MTU": ([1, 3], None), "invalid": ([3], (1, 4))},
+    "docs/empty.txt": {},
+}
+
+
+@pytest.fixture(scope="module")
+def vendor(tmp_path_factory):
+    root = tmp_path_factory.mktemp("vendor")
+    for relpath, data in FILES.items():
+        path = root / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return root
+
+
+def _content(root: Path, relpath: str) -> str:
+    return (root / relpath).read_text(encoding="utf-8", errors="replace")
+
+
+@pytest.mark.parametrize("relpath", sorted(FILES))
+def test_lines_and_excerpts_match_read_text(vendor, relpath):
+    content = _content(vendor, relpath)
+    expected_lines = content.replace("\r\n", "\n").splitlines()
+    vf = VendorIndex(vendor).get(relpath)
+    assert vf.n_lines == len(expected_lines)
+    for start in range(1, len(expected_lines) + 3):
+        for end in range(start - 1, len(expected_lines) + 3):
+            assert vf.lines(start, end) == expected_lines[max(0, start - 1) : min(len(expected_lines), end)]
+            assert vf.excerpt_bytes(start, end) == extract_refs.normalise_excerpt_bytes(content, start, end)
+    assert vf.excerpt_sha256(1, 3) == extract_refs.excerpt_hash(content, 1, 3)
+
+
+@pytest.mark.parametrize("relpath", sorted(FILES))
+def test_symbol_tables_and_fill_windows(vendor, relpath):
+    vf = VendorIndex(vendor).get(relpath)
+    for symbol in PY_SYMBOLS:
+        if relpath.endswith(".py"):
+            defs, assigned, hits, window = (FORM_FEED_SYMBOLS if relpath == "RNS/FormFeed.py" else PY_SYMBOLS)[symbol]
+            assert vf.def_ranges(symbol) == defs, symbol
+        else:
+            assigned, (hits, window) = [], TEXT_SYMBOLS[relpath].get(symbol, ([], None))
+        assert vf.assignment_lines(symbol) == assigned, symbol
+        assert vf.substring_lines(symbol) == hits, symbol
+        found = fill_window(relpath, vf.n_lines, lambda: vf.def_ranges(symbol), lambda: vf.assignment_lines(symbol), lambda: vf.substring_lines(symbol))
+        assert found[0] == window, symbol
+
+
+def test_files_loaded_once(vendor):
+    index = VendorIndex(vendor)
+    refs = [{"file": "RNS/Packet.py", "symbol": s, "lines": {"start": 1, "end": 20}} for s in ("MTU", "Packet", "pack")]
+    for ref in refs * 3:
+        assert extract_refs.verify_ref(vendor, ref, "rev", index) == (True, "")
+    assert index.files_loaded == 1
+    assert not index.is_file("RNS/Missing.py")
+    assert index.blob_id("RNS/Missing.py") == "missing"
+    index.close()
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+@pytest.mark.parametrize("relpath", sorted(FILES))
+def test_blob_id_matches_git(vendor, relpath):
+    out = subprocess.run(["git", "hash-object", "--no-filters", str(vendor / relpath)], capture_output=True, text=True, check=True)
+    assert VendorIndex(vendor).blob_id(relpath) == out.stdout.strip()
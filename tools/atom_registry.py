@@ -0,0 +1,130 @@
+"""
+atom_registry.py — Indexed view of SSOT atoms, built once per load.
+
+    atoms = AtomRegistry.from_ssot(data)
+    atoms["RNS.LNK.CONST.ECPUBSIZE"]           # atom dict (KeyError if unknown); atoms.get(id) -> None
+    atoms.constant_int("RNS.LNK.CONST.ECPUBSIZE")   # 64
+    atoms.layout_fields("RNS.PKT.LAYOUT.HEADER_1")  # [{"name", "offset", "length"}, ...]
+    atoms.by_kind("layout"), atoms.by_tag("context"), atoms.by_prefix("RNS.PKT"), atoms.by_file("RNS/Packet.py")
+
+Lookup by id is one dict access; the groupings are computed in the single pass that builds the
+registry and keep document order. The prefix is the first two id segments (RNS.PKT, RNS.LNK, ...);
+the vendor file grouping is by references[].file. Typed accessors raise ValueError with the
+atom id in the message (unknown id, missing value.number / layout.fields, wrong type).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+
+def id_prefix(atom_id: str) -> str:
+    """RNS.PKT.LAYOUT.HEADER_1 -> RNS.PKT (first two id segments)."""
+    return ".".join(atom_id.split(".")[:2])
+
+
+class AtomRegistry:
+    """Atoms keyed by id, plus kind/tag/prefix/vendor-file groupings (tuples in document order)."""
+
+    def __init__(self, atoms: list | None) -> None:
+        self._atoms: tuple = tuple(a for a in atoms or [] if isinstance(a, dict))
+        self._by_id: dict[str, dict] = {}
+        by_kind: dict[str, list] = {}
+        by_tag: dict[str, list] = {}
+        by_prefix: dict[str, list] = {}
+        by_file: dict[str, list] = {}
+        for a in self._atoms:
+            aid = a.get("id")
+            if isinstance(aid, str):
+                self._by_id.setdefault(aid, a)
+                by_prefix.setdefault(id_prefix(aid), []).append(a)
+            by_kind.setdefault(a.get("kind"), []).append(a)
+            for tag in dict.fromkeys(a.get("tags") or []):
+                by_tag.setdefault(tag, []).append(a)
+            files = {ref.get("file") for ref in a.get("references") or [] if isinstance(ref, dict)}
+            for f in sorted(f for f in files if f):
+                by_file.setdefault(f, []).append(a)
+        self._by_kind = {k: tuple(v) for k, v in by_kind.items()}
+        self._by_tag = {k: tuple(v) for k, v in by_tag.items()}
+        self._by_prefix = {k: tuple(v) for k, v in by_prefix.items()}
+        self._by_file = {k: tuple(v) for k, v in by_file.items()}
+
+    @classmethod
+    def from_ssot(cls, ssot: Any) -> AtomRegistry:
+        """Registry over ssot["atoms"]; an AtomRegistry is returned as is."""
+        if isinstance(ssot, AtomRegistry):
+            return ssot
+        return cls((ssot.get("atoms") or []) if isinstance(ssot, dict) else [])
+
+    # -----------------------------
+    # Lookup and groupings
+    # -----------------------------
+
+    def __len__(self) -> int:
+        return len(self._atoms)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self._atoms)
+
+    def __contains__(self, atom_id: object) -> bool:
+        return atom_id in self._by_id
+
+    def __getitem__(self, atom_id: str) -> dict:
+        return self._by_id[atom_id]
+
+    def get(self, atom_id: str) -> dict | None:
+        return self._by_id.get(atom_id)
+
+    def by_kind(self, kind: str) -> tuple:
+        return self._by_kind.get(kind, ())
+
+    def by_tag(self, tag: str) -> tuple:
+        return self._by_tag.get(tag, ())
+
+    def by_prefix(self, prefix: str) -> tuple:
+        return self._by_prefix.get(prefix, ())
+
+    def by_file(self, relpath: str) -> tuple:
+        return self._by_file.get(relpath, ())
+
+    def kinds(self) -> list[str]:
+        return sorted(k for k in self._by_kind if isinstance(k, str))
+
+    def tags(self) -> list[str]:
+        return sorted(self._by_tag)
+
+    def prefixes(self) -> list[str]:
+        return sorted(self._by_prefix)
+
+    def files(self) -> list[str]:
+        return sorted(self._by_file)
+
+    # -----------------------------
+    # Typed accessors
+    # -----------------------------
+
+    def _require(self, atom_id: str) -> dict:
+        atom = self._by_id.get(atom_id)
+        if atom is None:
+            raise ValueError(f"Atom id not found: {atom_id}")
+        return atom
+
+    def value_number(self, atom_id: str) -> Any:
+        """atoms[].value.number as stored: int, or string for e.g. hex values (IFAC_SALT)."""
+        v = (self._require(atom_id).get("value") or {}).get("number")
+        if v is None:
+            raise ValueError(f"Atom {atom_id} has no value.number")
+        return v
+
+    def constant_int(self, atom_id: str) -> int:
+        v = self.value_number(atom_id)
+        if isinstance(v, bool) or not isinstance(v, int):
+            raise ValueError(f"Atom {atom_id} value.number is not an integer: {v!r}")
+        return v
+
+    def layout_fields(self, atom_id: str) -> list[dict]:
+        atom = self._require(atom_id)
+        fields = (atom.get("layout") or {}).get("fields") or []
+        if not fields:
+            raise ValueError(f"layout atom {atom_id} has no layout.fields")
+        return fields
@@ -8,15 +8,32 @@ Outputs under spec/generated/ (plan section 10):
 - contexts.md (from atoms tagged context, sorted by numeric value)
 - layouts.md (byte/bit diagrams)
 - traceability.md (every atom ID exactly once)
+- codec.py (struct.Struct pack_into/unpack_from per kind: layout atom)
 - manifest.json (required: ssot_version, ssot_content_sha256, source_commit; optional generated_files, excerpts_sha256)
+
+Atom sections of reticulum-wire-format.md are cached under --cache-dir (default .cache/compile_ssot),
+keyed by (atom content, git blob ids of its referenced vendor files, sha256 of this script and of the
+vendor readers vendor_index.py and vendor_git.py); unchanged atoms are spliced in without re-reading
+excerpts. --no-cache renders everything (byte-identical output).
+--from-git reads the vendor files at manifest.repo_revision from git objects (tools/vendor_git.py)
+instead of requiring vendor/reticulum-source to be checked out at that commit.
+--profile PATH writes a Chrome trace (tools/profiling.py): one span per output file and per atom rendered.
 """
 
+import argparse
 import hashlib
 import json
+import os
 import subprocess
 import sys
 from pathlib import Path
 
+import profiling
+from atom_registry import AtomRegistry
+from ssot_loader import load_yaml_bytes
+from vendor_git import GitBlobStore, GitVendorIndex
+from vendor_index import VendorIndex
+
 # Extension -> fenced code block language (GitHub-style)
 _EXCERPT_LANG = {".py": "py", ".md": "markdown", ".yaml": "yaml", ".yml": "yaml", ".txt": "text"}
 
@@ -26,39 +43,6 @@ def _lang_for_file(filepath: str) -> str:
     return _EXCERPT_LANG.get(ext, "text")
 
 
-def _normalise_excerpt_bytes(content: str, start: int, end: int) -> bytes:
-    """Normalise excerpt for digest: \\r\\n -> \\n. start/end 1-indexed inclusive."""
-    content = content.replace("\r\n", "\n").replace("\r", "\n")
-    lines = content.splitlines(keepends=True)
-    if not lines:
-        return b""
-    lo = max(0, start - 1)
-    hi = min(len(lines), end)
-    excerpt = "".join(lines[lo:hi])
-    return excerpt.encode("utf-8")
-
-
-def _excerpt_sha256(content: str, start: int, end: int) -> str:
-    return hashlib.sha256(_normalise_excerpt_bytes(content, start, end)).hexdigest()
-
-
-def _read_excerpt_from_content(content: str, start: int, end: int) -> tuple[list[str], int]:
-    """From normalised content, return (lines[start:end], first_line_1based)."""
-    content = content.replace("\r\n", "\n").replace("\r", "\n")
-    lines = content.splitlines()
-    n = len(lines)
-    lo = max(0, start - 1)
-    hi = min(n, end)
-    return lines[lo:hi], start
-
-
-def _read_excerpt(vendor_root: Path, filepath: str, start: int, end: int) -> tuple[list[str], int]:
-    """Read lines start..end (1-indexed inclusive) from vendor file. Returns (list of line strings, first_line_1based)."""
-    path = vendor_root / filepath
-    raw = path.read_text(encoding="utf-8", errors="replace")
-    return _read_excerpt_from_content(raw, start, end)
-
-
 def _format_excerpt_with_line_numbers(lines: list[str], first_line_one_indexed: int) -> str:
     """Prefix each line with NNN: for visual mapping to lines.start/end."""
     return "\n".join(f"{first_line_one_indexed + i}: {line}" for i, line in enumerate(lines))
@@ -95,40 +79,274 @@ def _ensure_vendor_pinned(repo_root: Path, expected_commit: str, atoms: list) ->
     return vendor_root
 
 
-def load_ssot(path: Path):
-    """Load SSOT with ruamel.yaml to preserve ordering when round-tripping."""
-    try:
-        from ruamel.yaml import YAML
-        yaml = YAML()
-        yaml.preserve_quotes = True
-        with open(path, encoding="utf-8") as f:
-            return yaml.load(f)
-    except ImportError:
-        import yaml
-        with open(path, encoding="utf-8") as f:
-            return yaml.safe_load(f)
+def _codec_name(atom_id: str) -> str:
+    """RNS.PKT.LAYOUT.HEADER_1 -> header_1 (last id segment, lowercased)."""
+    return atom_id.rsplit(".", 1)[-1].lower()
 
 
-def main() -> int:
-    repo_root = Path(__file__).resolve().parent.parent
-    ssot_path = repo_root / "spec" / "reticulum-wire-format.ssot.yaml"
-    out_dir = repo_root / "spec" / "generated"
-    out_dir.mkdir(parents=True, exist_ok=True)
+def _codec_struct(atom_id: str, fields: list) -> tuple[str, list[str], str | None]:
+    """
+    Struct format for layout fields sorted by offset: 1- and 2-byte fields are big-endian unsigned
+    ints (B/H), longer fields bytes (Ns), gaps padding (Nx). A length-0 field last in offset order
+    is the variable-length tail. Fields marked allow_overlap whose bytes are already covered are
+    left out. Returns (format, fixed field names, tail name or None); raises ValueError naming the
+    atom for a variable-length field before the end or an unmarked overlap.
+    """
+    fmt = ">"
+    names: list[str] = []
+    tail = None
+    pos = 0
+    ordered = sorted(fields, key=lambda f: int(f.get("offset", 0)))
+    for i, f in enumerate(ordered):
+        offset, length = int(f.get("offset", 0)), int(f.get("length", 0))
+        if offset < pos or (length == 0 and i < len(ordered) - 1):
+            if f.get("allow_overlap"):
+                continue  # bytes already covered by the field it overlaps
+            if length == 0:
+                raise ValueError(f"layout atom {atom_id}: variable-length field {f.get('name')} at offset {offset} is not the last field")
+            raise ValueError(f"layout atom {atom_id}: field {f.get('name')} at offset {offset} overlaps the previous field without allow_overlap")
+        if offset > pos:
+            fmt += f"{offset - pos}x"
+            pos = offset
+        if length == 0:
+            tail = f.get("name")
+            continue
+        fmt += {1: "B", 2: "H"}.get(length, f"{length}s")
+        names.append(f.get("name"))
+        pos = offset + length
+    return fmt, names, tail
+
+
+def render_codec(atoms: list) -> str:
+    """Render spec/generated/codec.py: one precompiled struct.Struct plus unpack_from/pack_into per layout atom (ValueError: see _codec_struct)."""
+    out = [
+        '"""',
+        "codec.py — Struct codecs for SSOT layout atoms (generated by tools/compile_ssot.py; do not edit).",
+        "",
+        "Fixed fields in layout order: 1- and 2-byte fields are big-endian unsigned ints, longer fields bytes.",
+        "A trailing length-0 field is the variable-length tail: unpack_from returns it as a memoryview of",
+        "the remaining bytes; pack_into writes it after the fixed part. pack_into returns bytes written.",
+        '"""',
+        "",
+        "import struct",
+        "",
+    ]
+    table = []
+    for a in atoms:
+        if a.get("kind") != "layout":
+            continue
+        aid = a.get("id", "")
+        fields = (a.get("layout") or {}).get("fields") or []
+        fmt, names, tail = _codec_struct(aid, fields)
+        const = _codec_name(aid).upper()
+        fn = _codec_name(aid)
+        args = ", ".join(names + ([tail] if tail else []))
+        fixed = ", ".join(names)
+        out.append("")
+        out.append(f'{const} = struct.Struct("{fmt}")')
+        out.append(f"{const}_FIELDS = {tuple(names + ([tail] if tail else []))!r}")
+        out.append("")
+        out.append("")
+        out.append(f"def {fn}_unpack_from(buf, offset=0):")
+        out.append(f'    """{aid} -> ({args})."""')
+        if tail:
+            out.append(f"    return {const}.unpack_from(buf, offset) + (memoryview(buf)[offset + {const}.size :],)")
+        else:
+            out.append(f"    return {const}.unpack_from(buf, offset)")
+        out.append("")
+        out.append("")
+        out.append(f"def {fn}_pack_into(buf, offset{', ' + args if args else ''}):")
+        out.append(f'    """Write {aid} into buf at offset."""')
+        out.append(f"    {const}.pack_into(buf, offset{', ' + fixed if fixed else ''})")
+        if tail:
+            out.append(f"    end = offset + {const}.size + len({tail})")
+            out.append(f"    buf[offset + {const}.size : end] = {tail}")
+            out.append("    return end - offset")
+        else:
+            out.append(f"    return {const}.size")
+        out.append("")
+        table.append(f'    "{aid}": ({const}, {const}_FIELDS, {fn}_unpack_from, {fn}_pack_into),')
+    out.append("")
+    out.append("# atom id -> (Struct, field names, unpack_from, pack_into)")
+    out.append("LAYOUTS = {")
+    out.extend(table)
+    out.append("}")
+    out.append("")
+    return "\n".join(out)
+
+
+_TOOL_SOURCES = ("compile_ssot.py", "vendor_index.py", "vendor_git.py")
+
+
+def _tool_version() -> str:
+    """sha256 over the renderer's sources (this script and the vendor readers): any change invalidates every cache entry."""
+    h = hashlib.sha256()
+    for name in _TOOL_SOURCES:
+        h.update((Path(__file__).resolve().parent / name).read_bytes())
+    return h.hexdigest()
+
+
+class RenderCache:
+    """
+    Content-addressed store of rendered atoms: <root>/<key[:2]>/<key>.json holds one atom's
+    markdown lines and excerpts_sha256 entries. Entries are never rewritten; a changed atom,
+    referenced vendor file or renderer source (_TOOL_SOURCES) gives a new key.
+    """
 
-    if not ssot_path.is_file():
-        print(f"SSOT not found: {ssot_path}", file=sys.stderr)
-        return 1
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.hits = 0
+        self.misses = 0
 
-    raw_ssot = ssot_path.read_bytes()
-    ssot_content_sha256 = hashlib.sha256(raw_ssot).hexdigest()
-    data = load_ssot(ssot_path)
-    if not data:
-        print("SSOT is empty or invalid", file=sys.stderr)
-        return 1
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
 
+    def get(self, key: str) -> tuple[list[str], dict[str, str]] | None:
+        try:
+            entry = json.loads(self._path(key).read_text(encoding="utf-8"))
+            result = list(entry["lines"]), dict(entry["excerpts_sha256"])
+        except (OSError, ValueError, KeyError, TypeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, key: str, lines: list[str], excerpts_sha256: dict[str, str]) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"lines": lines, "excerpts_sha256": excerpts_sha256}), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            pass  # best-effort: output never depends on the cache
+
+
+def atom_cache_key(atom, vendor: VendorIndex | None, tool_version: str) -> str:
+    """sha256 over (atom content in YAML key order, blob ids of referenced vendor files, tool version)."""
+    blobs: dict[str, str] = {}
+    if vendor is not None:
+        for ref in atom.get("references") or []:
+            fpath = ref.get("file", "")
+            if fpath not in blobs:
+                blobs[fpath] = vendor.blob_id(fpath)
+    payload = json.dumps([atom, blobs, vendor is not None, tool_version], default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def render_atom(atom, vendor: VendorIndex | None) -> tuple[list[str], dict[str, str]]:
+    """Markdown lines for one atom in reticulum-wire-format.md, plus its excerpts_sha256 entries."""
+    lines: list[str] = []
+    excerpts_sha256: dict[str, str] = {}
+    aid = atom.get("id", "")
+    kind = atom.get("kind", "")
+    normative = atom.get("normative", "")
+    statement = atom.get("statement", "")
+    lines.append(f"## {aid}")
+    lines.append(f"- **Kind:** {kind}")
+    if normative:
+        lines.append(f"- **Normative:** {normative}")
+    lines.append(f"- **Statement:** {statement}")
+    refs = atom.get("references") or []
+    if refs:
+        lines.append("- **References:**")
+        for ref_idx, ref in enumerate(refs):
+            fpath = ref.get("file", "")
+            sym = ref.get("symbol", "")
+            ln = ref.get("lines") or {}
+            start_ln = ln.get("start")
+            end_ln = ln.get("end")
+            role = ref.get("role", "")
+            ref_line = f"  - {fpath} (`{sym}`) lines {start_ln or '?'}–{end_ln or '?'} ({role})"
+            lines.append(ref_line)
+            if vendor is not None and start_ln is not None and end_ln is not None:
+                try:
+                    vf = vendor.get(fpath)
+                    start_i, end_i = int(start_ln), int(end_ln)
+                    excerpt_body = _format_excerpt_with_line_numbers(vf.lines(start_i, end_i), start_i)
+                    lang = _lang_for_file(fpath)
+                    summary_label = f"Show code: {fpath}:{start_ln}–{end_ln} — {sym} — {role}"
+                    lines.append("    <details>")
+                    lines.append(f"      <summary>{summary_label}</summary>")
+                    lines.append("")
+                    lines.append(f"```{lang}")
+                    lines.append(excerpt_body)
+                    lines.append("```")
+                    lines.append("")
+                    lines.append("    </details>")
+                    # Optional: ±10 lines context with >> marker on referenced span
+                    ctx_start = max(1, start_i - 10)
+                    ctx_end = min(vf.n_lines, end_i + 10)
+                    ctx_lines = vf.lines(ctx_start, ctx_end)
+                    ctx_parts = []
+                    for i, line in enumerate(ctx_lines):
+                        ln = ctx_start + i
+                        marker = ">> " if start_i <= ln <= end_i else "   "
+                        ctx_parts.append(f"{marker}{ln}: {line}")
+                    lines.append("    <details>")
+                    lines.append("      <summary>Show ±10 lines context</summary>")
+                    lines.append("")
+                    lines.append(f"```{lang}")
+                    lines.append("\n".join(ctx_parts))
+                    lines.append("```")
+                    lines.append("")
+                    lines.append("    </details>")
+                    excerpts_sha256[f"{aid}#{ref_idx}"] = vf.excerpt_sha256(start_i, end_i)
+                except (ValueError, OSError):
+                    pass
+    if atom.get("value"):
+        lines.append(f"- **Value:** {atom['value']}")
+    if atom.get("layout", {}).get("fields"):
+        lines.append("- **Layout fields:**")
+        for f in atom["layout"]["fields"]:
+            lines.append(f"  - {f.get('name')}: offset {f.get('offset')}, length {f.get('length')}")
+    if atom.get("algorithm", {}).get("steps"):
+        lines.append("- **Steps:**")
+        for s in atom["algorithm"]["steps"]:
+            lines.append(f"  - {s}")
+    lines.append("")
+    return lines, excerpts_sha256
+
+
+def render_spec(spec_id: str, atoms: list, vendor: VendorIndex | None, cache: RenderCache | None) -> tuple[str, dict[str, str]]:
+    """reticulum-wire-format.md text and excerpts_sha256; with a cache, unchanged atoms are spliced in."""
+    excerpts_sha256: dict[str, str] = {}
+    lines = [f"# {spec_id.replace('-', ' ').title()} (generated from SSOT)", ""]
+    tool_version = _tool_version() if cache is not None else ""
+    for atom in atoms:
+        with profiling.span(atom.get("id", ""), "atom"):
+            if cache is None:
+                rendered = render_atom(atom, vendor)
+            else:
+                key = atom_cache_key(atom, vendor, tool_version)
+                rendered = cache.get(key)
+                if rendered is None:
+                    rendered = render_atom(atom, vendor)
+                    cache.put(key, *rendered)
+        lines.extend(rendered[0])
+        excerpts_sha256.update(rendered[1])
+    return "\n".join(lines), excerpts_sha256
+
+
+def compile_spec(
+    data,
+    raw_ssot: bytes,
+    repo_root: Path,
+    out_dir: Path,
+    cache_dir: Path | None = None,
+    index: VendorIndex | None = None,
+) -> int:
+    """
+    Write every generated file for an already-parsed SSOT into out_dir; returns an exit status
+    (errors on stderr). raw_ssot is the SSOT file's bytes (for ssot_content_sha256); cache_dir
+    enables the per-atom render cache; index is a shared VendorIndex over the vendor checkout.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    ssot_content_sha256 = hashlib.sha256(raw_ssot).hexdigest()
     spec_meta = data.get("spec_meta") or {}
     manifest = data.get("manifest") or {}
     atoms = data.get("atoms") or []
+    registry = AtomRegistry(atoms)
     spec_id = spec_meta.get("spec_id", "reticulum-wire-format")
     ssot_version = spec_meta.get("ssot_version", "0.0.0")
     source_commit = (manifest.get("repo_revision") or "").strip()
@@ -137,7 +355,15 @@ def main() -> int:
         return 1
 
     # Fail fast if atoms exist but vendor checkout missing or wrong commit (excerpts must be from pinned revision)
-    vendor_root = _ensure_vendor_pinned(repo_root, source_commit, atoms)
+    with profiling.span("vendor_check"):
+        if index is not None and index.revision is not None:
+            # Git-object index (vendor_git): no checkout needed, but it must be the pinned commit
+            if index.revision != source_commit:
+                print(f"vendor index is at {index.revision}, expected manifest.repo_revision {source_commit}.", file=sys.stderr)
+                return 1
+            vendor_root = index.root if atoms else None
+        else:
+            vendor_root = _ensure_vendor_pinned(repo_root, source_commit, atoms)
     if atoms and vendor_root is None:
         return 1
 
@@ -154,151 +380,134 @@ def main() -> int:
             pass
 
     # 1. reticulum-wire-format.md — full spec by atom order (with inline excerpts) + excerpts_sha256 for manifest
-    excerpts_sha256 = {}
-    lines = [f"# {spec_id.replace('-', ' ').title()} (generated from SSOT)", ""]
-    for atom in atoms:
-        aid = atom.get("id", "")
-        kind = atom.get("kind", "")
-        normative = atom.get("normative", "")
-        statement = atom.get("statement", "")
-        lines.append(f"## {aid}")
-        lines.append(f"- **Kind:** {kind}")
-        if normative:
-            lines.append(f"- **Normative:** {normative}")
-        lines.append(f"- **Statement:** {statement}")
-        refs = atom.get("references") or []
-        if refs:
-            lines.append("- **References:**")
-            for ref_idx, ref in enumerate(refs):
-                fpath = ref.get("file", "")
-                sym = ref.get("symbol", "")
-                ln = ref.get("lines") or {}
-                start_ln = ln.get("start")
-                end_ln = ln.get("end")
-                role = ref.get("role", "")
-                ref_line = f"  - {fpath} (`{sym}`) lines {start_ln or '?'}–{end_ln or '?'} ({role})"
-                lines.append(ref_line)
-                if vendor_root and start_ln is not None and end_ln is not None:
-                    try:
-                        path = vendor_root / fpath
-                        content = path.read_text(encoding="utf-8", errors="replace")
-                        start_i, end_i = int(start_ln), int(end_ln)
-                        all_lines = content.replace("\r\n", "\n").replace("\r", "\n").splitlines()
-                        n_lines = len(all_lines)
-                        excerpt_lines, first_ln = _read_excerpt_from_content(content, start_i, end_i)
-                        excerpt_body = _format_excerpt_with_line_numbers(excerpt_lines, first_ln)
-                        lang = _lang_for_file(fpath)
-                        summary_label = f"Show code: {fpath}:{start_ln}–{end_ln} — {sym} — {role}"
-                        lines.append("    <details>")
-                        lines.append(f"      <summary>{summary_label}</summary>")
-                        lines.append("")
-                        lines.append(f"```{lang}")
-                        lines.append(excerpt_body)
-                        lines.append("```")
-                        lines.append("")
-                        lines.append("    </details>")
-                        # Optional: ±10 lines context with >> marker on referenced span
-                        ctx_start = max(1, start_i - 10)
-                        ctx_end = min(n_lines, end_i + 10)
-                        ctx_lines = all_lines[ctx_start - 1 : ctx_end]
-                        ctx_parts = []
-                        for i, line in enumerate(ctx_lines):
-                            ln = ctx_start + i
-                            marker = ">> " if start_i <= ln <= end_i else "   "
-                            ctx_parts.append(f"{marker}{ln}: {line}")
-                        lines.append("    <details>")
-                        lines.append("      <summary>Show ±10 lines context</summary>")
-                        lines.append("")
-                        lines.append(f"```{lang}")
-                        lines.append("\n".join(ctx_parts))
-                        lines.append("```")
-                        lines.append("")
-                        lines.append("    </details>")
-                        excerpts_sha256[f"{aid}#{ref_idx}"] = _excerpt_sha256(content, start_i, end_i)
-                    except (ValueError, OSError):
-                        pass
-        if atom.get("value"):
-            lines.append(f"- **Value:** {atom['value']}")
-        if atom.get("layout", {}).get("fields"):
-            lines.append("- **Layout fields:**")
-            for f in atom["layout"]["fields"]:
-                lines.append(f"  - {f.get('name')}: offset {f.get('offset')}, length {f.get('length')}")
-        if atom.get("algorithm", {}).get("steps"):
-            lines.append("- **Steps:**")
-            for s in atom["algorithm"]["steps"]:
-                lines.append(f"  - {s}")
-        lines.append("")
-    (out_dir / "reticulum-wire-format.md").write_text("\n".join(lines), encoding="utf-8")
+    with profiling.span("reticulum-wire-format.md"):
+        vendor = (index if index is not None and index.root == vendor_root else VendorIndex(vendor_root)) if vendor_root else None
+        cache = RenderCache(cache_dir) if cache_dir is not None else None
+        spec_md, excerpts_sha256 = render_spec(spec_id, atoms, vendor, cache)
+        (out_dir / "reticulum-wire-format.md").write_text(spec_md, encoding="utf-8")
 
     # 2. constants.md — table by ID
-    const_atoms = [a for a in atoms if a.get("kind") == "constant" and "context" not in (a.get("tags") or [])]
-    const_atoms.sort(key=lambda a: a.get("id", ""))
-    const_lines = ["# Constants (from SSOT)", "", "| ID | Value | Unit | Statement |", "|----|-------|------|-----------|"]
-    for a in const_atoms:
-        val = a.get("value") or {}
-        num = val.get("number", "")
-        unit = val.get("unit", "")
-        stmt = (a.get("statement") or "")
-        const_lines.append(f"| {a.get('id', '')} | {num} | {unit} | {stmt} |")
-    const_lines.append("")
-    (out_dir / "constants.md").write_text("\n".join(const_lines), encoding="utf-8")
+    with profiling.span("constants.md"):
+        const_atoms = [a for a in registry.by_kind("constant") if "context" not in (a.get("tags") or [])]
+        const_atoms.sort(key=lambda a: a.get("id", ""))
+        const_lines = ["# Constants (from SSOT)", "", "| ID | Value | Unit | Statement |", "|----|-------|------|-----------|"]
+        for a in const_atoms:
+            val = a.get("value") or {}
+            num = val.get("number", "")
+            unit = val.get("unit", "")
+            stmt = (a.get("statement") or "")
+            const_lines.append(f"| {a.get('id', '')} | {num} | {unit} | {stmt} |")
+        const_lines.append("")
+        (out_dir / "constants.md").write_text("\n".join(const_lines), encoding="utf-8")
 
     # 3. contexts.md — from atoms tagged context, sorted by numeric value
-    ctx_atoms = [a for a in atoms if a.get("kind") == "constant" and "context" in (a.get("tags") or [])]
-    ctx_atoms.sort(key=lambda a: (a.get("value") or {}).get("number", 0))
-    ctx_lines = ["# Packet context byte values (from SSOT)", "", "| Value | Hex | ID | Meaning |", "|-------|-----|----|---------|"]
-    for a in ctx_atoms:
-        val = a.get("value") or {}
-        num = val.get("number", 0)
-        hex_val = f"0x{num:02X}" if isinstance(num, int) else str(num)
-        ctx_lines.append(f"| {num} | {hex_val} | {a.get('id', '')} | {a.get('statement', '')} |")
-    ctx_lines.append("")
-    (out_dir / "contexts.md").write_text("\n".join(ctx_lines), encoding="utf-8")
+    with profiling.span("contexts.md"):
+        ctx_atoms = [a for a in registry.by_tag("context") if a.get("kind") == "constant"]
+        ctx_atoms.sort(key=lambda a: (a.get("value") or {}).get("number", 0))
+        ctx_lines = ["# Packet context byte values (from SSOT)", "", "| Value | Hex | ID | Meaning |", "|-------|-----|----|---------|"]
+        for a in ctx_atoms:
+            val = a.get("value") or {}
+            num = val.get("number", 0)
+            hex_val = f"0x{num:02X}" if isinstance(num, int) else str(num)
+            ctx_lines.append(f"| {num} | {hex_val} | {a.get('id', '')} | {a.get('statement', '')} |")
+        ctx_lines.append("")
+        (out_dir / "contexts.md").write_text("\n".join(ctx_lines), encoding="utf-8")
 
     # 4. layouts.md — byte/bit diagrams
-    layout_atoms = [a for a in atoms if a.get("kind") == "layout"]
-    layout_lines = ["# Layouts (from SSOT)", ""]
-    for a in layout_atoms:
-        layout_lines.append(f"## {a.get('id', '')}")
-        layout_lines.append(a.get("statement", ""))
-        fields = (a.get("layout") or {}).get("fields") or []
-        if fields:
-            layout_lines.append("| Field | Offset | Length |")
-            layout_lines.append("|-------|--------|--------|")
-            for f in fields:
-                layout_lines.append(f"| {f.get('name')} | {f.get('offset')} | {f.get('length')} |")
-        layout_lines.append("")
-    (out_dir / "layouts.md").write_text("\n".join(layout_lines), encoding="utf-8")
+    with profiling.span("layouts.md"):
+        layout_atoms = registry.by_kind("layout")
+        layout_lines = ["# Layouts (from SSOT)", ""]
+        for a in layout_atoms:
+            layout_lines.append(f"## {a.get('id', '')}")
+            layout_lines.append(a.get("statement", ""))
+            fields = (a.get("layout") or {}).get("fields") or []
+            if fields:
+                layout_lines.append("| Field | Offset | Length |")
+                layout_lines.append("|-------|--------|--------|")
+                for f in fields:
+                    layout_lines.append(f"| {f.get('name')} | {f.get('offset')} | {f.get('length')} |")
+            layout_lines.append("")
+        (out_dir / "layouts.md").write_text("\n".join(layout_lines), encoding="utf-8")
 
     # 5. traceability.md — every atom ID exactly once
-    trace_lines = ["# Traceability (atoms → references)", ""]
-    for atom in atoms:
-        aid = atom.get("id", "")
-        trace_lines.append(f"## {aid}")
-        for ref in (atom.get("references") or []):
-            ln = ref.get("lines") or {}
-            trace_lines.append(f"- {ref.get('file')} `{ref.get('symbol')}` lines {ln.get('start')}-{ln.get('end')} ({ref.get('role')})")
-        trace_lines.append("")
-    (out_dir / "traceability.md").write_text("\n".join(trace_lines), encoding="utf-8")
-
-    # 6. manifest.json
-    generated_files = {}
-    for name in ["reticulum-wire-format.md", "constants.md", "contexts.md", "layouts.md", "traceability.md"]:
-        p = out_dir / name
-        if p.is_file():
-            generated_files[name] = hashlib.sha256(p.read_bytes()).hexdigest()
-    manifest = {
-        "ssot_version": ssot_version,
-        "ssot_content_sha256": ssot_content_sha256,
-        "source_commit": source_commit,
-        "generated_files": generated_files,
-    }
-    if excerpts_sha256:
-        manifest["excerpts_sha256"] = excerpts_sha256
-    (out_dir / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    with profiling.span("traceability.md"):
+        trace_lines = ["# Traceability (atoms → references)", ""]
+        for atom in atoms:
+            aid = atom.get("id", "")
+            trace_lines.append(f"## {aid}")
+            for ref in (atom.get("references") or []):
+                ln = ref.get("lines") or {}
+                trace_lines.append(f"- {ref.get('file')} `{ref.get('symbol')}` lines {ln.get('start')}-{ln.get('end')} ({ref.get('role')})")
+            trace_lines.append("")
+        (out_dir / "traceability.md").write_text("\n".join(trace_lines), encoding="utf-8")
+
+    # 6. codec.py — struct codecs for layout atoms
+    with profiling.span("codec.py"):
+        try:
+            codec = render_codec(layout_atoms)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 1
+        (out_dir / "codec.py").write_text(codec, encoding="utf-8")
+
+    # 7. manifest.json
+    with profiling.span("manifest.json"):
+        generated_files = {}
+        for name in ["reticulum-wire-format.md", "constants.md", "contexts.md", "layouts.md", "traceability.md", "codec.py"]:
+            p = out_dir / name
+            if p.is_file():
+                generated_files[name] = hashlib.sha256(p.read_bytes()).hexdigest()
+        manifest = {
+            "ssot_version": ssot_version,
+            "ssot_content_sha256": ssot_content_sha256,
+            "source_commit": source_commit,
+            "generated_files": generated_files,
+        }
+        if excerpts_sha256:
+            manifest["excerpts_sha256"] = excerpts_sha256
+        (out_dir / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
 
     return 0
 
 
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Compile SSOT into spec/generated.")
+    ap.add_argument("--out-dir", default="spec/generated", help="Output directory for generated files")
+    ap.add_argument("--cache-dir", default=".cache/compile_ssot", help="Per-atom render cache directory")
+    ap.add_argument("--no-cache", action="store_true", help="Render every atom; do not read or write the render cache")
+    ap.add_argument(
+        "--from-git",
+        action="store_true",
+        help="Read vendor files at manifest.repo_revision from git objects (no checkout of that commit needed)",
+    )
+    profiling.add_arguments(ap)
+    args = ap.parse_args()
+
+    repo_root = Path(__file__).resolve().parent.parent
+    ssot_path = repo_root / "spec" / "reticulum-wire-format.ssot.yaml"
+
+    if not ssot_path.is_file():
+        print(f"SSOT not found: {ssot_path}", file=sys.stderr)
+        return 1
+
+    with profiling.session(args.profile, "compile_ssot", args.profile_top):
+        with profiling.span("load_ssot"):
+            raw_ssot, data = load_yaml_bytes(ssot_path)
+        if not data:
+            print("SSOT is empty or invalid", file=sys.stderr)
+            return 1
+        cache_dir = None if args.no_cache else repo_root / args.cache_dir
+        if not args.from_git:
+            return compile_spec(data, raw_ssot, repo_root, repo_root / args.out_dir, cache_dir)
+        source_commit = ((data.get("manifest") or {}).get("repo_revision") or "").strip()
+        with GitBlobStore(repo_root / "vendor" / "reticulum-source") as store:
+            try:
+                index = GitVendorIndex(store, source_commit)
+            except ValueError as e:
+                print(e, file=sys.stderr)
+                return 1
+            return compile_spec(data, raw_ssot, repo_root, repo_root / args.out_dir, cache_dir, index)
+
+
 if __name__ == "__main__":
     sys.exit(main())
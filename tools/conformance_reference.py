@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+conformance_reference.py — Stand-in implementation for conformance_run.py, built from the reference code.
+
+    python tools/conformance_run.py                                   # runs this by default
+    python tools/conformance_reference.py --protocol binary < requests > responses
+
+Answers the conformance_run.py pipe protocol with the functions generate_vectors.py computes
+the vectors with (hashable part, signalling bytes, link id, batched IFAC mask/unmask) and the
+tools/framing.py codecs. Each batch is answered as a whole and flushed, in request order.
+ECPUBSIZE (the link id strip threshold) and MTU_BYTEMASK (signalling bytes) come from the
+SSOT given by --ssot.
+--ops restricts the ops announced in the hello reply; --corrupt OP flips the first byte of
+every hex output of OP (a known-bad implementation for testing the runner).
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import hashlib
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+from atom_registry import AtomRegistry
+from conformance_run import PROTOCOLS, read_message, write_message
+from framing import HDLCCodec, KISSCodec
+from generate_vectors import (
+    decode_signalling_bytes,
+    encode_signalling_bytes,
+    hashable_part,
+    ifac_mask_batch,
+    ifac_unmask_batch,
+    link_id_from_hashable_part,
+    load_yaml,
+)
+from random_vectors import Limits
+
+
+def _chunks(stream: bytes, sizes: list[int]) -> list[bytes]:
+    out, pos = [], 0
+    for n in sizes:
+        out.append(stream[pos : pos + n])
+        pos += n
+    if pos < len(stream):
+        out.append(stream[pos:])
+    return out
+
+
+def _hashable_part(items: list[dict]) -> list[dict]:
+    out = []
+    for it in items:
+        hp = hashable_part(bytes.fromhex(it["packet_hex"]), int(it["header_type"]))
+        out.append({"hashable_hex": hp.hex(), "sha256_hex": hashlib.sha256(hp).hexdigest()})
+    return out
+
+
+def _signalling_encode(items: list[dict], mtu_mask: int) -> list[dict]:
+    return [{"bytes_hex": encode_signalling_bytes(int(it["mtu"]), int(it["mode"]), mtu_mask).hex()} for it in items]
+
+
+def _signalling_decode(items: list[dict], mtu_mask: int) -> list[dict]:
+    out = []
+    for it in items:
+        mtu, mode = decode_signalling_bytes(bytes.fromhex(it["bytes_hex"]), mtu_mask)
+        out.append({"mtu": mtu, "mode": mode})
+    return out
+
+
+def _link_id(items: list[dict], ecpubsize: int) -> list[dict]:
+    return [{"link_id_hex": link_id_from_hashable_part(bytes.fromhex(it["hashable_part_hex"]), int(it["data_len"]), ecpubsize).hex()} for it in items]
+
+
+def _ifac_mask(items: list[dict]) -> list[dict]:
+    inputs = [(bytes.fromhex(it["canonical_packet_hex"]), bytes.fromhex(it["ifac_bytes_hex"]), bytes.fromhex(it["ifac_key_hex"])) for it in items]
+    return [{"on_wire_hex": w.hex()} for w in ifac_mask_batch(inputs)]
+
+
+def _ifac_unmask(items: list[dict]) -> list[dict]:
+    inputs = [(bytes.fromhex(it["on_wire_hex"]), int(it["ifac_size"]), bytes.fromhex(it["ifac_key_hex"])) for it in items]
+    return [{"canonical_packet_hex": c.hex()} for c in ifac_unmask_batch(inputs)]
+
+
+def _hdlc_encode(items: list[dict]) -> list[dict]:
+    return [{"encoded_hex": HDLCCodec.encode(bytes.fromhex(it["frame_hex"])).hex()} for it in items]
+
+
+def _hdlc_deframe(items: list[dict]) -> list[dict]:
+    out = []
+    for it in items:
+        codec = HDLCCodec()
+        frames = [f.hex() for chunk in _chunks(bytes.fromhex(it["stream_hex"]), it["chunk_sizes"]) for f in codec.feed(chunk)]
+        out.append({"frames_hex": frames})
+    return out
+
+
+def _kiss_encode(items: list[dict]) -> list[dict]:
+    return [{"encoded_hex": KISSCodec.encode(bytes.fromhex(it["data_hex"]), int(it["port"]), int(it["command"])).hex()} for it in items]
+
+
+def _kiss_deframe(items: list[dict]) -> list[dict]:
+    out = []
+    for it in items:
+        codec = KISSCodec()
+        frames = [
+            {"port": f.port, "command": f.command, "data_hex": f.data.hex()}
+            for chunk in _chunks(bytes.fromhex(it["stream_hex"]), it["chunk_sizes"])
+            for f in codec.feed(chunk)
+        ]
+        out.append({"frames": frames})
+    return out
+
+
+def make_ops(limits: Limits) -> dict[str, Callable[[list[dict]], list[dict]]]:
+    """The op table, with the SSOT constants in limits (Limits.from_ssot) bound in."""
+    return {
+        "hashable_part": _hashable_part,
+        "signalling_encode": functools.partial(_signalling_encode, mtu_mask=limits.mtu_bytemask),
+        "signalling_decode": functools.partial(_signalling_decode, mtu_mask=limits.mtu_bytemask),
+        "link_id": functools.partial(_link_id, ecpubsize=limits.ecpubsize),
+        "ifac_mask": _ifac_mask,
+        "ifac_unmask": _ifac_unmask,
+        "hdlc_encode": _hdlc_encode,
+        "hdlc_deframe": _hdlc_deframe,
+        "kiss_encode": _kiss_encode,
+        "kiss_deframe": _kiss_deframe,
+    }
+
+
+def _corrupt(result: dict[str, Any]) -> dict[str, Any]:
+    """Flip the first byte of every non-empty hex string output."""
+    return {k: f"{int(v[:2], 16) ^ 0xFF:02x}{v[2:]}" if k.endswith("_hex") and isinstance(v, str) and v else v for k, v in result.items()}
+
+
+def answer(msg: dict[str, Any], ops: dict[str, Callable], corrupt: str | None = None) -> dict[str, Any]:
+    """The response to one request; a batch that raises is answered per item so one bad input costs one item."""
+    op, items = msg.get("op"), msg.get("items") or []
+    if op == "hello":
+        return {"batch": msg.get("batch"), "ops": sorted(ops), "items": []}
+    fn = ops.get(op)
+    if fn is None:
+        return {"batch": msg.get("batch"), "items": [{"error": f"unsupported op {op!r}"}] * len(items)}
+    try:
+        results = fn(items)
+    except Exception:
+        results = []
+        for it in items:
+            try:
+                results.extend(fn([it]))
+            except Exception as e:
+                results.append({"error": f"{type(e).__name__}: {e}"})
+    if op == corrupt:
+        results = [_corrupt(r) for r in results]
+    return {"batch": msg.get("batch"), "items": results}
+
+
+def main() -> int:
+    repo_root = Path(__file__).resolve().parent.parent
+    ap = argparse.ArgumentParser(description="Reference stand-in for conformance_run.py (requests on stdin, responses on stdout).")
+    ap.add_argument("--ssot", default="spec/reticulum-wire-format.ssot.yaml", help="Path to SSOT YAML")
+    ap.add_argument("--protocol", choices=PROTOCOLS, default="jsonl")
+    ap.add_argument("--ops", help="Comma-separated ops to announce (default: all)")
+    ap.add_argument("--corrupt", metavar="OP", help="Answer OP with wrong bytes")
+    args = ap.parse_args()
+    ssot_path = repo_root / args.ssot
+    if not ssot_path.is_file():
+        print(f"SSOT not found: {ssot_path}", file=sys.stderr)
+        return 1
+    all_ops = make_ops(Limits.from_ssot(AtomRegistry.from_ssot(load_yaml(ssot_path))))
+    ops = {op: all_ops[op] for op in args.ops.split(",")} if args.ops else all_ops
+    stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+    while True:
+        msg = read_message(stdin, args.protocol)
+        if msg is None:
+            return 0
+        try:
+            write_message(stdout, answer(msg, ops, args.corrupt), args.protocol)
+        except BrokenPipeError:
+            return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
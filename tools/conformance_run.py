@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+conformance_run.py — Drive an external implementation through the conformance vectors over a pipe.
+
+Usage:
+    python tools/conformance_run.py [--impl "CMD ..."] [--protocol jsonl|binary] [--families F,...]
+        [--vectors-dir tests/vectors] [--random-vectors DIR] [--batch 2000] [--window 4]
+
+One process is started for the whole corpus (default: the reference stand-in,
+tools/conformance_reference.py). Every vector becomes one or more cases (an op, its inputs and the
+expected outputs); cases are sent in batches of --batch items, one op per batch, with up to
+--window batches in flight, from a writer thread while the main thread reads and checks the
+answers. Mismatches (first --max-report) go to stderr, a per-family table of cases, mismatches,
+errors and cases/s to stdout. Exit status 1 on any mismatch or error. The fuzz_vendor family
+holds the divergences tools/fuzz_vendor.py committed (vendor output expected), once there are any;
+a divergence where the vendor rejects the input expects an error item (any message).
+
+Protocol (stdin requests, stdout responses, answered in order):
+    request   {"batch": N, "op": OP, "items": [{inputs}, ...]}
+    response  {"batch": N, "items": [{outputs} | {"error": "..."}, ...]}   same length and order
+    batch 0 is {"op": "hello", "items": []}; its response lists the supported ops: {"batch": 0, "ops": [...], "items": []}.
+    Unsupported ops are skipped and counted. The runner closes stdin when done.
+--protocol jsonl: one compact JSON object per line. --protocol binary: u32 big-endian length,
+then the message as a .rvec document (tools/vector_corpus.py; meta = the message without
+"items", vectors = items), so "_hex" fields travel as raw bytes.
+
+Ops (inputs -> outputs; hex strings lowercase):
+    hashable_part       packet_hex, header_type           -> hashable_hex, sha256_hex
+    signalling_encode   mtu, mode                         -> bytes_hex
+    signalling_decode   bytes_hex                         -> mtu, mode
+    link_id             hashable_part_hex, data_len       -> link_id_hex (signalling bytes past ECPUBSIZE stripped)
+    ifac_mask           canonical_packet_hex, ifac_bytes_hex, ifac_key_hex -> on_wire_hex
+    ifac_unmask         on_wire_hex, ifac_size, ifac_key_hex               -> canonical_packet_hex
+    hdlc_encode         frame_hex                         -> encoded_hex
+    hdlc_deframe        stream_hex, chunk_sizes           -> frames_hex
+    kiss_encode         data_hex, port, command           -> encoded_hex
+    kiss_deframe        stream_hex, chunk_sizes           -> frames [{port, command, data_hex}]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import shlex
+import struct
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterator
+
+import random_vectors
+import ssot_loader
+import vector_corpus
+
+FAMILIES = ("hashable_part", "signalling_bytes", "link_id_from_linkrequest", "ifac_masking", "hdlc_framing", "kiss_framing", "fuzz_vendor")
+PROTOCOLS = ("jsonl", "binary")
+_LENGTH = struct.Struct(">I")
+
+# (op, inputs, expected outputs) for one vector
+Case = tuple[str, dict[str, Any], dict[str, Any]]
+
+
+# -----------------------------
+# Wire protocol (shared with conformance_reference.py)
+# -----------------------------
+
+
+def write_message(stream: BinaryIO, msg: dict[str, Any], protocol: str) -> None:
+    if protocol == "binary":
+        doc = {"meta": {k: v for k, v in msg.items() if k != "items"}, "vectors": msg.get("items") or []}
+        data = vector_corpus.dumps(doc, equivalence=False)
+        stream.write(_LENGTH.pack(len(data)) + data)
+    else:
+        stream.write(json.dumps(msg, separators=(",", ":")).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+def read_message(stream: BinaryIO, protocol: str) -> dict[str, Any] | None:
+    """Next message, or None at end of stream."""
+    if protocol == "binary":
+        head = stream.read(_LENGTH.size)
+        if len(head) < _LENGTH.size:
+            return None
+        (n,) = _LENGTH.unpack(head)
+        data = stream.read(n)
+        if len(data) < n:
+            return None
+        doc = vector_corpus.loads(data)
+        return {**(doc.get("meta") or {}), "items": doc["vectors"]}
+    line = stream.readline()
+    return json.loads(line) if line else None
+
+
+# -----------------------------
+# Vectors -> cases
+# -----------------------------
+
+
+def _expected(v: dict, **fields: str) -> dict[str, Any]:
+    """{output: v[vector key]} for the vector keys present."""
+    return {out: v[key] for out, key in fields.items() if key in v}
+
+
+def _hashable_part_cases(v: dict) -> list[Case]:
+    if "packet_hex" not in v or "expected_hashable_hex" not in v:
+        return []
+    inputs = {"packet_hex": v["packet_hex"], "header_type": v.get("header_type", 1)}
+    return [("hashable_part", inputs, _expected(v, hashable_hex="expected_hashable_hex", sha256_hex="expected_sha256_hex"))]
+
+
+def _signalling_cases(v: dict) -> list[Case]:
+    cases = []
+    if all(k in v for k in ("mtu", "mode", "expected_bytes_hex")):
+        cases.append(("signalling_encode", {"mtu": v["mtu"], "mode": v["mode"]}, {"bytes_hex": v["expected_bytes_hex"]}))
+    raw = v.get("bytes_hex") or v.get("expected_bytes_hex")
+    if raw and "expected_mtu" in v and "expected_mode" in v:
+        cases.append(("signalling_decode", {"bytes_hex": raw}, {"mtu": v["expected_mtu"], "mode": v["expected_mode"]}))
+    return cases
+
+
+def _link_id_cases(v: dict) -> list[Case]:
+    part = v.get("hashable_part_before_strip_hex") or v.get("hashable_part_hex")
+    if not part or not v.get("expected_link_id_hex"):
+        return []
+    inputs = {"hashable_part_hex": part, "data_len": v.get("data_len", len(part) // 2)}
+    return [("link_id", inputs, {"link_id_hex": v["expected_link_id_hex"]})]
+
+
+def _ifac_cases(v: dict) -> list[Case]:
+    if not all(k in v for k in ("canonical_packet_hex", "ifac_bytes_hex", "ifac_key_hex")):
+        return []
+    cases = []
+    if "expected_on_wire_hex" in v:
+        inputs = {k: v[k] for k in ("canonical_packet_hex", "ifac_bytes_hex", "ifac_key_hex")}
+        cases.append(("ifac_mask", inputs, {"on_wire_hex": v["expected_on_wire_hex"]}))
+        if "expected_recovered_canonical_hex" in v:
+            inputs = {"on_wire_hex": v["expected_on_wire_hex"], "ifac_size": len(v["ifac_bytes_hex"]) // 2, "ifac_key_hex": v["ifac_key_hex"]}
+            cases.append(("ifac_unmask", inputs, {"canonical_packet_hex": v["expected_recovered_canonical_hex"]}))
+    return cases
+
+
+def _hdlc_cases(v: dict) -> list[Case]:
+    if "frame_hex" in v and "expected_encoded_hex" in v:
+        return [("hdlc_encode", {"frame_hex": v["frame_hex"]}, {"encoded_hex": v["expected_encoded_hex"]})]
+    if "stream_hex" in v and "expected_frames_hex" in v:
+        inputs = {"stream_hex": v["stream_hex"], "chunk_sizes": v.get("chunk_sizes") or [len(v["stream_hex"]) // 2]}
+        return [("hdlc_deframe", inputs, {"frames_hex": v["expected_frames_hex"]})]
+    return []
+
+
+def _kiss_cases(v: dict) -> list[Case]:
+    if "data_hex" in v and "expected_encoded_hex" in v:
+        inputs = {"data_hex": v["data_hex"], "port": v.get("port", 0), "command": v.get("command", 0)}
+        return [("kiss_encode", inputs, {"encoded_hex": v["expected_encoded_hex"]})]
+    if "stream_hex" in v and "expected_frames" in v:
+        inputs = {"stream_hex": v["stream_hex"], "chunk_sizes": v.get("chunk_sizes") or [len(v["stream_hex"]) // 2]}
+        return [("kiss_deframe", inputs, {"frames": v["expected_frames"]})]
+    return []
+
+
+def _fuzz_cases(v: dict) -> list[Case]:
+    """fuzz_vendor.yaml (tools/fuzz_vendor.py): minimized inputs where reference and vendor diverged; expected is the vendor's."""
+    if "op" not in v or "input" not in v:
+        return []
+    if "expected" in v:
+        return [(v["op"], v["input"], v["expected"])]
+    if "expected_reject" in v:
+        return [(v["op"], v["input"], {"error": v["expected_reject"]})]
+    return []
+
+
+CASES: dict[str, Callable[[dict], list[Case]]] = {
+    "hashable_part": _hashable_part_cases,
+    "signalling_bytes": _signalling_cases,
+    "link_id_from_linkrequest": _link_id_cases,
+    "ifac_masking": _ifac_cases,
+    "hdlc_framing": _hdlc_cases,
+    "kiss_framing": _kiss_cases,
+    "fuzz_vendor": _fuzz_cases,
+}
+
+
+def iter_vectors(family: str, vectors_dir: Path | None, random_dir: Path | None) -> Iterator[dict]:
+    """Committed vectors of the family (.rvec, else YAML), then those of a --random directory."""
+    if vectors_dir is not None:
+        rvec = vectors_dir / f"{family}{vector_corpus.SUFFIX}"
+        yaml_path = vectors_dir / f"{family}.yaml"
+        if rvec.is_file():
+            with vector_corpus.VectorFile(rvec) as vf:
+                yield from vf
+        elif yaml_path.is_file():
+            yield from (ssot_loader.load_yaml(yaml_path, cache_dir=None) or {}).get("vectors") or []
+    if random_dir is not None:
+        yield from random_vectors.iter_vectors(random_dir, family)
+
+
+# -----------------------------
+# Runner
+# -----------------------------
+
+
+class FamilyStats:
+    """Counters of one family; seconds is the implementation time charged to its batches."""
+
+    __slots__ = ("cases", "mismatches", "errors", "unsupported", "seconds")
+
+    def __init__(self) -> None:
+        self.cases = self.mismatches = self.errors = self.unsupported = 0
+        self.seconds = 0.0
+
+
+class Runner:
+    """One implementation process; run() streams every case through it and checks the answers."""
+
+    def __init__(self, cmd: list[str], protocol: str = "jsonl", batch: int = 2000, window: int = 4, max_report: int = 20) -> None:
+        if protocol not in PROTOCOLS:
+            raise ValueError(f"protocol must be one of {', '.join(PROTOCOLS)}")
+        self.cmd, self.protocol, self.batch, self.window, self.max_report = cmd, protocol, max(1, batch), max(1, window), max_report
+        self.stats: dict[str, FamilyStats] = {}
+        self.reports: list[str] = []
+        self.failure: str | None = None
+
+    def _batches(self, families: list[tuple[str, Iterator[dict]]], ops: set[str]) -> Iterator[tuple[str, str, list]]:
+        """(family, op, [(name, inputs, expected), ...]) batches; unsupported ops are counted, not sent."""
+        for family, vectors in families:
+            stats = self.stats.setdefault(family, FamilyStats())
+            pending: dict[str, list] = {}
+            for v in vectors:
+                for op, inputs, expected in CASES[family](v):
+                    if op not in ops:
+                        stats.unsupported += 1
+                        continue
+                    cases = pending.setdefault(op, [])
+                    cases.append((v.get("name", "?"), inputs, expected))
+                    if len(cases) >= self.batch:
+                        yield family, op, pending.pop(op)
+            for op, cases in pending.items():
+                yield family, op, cases
+
+    def _report(self, line: str) -> None:
+        if len(self.reports) < self.max_report:
+            self.reports.append(line)
+
+    def _check(self, family: str, op: str, cases: list, items: list) -> None:
+        stats = self.stats[family]
+        if len(items) != len(cases):
+            stats.errors += len(cases)
+            self._report(f"{family} {op}: {len(items)} results for {len(cases)} items")
+            return
+        for (name, _, expected), got in zip(cases, items):
+            stats.cases += 1
+            if "error" in expected:  # the input must be rejected; the message is the implementation's own
+                if not (isinstance(got, dict) and "error" in got):
+                    stats.mismatches += 1
+                    self._report(f"{family}/{name} {op}: expected an error ({expected['error']}), got {_short(got)}")
+                continue
+            if not isinstance(got, dict) or "error" in got:
+                stats.errors += 1
+                self._report(f"{family}/{name} {op}: error: {got.get('error') if isinstance(got, dict) else got!r}")
+                continue
+            wrong = [k for k, want in expected.items() if got.get(k) != want]
+            if wrong:
+                stats.mismatches += 1
+                k = wrong[0]
+                self._report(f"{family}/{name} {op}: {k}: expected {_short(expected[k])}, got {_short(got.get(k))}")
+
+    def run(self, families: list[tuple[str, Iterator[dict]]]) -> dict[str, FamilyStats]:
+        proc = subprocess.Popen(self.cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        try:
+            write_message(proc.stdin, {"batch": 0, "op": "hello", "items": []}, self.protocol)
+            hello = read_message(proc.stdout, self.protocol)
+            if hello is None or hello.get("batch") != 0:
+                self.failure = "implementation did not answer hello"
+                return self.stats
+            self._pipeline(proc, families, set(hello.get("ops") or []))
+        except BrokenPipeError:
+            self.failure = "implementation closed its input"
+        finally:
+            if proc.stdin and not proc.stdin.closed:
+                try:
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    pass
+            code = proc.wait()
+            if code:
+                exited = f"implementation exited with status {code}"
+                self.failure = f"{self.failure} ({exited})" if self.failure else exited
+        return self.stats
+
+    def _pipeline(self, proc: subprocess.Popen, families: list[tuple[str, Iterator[dict]]], ops: set[str]) -> None:
+        in_flight: dict[int, tuple[str, str, list, float]] = {}  # batch -> (family, op, cases, sent at)
+        slots = threading.Semaphore(self.window)
+        stop = threading.Event()
+        sent = {"batches": 0, "done": False, "error": None}
+
+        def writer() -> None:
+            try:
+                for n, (family, op, cases) in enumerate(self._batches(families, ops), start=1):
+                    while not slots.acquire(timeout=0.1):
+                        if stop.is_set():
+                            return
+                    in_flight[n] = (family, op, cases, time.perf_counter())
+                    sent["batches"] = n
+                    write_message(proc.stdin, {"batch": n, "op": op, "items": [inputs for _, inputs, _ in cases]}, self.protocol)
+            except Exception as e:  # the implementation went away, or a vector file is bad: stop sending, report it
+                sent["error"] = e
+            finally:
+                sent["done"] = True
+                try:
+                    proc.stdin.close()
+                except OSError:
+                    pass
+
+        thread = threading.Thread(target=writer, name="conformance-writer", daemon=True)
+        thread.start()
+        answered = 0
+        last = time.perf_counter()
+        try:
+            while not (sent["done"] and answered == sent["batches"]):
+                msg = read_message(proc.stdout, self.protocol)
+                if msg is None:
+                    if not (sent["done"] and answered == sent["batches"]):
+                        self.failure = f"implementation stopped after {answered} of {sent['batches']} batches"
+                    break
+                batch = in_flight.pop(msg.get("batch"), None)
+                if batch is None:
+                    self.failure = f"unexpected response batch {msg.get('batch')!r}"
+                    break
+                family, op, cases, sent_at = batch
+                now = time.perf_counter()
+                # a batch is served once the one before it is answered: charge it from then (or its send), not from the queue
+                self.stats[family].seconds += now - max(sent_at, last)
+                last = now
+                self._check(family, op, cases, msg.get("items") or [])
+                answered += 1
+                slots.release()
+        finally:
+            stop.set()
+            thread.join(timeout=1.0)
+            if thread.is_alive():  # writer blocked on a pipe nobody reads any more
+                proc.kill()
+                thread.join()
+        if sent["error"] is not None and self.failure is None and not isinstance(sent["error"], BrokenPipeError):
+            self.failure = f"writer failed: {sent['error']}"
+
+    def summary(self) -> str:
+        lines = [f"{'family':<28} {'cases':>10} {'mismatch':>9} {'errors':>7} {'skipped':>8} {'seconds':>9} {'cases/s':>12}"]
+        for family, s in self.stats.items():
+            rate = f"{s.cases / s.seconds:>12,.0f}" if s.seconds else f"{'-':>12}"
+            lines.append(f"{family:<28} {s.cases:>10,} {s.mismatches:>9,} {s.errors:>7,} {s.unsupported:>8,} {s.seconds:>9.3f} {rate}")
+        return "\n".join(lines)
+
+    @property
+    def ok(self) -> bool:
+        return self.failure is None and not any(s.mismatches or s.errors for s in self.stats.values())
+
+
+def _short(value: Any, limit: int = 80) -> str:
+    text = repr(value)
+    return text if len(text) <= limit else text[: limit - 3] + "..."
+
+
+def main() -> int:
+    repo_root = Path(__file__).resolve().parent.parent
+    reference = [sys.executable, str(Path(__file__).resolve().parent / "conformance_reference.py")]
+    ap = argparse.ArgumentParser(description="Run the conformance vectors through an implementation over a stdin/stdout pipe.")
+    ap.add_argument("--impl", help="Implementation command line (default: the reference stand-in)")
+    ap.add_argument("--protocol", choices=PROTOCOLS, default="jsonl", help="Message framing on the pipe")
+    ap.add_argument("--families", help="Comma-separated families (default: all)")
+    ap.add_argument("--vectors-dir", default="tests/vectors", help="Committed vectors (.rvec, else YAML)")
+    ap.add_argument("--no-committed", action="store_true", help="Skip the committed vectors (run only --random-vectors)")
+    ap.add_argument("--random-vectors", metavar="DIR", help="Also run a generate_vectors.py --random directory")
+    ap.add_argument("--batch", type=int, default=2000, help="Items per request")
+    ap.add_argument("--window", type=int, default=4, help="Requests in flight")
+    ap.add_argument("--max-report", type=int, default=20, help="Mismatches printed")
+    args = ap.parse_args()
+
+    families = [f.strip() for f in args.families.split(",")] if args.families else list(FAMILIES)
+    unknown = [f for f in families if f not in CASES]
+    if unknown:
+        print(f"unknown families: {', '.join(unknown)}", file=sys.stderr)
+        return 1
+    cmd = shlex.split(args.impl) if args.impl else reference + ["--protocol", args.protocol]
+    vectors_dir = None if args.no_committed else repo_root / args.vectors_dir
+    random_dir = Path(args.random_vectors) if args.random_vectors else None
+    runner = Runner(cmd, args.protocol, args.batch, args.window, args.max_report)
+    runner.run([(family, iter_vectors(family, vectors_dir, random_dir)) for family in families])
+    for line in runner.reports:
+        print(line, file=sys.stderr)
+    if runner.failure:
+        print(runner.failure, file=sys.stderr)
+    print(runner.summary())
+    return 0 if runner.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,18 +11,32 @@ Bounded behaviour (plan section 4):
      - Constants: single line containing symbol ± 2 lines.
      - Functions/classes: full def/class block (parse with ast for .py files).
 - If symbol occurs more than once, MUST fail and require contractor to specify range manually.
+  Every unresolvable symbol is reported in one run, with its candidate lines.
+
+--fill looks symbols up in a per-revision index (tools/symbol_index.py: def/class ranges,
+assignments, substring hits), persisted under --cache-dir keyed by manifest.repo_revision
+and built with --jobs processes, so re-running a fill does not re-parse the vendor tree.
+Verification is sharded by vendor file over --jobs processes when there are at least
+PARALLEL_MIN_REFS references (verify_refs); errors are reported in SSOT order either way.
+--profile PATH writes a Chrome trace (tools/profiling.py) with one span per reference verified in-process.
 
 Schema vNext: repo_revision lives on manifest only; refs must not have repo_revision or excerpt_hash.
 - lines.start and lines.end are 1-indexed, inclusive.
 """
 
 import argparse
-import ast
 import hashlib
-import re
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
+import profiling
+import ssot_loader
+from symbol_index import SymbolIndex
+from vendor_index import VendorIndex
+
 
 def normalise_excerpt_bytes(content: str, start: int, end: int) -> bytes:
     """Compute excerpt bytes per plan section 3. start/end 1-indexed inclusive."""
@@ -43,119 +57,17 @@ def excerpt_hash(content: str, start: int, end: int) -> str:
     return hashlib.sha256(raw).hexdigest()
 
 
-def find_ast_def_ranges(content: str, symbol: str) -> list[tuple[int, int]]:
-    """
-    For .py content: find all FunctionDef/ClassDef/AsyncFunctionDef with node.name == symbol.
-    Returns list of (start, end) 1-indexed inclusive. Empty if not .py or parse error.
-    """
-    try:
-        tree = ast.parse(content)
-    except SyntaxError:
-        return []
-    matches = []
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-            if node.name == symbol:
-                end = node.end_lineno if hasattr(node, "end_lineno") and node.end_lineno else node.lineno
-                matches.append((node.lineno, end))
-    return matches
-
-
-def find_assignment_lines(content: str, symbol: str) -> list[int]:
-    """
-    Find line numbers (1-indexed) where symbol appears in assignment-ish form: ^SYMBOL\\s*=
-    (or with leading whitespace). Used for constants when AST has no def match.
-    """
-    pattern = re.compile(r"^\s*" + re.escape(symbol) + r"\s*=", re.MULTILINE)
-    lines = content.splitlines()
-    result = []
-    for i, line in enumerate(lines):
-        if pattern.match(line):
-            result.append(i + 1)
-    return result
-
-
-def find_symbol_line_ranges(content: str, symbol: str, filepath: str, kind_hint: str) -> list[tuple[int, int]]:
-    """
-    Find all (start, end) 1-indexed inclusive ranges where symbol appears (substring in line).
-    Returns list of (start_line, end_line) for each occurrence. Used as last resort.
-    """
-    lines = content.splitlines()
-    occurrences = []
-    for i, line in enumerate(lines):
-        if symbol in line:
-            occurrences.append((i + 1, i + 1))  # 1-indexed
-    return occurrences
-
-
-def fill_range_constant(content: str, line_one_indexed: int, window: int = 2) -> tuple[int, int]:
-    """Single line containing symbol ± window lines. 1-indexed inclusive (start, end)."""
-    lines = content.splitlines()
-    n = len(lines)
-    lo = max(1, line_one_indexed - window)
-    hi = min(n, line_one_indexed + window)
-    return (lo, hi)
-
-
-def fill_range_def_or_class(content: str, filepath: str, symbol: str) -> tuple[int, int] | None:
-    """Full def/class block via ast. Returns (start, end) 1-indexed inclusive or None."""
-    if not filepath.endswith(".py"):
-        return None
-    try:
-        tree = ast.parse(content)
-    except SyntaxError:
-        return None
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-            if node.name == symbol:
-                # ast line numbers are 1-indexed
-                start = node.lineno
-                end = node.end_lineno if hasattr(node, "end_lineno") and node.end_lineno else node.lineno
-                return (start, end)
-    return None
-
-
-def fill_line_range(content: str, filepath: str, symbol: str, kind_hint: str) -> tuple[int, int] | None:
-    """
-    Deterministic windowing. Returns (start, end) 1-indexed inclusive or None.
-    For .py: AST-first (FunctionDef/ClassDef by name), then assignment regex (^SYMBOL\\s*=),
-    then substring with uniqueness. Fails (returns None) if ambiguous; caller must exit non-zero.
-    """
-    if filepath.endswith(".py"):
-        # 1. AST-first: locate FunctionDef/ClassDef by exact node.name == symbol
-        ast_matches = find_ast_def_ranges(content, symbol)
-        if len(ast_matches) == 1:
-            return ast_matches[0]
-        if len(ast_matches) > 1:
-            return None  # ambiguous
-        # 2. No AST match: treat as constant, assignment-ish form
-        assign_lines = find_assignment_lines(content, symbol)
-        if len(assign_lines) == 1:
-            return fill_range_constant(content, assign_lines[0], 2)
-        if len(assign_lines) > 1:
-            return None
-        # 3. Fall back to substring; require uniqueness
-        occurrences = find_symbol_line_ranges(content, symbol, filepath, kind_hint)
-        if len(occurrences) != 1:
-            return None
-        return fill_range_constant(content, occurrences[0][0], 2)
-    # Non-.py: substring with uniqueness
-    occurrences = find_symbol_line_ranges(content, symbol, filepath, kind_hint)
-    if len(occurrences) == 0 or len(occurrences) > 1:
-        return None
-    return fill_range_constant(content, occurrences[0][0], 2)
-
-
-def verify_ref(vendor_root: Path, ref: dict, expected_commit: str) -> tuple[bool, str]:
+def verify_ref(vendor_root: Path, ref: dict, expected_commit: str, index: VendorIndex | None = None) -> tuple[bool, str]:
     """
     Verify one reference: file exists, symbol in range. Schema vNext: no repo_revision/excerpt_hash on ref.
-    Returns (ok, error_message).
+    Pass a shared VendorIndex to load each vendor file once across refs. Returns (ok, error_message).
     """
     filepath = ref.get("file")
     if not filepath:
         return (False, "reference missing 'file'")
-    path = vendor_root / filepath
-    if not path.is_file():
+    if index is None:
+        index = VendorIndex(vendor_root)
+    if not index.is_file(filepath):
         return (False, f"file not found under vendor: {filepath}")
     # repo_revision is on manifest only; ref must not override it
     if ref.get("repo_revision") is not None and ref.get("repo_revision") != expected_commit:
@@ -166,21 +78,87 @@ def verify_ref(vendor_root: Path, ref: dict, expected_commit: str) -> tuple[bool
     start, end = int(lines_obj["start"]), int(lines_obj["end"])
     if start > end:
         return (False, f"lines.start ({start}) > lines.end ({end})")
-    content = path.read_text(encoding="utf-8", errors="replace")
+    vf = index.get(filepath)
     symbol = ref.get("symbol", "")
     # Check symbol appears in range
-    excerpt_lines = content.replace("\r\n", "\n").splitlines()
-    if start < 1 or end > len(excerpt_lines):
-        return (False, f"lines [{start},{end}] out of range (file has {len(excerpt_lines)} lines)")
-    slice_text = "\n".join(excerpt_lines[start - 1 : end])
+    if start < 1 or end > vf.n_lines:
+        return (False, f"lines [{start},{end}] out of range (file has {vf.n_lines} lines)")
+    slice_text = vf.text(start, end)
     if symbol and symbol not in slice_text:
         return (False, f"symbol '{symbol}' not found in lines [{start},{end}]")
     # Schema vNext: no excerpt_hash on ref
     return (True, "")
 
 
+# -----------------------------
+# Parallel verification
+# -----------------------------
+
+PARALLEL_MIN_REFS = 500  # below this, starting worker processes costs more than the checks
+_REF_KEYS = ("file", "symbol", "lines", "repo_revision")
+
+_worker_index: VendorIndex | None = None
+
+
+def _init_worker(vendor_root: str) -> None:
+    global _worker_index
+    _worker_index = VendorIndex(Path(vendor_root))
+
+
+def _verify_shard(refs: list[dict], expected_commit: str) -> list[tuple[bool, str]]:
+    return [verify_ref(_worker_index.root, ref, expected_commit, _worker_index) for ref in refs]
+
+
+def _plain_ref(ref) -> dict:
+    """The fields verify_ref reads, as plain dicts (refs may be ruamel maps when filling)."""
+    return {k: dict(v) if k == "lines" and isinstance(v, dict) else v for k, v in ref.items() if k in _REF_KEYS}
+
+
+def shard_by_file(files: list) -> list[list[int]]:
+    """Positions grouped by file, shards in order of first appearance."""
+    groups: dict = {}
+    for i, f in enumerate(files):
+        groups.setdefault(f, []).append(i)
+    return list(groups.values())
+
+
+def verify_refs(
+    vendor_root: Path, refs: list[dict], expected_commit: str, index: VendorIndex | None = None, jobs: int = 1
+) -> list[tuple[bool, str]]:
+    """
+    verify_ref for every ref, results in input order. With jobs > 1 and at least PARALLEL_MIN_REFS
+    refs, refs are sharded by file across a ProcessPoolExecutor whose workers each keep one
+    VendorIndex, so a worker loads a vendor file at most once. An index over git objects
+    (index.revision set) is verified in-process.
+    """
+    if index is None:
+        index = VendorIndex(vendor_root)
+    if jobs <= 1 or len(refs) < PARALLEL_MIN_REFS or index.revision is not None:
+        if not profiling.enabled():
+            return [verify_ref(vendor_root, ref, expected_commit, index) for ref in refs]
+        results = []
+        for ref in refs:
+            lines = ref.get("lines") or {}
+            with profiling.span(ref.get("file"), "ref", lines=f"{lines.get('start')}-{lines.get('end')}"):
+                results.append(verify_ref(vendor_root, ref, expected_commit, index))
+        return results
+    shards = shard_by_file([ref.get("file") for ref in refs])
+    workers = min(jobs, len(shards))
+    results: list = [None] * len(refs)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(str(index.root),)) as pool:
+        batches = [[_plain_ref(refs[i]) for i in shard] for shard in shards]
+        outputs = pool.map(_verify_shard, batches, repeat(expected_commit), chunksize=max(1, len(shards) // (workers * 4)))
+        for shard, out in zip(shards, outputs):
+            for i, result in zip(shard, out):
+                results[i] = result
+    return results
+
+
 def load_ssot(path: Path, for_write: bool = False):
-    """Load SSOT. When for_write=True (--fill), MUST use ruamel.yaml for round-trip; fail if not available."""
+    """
+    Load SSOT. When for_write=True (--fill), MUST use ruamel.yaml for round-trip; fail if not available.
+    Otherwise the fast read-only loader (CSafeLoader + parse cache) is used.
+    """
     if for_write:
         try:
             from ruamel.yaml import YAML
@@ -193,21 +171,86 @@ def load_ssot(path: Path, for_write: bool = False):
             print("ruamel.yaml required for --fill (SSOT write); run: uv sync", file=sys.stderr)
             sys.exit(1)
     try:
-        import yaml
-
-        with open(path, encoding="utf-8") as f:
-            return yaml.safe_load(f), None
+        return ssot_loader.load_yaml(path), None
     except ImportError:
         print("PyYAML required; run: uv sync", file=sys.stderr)
         sys.exit(1)
 
 
+def _needs_fill(ref: dict) -> bool:
+    return bool(ref.get("symbol")) and not (ref.get("lines") or {}).get("start")
+
+
+def process_refs(
+    data,
+    vendor_root: Path,
+    fill: bool = False,
+    index: VendorIndex | None = None,
+    jobs: int = 1,
+    cache_dir: Path | None = None,
+) -> tuple[list[str], bool]:
+    """
+    Verify every reference in a loaded SSOT; with fill=True, fill missing line ranges in place
+    (unique symbols only) from a SymbolIndex for manifest.repo_revision, persisted under
+    cache_dir when given and built with up to jobs processes. References are verified with
+    verify_refs(jobs). Every unresolvable symbol is reported. Returns (errors, modified).
+    """
+    manifest = data.get("manifest") or {}
+    expected_commit = (manifest.get("repo_revision") or "").strip()
+    if not expected_commit:
+        return ["manifest.repo_revision is required; set it to the vendor commit."], False
+    atoms = data.get("atoms") or []
+    if index is None:
+        index = VendorIndex(vendor_root)
+    symbols = None
+    if fill:
+        wanted: dict[str, set[str]] = {}
+        for atom in atoms:
+            for ref in atom.get("references") or []:
+                if _needs_fill(ref) and ref.get("file") and index.is_file(ref["file"]):
+                    wanted.setdefault(ref["file"], set()).add(ref["symbol"])
+        if wanted:
+            with profiling.span("symbol_index", files=len(wanted)):
+                symbols = SymbolIndex(vendor_root, expected_commit, cache_dir, index)
+                symbols.prepare(wanted, jobs)
+    errors = []
+    modified = False
+    pairs = [(atom, ref) for atom in atoms for ref in atom.get("references") or []]
+    with profiling.span("verify_refs", refs=len(pairs), jobs=jobs):
+        verified = verify_refs(vendor_root, [ref for _, ref in pairs], expected_commit, index, jobs)
+    for (atom, ref), (ok, msg) in zip(pairs, verified):
+        # Schema vNext: do not write repo_revision or excerpt_hash to refs
+        if not ok:
+            if "lines" in ref and ref.get("lines", {}).get("start"):
+                errors.append(f"{atom.get('id', '?')} ref {ref.get('file')}: {msg}")
+            elif symbols is not None and ref.get("symbol") and index.is_file(ref.get("file") or ""):
+                # Try fill
+                filepath = ref.get("file")
+                rng, why = symbols.fill(filepath, ref["symbol"])
+                if rng is None:
+                    errors.append(f"{atom.get('id')} ref {filepath}: symbol '{ref['symbol']}' {why}; specify lines manually.")
+                else:
+                    ref["lines"] = {"start": rng[0], "end": rng[1]}
+                    # Schema vNext: do not write excerpt_hash
+                    modified = True
+            else:
+                errors.append(f"{atom.get('id', '?')} ref {ref.get('file')}: {msg}")
+    if symbols is not None:
+        symbols.save()
+        symbols.close()
+    return errors, modified
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Verify/fill SSOT references from vendor checkout.")
     parser.add_argument("--ssot", default="spec/reticulum-wire-format.ssot.yaml", help="SSOT YAML path")
     parser.add_argument("--vendor", default="vendor/reticulum-source", help="Vendor checkout root")
     parser.add_argument("--fill", action="store_true", help="Fill missing line ranges (when symbol unique)")
     parser.add_argument("--no-write", action="store_true", help="Only verify; do not write SSOT")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Processes for verifying references and indexing vendor files (--fill)")
+    parser.add_argument("--cache-dir", default=".cache/symbol_index", help="Per-revision symbol index directory (--fill)")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the symbol index")
+    profiling.add_arguments(parser)
     args = parser.parse_args()
     vendor_root = Path(args.vendor)
     if not vendor_root.is_dir():
@@ -217,52 +260,22 @@ def main() -> int:
     if not ssot_path.is_file():
         print(f"SSOT not found: {ssot_path}", file=sys.stderr)
         return 1
-    data, ruamel_yaml = load_ssot(ssot_path, for_write=args.fill and not args.no_write)
-    manifest = data.get("manifest") or {}
-    expected_commit = (manifest.get("repo_revision") or "").strip()
-    if not expected_commit:
-        print("manifest.repo_revision is required; set it to the vendor commit.", file=sys.stderr)
-        return 1
-    atoms = data.get("atoms") or []
-    errors = []
-    modified = False
-    for atom in atoms:
-        refs = atom.get("references") or []
-        kind = atom.get("kind", "")
-        for ref in refs:
-            # Schema vNext: do not write repo_revision or excerpt_hash to refs
-            ok, msg = verify_ref(vendor_root, ref, expected_commit)
-            if not ok:
-                if "lines" in ref and ref.get("lines", {}).get("start"):
-                    errors.append(f"{atom.get('id', '?')} ref {ref.get('file')}: {msg}")
-                elif args.fill and ref.get("symbol"):
-                    # Try fill
-                    filepath = ref.get("file")
-                    path = vendor_root / filepath
-                    content = path.read_text(encoding="utf-8", errors="replace")
-                    rng = fill_line_range(content, filepath, ref["symbol"], kind)
-                    if rng is None:
-                        errors.append(
-                            f"{atom.get('id')} ref {filepath}: symbol '{ref['symbol']}' "
-                            "occurs 0 or >1 time; specify lines manually."
-                        )
-                    else:
-                        ref["lines"] = {"start": rng[0], "end": rng[1]}
-                        # Schema vNext: do not write excerpt_hash
-                        modified = True
-                else:
-                    errors.append(f"{atom.get('id', '?')} ref {ref.get('file')}: {msg}")
-    for e in errors:
-        print(e, file=sys.stderr)
-    if errors:
-        return 1
-    if modified and not args.no_write:
-        if ruamel_yaml is None:
-            print("ruamel.yaml required to write SSOT; run: uv sync", file=sys.stderr)
+    with profiling.session(args.profile, "extract_refs", args.profile_top):
+        with profiling.span("load_ssot"):
+            data, ruamel_yaml = load_ssot(ssot_path, for_write=args.fill and not args.no_write)
+        cache_dir = None if args.no_cache else Path(args.cache_dir)
+        errors, modified = process_refs(data, vendor_root, fill=args.fill, jobs=max(1, args.jobs), cache_dir=cache_dir)
+        for e in errors:
+            print(e, file=sys.stderr)
+        if errors:
             return 1
-        with open(ssot_path, "w", encoding="utf-8") as f:
-            ruamel_yaml.dump(data, f)
-    return 0
+        if modified and not args.no_write:
+            if ruamel_yaml is None:
+                print("ruamel.yaml required to write SSOT; run: uv sync", file=sys.stderr)
+                return 1
+            with profiling.span(ssot_path.name, "output"), open(ssot_path, "w", encoding="utf-8") as f:
+                ruamel_yaml.dump(data, f)
+        return 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,193 @@
+"""
+framing.py — Streaming interface framing codecs (RNS.TRN.BEHAV.HDLC_FRAMING, RNS.TRN.BEHAV.KISS_FRAMING).
+
+HDLC (TCP, Serial, Pipe, Weave): packets delimited by FLAG 0x7E; 0x7E escaped to 0x7D 0x5E,
+0x7D escaped to 0x7D 0x5D. A frame is the unescaped bytes between two FLAG bytes; the closing
+FLAG of one frame is the opening FLAG of the next, so back-to-back FLAGs yield empty frames,
+which are dropped. Bytes before the first FLAG are discarded.
+
+KISS (packet radio): frames delimited by FEND 0xC0; 0xC0 escaped to 0xDB 0xDC (FESC TFEND),
+0xDB escaped to 0xDB 0xDD (FESC TFESC). The first unescaped byte of a frame is the command
+byte: high nibble KISS port, low nibble command (0x00 = CMD_DATA). The command byte is
+escaped with the data.
+
+Codecs are chunk-fed: feed() accepts arbitrary-sized chunks and returns the frames completed
+by that chunk. Each codec keeps one reusable bytearray; frame boundaries are found with
+find() and escapes are undone with bytes.replace on whole frames, so an escape pair
+split across chunks is handled without per-byte state.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+HDLC_FLAG = 0x7E
+HDLC_ESC = 0x7D
+HDLC_ESC_MASK = 0x20
+
+_HDLC_FLAG_B = bytes([HDLC_FLAG])
+_HDLC_ESC_B = bytes([HDLC_ESC])
+_HDLC_ESCAPED_FLAG = bytes([HDLC_ESC, HDLC_FLAG ^ HDLC_ESC_MASK])
+_HDLC_ESCAPED_ESC = bytes([HDLC_ESC, HDLC_ESC ^ HDLC_ESC_MASK])
+
+
+def hdlc_escape(data: bytes) -> bytes:
+    """Escape ESC first, then FLAG (same order as the vendor TCPInterface HDLC.escape)."""
+    return bytes(data).replace(_HDLC_ESC_B, _HDLC_ESCAPED_ESC).replace(_HDLC_FLAG_B, _HDLC_ESCAPED_FLAG)
+
+
+def hdlc_unescape(data: bytes) -> bytes:
+    """Undo hdlc_escape: 0x7D 0x5E -> 0x7E, then 0x7D 0x5D -> 0x7D."""
+    return bytes(data).replace(_HDLC_ESCAPED_FLAG, _HDLC_FLAG_B).replace(_HDLC_ESCAPED_ESC, _HDLC_ESC_B)
+
+
+class HDLCCodec:
+    """Incremental HDLC deframer/encoder. feed() chunks in, complete unescaped frames out."""
+
+    __slots__ = ("_buf", "_scan")
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._scan = 0  # offset in _buf from which to look for the next closing FLAG
+
+    @staticmethod
+    def encode(frame: bytes) -> bytes:
+        """FLAG + escaped frame + FLAG."""
+        return _HDLC_FLAG_B + hdlc_escape(frame) + _HDLC_FLAG_B
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Append chunk; return the frames it completed, in order. Empty frames are dropped."""
+        buf = self._buf
+        buf += chunk
+        frames: list[bytes] = []
+        if not buf or buf[0] != HDLC_FLAG:
+            start = buf.find(HDLC_FLAG)
+            if start == -1:
+                buf.clear()  # no opening FLAG: nothing here can become a frame
+                self._scan = 0
+                return frames
+            del buf[:start]
+            self._scan = 1
+        pos = 0
+        end = buf.find(HDLC_FLAG, max(self._scan, 1))
+        while end != -1:
+            if end - pos > 1:
+                frames.append(hdlc_unescape(buf[pos + 1 : end]))
+            pos = end
+            end = buf.find(HDLC_FLAG, pos + 1)
+        if pos:
+            del buf[:pos]
+        self._scan = len(buf)
+        return frames
+
+    def pending(self) -> int:
+        """Bytes buffered after the last opening FLAG (an incomplete frame)."""
+        return len(self._buf)
+
+    def reset(self) -> None:
+        self._buf.clear()
+        self._scan = 0
+
+
+KISS_FEND = 0xC0
+KISS_FESC = 0xDB
+KISS_TFEND = 0xDC
+KISS_TFESC = 0xDD
+KISS_CMD_DATA = 0x00
+
+_KISS_FEND_B = bytes([KISS_FEND])
+_KISS_FESC_B = bytes([KISS_FESC])
+_KISS_ESCAPED_FEND = bytes([KISS_FESC, KISS_TFEND])
+_KISS_ESCAPED_FESC = bytes([KISS_FESC, KISS_TFESC])
+
+
+def kiss_escape(data: bytes) -> bytes:
+    """Escape FESC first, then FEND (same order as the vendor KISS.escape)."""
+    return bytes(data).replace(_KISS_FESC_B, _KISS_ESCAPED_FESC).replace(_KISS_FEND_B, _KISS_ESCAPED_FEND)
+
+
+def kiss_unescape(data: bytes) -> bytes:
+    """Undo kiss_escape: FESC TFEND -> FEND, then FESC TFESC -> FESC."""
+    return bytes(data).replace(_KISS_ESCAPED_FEND, _KISS_FEND_B).replace(_KISS_ESCAPED_FESC, _KISS_FESC_B)
+
+
+class KISSFrame(NamedTuple):
+    port: int
+    command: int
+    data: memoryview
+
+
+class KISSCodec:
+    """
+    Incremental KISS deframer/encoder with port/command demux. feed() chunks in, KISSFrame out.
+
+    Frame data is a memoryview: for frames without escapes it is a zero-copy slice of the
+    (immutable) chunk the frame arrived in; only escaped frames, and the one frame straddling
+    two chunks, are copied. Only the incomplete tail after the last FEND is kept, in one
+    reusable bytearray.
+    """
+
+    __slots__ = ("_buf",)
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+
+    @staticmethod
+    def encode(data: bytes, port: int = 0, command: int = KISS_CMD_DATA) -> bytes:
+        """FEND + escape(command byte + data) + FEND; command byte = (port << 4) | command."""
+        if not 0 <= port <= 0x0F or not 0 <= command <= 0x0F:
+            raise ValueError("KISS port and command must each fit in a nibble")
+        return _KISS_FEND_B + kiss_escape(bytes([(port << 4) | command]) + bytes(data)) + _KISS_FEND_B
+
+    def feed(self, chunk: bytes) -> list[KISSFrame]:
+        """Append chunk; return the frames it completed, in order. Empty frames are dropped."""
+        chunk = bytes(chunk)  # no copy when chunk is already bytes
+        frames: list[KISSFrame] = []
+        buf = self._buf
+        if buf:
+            # Only the frame straddling the previous chunk is joined; the rest is sliced from chunk.
+            start = chunk.find(KISS_FEND)
+            if start == -1:
+                buf += chunk
+                return frames
+            buf += chunk[: start + 1]
+            if len(buf) > 2:
+                head = bytes(buf)
+                frames.append(self._frame(head, memoryview(head), 1, len(head) - 1))
+            buf.clear()
+        else:
+            start = chunk.find(KISS_FEND)
+            if start == -1:
+                return frames  # no opening FEND: nothing here can become a frame
+        mv = memoryview(chunk)
+        end = chunk.find(KISS_FEND, start + 1)
+        while end != -1:
+            if end - start > 1:
+                frames.append(self._frame(chunk, mv, start + 1, end))
+            start = end
+            end = chunk.find(KISS_FEND, start + 1)
+        buf += mv[start:]
+        return frames
+
+    def feed_ports(self, chunk: bytes) -> dict[int, list[memoryview]]:
+        """feed(), keeping only CMD_DATA frames, grouped by KISS port (arrival order within a port)."""
+        by_port: dict[int, list[memoryview]] = {}
+        for frame in self.feed(chunk):
+            if frame.command == KISS_CMD_DATA:
+                by_port.setdefault(frame.port, []).append(frame.data)
+        return by_port
+
+    @staticmethod
+    def _frame(data: bytes, mv: memoryview, start: int, end: int) -> KISSFrame:
+        if data.find(KISS_FESC, start, end) == -1:
+            cmd = data[start]
+            return KISSFrame(cmd >> 4, cmd & 0x0F, mv[start + 1 : end])
+        raw = kiss_unescape(mv[start:end])
+        return KISSFrame(raw[0] >> 4, raw[0] & 0x0F, memoryview(raw)[1:])
+
+    def pending(self) -> int:
+        """Bytes buffered after the last FEND (an incomplete frame)."""
+        return len(self._buf)
+
+    def reset(self) -> None:
+        self._buf.clear()
@@ -0,0 +1,609 @@
+#!/usr/bin/env python3
+"""
+fuzz_vendor.py — Differential fuzzing of the SSOT reference functions against the pinned vendor RNS code.
+
+Usage:
+    python tools/fuzz_vendor.py [--targets T,...] [--jobs N] [--duration SECONDS | --iterations N]
+        [--seed S] [--max-divergences N] [--write-vectors [PATH]] [--impl vendor|reference]
+
+Every target feeds the same input to the reference functions (generate_vectors.py) and to the
+code path of vendor/reticulum-source that computes the same thing, imported in-process
+(manifest.repo_revision must be checked out):
+
+    hashable_part       packet_hex, header_type     RNS.Packet.get_hashable_part
+    signalling_encode   mtu, mode                   RNS.Link.signalling_bytes
+    signalling_decode   bytes_hex                   RNS.Link.mtu_from_lr_packet / mode_from_lr_packet
+    link_id             hashable_part_hex, data_len RNS.Link.link_id_from_lr_packet
+    ifac_mask           canonical_packet_hex, ifac_bytes_hex, ifac_key_hex   RNS.Transport.transmit
+    ifac_unmask         on_wire_hex, ifac_size, ifac_key_hex                 RNS.Transport.inbound
+
+Inputs use the conformance_run.py op field names and stay inside the SSOT limits (packet sizes
+up to MTU, IFAC sizes IFAC_MIN_SIZE..64, 32-byte IFAC keys; signalling modes limited to the
+vendor's Link.ENABLED_MODES). The vendor side sees packets as bare RNS.Packet shells and IFAC
+through a stand-in interface whose identity "signs" with the given IFAC bytes: transmit's
+process_outgoing() output is the masked packet, and the packet inbound() passes to sign() to
+authenticate is the unmasked one. An input both sides reject (exception, dropped packet) agrees.
+
+Mutation-based, behaviour-guided: each worker (--jobs processes) starts from the committed
+vectors as seed corpus, then mostly mutates corpus entries (bit flips, interesting bytes,
+insert/delete, resize, splice, integer boundaries) and sometimes draws fresh random inputs; an
+input whose outcome signature (accept/reject on each side, output length) is new joins the
+corpus. Worker k of target t draws from random_vectors.shard_rng(seed, t, k), so --iterations
+runs are reproducible. A divergent input is minimized (shorter byte strings, zeroed bytes and
+bits, smaller integers) while it still diverges, and reported once. --write-vectors merges the
+minimized divergences into tests/vectors/fuzz_vendor.yaml (+ .rvec) with the vendor output as
+expected value; conformance_run.py and tests/test_fuzz_vendor.py run them from then on.
+
+Prints execs/sec per target and overall; exit status 1 if any input diverged.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import random
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+import conformance_run
+import vector_corpus
+from atom_registry import AtomRegistry
+from generate_vectors import (
+    IFAC_KEY_BYTES,
+    decode_signalling_bytes,
+    dump_yaml_stable,
+    encode_signalling_bytes,
+    hashable_part,
+    ifac_mask_transform,
+    ifac_unmask_transform,
+    link_id_from_hashable_part,
+    load_yaml,
+)
+from random_vectors import IFAC_MAX_SIZE, Limits, shard_rng
+
+TARGETS = ("hashable_part", "signalling_encode", "signalling_decode", "link_id", "ifac_mask", "ifac_unmask")
+VECTORS_NAME = "fuzz_vendor.yaml"
+CHUNK = 256  # execs per target between clock reads and target switches
+MINIMIZE_BUDGET = 2000  # execs spent minimizing one divergent input
+MINIMIZE_RUNS = 5  # minimizations per kept divergence (later divergent inputs mostly reduce to ones already kept)
+CORPUS_MAX = 4096
+_INTERESTING_BYTES = (0x00, 0x01, 0x0F, 0x10, 0x1F, 0x20, 0x3F, 0x40, 0x7D, 0x7E, 0x7F, 0x80, 0xC0, 0xDB, 0xE0, 0xFE, 0xFF)
+
+
+@dataclass(frozen=True)
+class Field:
+    """One input field: a byte string of lo..hi bytes (name ends in _hex) or an integer in lo..hi (or one of choices)."""
+
+    name: str
+    lo: int
+    hi: int
+    choices: tuple[int, ...] = ()
+
+    @property
+    def is_bytes(self) -> bool:
+        return self.name.endswith("_hex")
+
+
+def target_fields(limits: Limits) -> dict[str, tuple[Field, ...]]:
+    """Input domain of every target under the SSOT limits."""
+    return {
+        "hashable_part": (Field("packet_hex", limits.header_minsize, limits.mtu), Field("header_type", 1, 2, (1, 2))),
+        "signalling_encode": (Field("mtu", 0, 2**22 - 1), Field("mode", 0, 7)),
+        "signalling_decode": (Field("bytes_hex", limits.link_mtu_size, limits.link_mtu_size),),
+        "link_id": (Field("hashable_part_hex", 1, limits.mtu), Field("data_len", 0, limits.ecpubsize + limits.link_mtu_size)),
+        "ifac_mask": (
+            Field("canonical_packet_hex", limits.header_minsize, limits.mtu - limits.ifac_min_size),
+            Field("ifac_bytes_hex", limits.ifac_min_size, IFAC_MAX_SIZE),
+            Field("ifac_key_hex", IFAC_KEY_BYTES, IFAC_KEY_BYTES),
+        ),
+        "ifac_unmask": (
+            Field("on_wire_hex", limits.header_minsize + limits.ifac_min_size, limits.mtu),
+            Field("ifac_size", limits.ifac_min_size, IFAC_MAX_SIZE),
+            Field("ifac_key_hex", IFAC_KEY_BYTES, IFAC_KEY_BYTES),
+        ),
+    }
+
+
+def outputs(target: str, value: Any) -> dict[str, Any]:
+    """A target result as conformance_run.py op outputs (the fuzz_vendor.yaml expected values)."""
+    if target == "hashable_part":
+        return {"hashable_hex": value.hex(), "sha256_hex": hashlib.sha256(value).hexdigest()}
+    if target == "signalling_decode":
+        return {"mtu": value[0], "mode": value[1]}
+    key = {"signalling_encode": "bytes_hex", "link_id": "link_id_hex", "ifac_mask": "on_wire_hex", "ifac_unmask": "canonical_packet_hex"}[target]
+    return {key: bytes(value).hex()}
+
+
+# -----------------------------
+# Implementations (one method per target; raising = rejecting the input)
+# -----------------------------
+
+
+class Reference:
+    """The SSOT reference functions. Also usable as the implementation under test (--impl reference: harness self-check)."""
+
+    domains: dict[tuple[str, str], tuple[int, ...]] = {}
+
+    def __init__(self, limits: Limits) -> None:
+        self.limits = limits
+
+    def hashable_part(self, x: dict) -> bytes:
+        return hashable_part(x["packet_hex"], x["header_type"])
+
+    def signalling_encode(self, x: dict) -> bytes:
+        return encode_signalling_bytes(x["mtu"], x["mode"], self.limits.mtu_bytemask)
+
+    def signalling_decode(self, x: dict) -> tuple[int, int]:
+        return decode_signalling_bytes(x["bytes_hex"], self.limits.mtu_bytemask)
+
+    def link_id(self, x: dict) -> bytes:
+        return link_id_from_hashable_part(x["hashable_part_hex"], x["data_len"], self.limits.ecpubsize)
+
+    def ifac_mask(self, x: dict) -> bytes:
+        return ifac_mask_transform(x["canonical_packet_hex"], x["ifac_bytes_hex"], x["ifac_key_hex"])
+
+    def ifac_unmask(self, x: dict) -> bytes:
+        return ifac_unmask_transform(x["on_wire_hex"], x["ifac_size"], x["ifac_key_hex"])
+
+
+class _IfacInterface:
+    """Just enough of an RNS interface for Transport.transmit/inbound with IFAC enabled; the identity is itself."""
+
+    name = "fuzz_vendor"
+    rxb = txb = 0
+
+    def __init__(self, signature: bytes, ifac_size: int, ifac_key: bytes) -> None:
+        self.ifac_identity = self
+        self.ifac_size, self.ifac_key, self.signature = ifac_size, ifac_key, signature
+        self.signed: bytes | None = None
+        self.sent: bytes | None = None
+
+    def sign(self, data: bytes) -> bytes:
+        self.signed = bytes(data)
+        return self.signature
+
+    def process_outgoing(self, raw: bytes) -> None:
+        self.sent = bytes(raw)
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class VendorImpl:
+    """The same computations through the vendor RNS package at vendor_root (imported once per process)."""
+
+    def __init__(self, limits: Limits, vendor_root: Path) -> None:
+        if str(vendor_root) not in sys.path:
+            sys.path.insert(0, str(vendor_root))
+        import RNS
+
+        RNS.loglevel = -1  # Transport logs (and swallows) transmit errors; keep the fuzzer's output clean
+        self.RNS = RNS
+        self.limits = limits
+        modes = getattr(RNS.Link, "ENABLED_MODES", None)
+        self.domains = {("signalling_encode", "mode"): tuple(modes)} if modes else {}
+
+    def _packet(self, raw: bytes = b"", header_type: int = 1, data: bytes = b""):
+        packet = self.RNS.Packet.__new__(self.RNS.Packet)
+        packet.raw = raw
+        packet.header_type = self.RNS.Packet.HEADER_2 if header_type == 2 else self.RNS.Packet.HEADER_1
+        packet.data = data
+        return packet
+
+    def hashable_part(self, x: dict) -> bytes:
+        return self._packet(x["packet_hex"], x["header_type"]).get_hashable_part()
+
+    def signalling_encode(self, x: dict) -> bytes:
+        return self.RNS.Link.signalling_bytes(x["mtu"], x["mode"])
+
+    def signalling_decode(self, x: dict) -> tuple[int, int]:
+        packet = self._packet(data=bytes(self.limits.ecpubsize) + x["bytes_hex"])
+        return self.RNS.Link.mtu_from_lr_packet(packet), self.RNS.Link.mode_from_lr_packet(packet)
+
+    def link_id(self, x: dict) -> bytes:
+        packet = self._packet(data=bytes(x["data_len"]))
+        part = x["hashable_part_hex"]
+        packet.get_hashable_part = lambda: part
+        return self.RNS.Link.link_id_from_lr_packet(packet)
+
+    def ifac_mask(self, x: dict) -> bytes:
+        ifac = x["ifac_bytes_hex"]
+        interface = _IfacInterface(ifac, len(ifac), x["ifac_key_hex"])
+        self.RNS.Transport.transmit(interface, x["canonical_packet_hex"])
+        if interface.sent is None:
+            raise ValueError("transmit sent nothing")
+        return interface.sent
+
+    def ifac_unmask(self, x: dict) -> bytes:
+        wire, size = x["on_wire_hex"], x["ifac_size"]
+        # never authenticates (inverted IFAC), so inbound returns right after unmasking
+        interface = _IfacInterface(bytes(b ^ 0xFF for b in wire[2 : 2 + size]), size, x["ifac_key_hex"])
+        self.RNS.Transport.inbound(wire, interface)
+        if interface.signed is None:
+            raise ValueError("inbound dropped the packet before authenticating it")
+        return interface.signed
+
+
+def vendor_head(vendor_root: Path) -> str | None:
+    try:
+        out = subprocess.run(["git", "-C", str(vendor_root), "rev-parse", "HEAD"], capture_output=True, text=True, timeout=5)
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    return out.stdout.strip() or None
+
+
+# -----------------------------
+# Mutation engine
+# -----------------------------
+
+
+def _random_value(rng: random.Random, field: Field, choices: tuple[int, ...]) -> bytes | int:
+    if field.is_bytes:
+        return rng.randbytes(rng.randint(field.lo, field.hi))
+    return rng.choice(choices) if choices else rng.randint(field.lo, field.hi)
+
+
+def _mutate_bytes(rng: random.Random, field: Field, value: bytes, other: bytes) -> bytes:
+    buf = bytearray(value)
+    op = rng.randrange(8)
+    if op == 0 and buf:
+        i = rng.randrange(len(buf))
+        buf[i] ^= 1 << rng.randrange(8)
+    elif op == 1 and buf:
+        buf[rng.randrange(len(buf))] = rng.choice(_INTERESTING_BYTES)
+    elif op == 2 and buf:
+        buf[rng.randrange(len(buf))] = rng.getrandbits(8)
+    elif op == 3 and len(buf) < field.hi:
+        buf.insert(rng.randint(0, len(buf)), rng.choice(_INTERESTING_BYTES) if rng.getrandbits(1) else rng.getrandbits(8))
+    elif op == 4 and len(buf) > field.lo:
+        del buf[rng.randrange(len(buf))]
+    elif op == 5:
+        n = rng.choice((field.lo, field.hi, rng.randint(field.lo, field.hi)))
+        buf = buf[:n] + bytearray(rng.randbytes(max(0, n - len(buf))))
+    elif op == 6 and other:
+        cut = rng.randint(0, min(len(buf), len(other)))
+        buf = buf[:cut] + bytearray(other[cut:])
+    elif buf:
+        i, j = rng.randrange(len(buf)), rng.randrange(len(buf))
+        n = rng.randint(1, len(buf) - max(i, j))
+        buf[j : j + n] = buf[i : i + n]
+    if len(buf) < field.lo:
+        buf += rng.randbytes(field.lo - len(buf))
+    return bytes(buf[: field.hi])
+
+
+def _mutate_int(rng: random.Random, field: Field, value: int) -> int:
+    op = rng.randrange(4)
+    if op == 0:
+        value += rng.choice((-1, 1))
+    elif op == 1:
+        value ^= 1 << rng.randrange(max(1, field.hi.bit_length()))
+    elif op == 2:
+        k = rng.randrange(max(1, field.hi.bit_length()) + 1)
+        value = rng.choice((field.lo, field.hi, 2**k, 2**k - 1))
+    else:
+        value = rng.randint(field.lo, field.hi)
+    return min(max(value, field.lo), field.hi)
+
+
+class Fuzzer:
+    """Generation, mutation and minimization of one target's inputs, checked as reference vs implementation."""
+
+    def __init__(self, target: str, fields: tuple[Field, ...], reference: Reference, impl: Any, rng: random.Random) -> None:
+        self.target, self.fields, self.rng = target, fields, rng
+        self.choices = {f.name: impl.domains.get((target, f.name), f.choices) for f in fields}
+        self.ref_fn: Callable = getattr(reference, target)
+        self.impl_fn: Callable = getattr(impl, target)
+        self.corpus: list[dict] = []
+        self.signatures: set[tuple] = set()
+
+    def in_domain(self, x: dict) -> bool:
+        for f in self.fields:
+            v = x.get(f.name)
+            if f.is_bytes:
+                if not isinstance(v, bytes) or not f.lo <= len(v) <= f.hi:
+                    return False
+            elif not isinstance(v, int) or not f.lo <= v <= f.hi or (self.choices[f.name] and v not in self.choices[f.name]):
+                return False
+        return True
+
+    def generate(self) -> dict:
+        return {f.name: _random_value(self.rng, f, self.choices[f.name]) for f in self.fields}
+
+    def mutate(self, x: dict) -> dict:
+        x = dict(x)
+        for _ in range(self.rng.randint(1, 3)):
+            f = self.rng.choice(self.fields)
+            if f.is_bytes:
+                other = self.rng.choice(self.corpus)[f.name] if self.corpus else b""
+                x[f.name] = _mutate_bytes(self.rng, f, x[f.name], other)
+            elif self.choices[f.name]:
+                x[f.name] = self.rng.choice(self.choices[f.name])
+            else:
+                x[f.name] = _mutate_int(self.rng, f, x[f.name])
+        return x
+
+    def next_input(self) -> dict:
+        if not self.corpus or self.rng.random() < 0.2:
+            return self.generate()
+        return self.mutate(self.rng.choice(self.corpus))
+
+    @staticmethod
+    def _outcome(fn: Callable, x: dict) -> tuple[str, Any]:
+        try:
+            return "ok", fn(x)
+        except Exception as e:
+            return "reject", type(e).__name__
+
+    def run(self, x: dict) -> tuple[bool, tuple, tuple]:
+        """(diverges, reference outcome, implementation outcome) for one input."""
+        ref, got = self._outcome(self.ref_fn, x), self._outcome(self.impl_fn, x)
+        diverges = ref != got and not (ref[0] == got[0] == "reject")
+        return diverges, ref, got
+
+    def observe(self, x: dict, ref: tuple, got: tuple) -> None:
+        """Keep x in the corpus when its outcome signature is new."""
+        sig = tuple((o[0], o[1] if o[0] == "reject" else len(o[1]) if isinstance(o[1], (bytes, bytearray)) else None) for o in (ref, got))
+        if sig not in self.signatures and len(self.corpus) < CORPUS_MAX:
+            self.signatures.add(sig)
+            self.corpus.append(x)
+
+    def minimize(self, x: dict) -> tuple[dict, int]:
+        """A smaller input that still diverges (shorter, zeroed bytes, smaller ints) and the execs spent."""
+        execs = 0
+
+        def diverges(candidate: dict) -> bool:
+            nonlocal execs
+            execs += 1
+            return self.in_domain(candidate) and self.run(candidate)[0]
+
+        for f in self.fields:
+            if f.is_bytes:
+                n = len(x[f.name]) // 2
+                while n >= 1 and execs < MINIMIZE_BUDGET:
+                    v, i, shrunk = x[f.name], 0, False
+                    while i < len(v) and execs < MINIMIZE_BUDGET:
+                        candidate = {**x, f.name: v[:i] + v[i + n :]}
+                        if diverges(candidate):
+                            x, v, shrunk = candidate, candidate[f.name], True
+                        else:
+                            i += n
+                    if not shrunk:
+                        n //= 2
+                for i in range(len(x[f.name])):
+                    # zero the byte, else clear what bits can go (highest first)
+                    for bit in (0xFF, 0x80, 0x40, 0x20, 0x10, 0x08, 0x04, 0x02, 0x01):
+                        v = x[f.name]
+                        if execs >= MINIMIZE_BUDGET or not v[i]:
+                            break
+                        if v[i] & bit and v[i] != v[i] & ~bit & 0xFF:
+                            candidate = {**x, f.name: v[:i] + bytes([v[i] & ~bit & 0xFF]) + v[i + 1 :]}
+                            if diverges(candidate):
+                                x = candidate
+            else:
+                v = x[f.name]
+                # the smallest of lo, the choices and v >> k (k >= 1) that still diverges
+                for smaller in sorted({f.lo, *self.choices[f.name], *(v >> k for k in range(1, v.bit_length() + 1))}):
+                    if smaller >= v or execs >= MINIMIZE_BUDGET:
+                        break
+                    if diverges({**x, f.name: smaller}):
+                        x = {**x, f.name: smaller}
+                        break
+        return x, execs
+
+
+def _hexed(x: dict) -> dict:
+    return {k: v.hex() if isinstance(v, bytes) else v for k, v in x.items()}
+
+
+def _unhexed(x: dict) -> dict:
+    return {k: bytes.fromhex(v) if k.endswith("_hex") else int(v) for k, v in x.items()}
+
+
+def seed_corpus(targets: tuple[str, ...], vectors_dir: Path) -> dict[str, list[dict]]:
+    """Inputs of the committed vectors for each target (conformance_run.py cases), as hex-free dicts."""
+    seeds: dict[str, list[dict]] = {t: [] for t in targets}
+    for family in conformance_run.FAMILIES:
+        for v in conformance_run.iter_vectors(family, vectors_dir, None):
+            for op, inputs, _ in conformance_run.CASES[family](v):
+                if op in seeds:
+                    seeds[op].append(_unhexed(inputs))
+    return seeds
+
+
+# -----------------------------
+# Workers
+# -----------------------------
+
+
+@dataclass(frozen=True)
+class Task:
+    worker: int
+    seed: int
+    targets: tuple[str, ...]
+    limits: Limits
+    impl_factory: Callable[..., Any]
+    impl_args: tuple = ()
+    iterations: int | None = None  # per target; None: run until duration
+    duration: float = 10.0
+    seeds: dict | None = None
+    max_divergences: int = 20
+
+
+def fuzz_worker(task: Task) -> dict[str, dict]:
+    """Fuzz every target round-robin in CHUNK-exec slices; per target: execs, seconds, divergent execs, minimized divergences."""
+    fields = target_fields(task.limits)
+    reference = Reference(task.limits)
+    impl = task.impl_factory(task.limits, *task.impl_args)
+    fuzzers = {t: Fuzzer(t, fields[t], reference, impl, shard_rng(task.seed, t, task.worker)) for t in task.targets}
+    results = {t: {"execs": 0, "seconds": 0.0, "divergent": 0, "minimized": 0, "divergences": {}} for t in task.targets}
+    for t, fz in fuzzers.items():
+        for x in (task.seeds or {}).get(t, []):
+            if fz.in_domain(x):
+                fz.observe(x, *fz.run(x)[1:])
+    deadline = time.perf_counter() + task.duration
+    active = list(task.targets)
+    while active:
+        for t in list(active):
+            fz, res = fuzzers[t], results[t]
+            n = CHUNK if task.iterations is None else max(0, min(CHUNK, task.iterations - res["execs"]))
+            start = time.perf_counter()
+            for _ in range(n):
+                x = fz.next_input()
+                diverges, ref, got = fz.run(x)
+                res["divergent"] += diverges
+                if diverges and len(res["divergences"]) < task.max_divergences and res["minimized"] < MINIMIZE_RUNS * task.max_divergences:
+                    res["minimized"] += 1
+                    small, spent = fz.minimize(x)
+                    res["execs"] += spent
+                    _, ref, got = fz.run(small)
+                    res["divergences"].setdefault(_key(t, small), (small, ref, got))
+                fz.observe(x, ref, got)
+            res["execs"] += n
+            res["seconds"] += time.perf_counter() - start
+            if (task.iterations is not None and res["execs"] >= task.iterations) or (task.iterations is None and time.perf_counter() >= deadline):
+                active.remove(t)
+    return results
+
+
+def _key(target: str, x: dict) -> str:
+    return f"{target}_{hashlib.sha256(repr(sorted(_hexed(x).items())).encode()).hexdigest()[:12]}"
+
+
+def fuzz(tasks: list[Task], jobs: int) -> dict[str, dict]:
+    """Run the worker tasks (a process pool when jobs > 1) and merge: per target execs, seconds, divergences by key."""
+    if jobs <= 1 or len(tasks) <= 1:
+        parts = [fuzz_worker(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            parts = list(pool.map(fuzz_worker, tasks))
+    merged: dict[str, dict] = {}
+    for part in parts:
+        for t, res in part.items():
+            m = merged.setdefault(t, {"execs": 0, "seconds": 0.0, "divergent": 0, "divergences": {}})
+            for k in ("execs", "seconds", "divergent"):
+                m[k] += res[k]
+            for key, div in res["divergences"].items():
+                m["divergences"].setdefault(key, div)
+    return merged
+
+
+def divergence_vector(key: str, target: str, x: dict, ref: tuple, got: tuple) -> dict[str, Any]:
+    """A fuzz_vendor.yaml vector: the input, the implementation's (vendor's) output as expected, the reference's for the record."""
+    v: dict[str, Any] = {"name": key, "op": target, "input": _hexed(x)}
+    if got[0] == "ok":
+        v["expected"] = outputs(target, got[1])
+    else:
+        v["expected_reject"] = got[1]
+    if ref[0] == "ok":
+        v["reference"] = outputs(target, ref[1])
+    else:
+        v["reference_reject"] = ref[1]
+    return v
+
+
+def write_vectors(path: Path, vectors: list[dict], revision: str) -> int:
+    """Merge vectors into the fuzz vector file (by name) and rewrite it and its .rvec; returns how many were new."""
+    doc = load_yaml(path) if path.is_file() else None
+    existing = {v["name"]: v for v in (doc or {}).get("vectors") or []}
+    new = [v for v in vectors if v["name"] not in existing]
+    existing.update((v["name"], v) for v in new)
+    obj = {
+        "meta": {
+            "repo_revision": revision,
+            "note": "Minimized inputs on which the reference functions and the vendor code diverged (tools/fuzz_vendor.py); expected is the vendor's output.",
+        },
+        "vectors": [existing[name] for name in sorted(existing)],
+    }
+    dump_yaml_stable(obj, path)
+    vector_corpus.write(obj, path.with_suffix(vector_corpus.SUFFIX))
+    return len(new)
+
+
+def summary(merged: dict[str, dict], wall: float, jobs: int) -> str:
+    lines = [f"{'target':<20} {'execs':>12} {'divergent':>10} {'minimized':>10} {'cpu s':>9} {'execs/s/worker':>15}"]
+    for t, m in merged.items():
+        rate = f"{m['execs'] / m['seconds']:>15,.0f}" if m["seconds"] else f"{'-':>15}"
+        lines.append(f"{t:<20} {m['execs']:>12,} {m['divergent']:>10,} {len(m['divergences']):>10,} {m['seconds']:>9.2f} {rate}")
+    total = sum(m["execs"] for m in merged.values())
+    rate = f"{total / wall:,.0f}" if wall else "-"
+    lines.append(f"{total:,} execs in {wall:.1f} s wall with {jobs} worker(s): {rate} execs/s")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    repo_root = Path(__file__).resolve().parent.parent
+    ap = argparse.ArgumentParser(description="Differential fuzzing: SSOT reference functions vs the pinned vendor RNS code.")
+    ap.add_argument("--ssot", default="spec/reticulum-wire-format.ssot.yaml", help="Path to SSOT YAML")
+    ap.add_argument("--targets", help=f"Comma-separated targets (default: all of {', '.join(TARGETS)})")
+    ap.add_argument("--impl", choices=("vendor", "reference"), default="vendor", help="Code under test (reference: harness self-check)")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    ap.add_argument("--duration", type=float, default=10.0, help="Seconds per worker")
+    ap.add_argument("--iterations", type=int, help="Execs per target per worker instead of --duration (reproducible)")
+    ap.add_argument("--seed", type=int, default=0, help="Fuzzing seed")
+    ap.add_argument("--max-divergences", type=int, default=20, help="Minimized divergences kept per target per worker")
+    ap.add_argument("--vectors-dir", default="tests/vectors", help="Committed vectors (seed corpus)")
+    ap.add_argument("--write-vectors", nargs="?", const=f"tests/vectors/{VECTORS_NAME}", metavar="PATH", help="Merge minimized divergences into PATH")
+    args = ap.parse_args()
+
+    targets = tuple(t.strip() for t in args.targets.split(",")) if args.targets else TARGETS
+    unknown = [t for t in targets if t not in TARGETS]
+    if unknown:
+        print(f"unknown targets: {', '.join(unknown)}", file=sys.stderr)
+        return 1
+    ssot_path = repo_root / args.ssot
+    if not ssot_path.is_file():
+        print(f"SSOT not found: {ssot_path}", file=sys.stderr)
+        return 1
+    ssot = load_yaml(ssot_path)
+    revision = ((ssot.get("manifest") or {}).get("repo_revision") or "").strip()
+    limits = Limits.from_ssot(AtomRegistry.from_ssot(ssot))
+
+    impl_factory: Callable[..., Any] = Reference
+    impl_args: tuple = ()
+    if args.impl == "vendor":
+        vendor_root = repo_root / "vendor" / "reticulum-source"
+        if not (vendor_root / "RNS").is_dir():
+            print("vendor/reticulum-source/RNS not found. Populate vendor and checkout the SSOT commit (vendor/README.md).", file=sys.stderr)
+            return 1
+        head = vendor_head(vendor_root)
+        if head != revision:
+            print(f"vendor/reticulum-source/ is at {head or '(not a git repo)'}, expected manifest.repo_revision {revision}. Checkout the pinned commit.", file=sys.stderr)
+            return 1
+        impl_factory, impl_args = VendorImpl, (vendor_root,)
+
+    jobs = max(1, args.jobs)
+    seeds = seed_corpus(targets, repo_root / args.vectors_dir)
+    tasks = [Task(k, args.seed, targets, limits, impl_factory, impl_args, args.iterations, args.duration, seeds, args.max_divergences) for k in range(jobs)]
+    start = time.perf_counter()
+    merged = fuzz(tasks, jobs)
+    wall = time.perf_counter() - start
+
+    vectors = []
+    for t, m in merged.items():
+        for key, (x, ref, got) in sorted(m["divergences"].items()):
+            vectors.append(divergence_vector(key, t, x, ref, got))
+            print(f"{key}: input {conformance_run._short(_hexed(x), 160)}: reference {_describe(ref)}, {args.impl} {_describe(got)}", file=sys.stderr)
+    print(summary(merged, wall, jobs))
+    if vectors and args.write_vectors:
+        path = repo_root / args.write_vectors
+        added = write_vectors(path, vectors, revision)
+        print(f"{added} new divergence vector(s) written to {path}")
+    return 1 if vectors else 0
+
+
+def _describe(outcome: tuple[str, Any]) -> str:
+    kind, value = outcome
+    if kind == "reject":
+        return f"rejects ({value})"
+    return conformance_run._short(value.hex() if isinstance(value, (bytes, bytearray)) else value)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
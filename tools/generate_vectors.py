@@ -12,6 +12,16 @@ Vectors generated:
 - signalling_bytes.yaml
 - link_id_from_linkrequest.yaml
 - ifac_masking.yaml (mask/unmask transform level; IFAC bytes treated as input)
+- hdlc_framing.yaml (HDLC escape/deframe of chunked streams; see tools/framing.py)
+- kiss_framing.yaml (KISS escape/deframe of chunked streams with port/command nibbles)
+
+Each <family>.yaml gets a binary companion <family>.rvec (tools/vector_corpus.py): the same
+document with hex fields as raw bytes, and the equivalence sha256 of the document in its header.
+
+--random N --seed S writes N seeded random vectors per family as sharded JSONL with a sha256
+index instead (tools/random_vectors.py), byte-identical for a seed whatever --jobs is.
+
+--profile PATH writes a Chrome trace (tools/profiling.py): one span per generator and per file written.
 """
 
 from __future__ import annotations
@@ -19,10 +29,18 @@ from __future__ import annotations
 import argparse
 import hashlib
 import hmac
+import os
 import sys
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
+import profiling
+import ssot_loader
+import vector_corpus
+from atom_registry import AtomRegistry
+from framing import HDLC_FLAG, KISS_FEND, HDLCCodec, KISSCodec, hdlc_unescape, kiss_unescape
+
 # -----------------------------
 # SSOT loading + atom lookup
 # -----------------------------
@@ -30,33 +48,27 @@ from typing import Any
 
 def load_yaml(path: Path) -> dict[str, Any]:
     try:
-        from ruamel.yaml import YAML
-
-        y = YAML(typ="safe")
-        with open(path, encoding="utf-8") as f:
-            data = y.load(f)
-    except ImportError:
-        try:
-            import yaml
-
-            with open(path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-        except ImportError as e:
-            raise SystemExit("PyYAML or ruamel.yaml required. Run: uv sync") from e
+        data = ssot_loader.load_yaml(path)
+    except ImportError as e:
+        raise SystemExit("PyYAML required. Run: uv sync") from e
     if not isinstance(data, dict):
         raise SystemExit(f"SSOT at {path} is not a YAML mapping")
     return data
 
 
-def atom_value_number(ssot: dict[str, Any], atom_id: str) -> Any:
+def atom_value_number(ssot: dict[str, Any] | AtomRegistry, atom_id: str) -> Any:
     """Return atoms[].value.number for given atom_id. Supports int or string (e.g. IFAC_SALT hex)."""
-    for a in ssot.get("atoms") or []:
-        if a.get("id") == atom_id:
-            v = (a.get("value") or {}).get("number")
-            if v is None:
-                raise SystemExit(f"Atom {atom_id} has no value.number")
-            return v
-    raise SystemExit(f"Atom id not found: {atom_id}")
+    try:
+        return AtomRegistry.from_ssot(ssot).value_number(atom_id)
+    except ValueError as e:
+        raise SystemExit(str(e)) from e
+
+
+def atom_constant_int(atoms: AtomRegistry, atom_id: str) -> int:
+    try:
+        return atoms.constant_int(atom_id)
+    except ValueError as e:
+        raise SystemExit(str(e)) from e
 
 
 # -----------------------------
@@ -72,6 +84,16 @@ def truncated_hash_16_bytes(data: bytes) -> bytes:
     return hashlib.sha256(data).digest()[:16]
 
 
+def link_id_from_hashable_part(part: bytes, data_len: int, ecpubsize: int) -> bytes:
+    """
+    Spec: link id = truncated hash of the LINKREQUEST hashable part without its signalling bytes:
+    when data_len > ECPUBSIZE the last data_len - ECPUBSIZE bytes are stripped first.
+    """
+    if data_len > ecpubsize:
+        part = part[: -(data_len - ecpubsize)]
+    return truncated_hash_16_bytes(part)
+
+
 def hashable_part(packet_bytes: bytes, header_type: int) -> bytes:
     """
     Spec: mask first byte with 0x0F; exclude hops (byte 1).
@@ -87,6 +109,32 @@ def hashable_part(packet_bytes: bytes, header_type: int) -> bytes:
     return b0 + packet_bytes[2:]
 
 
+_MASKED_FLAGS = tuple(bytes([i]) for i in range(16))  # flags & 0x0F -> 1-byte prefix, no per-call allocation
+
+
+def packet_hash(buf: bytes | bytearray | memoryview, header_type: int | None = None) -> bytes:
+    """
+    SHA-256 of hashable_part(buf, header_type) without building it: the masked flag byte and a
+    memoryview of the tail are fed straight into sha256().update(). header_type defaults to
+    flags bit 6 (0=HEADER_1, 1=HEADER_2). Short packets hash b"", as hashable_part returns b"".
+    """
+    if isinstance(buf, memoryview) and (buf.format != "B" or buf.ndim != 1):
+        buf = buf.cast("B")
+    if header_type is None:
+        header_type = 2 if len(buf) and buf[0] & 0x40 else 1
+    start = 18 if header_type == 2 else 2
+    if len(buf) < start:
+        return hashlib.sha256(b"").digest()
+    h = hashlib.sha256(_MASKED_FLAGS[buf[0] & 0x0F])
+    h.update(memoryview(buf)[start:])
+    return h.digest()
+
+
+def truncated_packet_hash(buf: bytes | bytearray | memoryview, header_type: int | None = None) -> bytes:
+    """First 16 bytes of packet_hash(buf, header_type); equals truncated_hash_16_bytes(hashable_part(...))."""
+    return packet_hash(buf, header_type)[:16]
+
+
 def encode_signalling_bytes(mtu: int, mode: int, mtu_mask: int = 0x1FFFFF) -> bytes:
     """
     3 bytes big-endian: byte0=(mode<<5)|(mtu>>16), byte1=(mtu>>8)&0xFF, byte2=mtu&0xFF.
@@ -164,6 +212,84 @@ def ifac_unmask_transform(on_wire: bytes, ifac_size: int, ifac_key: bytes) -> by
     return canonical
 
 
+# -----------------------------
+# Batched IFAC engine (whole-buffer XOR)
+# -----------------------------
+
+
+def _hkdf_sha256_salted(salted: Any, ikm: bytes, length: int) -> bytes:
+    """hkdf_sha256 with info=b'' where `salted` is a pre-keyed HMAC-SHA256 object for the salt (copied per call)."""
+    extract = salted.copy()
+    extract.update(ikm)
+    prk = hmac.new(extract.digest(), digestmod=hashlib.sha256)
+    n_blocks = -(-length // 32)
+    if n_blocks >= 255:
+        raise ValueError("HKDF counter overflow")  # same limit as hkdf_sha256
+    blocks = []
+    t = b""
+    for counter in range(1, n_blocks + 1):
+        h = prk.copy()
+        h.update(t + bytes([counter]))
+        t = h.digest()
+        blocks.append(t)
+    return b"".join(blocks)[:length]
+
+
+def _xor_from(buf: bytes, mask: bytes, start: int) -> bytes:
+    """XOR mask[start:len(buf)] into buf[start:] as one big-integer operation; bytes before start are dropped."""
+    n = len(buf) - start
+    if n <= 0:
+        return b""
+    x = int.from_bytes(buf[start:], "big") ^ int.from_bytes(mask[start : len(buf)], "big")
+    return x.to_bytes(n, "big")
+
+
+def ifac_mask_batch(items: Iterable[tuple[bytes, bytes, bytes]]) -> list[bytes]:
+    """
+    Batched ifac_mask_transform over (canonical_raw, ifac_bytes, ifac_key) tuples; results in input order.
+    Bit-identical to ifac_mask_transform. Per-key HMAC state is reused across the batch and the
+    payload is masked with a single integer XOR instead of a per-byte loop.
+    """
+    salted: dict[bytes, Any] = {}
+    out: list[bytes] = []
+    for canonical_raw, ifac_bytes, ifac_key in items:
+        if len(canonical_raw) < 2:
+            raise ValueError("canonical_raw must be at least 2 bytes")
+        keyed = salted.get(ifac_key)
+        if keyed is None:
+            keyed = salted[ifac_key] = hmac.new(ifac_key, digestmod=hashlib.sha256)
+        ifac_size = len(ifac_bytes)
+        total = len(canonical_raw) + ifac_size
+        mask = _hkdf_sha256_salted(keyed, ifac_bytes, total)
+        head = bytes([((canonical_raw[0] | 0x80) ^ mask[0]) | 0x80, canonical_raw[1] ^ mask[1]])
+        # canonical_raw[2:] sits at new_raw[2+ifac_size:]; shift the mask instead of building new_raw.
+        tail = _xor_from(canonical_raw, mask[ifac_size:], 2)
+        out.append(head + ifac_bytes + tail)
+    return out
+
+
+def ifac_unmask_batch(items: Iterable[tuple[bytes, int, bytes]]) -> list[bytes]:
+    """
+    Batched ifac_unmask_transform over (on_wire, ifac_size, ifac_key) tuples; results in input order.
+    Bit-identical to ifac_unmask_transform (same ValueError on short or unflagged input).
+    """
+    salted: dict[bytes, Any] = {}
+    out: list[bytes] = []
+    for on_wire, ifac_size, ifac_key in items:
+        if len(on_wire) <= 2 + ifac_size:
+            raise ValueError("on_wire too short")
+        if (on_wire[0] & 0x80) != 0x80:
+            raise ValueError("IFAC flag not set")
+        keyed = salted.get(ifac_key)
+        if keyed is None:
+            keyed = salted[ifac_key] = hmac.new(ifac_key, digestmod=hashlib.sha256)
+        ifac = on_wire[2 : 2 + ifac_size]
+        mask = _hkdf_sha256_salted(keyed, ifac, len(on_wire))
+        head = bytes([(on_wire[0] ^ mask[0]) & 0x7F, on_wire[1] ^ mask[1]])
+        out.append(head + _xor_from(on_wire, mask, 2 + ifac_size))
+    return out
+
+
 # -----------------------------
 # YAML writer (stable formatting, quoted hex)
 # -----------------------------
@@ -266,11 +392,11 @@ def gen_hashable_part_vectors() -> dict[str, Any]:
     return {"vectors": vectors}
 
 
-def gen_signalling_vectors(ssot: dict[str, Any]) -> dict[str, Any]:
-    mtu_mask = int(atom_value_number(ssot, "RNS.LNK.CONST.MTU_BYTEMASK"))
-    mode_mask_val = atom_value_number(ssot, "RNS.LNK.CONST.MODE_BYTEMASK")
+def gen_signalling_vectors(atoms: AtomRegistry) -> dict[str, Any]:
+    mtu_mask = atom_constant_int(atoms, "RNS.LNK.CONST.MTU_BYTEMASK")
+    mode_mask_val = atom_value_number(atoms, "RNS.LNK.CONST.MODE_BYTEMASK")
     mode_mask = int(mode_mask_val) if isinstance(mode_mask_val, (int, float)) else 0xE0
-    link_mtu_size = int(atom_value_number(ssot, "RNS.LNK.CONST.LINK_MTU_SIZE"))
+    link_mtu_size = atom_constant_int(atoms, "RNS.LNK.CONST.LINK_MTU_SIZE")
     if link_mtu_size != 3:
         raise SystemExit("SSOT says LINK_MTU_SIZE != 3; generator expects 3-byte signalling")
 
@@ -335,8 +461,8 @@ def gen_signalling_vectors(ssot: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def gen_link_id_vectors(ssot: dict[str, Any]) -> dict[str, Any]:
-    ecpubsize = int(atom_value_number(ssot, "RNS.LNK.CONST.ECPUBSIZE"))
+def gen_link_id_vectors(atoms: AtomRegistry) -> dict[str, Any]:
+    ecpubsize = atom_constant_int(atoms, "RNS.LNK.CONST.ECPUBSIZE")
     if ecpubsize != 64:
         raise SystemExit("SSOT ECPUBSIZE != 64; generator expects 64 for strip threshold")
 
@@ -390,8 +516,8 @@ IFAC_KEY_BYTES = (
 )
 
 
-def gen_ifac_masking_vectors(ssot: dict[str, Any]) -> dict[str, Any]:
-    _ = atom_value_number(ssot, "RNS.IFAC.CONST.IFAC_SALT")
+def gen_ifac_masking_vectors(atoms: AtomRegistry) -> dict[str, Any]:
+    _ = atom_value_number(atoms, "RNS.IFAC.CONST.IFAC_SALT")
 
     vectors: list[dict[str, Any]] = []
 
@@ -483,15 +609,239 @@ def gen_ifac_masking_vectors(ssot: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def _hdlc_frames_whole_stream(stream: bytes) -> list[bytes]:
+    """Reference deframe of a complete stream: split on FLAG, drop text before the first FLAG, the unterminated tail and empty frames."""
+    parts = stream.split(bytes([HDLC_FLAG]))[1:-1]
+    return [hdlc_unescape(p) for p in parts if p]
+
+
+def gen_hdlc_framing_vectors() -> dict[str, Any]:
+    vectors: list[dict[str, Any]] = []
+    enc = HDLCCodec.encode
+
+    def deframe(name: str, description: str, stream: bytes, chunk_sizes: list[int]) -> None:
+        assert sum(chunk_sizes) == len(stream), f"{name}: chunk_sizes must cover the stream"
+        vectors.append(
+            {
+                "name": name,
+                "description": description,
+                "stream_hex": _hex_quoted(stream.hex()),
+                "chunk_sizes": chunk_sizes,
+                "expected_frames_hex": [_hex_quoted(f.hex()) for f in _hdlc_frames_whole_stream(stream)],
+            }
+        )
+
+    def encode(name: str, description: str, frame: bytes) -> None:
+        vectors.append(
+            {
+                "name": name,
+                "description": description,
+                "frame_hex": _hex_quoted(frame.hex()),
+                "expected_encoded_hex": _hex_quoted(enc(frame).hex()),
+            }
+        )
+
+    plain = bytes.fromhex("00" + "11" * 18)
+    specials = bytes.fromhex("007e117d227e7d33")
+    encode("encode_plain", "No FLAG/ESC bytes: frame wrapped in FLAGs unchanged.", plain)
+    encode("encode_flag_and_esc", "0x7E -> 0x7D 0x5E and 0x7D -> 0x7D 0x5D, including adjacent specials.", specials)
+    encode("encode_escaped_lookalike", "Literal 0x7D 0x5E in data is escaped as 0x7D 0x5D 0x5E.", bytes.fromhex("7d5e7d5d"))
+
+    stream = enc(specials)
+    deframe("single_frame_one_chunk", "One frame with escapes delivered in one chunk.", stream, [len(stream)])
+    esc_at = stream.index(bytes([0x7D]), 1)
+    deframe(
+        "split_escape_flag",
+        "Chunk boundary between 0x7D and 0x5E of an escaped FLAG.",
+        stream,
+        [esc_at + 1, len(stream) - esc_at - 1],
+    )
+    stream = enc(bytes.fromhex("017d02"))
+    deframe(
+        "split_escape_esc",
+        "Chunk boundary between 0x7D and 0x5D of an escaped ESC.",
+        stream,
+        [3, len(stream) - 3],
+    )
+    stream = bytes.fromhex("7e7e7e") + enc(plain) + bytes.fromhex("7e7e")
+    deframe("empty_frames", "Runs of FLAGs delimit empty frames, which are dropped.", stream, [2, len(stream) - 2])
+    a, b = bytes.fromhex("aa" * 19), bytes.fromhex("bb" * 20)
+    stream = enc(a) + enc(b)
+    deframe("back_to_back_flags", "Closing FLAG of one frame immediately followed by opening FLAG of the next.", stream, [len(stream)])
+    stream = enc(a)[:-1] + enc(b)
+    deframe("shared_flag", "One FLAG closes a frame and opens the next.", stream, [len(a) + 1, len(stream) - len(a) - 1])
+    stream = bytes.fromhex("0102037d") + enc(a)
+    deframe("leading_garbage", "Bytes before the first FLAG are discarded (including a stray ESC).", stream, [2, len(stream) - 2])
+    stream = enc(a) + bytes.fromhex("7e") + b
+    deframe("trailing_partial", "Unterminated trailing frame is not emitted.", stream, [len(stream)])
+    stream = enc(specials) + enc(a)
+    deframe("byte_by_byte", "Every chunk is a single byte.", stream, [1] * len(stream))
+
+    return {
+        "meta": {
+            "flag": HDLC_FLAG,
+            "esc": 0x7D,
+            "esc_mask": 0x20,
+            "note": "Deframe vectors: feed stream_hex split by chunk_sizes; frames must equal expected_frames_hex in order.",
+        },
+        "vectors": vectors,
+    }
+
+
+def _kiss_frames_whole_stream(stream: bytes) -> list[dict[str, Any]]:
+    """Reference deframe of a complete stream: split on FEND, unescape, then command byte = port<<4 | command."""
+    frames = []
+    for part in stream.split(bytes([KISS_FEND]))[1:-1]:
+        if not part:
+            continue
+        raw = kiss_unescape(part)
+        frames.append({"port": raw[0] >> 4, "command": raw[0] & 0x0F, "data_hex": _hex_quoted(raw[1:].hex())})
+    return frames
+
+
+def gen_kiss_framing_vectors() -> dict[str, Any]:
+    vectors: list[dict[str, Any]] = []
+    enc = KISSCodec.encode
+
+    def deframe(name: str, description: str, stream: bytes, chunk_sizes: list[int]) -> None:
+        assert sum(chunk_sizes) == len(stream), f"{name}: chunk_sizes must cover the stream"
+        vectors.append(
+            {
+                "name": name,
+                "description": description,
+                "stream_hex": _hex_quoted(stream.hex()),
+                "chunk_sizes": chunk_sizes,
+                "expected_frames": _kiss_frames_whole_stream(stream),
+            }
+        )
+
+    def encode(name: str, description: str, data: bytes, port: int, command: int) -> None:
+        vectors.append(
+            {
+                "name": name,
+                "description": description,
+                "data_hex": _hex_quoted(data.hex()),
+                "port": port,
+                "command": command,
+                "expected_encoded_hex": _hex_quoted(enc(data, port, command).hex()),
+            }
+        )
+
+    plain = bytes.fromhex("00" + "11" * 18)
+    specials = bytes.fromhex("00c011db22c0db33")
+    encode("encode_plain", "CMD_DATA on port 0: command byte 0x00 prepended, no escapes.", plain, 0, 0)
+    encode("encode_fend_and_fesc", "0xC0 -> 0xDB 0xDC and 0xDB -> 0xDB 0xDD.", specials, 0, 0)
+    encode("encode_port_nibble", "Port 3 CMD_DATA: command byte 0x30.", plain, 3, 0)
+    encode("encode_escaped_command_byte", "Port 12 CMD_DATA gives command byte 0xC0, which is escaped.", plain, 12, 0)
+    encode("encode_non_data_command", "Command 0x01 (TXDELAY) with a one-byte parameter on port 0.", bytes.fromhex("32"), 0, 1)
+
+    stream = enc(specials)
+    deframe("single_frame_one_chunk", "One CMD_DATA frame with escapes delivered in one chunk.", stream, [len(stream)])
+    esc_at = stream.index(bytes([0xDB]), 1)
+    deframe(
+        "split_escape_fend",
+        "Chunk boundary between FESC and TFEND of an escaped FEND.",
+        stream,
+        [esc_at + 1, len(stream) - esc_at - 1],
+    )
+    stream = bytes.fromhex("c0c0c0") + enc(plain) + bytes.fromhex("c0c0")
+    deframe("empty_frames", "Runs of FENDs delimit empty frames, which are dropped.", stream, [2, len(stream) - 2])
+    a, b = bytes.fromhex("aa" * 19), bytes.fromhex("bb" * 20)
+    stream = enc(a, 0) + enc(b, 1) + enc(a, 12) + enc(bytes.fromhex("0a"), 2, 1)
+    deframe(
+        "multi_port_demux",
+        "Frames for ports 0, 1 and 12 (escaped command byte) plus a non-data command on port 2.",
+        stream,
+        [7, 30, len(stream) - 37],
+    )
+    stream = enc(a)[:-1] + enc(b)
+    deframe("shared_fend", "One FEND closes a frame and opens the next.", stream, [len(stream)])
+    stream = bytes.fromhex("0102db") + enc(a)
+    deframe("leading_garbage", "Bytes before the first FEND are discarded (including a stray FESC).", stream, [2, len(stream) - 2])
+    stream = enc(a) + bytes.fromhex("c000") + b
+    deframe("trailing_partial", "Unterminated trailing frame is not emitted.", stream, [len(stream)])
+    stream = enc(specials) + enc(a, 5)
+    deframe("byte_by_byte", "Every chunk is a single byte.", stream, [1] * len(stream))
+
+    return {
+        "meta": {
+            "fend": KISS_FEND,
+            "fesc": 0xDB,
+            "tfend": 0xDC,
+            "tfesc": 0xDD,
+            "cmd_data": 0x00,
+            "note": "Deframe vectors: feed stream_hex split by chunk_sizes; frames (port, command, data) must equal expected_frames in order.",
+        },
+        "vectors": vectors,
+    }
+
+
 # -----------------------------
 # Main
 # -----------------------------
 
 
+def generate(ssot: dict[str, Any], vectors_dir: Path) -> int:
+    """Write every vector file for an already-parsed SSOT into vectors_dir; returns an exit status."""
+    manifest = ssot.get("manifest") or {}
+    source_commit = (manifest.get("repo_revision") or "").strip()
+    if not source_commit:
+        print("manifest.repo_revision is required.", file=sys.stderr)
+        return 1
+    atoms = AtomRegistry.from_ssot(ssot)
+    generators = (
+        ("hashable_part.yaml", gen_hashable_part_vectors, ()),
+        ("signalling_bytes.yaml", gen_signalling_vectors, (atoms,)),
+        ("link_id_from_linkrequest.yaml", gen_link_id_vectors, (atoms,)),
+        ("ifac_masking.yaml", gen_ifac_masking_vectors, (atoms,)),
+        ("hdlc_framing.yaml", gen_hdlc_framing_vectors, ()),
+        ("kiss_framing.yaml", gen_kiss_framing_vectors, ()),
+    )
+    # Generate everything before writing anything: a failing generator leaves the files untouched
+    vectors = {}
+    for filename, gen, gen_args in generators:
+        with profiling.span(gen.__name__):
+            vectors[filename] = gen(*gen_args)
+
+    for filename, obj in vectors.items():
+        with profiling.span(filename, "output"):
+            dump_yaml_stable(obj, vectors_dir / filename)
+        rvec = Path(filename).with_suffix(vector_corpus.SUFFIX).name
+        with profiling.span(rvec, "output"):
+            vector_corpus.write(obj, vectors_dir / rvec)
+
+    return 0
+
+
+def generate_random_cli(ssot: dict[str, Any], out_dir: Path, args: argparse.Namespace) -> int:
+    import random_vectors  # imports this module
+
+    families = tuple(f.strip() for f in args.families.split(",")) if args.families else random_vectors.FAMILIES
+    try:
+        limits = random_vectors.Limits.from_ssot(AtomRegistry.from_ssot(ssot))
+        with profiling.span("random_vectors", count=args.random, jobs=args.jobs):
+            index = random_vectors.generate_random(
+                out_dir, args.random, args.seed, limits, max(1, args.jobs), args.shard_size or random_vectors.SHARD_SIZE, families
+            )
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    shards = sum(len(f["shards"]) for f in index["families"].values())
+    print(f"{args.random} vectors x {len(families)} families in {shards} shards; index: {out_dir / random_vectors.INDEX_NAME}")
+    return 0
+
+
 def main() -> int:
     ap = argparse.ArgumentParser(description="Generate conformance vectors from SSOT.")
     ap.add_argument("--ssot", default="spec/reticulum-wire-format.ssot.yaml", help="Path to SSOT YAML")
     ap.add_argument("--vectors-dir", default="tests/vectors", help="Output directory for vector YAML files")
+    ap.add_argument("--random", type=int, metavar="N", help="Write N seeded random vectors per family as sharded JSONL instead")
+    ap.add_argument("--seed", type=int, default=0, help="Seed for --random (same seed: byte-identical shards)")
+    ap.add_argument("--random-dir", default="build/random-vectors", help="Output directory for --random shards and index.json")
+    ap.add_argument("--shard-size", type=int, default=None, metavar="M", help="Vectors per --random shard (default 100000)")
+    ap.add_argument("--families", help="Comma-separated --random families (default: all)")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Processes writing --random shards")
+    profiling.add_arguments(ap)
     args = ap.parse_args()
 
     repo_root = Path(__file__).resolve().parent.parent
@@ -502,23 +852,12 @@ def main() -> int:
         print(f"SSOT not found: {ssot_path}", file=sys.stderr)
         return 1
 
-    ssot = load_yaml(ssot_path)
-    manifest = ssot.get("manifest") or {}
-    source_commit = (manifest.get("repo_revision") or "").strip()
-    if not source_commit:
-        print("manifest.repo_revision is required.", file=sys.stderr)
-        return 1
-    hashable = gen_hashable_part_vectors()
-    signalling = gen_signalling_vectors(ssot)
-    link_id = gen_link_id_vectors(ssot)
-    ifac_masking = gen_ifac_masking_vectors(ssot)
-
-    dump_yaml_stable(hashable, vectors_dir / "hashable_part.yaml")
-    dump_yaml_stable(signalling, vectors_dir / "signalling_bytes.yaml")
-    dump_yaml_stable(link_id, vectors_dir / "link_id_from_linkrequest.yaml")
-    dump_yaml_stable(ifac_masking, vectors_dir / "ifac_masking.yaml")
-
-    return 0
+    with profiling.session(args.profile, "generate_vectors", args.profile_top):
+        with profiling.span("load_ssot"):
+            ssot = load_yaml(ssot_path)
+        if args.random is not None:
+            return generate_random_cli(ssot, repo_root / args.random_dir, args)
+        return generate(ssot, vectors_dir)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,111 @@
+"""
+packet_view.py — Zero-copy packet header views generated from SSOT layout atoms.
+
+Field accessors come from RNS.PKT.LAYOUT.HEADER_1 / RNS.PKT.LAYOUT.HEADER_2 (layout.fields),
+so offsets and lengths cannot drift from the SSOT:
+- 1-byte fields (flags, hops, context) read as int.
+- Multi-byte fields (transport_id, destination_hash) and payload read as memoryview slices
+  of the original buffer; nothing is copied.
+- Fields absent from the packet's header type (transport_id on HEADER_1) read as None.
+
+Header type is taken from flags bit 6 (0=HEADER_1, 1=HEADER_2), per RNS.PKT.ALG.FLAGS_PACK_UNPACK,
+unless the caller passes header_type explicitly (as hashable_part() does).
+
+Usage:
+    PacketView = packet_view_class(ssot)
+    v = PacketView(raw)  # or PacketView(raw, header_type=1)
+    v.destination_hash.hex(), v.context, bytes(v.payload)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from atom_registry import AtomRegistry
+
+HEADER_LAYOUT_IDS = {1: "RNS.PKT.LAYOUT.HEADER_1", 2: "RNS.PKT.LAYOUT.HEADER_2"}
+HEADER_TYPE_BIT = 0x40
+
+
+def header_layouts(ssot: dict[str, Any] | AtomRegistry) -> dict[int, list[tuple[str, int, int]]]:
+    """Return {header_type: [(name, offset, length), ...]} from the SSOT header layout atoms."""
+    atoms = AtomRegistry.from_ssot(ssot)
+    layouts: dict[int, list[tuple[str, int, int]]] = {}
+    for header_type, atom_id in HEADER_LAYOUT_IDS.items():
+        fields = atoms.layout_fields(atom_id)
+        layouts[header_type] = [(f["name"], int(f["offset"]), int(f["length"])) for f in fields]
+    return layouts
+
+
+def _field_getter(name: str, spans: tuple[tuple[int, int] | None, ...]) -> Callable[[Any], Any]:
+    """Accessor for one layout field; spans is indexed by header type (index 0 unused)."""
+
+    def get(self: Any) -> Any:
+        span = spans[self._header_type]
+        if span is None:
+            return None
+        offset, length = span
+        if length == 1:
+            return self._mv[offset]
+        return self._mv[offset : offset + length]
+
+    get.__name__ = name
+    return get
+
+
+def packet_view_class(ssot: dict[str, Any] | AtomRegistry) -> type:
+    """
+    Build a __slots__, memoryview-backed PacketView class whose accessors are the union of
+    HEADER_1 and HEADER_2 layout fields. Header size (and payload start) is the end of the
+    last field of each layout.
+    """
+    layouts = header_layouts(ssot)
+    names: list[str] = []
+    for fields in layouts.values():
+        for name, _, _ in fields:
+            if name not in names:
+                names.append(name)
+    header_size = (0,) + tuple(max(o + n for _, o, n in layouts[t]) for t in (1, 2))
+
+    def __init__(self: Any, buf: Any, header_type: int | None = None) -> None:
+        mv = memoryview(buf)
+        if mv.format != "B" or mv.ndim != 1:
+            mv = mv.cast("B")
+        if len(mv) < 1:
+            raise ValueError("packet must be at least 1 byte")
+        if header_type is None:
+            header_type = 2 if mv[0] & HEADER_TYPE_BIT else 1
+        elif header_type not in (1, 2):
+            raise ValueError(f"header_type must be 1 or 2, got {header_type}")
+        if len(mv) < header_size[header_type]:
+            raise ValueError(f"HEADER_{header_type} packet must be at least {header_size[header_type]} bytes, got {len(mv)}")
+        self._mv = mv
+        self._header_type = header_type
+
+    def payload(self: Any) -> memoryview:
+        return self._mv[header_size[self._header_type] :]
+
+    def __len__(self: Any) -> int:
+        return len(self._mv)
+
+    def __repr__(self: Any) -> str:
+        return f"<PacketView HEADER_{self._header_type} len={len(self._mv)}>"
+
+    namespace: dict[str, Any] = {
+        "__slots__": ("_mv", "_header_type"),
+        "__doc__": "Zero-copy view over one canonical packet; fields: " + ", ".join(names) + ", payload.",
+        "__init__": __init__,
+        "__len__": __len__,
+        "__repr__": __repr__,
+        "FIELDS": tuple(names),
+        "HEADER_SIZE": {1: header_size[1], 2: header_size[2]},
+        "header_type": property(lambda self: self._header_type),
+        "payload": property(payload),
+        "raw": property(lambda self: self._mv),
+    }
+    for name in names:
+        spans = (None,) + tuple(
+            next(((o, n) for fname, o, n in layouts[t] if fname == name), None) for t in (1, 2)
+        )
+        namespace[name] = property(_field_getter(name, spans))
+    return type("PacketView", (), namespace)
@@ -0,0 +1,165 @@
+"""
+profiling.py — Nested span timings, peak RSS and per-atom/per-reference costs (--profile PATH).
+
+    profiling.add_arguments(ap)                       # --profile PATH, --profile-top N
+    args = ap.parse_args()
+    with profiling.session(args.profile, "compile_ssot", args.profile_top):
+        with profiling.span("load_ssot"):
+            ...
+        for atom in atoms:
+            with profiling.span(atom["id"], "atom"):
+                ...
+
+span() is a no-op (one shared null context) unless a session is active, so instrumented loops
+cost next to nothing without --profile. In a session every span becomes a Chrome trace "X"
+event (chrome://tracing, Perfetto) nested by time per thread, with a peak-RSS counter sampled
+whenever a phase ends. Span depth is a context variable: wrap functions handed to a thread
+pool with in_context() so their spans nest under the span that submitted them. On exit the trace is written to PATH and a summary goes to stderr: wall
+time, peak RSS, the phases and outputs under the tool span, and the top-N slowest atoms and
+references. Categories: "phase" (pipeline steps), "atom" (name: atom id), "ref" (name:
+vendor file, args lines/atom), "output" (file writes). Work done in process-pool workers
+appears as the enclosing span only.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterator, TextIO, TypeVar
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_NULL = contextlib.nullcontext()
+_active: Profiler | None = None
+_depth: contextvars.ContextVar[int] = contextvars.ContextVar("profiling_depth", default=0)
+_T = TypeVar("_T")
+
+
+def peak_rss_bytes(children: bool = False) -> int | None:
+    """Peak resident set size of this process (or of its waited-for children), None if unknown."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # macOS reports bytes, Linux KiB
+
+
+def _mib(n: int | None) -> str:
+    return f"{n / 2**20:.1f} MiB" if n is not None else "n/a"
+
+
+class Profiler:
+    """Collects spans as Chrome trace events (timestamps in µs from the profiler's start)."""
+
+    def __init__(self, process_name: str = "") -> None:
+        self.pid = os.getpid()
+        self._t0 = time.perf_counter_ns()
+        self.events: list[dict[str, Any]] = [{"name": "process_name", "ph": "M", "pid": self.pid, "tid": 0, "args": {"name": process_name}}]
+        self.spans: list[tuple[str, str, int, int, int, dict[str, Any], int]] = []  # (cat, name, depth, start_ns, dur_ns, args, tid)
+
+    def _us(self, ns: int) -> float:
+        return (ns - self._t0) / 1000
+
+    @contextlib.contextmanager
+    def span(self, name: str, cat: str = "phase", **args: Any) -> Iterator[None]:
+        depth = _depth.get()
+        token = _depth.set(depth + 1)
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            _depth.reset(token)
+            tid = threading.get_ident()
+            self.events.append(
+                {"name": str(name), "cat": cat, "ph": "X", "ts": self._us(start), "dur": (end - start) / 1000, "pid": self.pid, "tid": tid, "args": args}
+            )
+            self.spans.append((cat, str(name), depth, start, end - start, args, tid))
+            if cat == "phase":
+                rss = peak_rss_bytes()
+                if rss is not None:
+                    self.events.append({"name": "peak_rss", "ph": "C", "ts": self._us(end), "pid": self.pid, "tid": tid, "args": {"MiB": round(rss / 2**20, 2)}})
+
+    def write(self, path: Path) -> None:
+        trace = {
+            "traceEvents": self.events,
+            "displayTimeUnit": "ms",
+            "otherData": {"peak_rss_bytes": peak_rss_bytes(), "peak_rss_children_bytes": peak_rss_bytes(children=True)},
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(trace), encoding="utf-8")
+
+    def summary(self, top: int = 10) -> str:
+        """Text table: wall time and peak RSS, the phase/output tree in start order, slowest atoms and references."""
+        roots = [s for s in self.spans if s[2] == 0]
+        main_roots = [s for s in roots if s[6] == threading.main_thread().ident] or roots
+        wall = max((s[3] + s[4] for s in main_roots), default=0) - min((s[3] for s in main_roots), default=0)
+        out = [f"profile: {wall / 1e6:.1f} ms in {len(roots)} top-level span(s), peak RSS {_mib(peak_rss_bytes())}"]
+        phases = sorted((s for s in self.spans if s[0] in ("phase", "output") and s[2] >= 1), key=lambda s: (s[3], s[2]))
+        if phases:
+            out.append(f"{'ms':>10}  phase")
+            out.extend(f"{dur / 1e6:>10.2f}  {'  ' * (depth - 1)}{_label(name, args)}" for _, name, depth, _, dur, args, _ in phases)
+        for cat, title in (("atom", "atoms"), ("ref", "references")):
+            rows = sorted((s for s in self.spans if s[0] == cat), key=lambda s: -s[4])
+            if not rows:
+                continue
+            total = sum(s[4] for s in rows)
+            out.append(f"{'ms':>10}  slowest {title} (top {min(top, len(rows))} of {len(rows)}, {total / 1e6:.2f} ms total)")
+            out.extend(f"{dur / 1e6:>10.3f}  {_label(name, args)}" for _, name, _, _, dur, args, _ in rows[:top])
+        return "\n".join(out)
+
+
+def _label(name: str, args: dict[str, Any]) -> str:
+    lines = args.get("lines")
+    label = f"{name}:{lines}" if lines else name
+    extra = ", ".join(f"{k}={v}" for k, v in args.items() if k != "lines")
+    return f"{label} ({extra})" if extra else label
+
+
+def in_context(fn: Callable[..., _T]) -> Callable[..., _T]:
+    """fn run in a copy of the caller's context on every call: spans it opens in a pool thread nest under the current span."""
+    ctx = contextvars.copy_context()
+    return lambda *args, **kwargs: ctx.copy().run(fn, *args, **kwargs)
+
+
+def span(name: str, cat: str = "phase", **args: Any) -> contextlib.AbstractContextManager:
+    """A span in the active session, or a shared no-op context when profiling is off."""
+    if _active is None:
+        return _NULL
+    return _active.span(name, cat, **args)
+
+
+def enabled() -> bool:
+    return _active is not None
+
+
+@contextlib.contextmanager
+def session(path: Path | str | None, name: str, top: int = 10, stream: TextIO | None = None) -> Iterator[Profiler | None]:
+    """Profile the block as span `name` when path is set: write the trace there, summary to stderr."""
+    global _active
+    if not path or _active is not None:
+        yield None
+        return
+    prof = _active = Profiler(name)
+    try:
+        with prof.span(name):
+            yield prof
+    finally:
+        _active = None
+        prof.write(Path(path))
+        print(prof.summary(top), file=stream or sys.stderr)
+        print(f"profile: trace written to {path}", file=stream or sys.stderr)
+
+
+def add_arguments(ap) -> None:
+    ap.add_argument("--profile", metavar="PATH", help="Write a Chrome trace (span timings, peak RSS) to PATH; summary on stderr")
+    ap.add_argument("--profile-top", type=int, default=10, metavar="N", help="Slowest atoms/references listed in the --profile summary")
@@ -0,0 +1,257 @@
+"""
+random_vectors.py — Seeded randomized conformance vectors as sharded JSONL (generate_vectors.py --random).
+
+    python tools/generate_vectors.py --random 1000000 --seed 7 [--jobs 8] [--random-dir build/random-vectors]
+
+For each family, N vectors are cut into shards of --shard-size vectors; shard k of a family draws
+from its own random.Random seeded with sha256("<seed>/<family>/<k>"), so a shard's bytes depend
+only on (seed, family, k, N, shard size, SSOT constants) and never on --jobs or on which worker
+wrote it. Shards are generated and written by a process pool, one file per shard:
+
+    <dir>/<family>/<family>-00000.jsonl   one JSON object per line, compact, same field names
+                                          as the committed YAML vectors
+    <dir>/index.json                      seed, count, shard size, SSOT constants and, per
+                                          shard, its file, vector count and sha256
+
+Families (random inputs, expected outputs computed with the generate_vectors reference code):
+- hashable_part: header type 1/2, random flags/hops/addresses, total length up to MTU.
+- signalling_bytes: MTU 0..2^22-1 (overflow masked to 21 bits), mode 0..7; encode and decode
+  expectations in one vector (expected_bytes_hex, expected_mtu, expected_mode).
+- link_id_from_linkrequest: ECPUBSIZE bytes, with or without LINK_MTU_SIZE signalling bytes.
+- ifac_masking: canonical packets up to MTU - IFAC size, IFAC sizes 1..64, random 32-byte keys.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator
+
+from atom_registry import AtomRegistry
+from generate_vectors import (
+    IFAC_KEY_BYTES,
+    encode_signalling_bytes,
+    hashable_part,
+    ifac_mask_batch,
+    ifac_unmask_batch,
+    link_id_from_hashable_part,
+)
+
+FAMILIES = ("hashable_part", "signalling_bytes", "link_id_from_linkrequest", "ifac_masking")
+SHARD_SIZE = 100_000
+IFAC_MAX_SIZE = 64
+INDEX_NAME = "index.json"
+
+
+@dataclass(frozen=True)
+class Limits:
+    """SSOT constants bounding the random inputs (recorded in the index)."""
+
+    mtu: int = 500
+    header_minsize: int = 19
+    header_maxsize: int = 35
+    ecpubsize: int = 64
+    link_mtu_size: int = 3
+    mtu_bytemask: int = 0x1FFFFF
+    ifac_min_size: int = 1
+
+    @classmethod
+    def from_ssot(cls, atoms: AtomRegistry) -> Limits:
+        return cls(
+            mtu=atoms.constant_int("RNS.TRN.CONST.MTU_DEFAULT"),
+            header_minsize=atoms.constant_int("RNS.PKT.CONST.HEADER_MINSIZE"),
+            header_maxsize=atoms.constant_int("RNS.PKT.CONST.HEADER_MAXSIZE"),
+            ecpubsize=atoms.constant_int("RNS.LNK.CONST.ECPUBSIZE"),
+            link_mtu_size=atoms.constant_int("RNS.LNK.CONST.LINK_MTU_SIZE"),
+            mtu_bytemask=atoms.constant_int("RNS.LNK.CONST.MTU_BYTEMASK"),
+            ifac_min_size=atoms.constant_int("RNS.TRN.CONST.IFAC_MIN_SIZE"),
+        )
+
+
+def shard_rng(seed: int, family: str, shard: int) -> random.Random:
+    """The generator for one shard; independent of every other shard and of the worker count."""
+    return random.Random(int.from_bytes(hashlib.sha256(f"{seed}/{family}/{shard}".encode()).digest(), "big"))
+
+
+def _packet(rng: random.Random, limits: Limits, header_type: int, max_len: int) -> bytes:
+    """Random packet of the header type: random flags with bit 0x40 set for HEADER_2 only, length header..max_len."""
+    header = limits.header_maxsize if header_type == 2 else limits.header_minsize
+    flags = (rng.getrandbits(8) & 0xBF) | (0x40 if header_type == 2 else 0)
+    return bytes([flags]) + rng.randbytes(rng.randint(header, max_len) - 1)
+
+
+def _hashable_part(rng: random.Random, limits: Limits, start: int, count: int) -> list[dict]:
+    out = []
+    for i in range(start, start + count):
+        header_type = rng.randint(1, 2)
+        packet = _packet(rng, limits, header_type, limits.mtu)
+        hp = hashable_part(packet, header_type)
+        out.append(
+            {
+                "name": f"random_{i}",
+                "packet_hex": packet.hex(),
+                "header_type": header_type,
+                "expected_hashable_hex": hp.hex(),
+                "expected_sha256_hex": hashlib.sha256(hp).hexdigest(),
+            }
+        )
+    return out
+
+
+def _signalling_bytes(rng: random.Random, limits: Limits, start: int, count: int) -> list[dict]:
+    out = []
+    for i in range(start, start + count):
+        mtu, mode = rng.getrandbits(22), rng.getrandbits(3)
+        out.append(
+            {
+                "name": f"random_{i}",
+                "mtu": mtu,
+                "mode": mode,
+                "expected_bytes_hex": encode_signalling_bytes(mtu, mode, limits.mtu_bytemask).hex(),
+                "expected_mtu": mtu & limits.mtu_bytemask,
+                "expected_mode": mode,
+            }
+        )
+    return out
+
+
+def _link_id(rng: random.Random, limits: Limits, start: int, count: int) -> list[dict]:
+    out = []
+    for i in range(start, start + count):
+        part = rng.randbytes(limits.ecpubsize + (limits.link_mtu_size if rng.getrandbits(1) else 0))
+        out.append(
+            {
+                "name": f"random_{i}",
+                "hashable_part_before_strip_hex": part.hex(),
+                "data_len": len(part),
+                "expected_link_id_hex": link_id_from_hashable_part(part, len(part), limits.ecpubsize).hex(),
+            }
+        )
+    return out
+
+
+def _ifac_masking(rng: random.Random, limits: Limits, start: int, count: int) -> list[dict]:
+    inputs = []
+    for _ in range(count):
+        ifac = rng.randbytes(rng.randint(limits.ifac_min_size, IFAC_MAX_SIZE))
+        canonical = _packet(rng, limits, rng.randint(1, 2), limits.mtu - len(ifac))
+        canonical = bytes([canonical[0] & 0x7F]) + canonical[1:]  # canonical packets have the IFAC flag clear
+        inputs.append((canonical, ifac, rng.randbytes(IFAC_KEY_BYTES)))
+    on_wire = ifac_mask_batch(inputs)
+    recovered = ifac_unmask_batch((w, len(ifac), key) for w, (_, ifac, key) in zip(on_wire, inputs))
+    return [
+        {
+            "name": f"random_{i}",
+            "canonical_packet_hex": canonical.hex(),
+            "ifac_bytes_hex": ifac.hex(),
+            "ifac_key_hex": key.hex(),
+            "expected_on_wire_hex": w.hex(),
+            "expected_recovered_canonical_hex": r.hex(),
+        }
+        for i, (canonical, ifac, key), w, r in zip(range(start, start + count), inputs, on_wire, recovered)
+    ]
+
+
+_GENERATORS = {
+    "hashable_part": _hashable_part,
+    "signalling_bytes": _signalling_bytes,
+    "link_id_from_linkrequest": _link_id,
+    "ifac_masking": _ifac_masking,
+}
+
+
+def gen_shard(family: str, seed: int, shard: int, count: int, limits: Limits, shard_size: int = SHARD_SIZE) -> list[dict]:
+    """Vectors shard*shard_size .. shard*shard_size+count-1 of a family."""
+    return _GENERATORS[family](shard_rng(seed, family, shard), limits, shard * shard_size, count)
+
+
+def shard_path(family: str, shard: int) -> str:
+    return f"{family}/{family}-{shard:05d}.jsonl"
+
+
+def _write_shard(out_dir: str, family: str, seed: int, shard: int, count: int, limits: Limits, shard_size: int) -> dict:
+    """Generate one shard and write it atomically; returns its index entry."""
+    data = "".join(json.dumps(v, separators=(",", ":")) + "\n" for v in gen_shard(family, seed, shard, count, limits, shard_size)).encode("utf-8")
+    rel = shard_path(family, shard)
+    path = Path(out_dir) / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return {"file": rel, "count": count, "sha256": hashlib.sha256(data).hexdigest()}
+
+
+def _write_shard_task(task: tuple) -> dict:
+    return _write_shard(*task)
+
+
+def generate_random(
+    out_dir: Path,
+    count: int,
+    seed: int,
+    limits: Limits,
+    jobs: int = 1,
+    shard_size: int = SHARD_SIZE,
+    families: tuple[str, ...] = FAMILIES,
+) -> dict:
+    """
+    Write count vectors per family as shards under out_dir (jobs processes) and index.json;
+    returns the index. Stale shards of a family from a larger earlier run are removed.
+    """
+    if count < 0 or shard_size < 1:
+        raise ValueError("count must be >= 0 and shard_size >= 1")
+    unknown = sorted(set(families) - set(FAMILIES))
+    if unknown:
+        raise ValueError(f"unknown vector families: {', '.join(unknown)}")
+    out_dir = Path(out_dir)
+    tasks = [
+        (str(out_dir), family, seed, shard, min(shard_size, count - shard * shard_size), limits, shard_size)
+        for family in families
+        for shard in range(-(-count // shard_size))
+    ]
+    if jobs <= 1 or len(tasks) <= 1:
+        entries = [_write_shard_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            entries = list(pool.map(_write_shard_task, tasks))
+    index = {"seed": seed, "count": count, "shard_size": shard_size, "limits": asdict(limits), "families": {}}
+    for family in families:
+        shards = [e for e in entries if e["file"].startswith(f"{family}/")]
+        index["families"][family] = {"count": count, "shards": shards}
+        keep = {out_dir / e["file"] for e in shards}
+        for stale in (out_dir / family).glob(f"{family}-*.jsonl"):
+            if stale not in keep:
+                stale.unlink()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / INDEX_NAME).write_text(json.dumps(index, indent=2) + "\n", encoding="utf-8")
+    return index
+
+
+def iter_vectors(out_dir: Path, family: str) -> Iterator[dict]:
+    """Vectors of a family from a generate_random directory, in shard order, one shard in memory at a time."""
+    out_dir = Path(out_dir)
+    index = json.loads((out_dir / INDEX_NAME).read_text(encoding="utf-8"))
+    for shard in (index["families"].get(family) or {}).get("shards", []):
+        with open(out_dir / shard["file"], encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+
+def verify_index(out_dir: Path) -> list[str]:
+    """Shards whose content no longer matches index.json (missing, or sha256 differs)."""
+    out_dir = Path(out_dir)
+    index = json.loads((out_dir / INDEX_NAME).read_text(encoding="utf-8"))
+    errors = []
+    for family in index["families"].values():
+        for entry in family["shards"]:
+            path = out_dir / entry["file"]
+            if not path.is_file():
+                errors.append(f"{entry['file']}: missing")
+            elif hashlib.sha256(path.read_bytes()).hexdigest() != entry["sha256"]:
+                errors.append(f"{entry['file']}: sha256 mismatch")
+    return errors
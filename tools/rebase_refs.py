@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+rebase_refs.py — Move SSOT reference line ranges from one vendor commit to another via the git diff.
+
+Usage: python tools/rebase_refs.py OLD NEW [--ssot PATH] [--vendor DIR] [--no-write]
+
+One `git diff -U0 -M OLD NEW` in the vendor checkout is parsed into per-file hunks, and every
+reference range is mapped through its file's hunk offsets (bisect over the hunk table):
+- unchanged: no hunk touches the file before the range end; lines stay as they are.
+- shifted:   hunks only before the range; start/end move by the net line delta (content identical).
+- changed:   a hunk overlaps the range, or inserts lines inside it; the range is widened to cover
+             the replacement and the reference is reported for review.
+- deleted:   the file, or every line of the range, was removed; reported, lines left as is.
+Renamed files carry their references to the new path.
+
+Only changed/deleted references are reported, and only their atoms are re-verified (symbol in
+range, against the vendor working tree when it is checked out at NEW); unchanged and shifted
+excerpts are byte-identical by construction. Unless --no-write, the SSOT is rewritten with
+ruamel round-trip, manifest.repo_revision and spec_meta.source_of_truth.revision.commit (and
+.date when present) set to NEW. Exit 1 when a reference was deleted or fails verification.
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from extract_refs import load_ssot, verify_ref
+from vendor_index import VendorIndex
+
+_HUNK = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+@dataclass(frozen=True)
+class Hunk:
+    """One -U0 hunk: old lines [old_start, old_start + old_len) replaced by new lines (git numbering)."""
+
+    old_start: int
+    old_len: int
+    new_start: int
+    new_len: int
+
+    @property
+    def old_last(self) -> int:
+        """Last old line the hunk covers; for an insertion (old_len 0), the line it follows."""
+        return self.old_start + self.old_len - 1 if self.old_len else self.old_start
+
+
+@dataclass
+class FileDiff:
+    old_path: str
+    new_path: str | None  # None: deleted
+    hunks: list[Hunk] = field(default_factory=list)
+    _keys: list[int] = field(default_factory=list, repr=False)
+    _deltas: list[int] = field(default_factory=list, repr=False)
+
+    def finish(self) -> None:
+        """Sort hunks and precompute the bisect table (old_last, cumulative delta through hunk)."""
+        self.hunks.sort(key=lambda h: (h.old_start, h.old_len))
+        self._keys = [h.old_last for h in self.hunks]
+        total = 0
+        self._deltas = []
+        for h in self.hunks:
+            total += h.new_len - h.old_len
+            self._deltas.append(total)
+
+    def _delta_before(self, line: int) -> int:
+        """Net line delta of hunks entirely before old line `line`."""
+        i = bisect.bisect_left(self._keys, line)
+        return self._deltas[i - 1] if i else 0
+
+    def _inside(self, line: int) -> Hunk | None:
+        """Hunk whose removed lines include old line `line`, if any."""
+        i = bisect.bisect_left(self._keys, line)
+        while i < len(self.hunks) and self.hunks[i].old_start <= line:
+            h = self.hunks[i]
+            if h.old_len and h.old_start <= line <= h.old_last:
+                return h
+            i += 1
+        return None
+
+    def changes(self, start: int, end: int) -> bool:
+        """True if a hunk removes a line of [start, end] or inserts lines between two of them."""
+        i = bisect.bisect_left(self._keys, start)
+        for h in self.hunks[i:]:
+            if h.old_start > end:
+                break
+            if h.old_len or start <= h.old_start < end:
+                return True
+        return False
+
+    def map_range(self, start: int, end: int) -> tuple[int, int] | None:
+        """New [start, end] for old [start, end]; widened over changed hunks, None if all removed."""
+        h = self._inside(start)
+        if h is None:
+            new_start = start + self._delta_before(start)
+        else:
+            new_start = h.new_start if h.new_len else h.new_start + 1
+        h = self._inside(end)
+        if h is None:
+            new_end = end + self._delta_before(end)
+        else:
+            new_end = h.new_start + h.new_len - 1 if h.new_len else h.new_start
+        return (new_start, new_end) if new_start <= new_end else None
+
+
+def _diff_path(token: str, prefix: str) -> str | None:
+    if token == "/dev/null":
+        return None
+    return token[len(prefix):] if token.startswith(prefix) else token
+
+
+def parse_unified_diff(text: str) -> dict[str, FileDiff]:
+    """`git diff -U0 -M` output -> FileDiff per old path (files without hunks: renames only)."""
+    diffs: dict[str, FileDiff] = {}
+    cur: FileDiff | None = None
+    for line in text.splitlines():
+        if line.startswith("diff --git "):
+            cur = None
+            m = re.match(r"diff --git a/(.*) b/(.*)$", line)
+            if m:
+                cur = FileDiff(m.group(1), m.group(2))
+                diffs[cur.old_path] = cur
+        elif cur is None:
+            continue
+        elif line.startswith("rename from "):
+            del diffs[cur.old_path]
+            cur.old_path = line[len("rename from "):]
+            diffs[cur.old_path] = cur
+        elif line.startswith("rename to "):
+            cur.new_path = line[len("rename to "):]
+        elif line.startswith("deleted file mode"):
+            cur.new_path = None
+        elif line.startswith("+++ "):
+            if _diff_path(line[4:], "b/") is None:
+                cur.new_path = None
+        elif line.startswith("@@"):
+            m = _HUNK.match(line)
+            if m:
+                a, b, c, d = m.groups()
+                cur.hunks.append(Hunk(int(a), int(b) if b is not None else 1, int(c), int(d) if d is not None else 1))
+    for d in diffs.values():
+        d.finish()
+    return diffs
+
+
+def git_diff(vendor_root: Path, old: str, new: str) -> str:
+    out = subprocess.run(
+        ["git", "-c", "core.quotepath=off", "-C", str(vendor_root), "diff", "-U0", "-M", "--no-color", "--no-ext-diff", old, new],
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        check=True,
+    )
+    return out.stdout
+
+
+def rev_parse(vendor_root: Path, rev: str) -> str:
+    out = subprocess.run(
+        ["git", "-C", str(vendor_root), "rev-parse", "--verify", f"{rev}^{{commit}}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return out.stdout.strip()
+
+
+@dataclass
+class Rebased:
+    atom_id: str
+    ref: dict
+    old: tuple[str, int, int]
+    new: tuple[str, int, int] | None
+    status: str  # unchanged | shifted | changed | deleted
+
+
+def rebase_refs(data, diffs: dict[str, FileDiff]) -> list[Rebased]:
+    """Map every reference with a line range through diffs, updating refs in place (not deleted ones)."""
+    results = []
+    for atom in data.get("atoms") or []:
+        for ref in atom.get("references") or []:
+            lines = ref.get("lines") or {}
+            if not ref.get("file") or not lines.get("start") or not lines.get("end"):
+                continue
+            relpath, start, end = ref["file"], int(lines["start"]), int(lines["end"])
+            old = (relpath, start, end)
+            d = diffs.get(relpath)
+            if d is None:
+                results.append(Rebased(atom.get("id", "?"), ref, old, old, "unchanged"))
+                continue
+            rng = d.map_range(start, end) if d.new_path is not None else None
+            if rng is None:
+                results.append(Rebased(atom.get("id", "?"), ref, old, None, "deleted"))
+                continue
+            new = (d.new_path, rng[0], rng[1])
+            status = "changed" if d.changes(start, end) else ("unchanged" if new == old else "shifted")
+            if new != old:
+                ref["file"] = d.new_path
+                lines["start"], lines["end"] = rng
+            results.append(Rebased(atom.get("id", "?"), ref, old, new, status))
+    return results
+
+
+def _set_revision(data, old_commit: str, new_commit: str, new_date: str | None) -> None:
+    data["manifest"]["repo_revision"] = new_commit
+    revision = ((data.get("spec_meta") or {}).get("source_of_truth") or {}).get("revision")
+    if isinstance(revision, dict) and str(revision.get("commit", "")).strip() in ("", old_commit):
+        revision["commit"] = new_commit
+        if new_date and "date" in revision:
+            revision["date"] = new_date
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Rebase SSOT reference line ranges from vendor commit OLD to NEW via git diff.")
+    ap.add_argument("old", help="Vendor commit the SSOT ranges refer to (normally manifest.repo_revision)")
+    ap.add_argument("new", help="Vendor commit to move the ranges to")
+    ap.add_argument("--ssot", default="spec/reticulum-wire-format.ssot.yaml", help="SSOT YAML path")
+    ap.add_argument("--vendor", default="vendor/reticulum-source", help="Vendor git checkout")
+    ap.add_argument("--no-write", action="store_true", help="Report only; do not write the SSOT")
+    args = ap.parse_args()
+
+    vendor_root, ssot_path = Path(args.vendor), Path(args.ssot)
+    if not vendor_root.is_dir():
+        print(f"Vendor root not found: {vendor_root}", file=sys.stderr)
+        return 1
+    if not ssot_path.is_file():
+        print(f"SSOT not found: {ssot_path}", file=sys.stderr)
+        return 1
+    try:
+        old, new = rev_parse(vendor_root, args.old), rev_parse(vendor_root, args.new)
+        diffs = parse_unified_diff(git_diff(vendor_root, old, new))
+        head = subprocess.run(["git", "-C", str(vendor_root), "rev-parse", "HEAD"], capture_output=True, text=True).stdout.strip()
+        new_date = subprocess.run(
+            ["git", "-C", str(vendor_root), "log", "-1", "--format=%cI", new], capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"git: {getattr(e, 'stderr', '') or e}".strip(), file=sys.stderr)
+        return 1
+
+    data, ruamel_yaml = load_ssot(ssot_path, for_write=not args.no_write)
+    current = ((data.get("manifest") or {}).get("repo_revision") or "").strip()
+    if current != old:
+        print(f"manifest.repo_revision is {current or '(unset)'}, not OLD {old}", file=sys.stderr)
+        return 1
+    results = rebase_refs(data, diffs)
+    counts = {s: sum(r.status == s for r in results) for s in ("unchanged", "shifted", "changed", "deleted")}
+    print(f"{len(results)} references: " + ", ".join(f"{n} {s}" for s, n in counts.items()))
+
+    failed = False
+    index = VendorIndex(vendor_root) if head == new else None
+    for r in results:
+        if r.status not in ("changed", "deleted"):
+            continue
+        old_s = f"{r.old[0]}:{r.old[1]}-{r.old[2]}"
+        if r.status == "deleted":
+            print(f"{r.atom_id} ref {old_s} ({r.ref.get('symbol')}): deleted at {new[:12]}; specify the reference manually", file=sys.stderr)
+            failed = True
+            continue
+        note = "excerpt changed; review"
+        if index is not None:
+            ok, msg = verify_ref(vendor_root, r.ref, new, index)
+            if not ok:
+                note, failed = msg, True
+        else:
+            note += f" (not verified: vendor HEAD is {head[:12] or '?'}, not NEW)"
+        print(f"{r.atom_id} ref {old_s} -> {r.new[0]}:{r.new[1]}-{r.new[2]} ({r.ref.get('symbol')}): {note}", file=sys.stderr)
+
+    if not args.no_write:
+        _set_revision(data, old, new, new_date or None)
+        with open(ssot_path, "w", encoding="utf-8") as f:
+            ruamel_yaml.dump(data, f)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,379 @@
+"""
+spectral_rules.py — Native evaluator for the Spectral ruleset (spec/rules/spectral.ssot.yaml).
+
+Evaluates rules directly against the loaded SSOT dict, replacing `npx @stoplight/spectral-cli`
+(which stays available as a cross-check via run_spectral_cli). Follows Spectral 6 semantics:
+- given: JSONPath subset — $, .name, ['name'], [N], [*], .*, [?(@.a.b == 'v')] / != / @.a (truthy).
+  A missing property yields no node, so the rule does not run.
+- then.field: dotted path into an object/array target; ignored when the target is a primitive
+  (so `given: $.atoms[*].id` + `field: id` checks the id string itself).
+- functions: truthy / falsy (JavaScript truthiness: [] and {} are truthy), pattern
+  (match / notMatch as JavaScript RegExp: `$` only matches at the very end), enumeration (values).
+  pattern and enumeration skip inputs of the wrong type, as Spectral's input schemas do.
+- A finding's path is the longest prefix of the target path that exists in the document; its
+  message is the rule description (or message) as Spectral reports it.
+
+Findings compare equal across engines on (code, path, severity).
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+import shutil
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+SPECTRAL_CLI_PACKAGE = "@stoplight/spectral-cli@6.11.0"
+SEVERITIES = ("error", "warn", "info", "hint")  # Spectral JSON output uses their index
+
+
+class Finding(NamedTuple):
+    code: str
+    path: tuple
+    severity: str
+    message: str
+
+    def key(self) -> tuple:
+        return (self.code, self.path, self.severity)
+
+    def __str__(self) -> str:
+        where = ".".join(str(p) for p in self.path) or "$"
+        return f"{where}: {self.severity} {self.code}: {self.message}"
+
+
+_MISSING = object()
+
+
+# -----------------------------
+# JavaScript value semantics
+# -----------------------------
+
+
+def _js_truthy(value: Any) -> bool:
+    if value is _MISSING or value is None or value is False:
+        return False
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value != 0 and not (isinstance(value, float) and math.isnan(value))
+    if isinstance(value, str):
+        return value != ""
+    return True
+
+
+@lru_cache(maxsize=None)
+def _js_regex(pattern: str) -> re.Pattern:
+    """Compile a Spectral pattern ("re" or "/re/flags") with JavaScript `$` (end of input only)."""
+    flags = 0
+    m = re.fullmatch(r"/(.+)/([a-z]*)", pattern, re.DOTALL)
+    if m:
+        pattern = m.group(1)
+        for flag in m.group(2):
+            flags |= {"i": re.IGNORECASE, "m": re.MULTILINE, "s": re.DOTALL}.get(flag, 0)
+    if not flags & re.MULTILINE:
+        out, in_class, i = [], False, 0
+        while i < len(pattern):
+            c = pattern[i]
+            if c == "\\":
+                out.append(pattern[i : i + 2])
+                i += 2
+                continue
+            if c == "[":
+                in_class = True
+            elif c == "]":
+                in_class = False
+            elif c == "$" and not in_class:
+                c = r"\Z"
+            out.append(c)
+            i += 1
+        pattern = "".join(out)
+    return re.compile(pattern, flags)
+
+
+# -----------------------------
+# JSONPath subset (given)
+# -----------------------------
+
+_TOKEN = re.compile(
+    r"""\.(?P<name>[A-Za-z_$][\w$-]*)
+      | \.\*(?P<dotstar>)
+      | \[\s*\*\s*\](?P<star>)
+      | \[\s*(?P<index>-?\d+)\s*\]
+      | \[\s*(?P<q>['"])(?P<qname>.*?)(?P=q)\s*\]
+      | \[\s*\?\s*\((?P<filter>.*?)\)\s*\](?=$|[.\[])
+    """,
+    re.VERBOSE,
+)
+_FILTER = re.compile(
+    r"""^\s*@(?P<path>(?:\.[A-Za-z_$][\w$]*)+)\s*
+         (?:(?P<op>===?|!==?)\s*(?:(?P<q>['"])(?P<str>.*?)(?P=q)|(?P<num>-?\d+(?:\.\d+)?)|(?P<lit>true|false|null)))?\s*$""",
+    re.VERBOSE,
+)
+
+Step = Callable[[Any, tuple], list]
+
+
+def _children(value: Any, path: tuple) -> list[tuple[Any, tuple]]:
+    if isinstance(value, dict):
+        return [(v, path + (k,)) for k, v in value.items()]
+    if isinstance(value, list):
+        return [(v, path + (i,)) for i, v in enumerate(value)]
+    return []
+
+
+def _member(name: Any) -> Step:
+    def step(value: Any, path: tuple) -> list:
+        if isinstance(value, dict) and name in value:
+            return [(value[name], path + (name,))]
+        if isinstance(value, list) and isinstance(name, int) and -len(value) <= name < len(value):
+            i = name % len(value)
+            return [(value[i], path + (i,))]
+        return []
+
+    return step
+
+
+def _filter(expr: str) -> Step:
+    m = _FILTER.match(expr)
+    if not m:
+        raise ValueError(f"unsupported JSONPath filter: {expr}")
+    keys = m.group("path").split(".")[1:]
+    op = m.group("op")
+    if m.group("q"):
+        expected: Any = m.group("str")
+    elif m.group("num"):
+        expected = json.loads(m.group("num"))
+    else:
+        expected = json.loads(m.group("lit") or "null")
+
+    def test(item: Any) -> bool:
+        for k in keys:
+            item = item.get(k, _MISSING) if isinstance(item, dict) else _MISSING
+        if op is None:
+            return _js_truthy(item)
+        equal = item is not _MISSING and type(item) is type(expected) and item == expected
+        return equal if op.startswith("=") else not equal
+
+    return lambda value, path: [(v, p) for v, p in _children(value, path) if test(v)]
+
+
+def compile_jsonpath(expr: str) -> Callable[[Any], list[tuple[Any, tuple]]]:
+    """Compile a `given` expression to doc -> [(value, path), ...] in document order."""
+    if not expr.startswith("$"):
+        raise ValueError(f"JSONPath must start with $: {expr}")
+    steps: list[Step] = []
+    pos = 1
+    while pos < len(expr):
+        m = _TOKEN.match(expr, pos)
+        if not m:
+            raise ValueError(f"unsupported JSONPath at {expr[pos:]!r}: {expr}")
+        if m.group("name") is not None:
+            steps.append(_member(m.group("name")))
+        elif m.group("dotstar") is not None or m.group("star") is not None:
+            steps.append(_children)
+        elif m.group("index") is not None:
+            steps.append(_member(int(m.group("index"))))
+        elif m.group("qname") is not None:
+            steps.append(_member(m.group("qname")))
+        else:
+            steps.append(_filter(m.group("filter")))
+        pos = m.end()
+
+    def evaluate(doc: Any) -> list[tuple[Any, tuple]]:
+        nodes = [(doc, ())]
+        for step in steps:
+            nodes = [out for value, path in nodes for out in step(value, path)]
+        return nodes
+
+    return evaluate
+
+
+# -----------------------------
+# Rule functions
+# -----------------------------
+
+
+def _fn_truthy(value: Any, options: dict) -> bool:
+    return _js_truthy(value)
+
+
+def _fn_falsy(value: Any, options: dict) -> bool:
+    return not _js_truthy(value)
+
+
+def _fn_pattern(value: Any, options: dict) -> bool:
+    if not isinstance(value, str):
+        return True
+    if "match" in options and not _js_regex(options["match"]).search(value):
+        return False
+    if "notMatch" in options and _js_regex(options["notMatch"]).search(value):
+        return False
+    return True
+
+
+def _fn_enumeration(value: Any, options: dict) -> bool:
+    if value is _MISSING or isinstance(value, (dict, list)):
+        return True
+    return any(type(value) is type(v) and value == v for v in options.get("values") or [])
+
+
+FUNCTIONS: dict[str, Callable[[Any, dict], bool]] = {
+    "truthy": _fn_truthy,
+    "falsy": _fn_falsy,
+    "pattern": _fn_pattern,
+    "enumeration": _fn_enumeration,
+}
+
+
+# -----------------------------
+# Ruleset evaluation
+# -----------------------------
+
+
+class Rule(NamedTuple):
+    code: str
+    given: list[Callable[[Any], list]]
+    then: list[tuple[list | None, Callable[[Any, dict], bool], dict]]
+    severity: str
+    message: str
+
+
+def compile_ruleset(ruleset: dict) -> list[Rule]:
+    """Compile a parsed ruleset; raises ValueError on anything outside the supported subset."""
+    if ruleset.get("extends"):
+        raise ValueError("extends is not supported by the native engine")
+    rules = []
+    for code, spec in (ruleset.get("rules") or {}).items():
+        if spec is False or spec == "off" or not isinstance(spec, dict):
+            continue
+        severity = spec.get("severity", "warn")
+        if isinstance(severity, int) and not isinstance(severity, bool):
+            severity = SEVERITIES[severity] if 0 <= severity < len(SEVERITIES) else "off"
+        if severity == "off" or spec.get("recommended") is False:
+            continue
+        if severity not in SEVERITIES:
+            raise ValueError(f"rule {code}: unsupported severity {severity!r}")
+        given = spec.get("given")
+        given_list = given if isinstance(given, list) else [given]
+        then = spec.get("then")
+        then_list = then if isinstance(then, list) else [then]
+        compiled_then = []
+        for t in then_list:
+            fn = FUNCTIONS.get(t.get("function"))
+            if fn is None:
+                raise ValueError(f"rule {code}: unsupported function {t.get('function')!r}")
+            field = t.get("field")
+            if field is not None and (field == "@key" or field.startswith("$")):
+                raise ValueError(f"rule {code}: unsupported field {field!r}")
+            keys = [int(k) if k.isdigit() else k for k in re.findall(r"[^.\[\]]+", field)] if field else None
+            compiled_then.append((keys, fn, t.get("functionOptions") or {}))
+        message = spec.get("message") or spec.get("description") or code
+        rules.append(Rule(code, [compile_jsonpath(g) for g in given_list], compiled_then, severity, message))
+    return rules
+
+
+def _get(value: Any, keys: list) -> Any:
+    for k in keys:
+        if isinstance(value, dict):
+            value = value.get(k, _MISSING)
+        elif isinstance(value, list) and isinstance(k, int) and 0 <= k < len(value):
+            value = value[k]
+        else:
+            return _MISSING
+    return value
+
+
+def _closest_path(doc: Any, path: tuple) -> tuple:
+    value = doc
+    for i, k in enumerate(path):
+        if isinstance(value, dict) and k in value:
+            value = value[k]
+        elif isinstance(value, list) and isinstance(k, int) and 0 <= k < len(value):
+            value = value[k]
+        else:
+            return path[:i]
+    return path
+
+
+def lint(doc: Any, rules: list[Rule]) -> list[Finding]:
+    """
+    Run compiled rules against a loaded document; findings in rule order, then document order.
+    Like Spectral, a repeated (code, path) is reported once.
+    """
+    findings = []
+    seen = set()
+    for rule in rules:
+        for given in rule.given:
+            for value, given_path in given(doc):
+                for keys, fn, options in rule.then:
+                    if keys is not None and isinstance(value, (dict, list)):
+                        target, path = _get(value, keys), given_path + tuple(keys)
+                    else:
+                        target, path = value, given_path
+                    if not fn(target, options):
+                        finding = Finding(rule.code, _closest_path(doc, path), rule.severity, rule.message)
+                        if finding.key() not in seen:
+                            seen.add(finding.key())
+                            findings.append(finding)
+    return findings
+
+
+def load_ruleset(path: Path) -> list[Rule]:
+    import yaml
+
+    with open(path, encoding="utf-8") as f:
+        return compile_ruleset(yaml.safe_load(f) or {})
+
+
+# -----------------------------
+# Node cross-check
+# -----------------------------
+
+
+def spectral_cli_argv() -> list[str]:
+    """Globally installed `spectral` if on PATH (as in CI), else the pinned package via npx."""
+    if shutil.which("spectral"):
+        return ["spectral"]
+    return ["npx", "--yes", SPECTRAL_CLI_PACKAGE]
+
+
+def run_spectral_cli(doc_path: Path, ruleset_path: Path, cwd: Path | None = None, timeout: float = 30) -> list[Finding]:
+    """
+    Lint with the Spectral CLI (--format json). Raises FileNotFoundError when the CLI is missing,
+    subprocess.TimeoutExpired on timeout, RuntimeError when its output cannot be parsed.
+    """
+    r = subprocess.run(
+        [*spectral_cli_argv(), "lint", str(doc_path), "--ruleset", str(ruleset_path), "--format", "json", "--quiet"],
+        cwd=str(cwd) if cwd else None,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    out = r.stdout.strip()
+    start = out.find("[")
+    try:
+        results = json.loads(out[start:]) if start != -1 else []
+    except ValueError as e:
+        raise RuntimeError(f"unparseable Spectral output: {out[:200] or r.stderr.strip()[:200]}") from e
+    if r.returncode not in (0, 1) or (r.returncode == 1 and not results):
+        raise RuntimeError(r.stderr.strip() or out or f"spectral exited {r.returncode}")
+    return [
+        Finding(
+            res["code"],
+            tuple(int(k) if isinstance(k, str) and k.isdigit() else k for k in res.get("path") or ()),
+            SEVERITIES[res.get("severity", 0)],
+            res.get("message", ""),
+        )
+        for res in results
+    ]
+
+
+def diff_findings(native: list[Finding], node: list[Finding]) -> list[str]:
+    """Human-readable differences between two engines' findings (empty when identical)."""
+    a = {f.key(): f for f in native}
+    b = {f.key(): f for f in node}
+    out = [f"only native: {a[k]}" for k in sorted(a.keys() - b.keys(), key=repr)]
+    out += [f"only node: {b[k]}" for k in sorted(b.keys() - a.keys(), key=repr)]
+    return out
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+ssot.py — Importable toolchain API over one parsed SSOT, and the single-interpreter pipeline.
+
+    sys.path.insert(0, "tools"); import ssot
+    doc = ssot.load()                         # read + parse the SSOT once
+    doc.registry.constant_int(atom_id)        # AtomRegistry: atoms by id, kind, tag, prefix, vendor file
+    errors = ssot.validate(doc)               # schema, Spectral, bespoke checks, reference verification
+    errors, modified = ssot.extract_refs(doc)  # verify refs (fill=True fills missing ranges in doc.data)
+    status = ssot.compile(doc)                # spec/generated (per-atom render cache on)
+    status = ssot.generate_vectors(doc)       # tests/vectors
+
+Every call works on doc's parsed tree and shares doc.index (one VendorIndex), so each vendor
+file is read once per run. compile/generate_vectors return an exit status with messages on
+stderr, as the scripts do.
+
+CLI:
+    python tools/ssot.py validate [--spectral native|node|both]
+    python tools/ssot.py extract-refs
+    python tools/ssot.py compile [--out-dir DIR] [--no-cache]
+    python tools/ssot.py vectors [--vectors-dir DIR]
+    python tools/ssot.py all [--spectral ...] [--no-diff-check]
+
+`all` is the CI pipeline in one interpreter: validate → pytest -q tests/ (pytest.main) →
+compile → git diff --exit-code spec/generated → vectors → git diff --exit-code tests/vectors.
+Writing filled references back to the SSOT stays with `tools/extract_refs.py --fill`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import compile_ssot
+import extract_refs as _extract_refs
+import generate_vectors as _generate_vectors
+import validate_ssot
+from atom_registry import AtomRegistry
+from ssot_loader import load_yaml_bytes
+from vendor_index import VendorIndex
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SSOT = REPO_ROOT / "spec" / "reticulum-wire-format.ssot.yaml"
+
+
+class SSOT:
+    """One parsed SSOT file plus state the tools share: raw bytes, the atom registry and the vendor index."""
+
+    def __init__(self, path: Path, raw: bytes, data: Any, repo_root: Path = REPO_ROOT) -> None:
+        self.path = path
+        self.raw = raw
+        self.data = data
+        self.repo_root = repo_root
+        self._index: VendorIndex | None = None
+        self._registry: AtomRegistry | None = None
+
+    @property
+    def sha256(self) -> str:
+        return hashlib.sha256(self.raw).hexdigest()
+
+    @property
+    def atoms(self) -> list:
+        return (self.data.get("atoms") or []) if isinstance(self.data, dict) else []
+
+    @property
+    def registry(self) -> AtomRegistry:
+        if self._registry is None:
+            self._registry = AtomRegistry(self.atoms)
+        return self._registry
+
+    @property
+    def vendor_root(self) -> Path:
+        return self.repo_root / "vendor" / "reticulum-source"
+
+    @property
+    def index(self) -> VendorIndex:
+        if self._index is None:
+            self._index = VendorIndex(self.vendor_root)
+        return self._index
+
+
+def load(path: Path | str | None = None, repo_root: Path = REPO_ROOT, cache: bool = True) -> SSOT:
+    """Read and parse the SSOT once (CSafeLoader; parse cache under .cache/ssot_load unless cache=False)."""
+    path = Path(path) if path is not None else repo_root / "spec" / "reticulum-wire-format.ssot.yaml"
+    raw, data = load_yaml_bytes(path, repo_root / ".cache" / "ssot_load" if cache else None)
+    return SSOT(path, raw, data, repo_root)
+
+
+def validate(doc: SSOT, spectral: str = "native", cache: bool = True) -> list[str]:
+    """All validate_ssot checks on doc; returns error messages (empty when valid)."""
+    cache_dir = doc.repo_root / ".cache" / "validate_ssot" if cache else None
+    return validate_ssot.validate(doc.data, doc.repo_root, doc.path, doc.raw, spectral, doc.index, cache_dir)
+
+
+def extract_refs(doc: SSOT, fill: bool = False) -> tuple[list[str], bool]:
+    """Verify doc's references against the vendor checkout; returns (errors, modified)."""
+    if not doc.vendor_root.is_dir():
+        return [f"Vendor root not found: {doc.vendor_root}"], False
+    cache_dir = doc.repo_root / ".cache" / "symbol_index"
+    return _extract_refs.process_refs(doc.data, doc.vendor_root, fill=fill, index=doc.index, cache_dir=cache_dir)
+
+
+def compile(doc: SSOT, out_dir: Path | None = None, cache: bool = True) -> int:  # noqa: A001 - API name
+    """Write spec/generated (or out_dir) from doc; returns an exit status."""
+    out_dir = out_dir or doc.repo_root / "spec" / "generated"
+    cache_dir = doc.repo_root / ".cache" / "compile_ssot" if cache else None
+    return compile_ssot.compile_spec(doc.data, doc.raw, doc.repo_root, out_dir, cache_dir, doc.index)
+
+
+def generate_vectors(doc: SSOT, vectors_dir: Path | None = None) -> int:
+    """Write tests/vectors (or vectors_dir) from doc; returns an exit status."""
+    return _generate_vectors.generate(doc.data, vectors_dir or doc.repo_root / "tests" / "vectors")
+
+
+# -----------------------------
+# Pipeline
+# -----------------------------
+
+
+def _git_diff_clean(repo_root: Path, pathspec: str) -> int:
+    return subprocess.run(["git", "diff", "--exit-code", "--", pathspec], cwd=str(repo_root)).returncode
+
+
+def _run_tests(repo_root: Path) -> int:
+    import pytest
+
+    return int(pytest.main(["-q", str(repo_root / "tests")]))
+
+
+def run_all(doc: SSOT, spectral: str = "native", diff_check: bool = True) -> int:
+    """CI pipeline on one parsed SSOT; stops at the first failing step. Step times on stderr."""
+    steps: list[tuple[str, Callable[[], int]]] = [
+        ("validate", lambda: _report(validate(doc, spectral))),
+        ("tests", lambda: _run_tests(doc.repo_root)),
+        ("compile", lambda: compile(doc)),
+    ]
+    if diff_check:
+        steps.append(("diff spec/generated", lambda: _git_diff_clean(doc.repo_root, "spec/generated")))
+    steps.append(("vectors", lambda: generate_vectors(doc)))
+    if diff_check:
+        steps.append(("diff tests/vectors", lambda: _git_diff_clean(doc.repo_root, "tests/vectors")))
+    t_start = time.perf_counter()
+    for name, step in steps:
+        t0 = time.perf_counter()
+        status = step()
+        print(f"[ssot] {name}: {'ok' if status == 0 else 'FAILED'} ({time.perf_counter() - t0:.2f}s)", file=sys.stderr)
+        if status != 0:
+            return 1
+    print(f"[ssot] all: ok ({time.perf_counter() - t_start:.2f}s)", file=sys.stderr)
+    return 0
+
+
+def _report(errors: list[str]) -> int:
+    for e in errors:
+        print(e, file=sys.stderr)
+    return 1 if errors else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="SSOT toolchain on one parsed SSOT (validate, compile, vectors, all).")
+    ap.add_argument("--ssot", default=str(DEFAULT_SSOT), help="SSOT YAML path")
+    sub = ap.add_subparsers(dest="command", required=True)
+    p_validate = sub.add_parser("validate", help="Schema, Spectral, bespoke checks, reference verification")
+    p_validate.add_argument("--spectral", choices=("native", "node", "both"), default="native")
+    sub.add_parser("extract-refs", help="Verify references against the vendor checkout")
+    p_compile = sub.add_parser("compile", help="Write spec/generated")
+    p_compile.add_argument("--out-dir", help="Output directory (default spec/generated)")
+    p_compile.add_argument("--no-cache", action="store_true", help="Disable the per-atom render cache")
+    p_vectors = sub.add_parser("vectors", help="Write tests/vectors")
+    p_vectors.add_argument("--vectors-dir", help="Output directory (default tests/vectors)")
+    p_all = sub.add_parser("all", help="validate, tests, compile, vectors (the CI pipeline)")
+    p_all.add_argument("--spectral", choices=("native", "node", "both"), default="native")
+    p_all.add_argument("--no-diff-check", action="store_true", help="Skip git diff --exit-code on generated outputs")
+    args = ap.parse_args(argv)
+
+    try:
+        doc = load(args.ssot)
+    except Exception as e:
+        print(f"Load SSOT: {e}", file=sys.stderr)
+        return 1
+    if args.command == "validate":
+        return _report(validate(doc, args.spectral))
+    if args.command == "extract-refs":
+        return _report(extract_refs(doc)[0])
+    if args.command == "compile":
+        return compile(doc, Path(args.out_dir).resolve() if args.out_dir else None, cache=not args.no_cache)
+    if args.command == "vectors":
+        return generate_vectors(doc, Path(args.vectors_dir).resolve() if args.vectors_dir else None)
+    return run_all(doc, args.spectral, diff_check=not args.no_diff_check)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
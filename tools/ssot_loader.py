@@ -0,0 +1,72 @@
+"""
+ssot_loader.py — Fast read-only SSOT/YAML loading: libyaml CSafeLoader plus a content-addressed parse cache.
+
+load_yaml_bytes(path) -> (raw bytes, parsed tree):
+- The file is read once; its SHA-256 (with the PyYAML version) keys a pickle of the parsed tree
+  under .cache/ssot_load/, so a repeat load of unchanged content is one file read, one hash
+  and one unpickle.
+- On a miss the text is parsed with yaml.CSafeLoader when PyYAML was built with libyaml, else
+  yaml.SafeLoader (same constructors, so the tree is identical), and the pickle is written
+  atomically. The cache is best-effort: unreadable or corrupt entries are re-parsed.
+
+Round-trip ruamel loading is only for tools that write the SSOT back (extract_refs --fill).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_DIR = REPO_ROOT / ".cache" / "ssot_load"
+
+
+def safe_loader() -> type:
+    """yaml.CSafeLoader when libyaml is available, else yaml.SafeLoader."""
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def parse_yaml(raw: bytes) -> Any:
+    import yaml
+
+    return yaml.load(raw.decode("utf-8"), Loader=safe_loader())
+
+
+def _cache_path(cache_dir: Path, raw: bytes) -> Path:
+    import yaml
+
+    digest = hashlib.sha256(raw).hexdigest()
+    return cache_dir / f"{digest}-pyyaml{yaml.__version__}.pickle"
+
+
+def load_yaml_bytes(path: Path, cache_dir: Path | None = DEFAULT_CACHE_DIR) -> tuple[bytes, Any]:
+    """Return (raw bytes, parsed tree) for a YAML file; cache_dir=None disables the parse cache."""
+    raw = Path(path).read_bytes()
+    if cache_dir is None:
+        return raw, parse_yaml(raw)
+    entry = _cache_path(Path(cache_dir), raw)
+    try:
+        with open(entry, "rb") as f:
+            return raw, pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        pass
+    data = parse_yaml(raw)
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, entry)
+    except OSError:
+        pass
+    return raw, data
+
+
+def load_yaml(path: Path, cache_dir: Path | None = DEFAULT_CACHE_DIR) -> Any:
+    """Parsed tree of a YAML file (see load_yaml_bytes)."""
+    return load_yaml_bytes(path, cache_dir)[1]
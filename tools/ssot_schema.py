@@ -0,0 +1,118 @@
+"""
+ssot_schema.py — The SSOT JSON Schema (Draft 2020-12), compiled once and applied per atom.
+
+    schema = ssot_schema.load(repo_root / "spec/schema/reticulum-wire-format.ssot.schema.json")
+    schema.document_errors(data)   # everything except the atoms' items
+    schema.atom_errors(atom)       # one atom against properties.atoms.items
+    schema.errors(data)            # both, every error, atoms in order
+
+load() checks the schema against the metaschema and builds the validators once per schema
+content in a process (later calls hash the file and return the same object). Local "$ref"s
+("#/...") are inlined at load time, so validation does no reference lookups; cyclic ones are
+left to the resolver. Atoms are validated independently of each other and of the document,
+so validate_ssot caches each atom's result and can check atoms in any order or in parallel.
+
+Messages are "<atom id>: <json path in the atom>: <message>" for atoms and
+"<json path>: <message>" for the document. Format keywords are not asserted (as
+jsonschema.validate). Raises ImportError without jsonschema and ValueError for an invalid schema.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+from pathlib import Path
+
+_LOADED: dict[str, SsotSchema] = {}
+
+
+def _pointer(root, ref: str):
+    """Target of a local JSON pointer reference "#/a/b" in root (KeyError/IndexError if absent)."""
+    node = root
+    for token in ref[2:].split("/") if ref != "#" else ():
+        token = token.replace("~1", "/").replace("~0", "~")
+        node = node[int(token)] if isinstance(node, list) else node[token]
+    return node
+
+
+def inline_refs(node, root, _stack: tuple[str, ...] = ()):
+    """Copy of node with local "$ref"s replaced by their targets; cyclic or unresolvable refs are kept."""
+    if isinstance(node, list):
+        return [inline_refs(v, root, _stack) for v in node]
+    if not isinstance(node, dict):
+        return node
+    out = {k: inline_refs(v, root, _stack) for k, v in node.items() if k != "$ref"}
+    ref = node.get("$ref")
+    if not isinstance(ref, str):
+        return out
+    try:
+        target = _pointer(root, ref) if ref.startswith("#/") and ref not in _stack else None
+    except (KeyError, IndexError, ValueError, TypeError):
+        target = None
+    if target is None:
+        out["$ref"] = ref
+        return out
+    target = inline_refs(target, root, _stack + (ref,))
+    if not out:
+        return target
+    out.setdefault("allOf", []).append(target)  # "$ref" next to other keywords applies both
+    return out
+
+
+class SsotSchema:
+    """Compiled validators for one schema: the document without atom items, and one atom."""
+
+    def __init__(self, schema: dict, sha256: str = "", path: Path | None = None) -> None:
+        from jsonschema import Draft202012Validator
+        from jsonschema.exceptions import SchemaError
+
+        try:
+            Draft202012Validator.check_schema(schema)
+        except SchemaError as e:
+            raise ValueError(f"invalid JSON Schema: {e.message}") from e
+        self.sha256 = sha256
+        self.path = path
+        inlined = inline_refs(schema, schema)
+        defs = {k: schema[k] for k in ("$defs", "definitions") if k in schema}
+        atoms = (inlined.get("properties") or {}).get("atoms") or {}
+        atom_schema = atoms.get("items") if isinstance(atoms.get("items"), dict) else {}
+        document = copy.deepcopy(inlined)
+        if atom_schema:
+            document["properties"]["atoms"] = {k: v for k, v in atoms.items() if k != "items"}
+        self._document = Draft202012Validator(document)
+        self._atom = Draft202012Validator({**atom_schema, **defs})
+        self._full = Draft202012Validator(inlined)
+
+    def document_errors(self, data) -> list[str]:
+        """Errors outside the atoms' items (the atoms list itself is still type-checked)."""
+        if not isinstance(data, dict) or not isinstance(data.get("atoms"), list):
+            return [f"{e.json_path}: {e.message}" for e in _sorted(self._full.iter_errors(data))]
+        return [f"{e.json_path}: {e.message}" for e in _sorted(self._document.iter_errors(data))]
+
+    def atom_errors(self, atom) -> list[str]:
+        """Errors of one atom, prefixed with its id ("?" when it has none)."""
+        aid = atom.get("id", "?") if isinstance(atom, dict) else "?"
+        return [f"{aid}: {e.json_path}: {e.message}" for e in _sorted(self._atom.iter_errors(atom))]
+
+    def errors(self, data) -> list[str]:
+        """Every schema error of the document: document-level first, then atoms in order."""
+        errors = self.document_errors(data)
+        if isinstance(data, dict) and isinstance(data.get("atoms"), list):
+            for atom in data["atoms"]:
+                errors.extend(self.atom_errors(atom))
+        return errors
+
+
+def _sorted(errors):
+    return sorted(errors, key=lambda e: (e.json_path, e.message))
+
+
+def load(path: Path) -> SsotSchema:
+    """Compiled schema for the file at path, reused while its content is unchanged."""
+    raw = Path(path).read_bytes()
+    sha = hashlib.sha256(raw).hexdigest()
+    schema = _LOADED.get(sha)
+    if schema is None:
+        schema = _LOADED[sha] = SsotSchema(json.loads(raw), sha, Path(path))
+    return schema
@@ -0,0 +1,232 @@
+"""
+symbol_index.py — Persistent symbol index over the pinned vendor checkout, for extract_refs --fill.
+
+One pickle per vendor revision, <cache_dir>/<manifest.repo_revision>.pickle, holds per vendor file:
+- its git blob id and line count;
+- the def/class table (Python files; name -> ranges, as VendorFile.def_table);
+- the assignment table (Python files; ^NAME\\s*= at any indentation, so top-level and
+  class-level constants alike, as VendorFile.assignment_table);
+- substring hits (symbol -> line numbers) for every symbol looked up so far.
+
+Filling a reference is then a few dict lookups. A stored file whose blob id no longer matches
+the checkout is re-indexed, so a vendor tree moved without a revision bump cannot serve stale
+ranges. prepare() indexes missing files in a ProcessPoolExecutor (one file per task) when
+jobs > 1. fill() returns the range or the reason there is none ("not found", or "ambiguous"
+with the candidate lines), so every unresolvable symbol is reported in one pass.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable
+
+from vendor_index import VendorFile, VendorIndex
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_DIR = REPO_ROOT / ".cache" / "symbol_index"
+_FORMAT = 1
+_WINDOW = 2
+_MAX_LISTED = 10
+
+
+def _plain(symbol: str) -> bool:
+    """True if symbol can be a key of the assignment table (no whitespace, no "=")."""
+    return bool(symbol) and not any(c.isspace() or c == "=" for c in symbol)
+
+
+def _listed(items: list) -> str:
+    shown = ", ".join(str(x) for x in items[:_MAX_LISTED])
+    return shown + (f", ... ({len(items)} total)" if len(items) > _MAX_LISTED else "")
+
+
+def fill_window(
+    relpath: str,
+    n_lines: int,
+    defs: Callable[[], list[tuple[int, int]]],
+    assignments: Callable[[], list[int]],
+    substrings: Callable[[], list[int]],
+) -> tuple[tuple[int, int] | None, str]:
+    """
+    extract_refs deterministic windowing over lazily computed matches: for .py files a unique
+    def/class block, else a unique assignment ± 2 lines; then a unique substring line ± 2 lines.
+    Returns (range, "") or (None, reason).
+    """
+
+    def window(line: int) -> tuple[int, int]:
+        return (max(1, line - _WINDOW), min(n_lines, line + _WINDOW))
+
+    if relpath.endswith(".py"):
+        found = defs()
+        if len(found) == 1:
+            return found[0], ""
+        if found:
+            return None, "is ambiguous: def/class at lines " + _listed([f"{a}-{b}" for a, b in sorted(found)])
+        lines = assignments()
+        if len(lines) == 1:
+            return window(lines[0]), ""
+        if lines:
+            return None, "is ambiguous: assigned at lines " + _listed(lines)
+    lines = substrings()
+    if len(lines) == 1:
+        return window(lines[0]), ""
+    if not lines:
+        return None, "not found"
+    return None, "is ambiguous: occurs on lines " + _listed(lines)
+
+
+@dataclass
+class FileSymbols:
+    """Index record for one vendor file (plain data, pickled as part of the revision index)."""
+
+    blob_id: str
+    n_lines: int
+    defs: dict[str, list[tuple[int, int]]]
+    assignments: dict[str, list[int]]
+    substrings: dict[str, list[int]] = field(default_factory=dict)
+
+    def add_symbol(self, vf: VendorFile, symbol: str) -> None:
+        """Record substring hits for symbol (and its assignment lines if it cannot be a table key)."""
+        self.substrings[symbol] = vf.substring_lines(symbol)
+        if vf.relpath.endswith(".py") and not _plain(symbol):
+            self.assignments[symbol] = vf.assignment_lines(symbol)
+
+    def fill(self, relpath: str, symbol: str) -> tuple[tuple[int, int] | None, str]:
+        return fill_window(
+            relpath,
+            self.n_lines,
+            lambda: self.defs.get(symbol, []),
+            lambda: self.assignments.get(symbol, []),
+            lambda: self.substrings[symbol],
+        )
+
+
+def index_file(vf: VendorFile, symbols: Iterable[str] = ()) -> FileSymbols:
+    """Build the record for one vendor file: full def/assignment tables plus hits for symbols."""
+    py = vf.relpath.endswith(".py")
+    rec = FileSymbols(
+        vf.blob_id,
+        vf.n_lines,
+        {k: list(v) for k, v in vf.def_table().items()} if py else {},
+        {k: list(v) for k, v in vf.assignment_table().items()} if py else {},
+    )
+    for symbol in symbols:
+        rec.add_symbol(vf, symbol)
+    return rec
+
+
+def _index_file_task(root: str, relpath: str, symbols: tuple[str, ...]) -> FileSymbols:
+    with VendorIndex(Path(root)) as index:
+        return index_file(index.get(relpath), symbols)
+
+
+class SymbolIndex:
+    """Per-revision symbol records for the vendor checkout, loaded from and saved to cache_dir."""
+
+    def __init__(
+        self,
+        vendor_root: Path,
+        repo_revision: str,
+        cache_dir: Path | None = DEFAULT_CACHE_DIR,
+        index: VendorIndex | None = None,
+    ) -> None:
+        self.root = Path(vendor_root)
+        self.repo_revision = repo_revision
+        name = re.sub(r"[^0-9A-Za-z_-]", "_", repo_revision)  # revision is SSOT input; keep it a plain file name
+        self.path = Path(cache_dir) / f"{name}.pickle" if cache_dir is not None else None
+        self._index = index if index is not None and index.root == self.root else VendorIndex(self.root)
+        self._owns_index = self._index is not index
+        self._files: dict[str, FileSymbols] = self._load()
+        self._checked: set[str] = set()
+        self._dirty = False
+        self.files_indexed = 0
+
+    def _load(self) -> dict[str, FileSymbols]:
+        if self.path is None:
+            return {}
+        try:
+            with open(self.path, "rb") as f:
+                payload = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError, ImportError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("format") != _FORMAT or payload.get("repo_revision") != self.repo_revision:
+            return {}
+        return payload.get("files") or {}
+
+    def save(self) -> None:
+        """Write the index if anything was added this run (atomic replace; best-effort)."""
+        if self.path is None or not self._dirty:
+            return
+        payload = {"format": _FORMAT, "repo_revision": self.repo_revision, "files": self._files}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path)
+        except OSError:
+            return
+        self._dirty = False
+
+    def close(self) -> None:
+        if self._owns_index:
+            self._index.close()
+
+    def __enter__(self) -> SymbolIndex:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _current(self, relpath: str) -> FileSymbols | None:
+        """Stored record for relpath if it matches the file on disk (checked once per run)."""
+        rec = self._files.get(relpath)
+        if rec is not None and relpath not in self._checked:
+            if rec.blob_id != self._index.blob_id(relpath):
+                del self._files[relpath]
+                return None
+            self._checked.add(relpath)
+        return rec
+
+    def _store(self, relpath: str, rec: FileSymbols) -> None:
+        self._files[relpath] = rec
+        self._checked.add(relpath)
+        self._dirty = True
+        self.files_indexed += 1
+
+    def prepare(self, wanted: dict[str, set[str]], jobs: int = 1) -> None:
+        """
+        Make every (relpath, symbol) in wanted answerable from the index: stale or missing files
+        are indexed (in parallel when jobs > 1), known files get any new symbols added.
+        Raises OSError if a file cannot be read.
+        """
+        todo: dict[str, tuple[str, ...]] = {}
+        for relpath, symbols in sorted(wanted.items()):
+            rec = self._current(relpath)
+            if rec is None:
+                self._index.get(relpath)
+                todo[relpath] = tuple(sorted(symbols))
+                continue
+            for symbol in sorted(symbols - rec.substrings.keys()):
+                rec.add_symbol(self._index.get(relpath), symbol)
+                self._dirty = True
+        if jobs > 1 and len(todo) > 1:
+            with ProcessPoolExecutor(max_workers=min(jobs, len(todo))) as pool:
+                futures = {relpath: pool.submit(_index_file_task, str(self.root), relpath, symbols) for relpath, symbols in todo.items()}
+                for relpath, fut in futures.items():
+                    self._store(relpath, fut.result())
+        else:
+            for relpath, symbols in todo.items():
+                self._store(relpath, index_file(self._index.get(relpath), symbols))
+
+    def fill(self, relpath: str, symbol: str) -> tuple[tuple[int, int] | None, str]:
+        """Deterministic fill window for symbol in relpath: (range, "") or (None, reason)."""
+        rec = self._current(relpath)
+        if rec is None or symbol not in rec.substrings:
+            self.prepare({relpath: {symbol}})
+            rec = self._files[relpath]
+        return rec.fill(relpath, symbol)
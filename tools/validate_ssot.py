@@ -2,20 +2,54 @@
 """
 validate_ssot.py — Validate SSOT YAML: JSON Schema 2020-12, Spectral, bespoke checks.
 
-Order: Load SSOT → JSON Schema → Spectral → bespoke checks → extract_refs verification.
+Order: Load SSOT → JSON Schema → Spectral → bespoke checks → extract_refs verification (in-process,
+extract_refs.process_refs on the same parsed SSOT and VendorIndex).
+The JSON Schema is compiled once per process (tools/ssot_schema.py) and applied to the document
+and to each atom separately; every schema error is reported, atom errors with the atom id.
+--vendor-rev REV (repeatable) checks references against vendor commits read from git objects
+(tools/vendor_git.py, one cat-file process), each revision validated concurrently, instead of
+the vendor working tree.
+Spectral rules are evaluated in-process by tools/spectral_rules.py (--spectral native, default);
+--spectral node runs the pinned Spectral CLI instead, --spectral both runs both and fails if
+their findings differ.
+Results are cached under --cache-dir (default .cache/validate_ssot): a run whose inputs (SSOT bytes,
+schema, Spectral ruleset, generated manifest.json, check sources, vendor revision and blob ids of the
+referenced files) are unchanged returns its stored errors; otherwise per-atom results are reused for
+atoms whose content and referenced vendor files are unchanged, and only the global checks (document
+schema, Spectral, ID uniqueness, manifest) run again. --no-cache runs everything.
+--jobs N runs the per-atom checks (schema, bespoke and reference checks) in N processes, sharded
+by vendor file, when there are enough references to pay for them; output order is unchanged.
+--profile PATH writes a Chrome trace of the run (tools/profiling.py: phases, per-atom and
+per-reference spans, peak RSS) and prints the slowest atoms and references.
 Manifest.repo_revision is the single source of truth; atoms MUST NOT contain repo_revision or excerpt_hash.
 Bespoke checks: ID uniqueness; manifest required; ref must not have repo_revision/excerpt_hash;
 file exists under vendor; symbol in file; lines.start <= lines.end; slice contains symbol;
 layout offsets monotone; constant sane bounds; version vs manifest.
 """
 
+import argparse
 import hashlib
 import json
 import os
 import subprocess
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
+import extract_refs
+import profiling
+import spectral_rules
+import ssot_schema
+from ssot_loader import load_yaml_bytes
+from vendor_git import GitBlobStore, GitVendorIndex
+from vendor_index import VendorIndex
+
+SCHEMA_RELPATH = Path("spec") / "schema" / "reticulum-wire-format.ssot.schema.json"
+RULESET_RELPATH = Path("spec") / "rules" / "spectral.ssot.yaml"
+MANIFEST_RELPATH = Path("spec") / "generated" / "manifest.json"
+
 
 def normalise_excerpt_bytes(content: str, start: int, end: int) -> bytes:
     """Plan section 3: 1-indexed inclusive; \\n line endings normalised."""
@@ -35,33 +69,327 @@ def excerpt_hash_hex(content: str, start: int, end: int) -> str:
     return hashlib.sha256(raw).hexdigest()
 
 
-def main() -> int:
-    repo_root = Path(__file__).resolve().parent.parent
-    ssot_path = repo_root / "spec" / "reticulum-wire-format.ssot.yaml"
-    schema_path = repo_root / "spec" / "schema" / "reticulum-wire-format.ssot.schema.json"
-    spectral_rules = repo_root / "spec" / "rules" / "spectral.ssot.yaml"
-    vendor_root = repo_root / "vendor" / "reticulum-source"
-    generated_dir = repo_root / "spec" / "generated"
-    manifest_path = generated_dir / "manifest.json"
+def _spectral_node(ssot_path: Path, spectral_rules_path: Path, repo_root: Path, errors: list) -> list | None:
+    """Spectral CLI findings, or None (with the reason appended to errors) when it cannot run."""
+    try:
+        return spectral_rules.run_spectral_cli(ssot_path, spectral_rules_path, cwd=repo_root, timeout=30)
+    except FileNotFoundError:
+        errors.append(f"Spectral: npx or @stoplight/spectral-cli not found. Install Node (LTS) and run: npx --yes {spectral_rules.SPECTRAL_CLI_PACKAGE} lint ...")
+    except subprocess.TimeoutExpired:
+        errors.append("Spectral: timeout")
+    except RuntimeError as e:
+        errors.append(f"Spectral: {e}")
+    return None
 
-    errors = []
 
-    # Load SSOT
-    try:
-        import yaml
-        with open(ssot_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-    except Exception as e:
-        errors.append(f"Load SSOT: {e}")
-        for e in errors:
-            print(e, file=sys.stderr)
-        return 1
+# -----------------------------
+# Result cache
+# -----------------------------
+
+_TOOL_SOURCES = (
+    "validate_ssot.py",
+    "extract_refs.py",
+    "spectral_rules.py",
+    "ssot_loader.py",
+    "ssot_schema.py",
+    "symbol_index.py",
+    "vendor_git.py",
+    "vendor_index.py",
+)
+
+
+def _tool_version() -> str:
+    """sha256 over the sources of the checks (this script and every tools/ module it imports, profiling aside)."""
+    h = hashlib.sha256()
+    for name in _TOOL_SOURCES:
+        h.update((Path(__file__).resolve().parent / name).read_bytes())
+    return h.hexdigest()
+
+
+def _digest(*parts) -> str:
+    return hashlib.sha256(json.dumps(parts, default=str, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Content-addressed check results: <root>/<kind>/<key[:2]>/<key>.json, where kind "run" holds
+    the error list of a whole validate() call and kind "atom" one check_atom() result. Entries are
+    never rewritten; any changed input gives a new key. Unreadable entries count as misses.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, kind: str, key: str) -> Path:
+        return self.root / kind / key[:2] / f"{key}.json"
+
+    def get(self, kind: str, key: str):
+        try:
+            with open(self._path(kind, key), encoding="utf-8") as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, kind: str, key: str, value) -> None:
+        path = self._path(kind, key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps(value), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            pass  # best-effort: results never depend on the cache
+
+
+def _lines_label(ref) -> str:
+    lines = ref.get("lines") or {}
+    return f"{lines.get('start')}-{lines.get('end')}"
+
+
+def _ref_files(atom) -> list[str]:
+    return sorted({ref.get("file") for ref in atom.get("references") or [] if isinstance(ref, dict) and ref.get("file")})
+
+
+def _vendor_state(atoms: list, index: VendorIndex) -> dict:
+    """Vendor inputs of the checks: git blob id of every referenced file (or "missing") and the index revision."""
+    files = sorted({f for atom in atoms if isinstance(atom, dict) for f in _ref_files(atom)})
+    return {"root": index.root.is_dir(), "revision": index.revision, "blobs": {f: index.blob_id(f) for f in files}}
+
+
+def run_cache_key(data, raw: bytes, repo_root: Path, index: VendorIndex, tool_version: str) -> str:
+    """
+    Whole-run key: SSOT bytes and parsed content (callers may validate an edited document),
+    schema, Spectral ruleset, generated manifest.json, tool sources, vendor state.
+    """
+    atoms = data.get("atoms") if isinstance(data, dict) else None
+    inputs = []
+    for path in (SCHEMA_RELPATH, RULESET_RELPATH, MANIFEST_RELPATH):
+        try:
+            inputs.append(hashlib.sha256((repo_root / path).read_bytes()).hexdigest())
+        except OSError:
+            inputs.append(None)
+    vendor = _vendor_state(atoms if isinstance(atoms, list) else [], index)
+    return _digest(hashlib.sha256(raw).hexdigest(), data, inputs, tool_version, vendor)
+
+
+def atom_cache_key(atom, expected_commit: str, index: VendorIndex, tool_version: str, schema: ssot_schema.SsotSchema | None = None) -> str:
+    """Per-atom key: atom content, manifest.repo_revision, its referenced files' blob ids, schema, tool sources."""
+    blobs = {f: index.blob_id(f) for f in _ref_files(atom)}
+    return _digest(atom, expected_commit, index.root.is_dir(), blobs, schema.sha256 if schema else None, tool_version)
+
+
+# -----------------------------
+# Checks
+# -----------------------------
+
+
+def check_atom(atom, index: VendorIndex, expected_commit: str, schema: ssot_schema.SsotSchema | None = None) -> dict[str, list[str]]:
+    """
+    Checks that depend on one atom only, as JSON-able lists: JSON Schema ("schema", when a
+    compiled schema is given), forbidden ref fields ("forbidden"), ref file/lines/symbol, layout
+    overlaps and constant bounds ("errors"), and extract_refs verification of its references ("refs").
+    """
+    forbidden: list[str] = []
+    errors: list[str] = []
+    ref_errors: list[str] = []
+    vendor_root = index.root
+    aid = atom.get("id")
+
+    # Forbidden fields in references (repo_revision, excerpt_hash)
+    for ref in atom.get("references") or []:
+        if ref.get("repo_revision") is not None:
+            forbidden.append(f"ref must not contain repo_revision (use manifest.repo_revision) (atom {atom.get('id', '?')})")
+        if ref.get("excerpt_hash") is not None:
+            forbidden.append(f"ref must not contain excerpt_hash (Schema vNext) (atom {atom.get('id', '?')})")
+
+    refs = atom.get("references") or []
+    for ref in refs:
+        # repo_revision is on manifest only; ref must not have it (already checked above)
+        fpath = ref.get("file")
+        if not fpath:
+            errors.append(f"ref missing file (atom {aid})")
+            continue
+        if ".." in fpath:
+            errors.append(f"ref file must not contain ..: {fpath} (atom {aid})")
+        if not vendor_root.is_dir():
+            pass  # reported once by validate() when atoms exist
+        elif not index.is_file(fpath):
+            errors.append(f"ref file not found under vendor: {fpath} (atom {aid})")
+        else:
+            lines_obj = ref.get("lines") or {}
+            start = lines_obj.get("start")
+            end = lines_obj.get("end")
+            if start is not None and end is not None:
+                if start > end:
+                    errors.append(f"lines.start > lines.end (atom {aid}, file {fpath})")
+                else:
+                    try:
+                        vf = index.get(fpath)
+                        if 1 <= start <= vf.n_lines and 1 <= end <= vf.n_lines:
+                            slice_text = vf.text(start, end)
+                            symbol = ref.get("symbol", "")
+                            if symbol and symbol not in slice_text:
+                                errors.append(f"symbol '{symbol}' not in lines [{start},{end}] (atom {aid}, file {fpath})")
+                            # excerpt_hash removed in Schema vNext; no per-ref hash check
+                        else:
+                            errors.append(f"lines [{start},{end}] out of range (atom {aid}, file {fpath})")
+                    except Exception as e:
+                        errors.append(f"reading ref file {fpath}: {e}")
+
+    if atom.get("kind") == "layout":
+        layout = atom.get("layout") or {}
+        fields = layout.get("fields") or []
+        prev_end = -1
+        for i, f in enumerate(fields):
+            offset = f.get("offset", 0)
+            length = f.get("length", 0)
+            if offset < prev_end:
+                allow = f.get("allow_overlap") and f.get("overlap_with")
+                if not allow:
+                    errors.append(f"layout atom {aid} field {f.get('name')} overlaps previous; set allow_overlap and overlap_with if intentional")
+            prev_end = offset + length
+        for f in fields:
+            if f.get("allow_overlap"):
+                ow = f.get("overlap_with")
+                if not ow or not isinstance(ow, list):
+                    errors.append(f"layout atom {aid} allow_overlap=true but overlap_with missing or not list")
+
+    if atom.get("kind") == "constant":
+        val = atom.get("value") or {}
+        num = val.get("number")
+        unit = (val.get("unit") or "").lower()
+        if num is not None and isinstance(num, (int, float)) and ("byte" in unit or "bit" in unit):
+            constraints = atom.get("constraints") or {}
+            max_r = val.get("max_reasonable")
+            lo = constraints.get("min", 0)
+            hi = constraints.get("max") if constraints.get("max") is not None else (max_r if max_r is not None else 10_000)
+            if hi is not None and num > hi:
+                errors.append(f"constant atom {aid} value {num} exceeds max {hi} (set constraints or value.max_reasonable to override)")
+
+    # extract_refs verification (same messages as extract_refs.process_refs without --fill)
+    if vendor_root.is_dir() and expected_commit:
+        for ref in refs:
+            with profiling.span(ref.get("file"), "ref", lines=_lines_label(ref), atom=atom.get("id", "?")):
+                ok, msg = extract_refs.verify_ref(vendor_root, ref, expected_commit, index)
+            if not ok:
+                ref_errors.append(f"{atom.get('id', '?')} ref {ref.get('file')}: {msg}")
+
+    return {
+        "schema": schema.atom_errors(atom) if schema is not None else [],
+        "forbidden": forbidden,
+        "errors": errors,
+        "refs": ref_errors,
+    }
+
+
+_worker: tuple[VendorIndex, ssot_schema.SsotSchema | None] | None = None
+
+
+def _init_worker(vendor_root: str, schema_path: str | None) -> None:
+    global _worker
+    _worker = (VendorIndex(Path(vendor_root)), ssot_schema.load(Path(schema_path)) if schema_path else None)
+
+
+def _check_shard(atoms: list, expected_commit: str) -> list[dict[str, list[str]]]:
+    index, schema = _worker
+    return [check_atom(atom, index, expected_commit, schema) for atom in atoms]
+
+
+def check_atoms(
+    atoms: list, index: VendorIndex, expected_commit: str, schema: ssot_schema.SsotSchema | None = None, jobs: int = 1
+) -> list[dict[str, list[str]]]:
+    """
+    check_atom for every atom, results in input order. With jobs > 1 and at least
+    extract_refs.PARALLEL_MIN_REFS references, atoms are sharded by their first referenced vendor
+    file across a ProcessPoolExecutor whose workers each keep one VendorIndex and load the schema
+    from schema.path; an index over git objects is checked in-process.
+    """
+    n_refs = sum(len(atom.get("references") or []) for atom in atoms)
+    unloadable = schema is not None and schema.path is None  # built in memory; workers cannot load it
+    if jobs <= 1 or n_refs < extract_refs.PARALLEL_MIN_REFS or index.revision is not None or unloadable:
+        results = []
+        for atom in atoms:
+            with profiling.span(atom.get("id", "?"), "atom"):
+                results.append(check_atom(atom, index, expected_commit, schema))
+        return results
+    shards = extract_refs.shard_by_file([(_ref_files(atom) or [None])[0] for atom in atoms])
+    workers = min(jobs, len(shards))
+    results: list = [None] * len(atoms)
+    initargs = (str(index.root), str(schema.path) if schema else None)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+        outputs = pool.map(_check_shard, [[atoms[i] for i in shard] for shard in shards], repeat(expected_commit))
+        for shard, out in zip(shards, outputs):
+            for i, result in zip(shard, out):
+                results[i] = result
+    return results
+
+
+def validate(
+    data,
+    repo_root: Path,
+    ssot_path: Path | None = None,
+    raw: bytes | None = None,
+    spectral: str = "native",
+    index: VendorIndex | None = None,
+    cache_dir: Path | None = None,
+    jobs: int = 1,
+) -> list[str]:
+    """
+    Run every check on an already-parsed SSOT; returns error messages (empty when valid).
+    raw is the SSOT file's bytes (read from ssot_path when omitted); index is a shared VendorIndex
+    (its root is the vendor directory; a vendor_git.GitVendorIndex checks another revision).
+    cache_dir enables the result cache: an unchanged run returns its stored errors, otherwise
+    only atoms whose content or referenced vendor files changed are re-checked. jobs: processes
+    for the per-atom checks (check_atoms).
+    """
+    ssot_path = ssot_path or repo_root / "spec" / "reticulum-wire-format.ssot.yaml"
+    if raw is None:
+        raw = ssot_path.read_bytes()
+    if index is None:
+        index = VendorIndex(repo_root / "vendor" / "reticulum-source")
+    if cache_dir is None:
+        return _validate(data, repo_root, ssot_path, raw, spectral, index, None, "", jobs)
+    cache = ResultCache(cache_dir)
+    tool_version = _tool_version()
+    key = None
+    if spectral == "native":  # the Spectral CLI is outside the key
+        with profiling.span("run_cache_lookup"):
+            key = run_cache_key(data, raw, repo_root, index, tool_version)
+            errors = cache.get("run", key)
+        if isinstance(errors, list):
+            return errors
+    errors = _validate(data, repo_root, ssot_path, raw, spectral, index, cache, tool_version, jobs)
+    if key is not None:
+        cache.put("run", key, errors)
+    return errors
+
+
+def _validate(
+    data,
+    repo_root: Path,
+    ssot_path: Path,
+    raw: bytes,
+    spectral: str,
+    index: VendorIndex,
+    cache: ResultCache | None,
+    tool_version: str,
+    jobs: int,
+) -> list[str]:
+    schema_path = repo_root / SCHEMA_RELPATH
+    spectral_rules_path = repo_root / RULESET_RELPATH
+    manifest_path = repo_root / MANIFEST_RELPATH
+    vendor_root = index.root
+
+    errors = []
 
     if not isinstance(data, dict):
         errors.append("SSOT root must be an object with spec_meta and atoms")
-        for e in errors:
-            print(e, file=sys.stderr)
-        return 1
+        return errors
 
     spec_meta = data.get("spec_meta")
     manifest = data.get("manifest")
@@ -75,19 +403,15 @@ def main() -> int:
     if not isinstance(atoms, list):
         errors.append("atoms must be an array")
     if errors:
-        for e in errors:
-            print(e, file=sys.stderr)
-        return 1
+        return errors
 
     expected_commit = (manifest.get("repo_revision") or "").strip()
     if not expected_commit:
         errors.append("manifest.repo_revision is required and must be non-empty")
-        for e in errors:
-            print(e, file=sys.stderr)
-        return 1
+        return errors
 
     # Atoms list indentation: list items under atoms: MUST be indented (e.g. "  - id:" not "- id:" at column 0)
-    raw_lines = ssot_path.read_text(encoding="utf-8").splitlines()
+    raw_lines = raw.decode("utf-8").splitlines()
     in_atoms = False
     for i, line in enumerate(raw_lines):
         if line.strip() == "atoms:":
@@ -106,164 +430,161 @@ def main() -> int:
         if not expected_commit or not expected_commit.strip():
             errors.append("spec_meta.source_of_truth.revision.commit is required when atoms exist; set to pinned vendor commit")
 
-    # 1. JSON Schema
-    try:
-        import jsonschema
-        with open(schema_path, encoding="utf-8") as f:
-            schema = json.load(f)
-        jsonschema.validate(instance=data, schema=schema)
-    except ImportError:
-        errors.append("JSON Schema validation: jsonschema not installed. Run: uv sync")
-    except Exception as e:
-        errors.append(f"JSON Schema validation: {e}")
+    # 1. JSON Schema: compiled once per process; the document here, each atom with its own checks
+    with profiling.span("schema"):
+        schema = None
+        try:
+            schema = ssot_schema.load(schema_path)
+            errors.extend(f"JSON Schema validation: {e}" for e in schema.document_errors(data))
+        except ImportError:
+            errors.append("JSON Schema validation: jsonschema not installed. Run: uv sync")
+        except (OSError, ValueError) as e:
+            errors.append(f"JSON Schema validation: {e}")
+
+    # Per-atom checks (1, 1b, 3 and 5), from the cache where the atom and its vendor files are unchanged
+    with profiling.span("atom_cache_lookup"):
+        keys = [atom_cache_key(atom, expected_commit, index, tool_version, schema) for atom in atoms] if cache else []
+        results = [cache.get("atom", key) for key in keys] if cache else [None] * len(atoms)
+    todo = [i for i, result in enumerate(results) if not isinstance(result, dict)]
+    with profiling.span("check_atoms", atoms=len(todo), jobs=jobs):
+        checked = check_atoms([atoms[i] for i in todo], index, expected_commit, schema, jobs)
+    for i, result in zip(todo, checked):
+        results[i] = result
+        if cache:
+            cache.put("atom", keys[i], result)
+    for result in results:
+        errors.extend(f"JSON Schema validation: atom {e}" for e in result["schema"])
 
     # 1b. Fail fast: reject forbidden fields in references (repo_revision, excerpt_hash)
-    for atom in atoms:
-        aid = atom.get("id", "?")
-        for ref in atom.get("references") or []:
-            if ref.get("repo_revision") is not None:
-                errors.append(f"ref must not contain repo_revision (use manifest.repo_revision) (atom {aid})")
-            if ref.get("excerpt_hash") is not None:
-                errors.append(f"ref must not contain excerpt_hash (Schema vNext) (atom {aid})")
+    for result in results:
+        errors.extend(result["forbidden"])
 
     # 2. Spectral
-    if spectral_rules.is_file():
-        try:
-            r = subprocess.run(
-                ["npx", "--yes", "@stoplight/spectral-cli@6.11.0", "lint", str(ssot_path), "--ruleset", str(spectral_rules)],
-                cwd=str(repo_root),
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            if r.returncode != 0 and r.stderr:
-                errors.append(f"Spectral: {r.stderr.strip()}")
-            if r.returncode != 0 and r.stdout:
-                errors.append(r.stdout.strip())
-        except FileNotFoundError:
-            errors.append("Spectral: npx or @stoplight/spectral-cli not found. Install Node (LTS) and run: npx --yes @stoplight/spectral-cli@6.11.0 lint ...")
-        except subprocess.TimeoutExpired:
-            errors.append("Spectral: timeout")
-    else:
-        errors.append(f"Spectral ruleset not found: {spectral_rules}")
-
-    # 3. Bespoke checks
+    with profiling.span("spectral", engine=spectral):
+        if spectral_rules_path.is_file():
+            native = node = None
+            if spectral in ("native", "both"):
+                try:
+                    native = spectral_rules.lint(data, spectral_rules.load_ruleset(spectral_rules_path))
+                except ValueError as e:
+                    errors.append(f"Spectral (native): {e}")
+            if spectral in ("node", "both"):
+                node = _spectral_node(ssot_path, spectral_rules_path, repo_root, errors)
+            for f in native if native is not None else node or []:
+                if f.severity == "error":
+                    errors.append(f"Spectral: {f}")
+            if native is not None and node is not None:
+                errors.extend(f"Spectral engines disagree: {d}" for d in spectral_rules.diff_findings(native, node))
+        else:
+            errors.append(f"Spectral ruleset not found: {spectral_rules_path}")
+
+    # 3. Bespoke checks: ID uniqueness across atoms, then each atom's own checks
     seen_ids = set()
-    for atom in atoms:
+    for atom, result in zip(atoms, results):
         aid = atom.get("id")
         if aid:
             if aid in seen_ids:
                 errors.append(f"Duplicate atom id: {aid}")
             seen_ids.add(aid)
-
-        refs = atom.get("references") or []
-        for ref in refs:
-            # repo_revision is on manifest only; ref must not have it (already checked above)
-            fpath = ref.get("file")
-            if not fpath:
-                errors.append(f"ref missing file (atom {aid})")
-                continue
-            if ".." in fpath:
-                errors.append(f"ref file must not contain ..: {fpath} (atom {aid})")
-            full_path = vendor_root / fpath
-            if not vendor_root.is_dir():
-                pass  # already reported above when atoms exist
-            elif not full_path.is_file():
-                errors.append(f"ref file not found under vendor: {fpath} (atom {aid})")
-            else:
-                lines_obj = ref.get("lines") or {}
-                start = lines_obj.get("start")
-                end = lines_obj.get("end")
-                if start is not None and end is not None:
-                    if start > end:
-                        errors.append(f"lines.start > lines.end (atom {aid}, file {fpath})")
-                    else:
-                        try:
-                            content = full_path.read_text(encoding="utf-8", errors="replace")
-                            excerpt_lines = content.replace("\r\n", "\n").splitlines()
-                            if 1 <= start <= len(excerpt_lines) and 1 <= end <= len(excerpt_lines):
-                                slice_text = "\n".join(excerpt_lines[start - 1 : end])
-                                symbol = ref.get("symbol", "")
-                                if symbol and symbol not in slice_text:
-                                    errors.append(f"symbol '{symbol}' not in lines [{start},{end}] (atom {aid}, file {fpath})")
-                                # excerpt_hash removed in Schema vNext; no per-ref hash check
-                            else:
-                                errors.append(f"lines [{start},{end}] out of range (atom {aid}, file {fpath})")
-                        except Exception as e:
-                            errors.append(f"reading ref file {fpath}: {e}")
-
-        if atom.get("kind") == "layout":
-            layout = atom.get("layout") or {}
-            fields = layout.get("fields") or []
-            prev_end = -1
-            for i, f in enumerate(fields):
-                offset = f.get("offset", 0)
-                length = f.get("length", 0)
-                if offset < prev_end:
-                    allow = f.get("allow_overlap") and f.get("overlap_with")
-                    if not allow:
-                        errors.append(f"layout atom {aid} field {f.get('name')} overlaps previous; set allow_overlap and overlap_with if intentional")
-                prev_end = offset + length
-            for f in fields:
-                if f.get("allow_overlap"):
-                    ow = f.get("overlap_with")
-                    if not ow or not isinstance(ow, list):
-                        errors.append(f"layout atom {aid} allow_overlap=true but overlap_with missing or not list")
-
-        if atom.get("kind") == "constant":
-            val = atom.get("value") or {}
-            num = val.get("number")
-            unit = (val.get("unit") or "").lower()
-            if num is not None and isinstance(num, (int, float)) and ("byte" in unit or "bit" in unit):
-                constraints = atom.get("constraints") or {}
-                max_r = val.get("max_reasonable")
-                lo = constraints.get("min", 0)
-                hi = constraints.get("max") if constraints.get("max") is not None else (max_r if max_r is not None else 10_000)
-                if hi is not None and num > hi:
-                    errors.append(f"constant atom {aid} value {num} exceeds max {hi} (set constraints or value.max_reasonable to override)")
+        errors.extend(result["errors"])
 
     # 4. Version bump: manifest required (plan 2b)
-    if manifest_path.is_file():
-        try:
-            with open(manifest_path, encoding="utf-8") as f:
-                manifest = json.load(f)
-            manifest_ver = manifest.get("ssot_version", "")
-            spec_ver = (spec_meta or {}).get("ssot_version", "")
-            if spec_ver != manifest_ver:
-                errors.append(f"spec_meta.ssot_version ({spec_ver}) != manifest.ssot_version ({manifest_ver}); bump ssot_version and recompile")
-            # Content hash: compare SSOT file hash to manifest
-            raw_ssot = ssot_path.read_bytes()
-            ssot_sha = hashlib.sha256(raw_ssot).hexdigest()
-            manifest_sha = manifest.get("ssot_content_sha256", "")
-            if manifest_sha and ssot_sha != manifest_sha:
-                errors.append("SSOT content changed but manifest.ssot_content_sha256 not updated; run compile_ssot.py and commit generated files")
-        except Exception as e:
-            errors.append(f"manifest read: {e}")
-    else:
-        # Manifest required when we have atoms; with empty atoms allow missing until first compile
-        if atoms and len(atoms) > 0:
-            errors.append("spec/generated/manifest.json required; run tools/compile_ssot.py first")
-
-    # 5. extract_refs verification (when vendor and atoms exist)
-    if vendor_root.is_dir() and atoms and expected_commit and expected_commit.strip():
-        extract_refs = repo_root / "tools" / "extract_refs.py"
-        if extract_refs.is_file():
+    with profiling.span("manifest"):
+        if manifest_path.is_file():
             try:
-                r = subprocess.run(
-                    [sys.executable, str(extract_refs), "--ssot", str(ssot_path), "--vendor", str(vendor_root), "--no-write"],
-                    cwd=str(repo_root),
-                    capture_output=True,
-                    text=True,
-                    timeout=60,
-                )
-                if r.returncode != 0 and r.stderr:
-                    errors.append(f"extract_refs: {r.stderr.strip()}")
+                with open(manifest_path, encoding="utf-8") as f:
+                    manifest = json.load(f)
+                manifest_ver = manifest.get("ssot_version", "")
+                spec_ver = (spec_meta or {}).get("ssot_version", "")
+                if spec_ver != manifest_ver:
+                    errors.append(f"spec_meta.ssot_version ({spec_ver}) != manifest.ssot_version ({manifest_ver}); bump ssot_version and recompile")
+                # Content hash: compare SSOT file hash to manifest
+                ssot_sha = hashlib.sha256(raw).hexdigest()
+                manifest_sha = manifest.get("ssot_content_sha256", "")
+                if manifest_sha and ssot_sha != manifest_sha:
+                    errors.append("SSOT content changed but manifest.ssot_content_sha256 not updated; run compile_ssot.py and commit generated files")
             except Exception as e:
-                errors.append(f"extract_refs: {e}")
+                errors.append(f"manifest read: {e}")
+        else:
+            # Manifest required when we have atoms; with empty atoms allow missing until first compile
+            if atoms and len(atoms) > 0:
+                errors.append("spec/generated/manifest.json required; run tools/compile_ssot.py first")
+
+    # 5. extract_refs verification (when vendor and atoms exist), same messages as extract_refs.process_refs
+    ref_errors = [e for result in results for e in result["refs"]]
+    if ref_errors:
+        errors.append("extract_refs: " + "\n".join(ref_errors))
+
+    return errors
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Validate the SSOT: JSON Schema, Spectral rules, bespoke checks, references.")
+    ap.add_argument(
+        "--spectral",
+        choices=("native", "node", "both"),
+        default="native",
+        help="Spectral engine: native (in-process, default), node (Spectral CLI), both (cross-check)",
+    )
+    ap.add_argument(
+        "--vendor-rev",
+        action="append",
+        default=[],
+        metavar="REV",
+        help="Check references at this vendor commit, read from git objects (repeatable; default: the working tree)",
+    )
+    ap.add_argument("--cache-dir", default=".cache/validate_ssot", help="Validation result cache directory")
+    ap.add_argument("--no-cache", action="store_true", help="Run every check; do not read or write the result cache")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Processes for the per-atom checks (reference verification)")
+    profiling.add_arguments(ap)
+    args = ap.parse_args()
+
+    repo_root = Path(__file__).resolve().parent.parent
+    ssot_path = repo_root / "spec" / "reticulum-wire-format.ssot.yaml"
+
+    with profiling.session(args.profile, "validate_ssot", args.profile_top):
+        # Load SSOT
+        try:
+            with profiling.span("load_ssot"):
+                raw, data = load_yaml_bytes(ssot_path)
+        except Exception as e:
+            print(f"Load SSOT: {e}", file=sys.stderr)
+            return 1
+
+        cache_dir = None if args.no_cache else repo_root / args.cache_dir
+        if args.vendor_rev:
+            return _validate_revisions(data, repo_root, ssot_path, raw, args.spectral, args.vendor_rev, cache_dir)
+        with profiling.span("validate"):
+            errors = validate(data, repo_root, ssot_path, raw=raw, spectral=args.spectral, cache_dir=cache_dir, jobs=max(1, args.jobs))
+        for e in errors:
+            print(e, file=sys.stderr)
+        return 1 if errors else 0
+
+
+def _validate_revision(data, repo_root: Path, ssot_path: Path, raw: bytes, spectral: str, index: VendorIndex, cache_dir: Path | None) -> list[str]:
+    with profiling.span("validate", revision=index.revision):
+        return validate(data, repo_root, ssot_path, raw, spectral, index, cache_dir)
 
-    for e in errors:
-        print(e, file=sys.stderr)
-    return 1 if errors else 0
+
+def _validate_revisions(
+    data, repo_root: Path, ssot_path: Path, raw: bytes, spectral: str, revs: list[str], cache_dir: Path | None = None
+) -> int:
+    """validate() once per vendor revision, concurrently, over one shared GitBlobStore."""
+    with GitBlobStore(repo_root / "vendor" / "reticulum-source") as store:
+        try:
+            indexes = [GitVendorIndex(store, rev) for rev in revs]
+        except (ValueError, OSError) as e:
+            print(f"vendor: {e}", file=sys.stderr)
+            return 1
+        with ThreadPoolExecutor(max_workers=len(indexes)) as pool:
+            results = list(pool.map(profiling.in_context(lambda ix: _validate_revision(data, repo_root, ssot_path, raw, spectral, ix, cache_dir)), indexes))
+    status = 0
+    for rev, ix, errors in zip(revs, indexes, results):
+        for e in errors:
+            print(f"[{rev}] {e}", file=sys.stderr)
+        print(f"[{rev}] {ix.revision[:12]}: {'ok' if not errors else f'{len(errors)} error(s)'}", file=sys.stderr)
+        status = status or (1 if errors else 0)
+    return status
 
 
 if __name__ == "__main__":
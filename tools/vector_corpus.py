@@ -0,0 +1,284 @@
+"""
+vector_corpus.py — Compact binary companion (.rvec) of the YAML conformance vector files.
+
+    vector_corpus.write(doc, Path("tests/vectors/hashable_part.rvec"))    # doc: {"meta": ..., "vectors": [...]}
+    doc = vector_corpus.read(Path("tests/vectors/hashable_part.rvec"))   # == yaml.safe_load of the YAML file
+    vector_corpus.loads(vector_corpus.dumps(doc)) == doc                  # in memory (conformance_run.py --protocol binary)
+    with vector_corpus.VectorFile(path) as vf:                            # memory-mapped, random access
+        vf.meta, len(vf), vf[i], vf.equivalence
+
+generate_vectors.py writes <family>.rvec next to every <family>.yaml. The file stores the same
+document: values under keys ending in "_hex" (strings, or lists of strings) are stored as raw
+bytes and given back as lowercase hex (or as bytes with as_hex=False), everything else as
+typed values. Keys are interned in a table. The header carries the equivalence hash:
+sha256 of the canonical JSON (sorted keys, compact) of the document, so a reader can check
+the binary against the YAML it was generated with.
+
+Layout (little-endian):
+    header   "RVEC", u16 version, u16 key count, u32 vector count, 32-byte equivalence sha256
+    keys     per key: u8 length, UTF-8
+    meta     u32 length, value
+    vectors  per vector: u32 length, value (a map)
+    value    u8 tag: 0 None, 1 False, 2 True, 3 i64, 4 big int (u8 length, signed bytes),
+             5 str (u32 length, UTF-8), 6 bytes (u32 length, raw), 7 list (u32 count, values),
+             8 map (u32 count, then u16 key index + value per entry)
+Raises ValueError for a file that is not a version-1 corpus and TypeError for unsupported values.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Iterator
+
+MAGIC = b"RVEC"
+VERSION = 1
+SUFFIX = ".rvec"
+HEADER = struct.Struct("<4sHHI32s")
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_NONE, _FALSE, _TRUE, _INT, _BIGINT, _STR, _BYTES, _LIST, _MAP = range(9)
+
+
+def equivalence_hash(doc: Any) -> str:
+    """sha256 hex of the document's canonical JSON; equal for the YAML file and its .rvec."""
+    canonical = json.dumps(doc, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# -----------------------------
+# Writer
+# -----------------------------
+
+
+class _Encoder:
+    def __init__(self) -> None:
+        self.keys: dict[str, int] = {}
+
+    def value(self, v: Any, out: bytearray, hexed: bool = False) -> None:
+        if v is None:
+            out.append(_NONE)
+        elif v is True or v is False:
+            out.append(_TRUE if v else _FALSE)
+        elif isinstance(v, int):
+            if -(2**63) <= v < 2**63:
+                out.append(_INT)
+                out += _I64.pack(v)
+            else:
+                raw = v.to_bytes((v.bit_length() + 8) // 8, "little", signed=True)
+                out.append(_BIGINT)
+                out += _U8.pack(len(raw)) + raw
+        elif isinstance(v, str):
+            raw = _hex_bytes(v) if hexed else None
+            if raw is not None:
+                out.append(_BYTES)
+                out += _U32.pack(len(raw)) + raw
+            else:
+                raw = v.encode("utf-8")
+                out.append(_STR)
+                out += _U32.pack(len(raw)) + raw
+        elif isinstance(v, (list, tuple)):
+            out.append(_LIST)
+            out += _U32.pack(len(v))
+            for item in v:
+                self.value(item, out, hexed)
+        elif isinstance(v, dict):
+            out.append(_MAP)
+            out += _U32.pack(len(v))
+            for k, item in v.items():
+                if not isinstance(k, str):
+                    raise TypeError(f"map keys must be strings, got {k!r}")
+                index = self.keys.setdefault(k, len(self.keys))
+                out += _U16.pack(index)
+                self.value(item, out, k.endswith("_hex"))
+        else:
+            raise TypeError(f"unsupported vector value {type(v).__name__}: {v!r}")
+
+
+def _hex_bytes(s: str) -> bytes | None:
+    """Raw bytes of a lowercase hex string that round-trips exactly, else None (kept as text)."""
+    try:
+        raw = bytes.fromhex(s)
+    except ValueError:
+        return None
+    return raw if raw.hex() == s else None
+
+
+def dumps(doc: dict[str, Any], equivalence: bool = True) -> bytes:
+    """The .rvec encoding of a vector document ({"meta": ..., "vectors": [...]}); equivalence=False leaves the hash zero."""
+    extra = sorted(set(doc) - {"meta", "vectors"})
+    if extra:
+        raise ValueError(f"vector documents hold only meta and vectors, got: {', '.join(extra)}")
+    enc = _Encoder()
+    meta = bytearray()
+    enc.value(doc.get("meta"), meta)
+    records = []
+    for v in doc.get("vectors") or []:
+        rec = bytearray()
+        enc.value(v, rec)
+        records.append(rec)
+    if len(enc.keys) > 0xFFFF:
+        raise ValueError("too many distinct keys for .rvec")
+    keys = bytearray()
+    for k in enc.keys:  # insertion order == index order
+        raw = k.encode("utf-8")
+        if len(raw) > 0xFF:
+            raise ValueError(f"key too long for .rvec: {k!r}")
+        keys += _U8.pack(len(raw)) + raw
+    digest = bytes.fromhex(equivalence_hash(doc)) if equivalence else bytes(32)
+    parts = [HEADER.pack(MAGIC, VERSION, len(enc.keys), len(records), digest), keys]
+    parts.append(_U32.pack(len(meta)) + meta)
+    for rec in records:
+        parts.append(_U32.pack(len(rec)))
+        parts.append(rec)
+    return b"".join(parts)
+
+
+def write(doc: dict[str, Any], path: Path) -> None:
+    """Write doc as .rvec at path (atomically)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(dumps(doc))
+    os.replace(tmp, path)
+
+
+# -----------------------------
+# Reader
+# -----------------------------
+
+
+class VectorFile:
+    """A memory-mapped .rvec (or one in memory): meta, len(), indexing and iteration decode one record at a time."""
+
+    def __init__(self, source: Path | bytes, as_hex: bool = True) -> None:
+        self.as_hex = as_hex
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self.path = Path("<bytes>")
+            self._buf = bytes(source)
+        else:
+            self.path = Path(source)
+            with open(self.path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        try:
+            self._parse_index()
+        except (struct.error, IndexError) as e:
+            self.close()
+            raise ValueError(f"{self.path}: truncated vector corpus") from e
+        except Exception:
+            self.close()
+            raise
+
+    def _parse_index(self) -> None:
+        buf = self._buf
+        if len(buf) < HEADER.size:
+            raise ValueError(f"{self.path}: not a vector corpus (too short)")
+        magic, version, n_keys, n_vectors, equivalence = HEADER.unpack_from(buf, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.path}: not a version {VERSION} vector corpus")
+        self.equivalence = equivalence.hex()
+        pos = HEADER.size
+        keys = []
+        for _ in range(n_keys):
+            n = buf[pos]
+            keys.append(bytes(buf[pos + 1 : pos + 1 + n]).decode("utf-8"))
+            pos += 1 + n
+        self._keys = keys
+        (n,) = _U32.unpack_from(buf, pos)
+        self._meta_at = pos + 4
+        pos += 4 + n
+        offsets = []
+        for _ in range(n_vectors):
+            (n,) = _U32.unpack_from(buf, pos)
+            offsets.append(pos + 4)
+            pos += 4 + n
+        if pos != len(buf):
+            raise ValueError(f"{self.path}: truncated or trailing data")
+        self._offsets = offsets
+
+    @property
+    def meta(self) -> Any:
+        return self._decode(self._meta_at)[0]
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, i: int) -> dict[str, Any]:
+        return self._decode(self._offsets[i])[0]
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for at in self._offsets:
+            yield self._decode(at)[0]
+
+    def document(self) -> dict[str, Any]:
+        """The whole file as {"meta": ..., "vectors": [...]} (meta omitted when None, as in YAML)."""
+        doc: dict[str, Any] = {}
+        meta = self.meta
+        if meta is not None:
+            doc["meta"] = meta
+        doc["vectors"] = list(self)
+        return doc
+
+    def _decode(self, pos: int) -> tuple[Any, int]:
+        buf = self._buf
+        tag = buf[pos]
+        pos += 1
+        if tag == _STR or tag == _BYTES:
+            (n,) = _U32.unpack_from(buf, pos)
+            raw = buf[pos + 4 : pos + 4 + n]
+            if tag == _STR:
+                return raw.decode("utf-8"), pos + 4 + n
+            return (raw.hex() if self.as_hex else bytes(raw)), pos + 4 + n
+        if tag == _INT:
+            return _I64.unpack_from(buf, pos)[0], pos + 8
+        if tag == _MAP:
+            (n,) = _U32.unpack_from(buf, pos)
+            pos += 4
+            keys = self._keys
+            out = {}
+            for _ in range(n):
+                (k,) = _U16.unpack_from(buf, pos)
+                out[keys[k]], pos = self._decode(pos + 2)
+            return out, pos
+        if tag == _LIST:
+            (n,) = _U32.unpack_from(buf, pos)
+            pos += 4
+            items = []
+            for _ in range(n):
+                item, pos = self._decode(pos)
+                items.append(item)
+            return items, pos
+        if tag <= _TRUE:
+            return (None, False, True)[tag], pos
+        if tag == _BIGINT:
+            n = buf[pos]
+            return int.from_bytes(buf[pos + 1 : pos + 1 + n], "little", signed=True), pos + 1 + n
+        raise ValueError(f"{self.path}: bad value tag {tag} at offset {pos - 1}")
+
+    def close(self) -> None:
+        if isinstance(self._buf, mmap.mmap):
+            self._buf.close()
+
+    def __enter__(self) -> VectorFile:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read(path: Path, as_hex: bool = True) -> dict[str, Any]:
+    """The document stored at path; with as_hex=True equal to yaml.safe_load of the matching YAML."""
+    with VectorFile(path, as_hex) as vf:
+        return vf.document()
+
+
+def loads(data: bytes, as_hex: bool = True) -> dict[str, Any]:
+    """The document encoded in data (see dumps)."""
+    return VectorFile(data, as_hex).document()
@@ -0,0 +1,120 @@
+"""
+vendor_git.py — Vendor sources read from git objects at any commit, without a checkout.
+
+    with GitBlobStore(vendor_root) as store:
+        index = GitVendorIndex(store, "286a78ef...")   # a VendorIndex over that commit's blobs
+        index.get("RNS/Packet.py").lines(10, 20)
+
+GitBlobStore keeps one long-lived `git cat-file --batch` process per repository and answers
+"<commit>:<path>" queries over its pipe; blobs are cached in memory by object id, so a file
+unchanged between revisions is transferred and held once. Queries are serialised by a lock,
+so one store can back several GitVendorIndex instances (one per revision) used from threads.
+
+GitVendorIndex is a VendorIndex whose files come from the store: validate_ssot.py
+(--vendor-rev, repeatable) and compile_ssot.py (--from-git) use it to check the SSOT against
+revisions other than the checked-out one, with no working-tree churn.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+from pathlib import Path
+
+from vendor_index import VendorFile, VendorIndex
+
+
+class GitBlobStore:
+    """One `git cat-file --batch` process over repo, with an in-memory blob cache keyed by object id."""
+
+    def __init__(self, repo: Path) -> None:
+        self.repo = Path(repo)
+        self._proc: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+        self._commits: dict[str, str | None] = {}
+        self._paths: dict[tuple[str, str], str | None] = {}
+        self._blobs: dict[str, bytes] = {}
+        self.queries = 0
+        self.bytes_read = 0
+
+    def _start(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["git", "-C", str(self.repo), "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._proc
+
+    def _query(self, obj: str) -> tuple[str, str, bytes] | None:
+        """(oid, type, content) for an object name, or None if git reports it missing/ambiguous."""
+        if "\n" in obj:
+            return None
+        proc = self._start()
+        proc.stdin.write(obj.encode("utf-8") + b"\n")
+        proc.stdin.flush()
+        header = proc.stdout.readline()
+        if not header:
+            raise OSError(f"git cat-file exited while reading {obj!r}")
+        parts = header.split()
+        if len(parts) != 3:
+            return None  # "<obj> missing" / "<obj> ambiguous"
+        oid, kind, size = parts[0].decode(), parts[1].decode(), int(parts[2])
+        content = proc.stdout.read(size)
+        proc.stdout.read(1)  # trailing LF
+        self.queries += 1
+        self.bytes_read += size
+        return oid, kind, content
+
+    def resolve(self, rev: str) -> str | None:
+        """Commit id for rev (sha, tag, branch), or None if it does not name a commit."""
+        with self._lock:
+            if rev not in self._commits:
+                found = self._query(f"{rev}^{{commit}}")
+                self._commits[rev] = found[0] if found else None
+            return self._commits[rev]
+
+    def read(self, commit: str, relpath: str) -> bytes | None:
+        """Blob bytes of relpath at commit; None if it is missing or not a file."""
+        key = (commit, relpath)
+        with self._lock:
+            if key not in self._paths:
+                found = self._query(f"{commit}:{relpath}")
+                if found is None or found[1] != "blob":
+                    self._paths[key] = None
+                else:
+                    self._paths[key] = found[0]
+                    self._blobs.setdefault(found[0], found[2])
+            oid = self._paths[key]
+            return self._blobs[oid] if oid is not None else None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._proc is not None:
+                self._proc.stdin.close()
+                self._proc.wait()
+                self._proc.stdout.close()
+                self._proc = None
+
+    def __enter__(self) -> GitBlobStore:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class GitVendorIndex(VendorIndex):
+    """VendorIndex over the blobs of one commit in store (revision: the resolved commit id)."""
+
+    def __init__(self, store: GitBlobStore, rev: str) -> None:
+        super().__init__(store.repo)
+        commit = store.resolve(rev)
+        if commit is None:
+            raise ValueError(f"not a commit in {store.repo}: {rev}")
+        self.store = store
+        self.revision = commit
+
+    def _open(self, relpath: str) -> VendorFile | None:
+        data = self.store.read(self.revision, relpath)
+        return VendorFile(relpath, data=data) if data is not None else None
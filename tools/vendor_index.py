@@ -0,0 +1,249 @@
+"""
+vendor_index.py — Shared index over the pinned vendor checkout (vendor/reticulum-source).
+
+One VendorIndex per run, shared by compile_ssot.py, validate_ssot.py and extract_refs.py
+(vendor_git.GitVendorIndex is the same index over git objects at a given commit):
+- Each vendor file is opened once and memory-mapped (empty files are read as b"").
+- Line-start offsets are computed once per file, so lines [start, end] (1-indexed inclusive)
+  is one slice + decode, independent of file size.
+- Python files get a cached AST def table (FunctionDef/AsyncFunctionDef/ClassDef name ->
+  ranges, in ast.walk order) from a single ast.parse; every file gets a cached assignment
+  table (^SYMBOL\\s*= name -> line numbers) from a single pass.
+
+Results match the str-based helpers in extract_refs.py (read_text, \\r\\n and \\r -> \\n,
+splitlines). Files containing \\r or one of the other str.splitlines separators (\\v, \\f,
+\\x1c-\\x1e, \\x85, \\u2028, \\u2029) are indexed from their decoded lines instead of raw
+offsets so line numbering is unchanged.
+"""
+
+from __future__ import annotations
+
+import ast
+import bisect
+from collections import deque
+import hashlib
+import mmap
+import re
+from pathlib import Path
+
+# Bytes that str.splitlines() treats as line breaks besides \n (UTF-8 encoded)
+_OTHER_LINE_BREAKS = re.compile(rb"[\r\x0b\x0c\x1c-\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]")
+_ASSIGNMENT = re.compile(r"^\s*([^\s=][^=]*?)\s*=")
+_DEF_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+_BODY_NODES = (ast.stmt, ast.excepthandler, ast.match_case)
+
+
+def _def_table(tree: ast.AST) -> dict[str, list[tuple[int, int]]]:
+    """
+    name -> [(lineno, end_lineno), ...] for every def/class, in ast.walk order. Only statement
+    bodies are traversed (defs cannot occur inside expressions); pruning subtrees from a
+    breadth-first walk keeps the relative order of the nodes that remain.
+    """
+    table: dict[str, list[tuple[int, int]]] = {}
+    todo = deque([tree])
+    while todo:
+        node = todo.popleft()
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if not isinstance(value, list):
+                continue
+            for child in value:
+                if isinstance(child, _BODY_NODES):
+                    if isinstance(child, _DEF_NODES):
+                        table.setdefault(child.name, []).append((child.lineno, child.end_lineno or child.lineno))
+                    todo.append(child)
+    return table
+
+
+class VendorFile:
+    """One vendor file: mapped bytes, line offsets, and lazily built def/assignment tables."""
+
+    __slots__ = ("relpath", "_data", "_mmap", "_starts", "_text", "_lines", "_lines_ke", "n_lines", "_defs", "_assignments", "_blob_id")
+
+    def __init__(self, relpath: str, path: Path | None = None, data: bytes | None = None) -> None:
+        """Map the file at path, or index data already in memory (e.g. a git blob)."""
+        self.relpath = relpath
+        self._mmap = None
+        if data is not None:
+            self._data = data
+        else:
+            with open(path, "rb") as f:
+                try:
+                    self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    self._data = self._mmap
+                except (ValueError, OSError):  # empty file, or a filesystem without mmap
+                    self._data = f.read()
+        self._defs: dict[str, list[tuple[int, int]]] | None = None
+        self._assignments: dict[str, list[int]] | None = None
+        self._blob_id: str | None = None
+        if _OTHER_LINE_BREAKS.search(self._data):
+            self._text: str | None = self._data[:].decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+            self._lines: list[str] | None = self._text.splitlines()
+            self._lines_ke = self._text.splitlines(keepends=True)
+            self._starts: list[int] = []
+            self.n_lines = len(self._lines)
+            return
+        self._text = self._lines = self._lines_ke = None
+        data = self._data
+        starts = [0] if len(data) else []
+        pos = data.find(b"\n")
+        while pos != -1 and pos + 1 < len(data):
+            starts.append(pos + 1)
+            pos = data.find(b"\n", pos + 1)
+        self._starts = starts
+        self.n_lines = len(starts)
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._data = b""
+            self._mmap.close()
+            self._mmap = None
+
+    def _span(self, lo: int, hi: int) -> tuple[int, int]:
+        """Byte span of 0-based lines [lo, hi), including the newline ending line hi - 1 if any."""
+        return self._starts[lo], self._starts[hi] if hi < self.n_lines else len(self._data)
+
+    def lines(self, start: int, end: int) -> list[str]:
+        """Lines start..end (1-indexed inclusive, clamped to the file) without line endings."""
+        lo, hi = max(0, start - 1), min(self.n_lines, end)
+        if lo >= hi:
+            return []
+        if self._lines is not None:
+            return self._lines[lo:hi]
+        a, b = self._span(lo, hi)
+        text = self._data[a:b].decode("utf-8", errors="replace")
+        if text.endswith("\n"):
+            text = text[:-1]
+        return text.split("\n")
+
+    def text(self, start: int, end: int) -> str:
+        """"\\n".join(lines(start, end))."""
+        return "\n".join(self.lines(start, end))
+
+    def excerpt_bytes(self, start: int, end: int) -> bytes:
+        """Same bytes as extract_refs.normalise_excerpt_bytes(content, start, end)."""
+        lo, hi = max(0, start - 1), min(self.n_lines, end)
+        if lo >= hi:
+            return b""
+        if self._lines_ke is not None:
+            return "".join(self._lines_ke[lo:hi]).encode("utf-8")
+        a, b = self._span(lo, hi)
+        return self._data[a:b].decode("utf-8", errors="replace").encode("utf-8")
+
+    def excerpt_sha256(self, start: int, end: int) -> str:
+        return hashlib.sha256(self.excerpt_bytes(start, end)).hexdigest()
+
+    def def_table(self) -> dict[str, list[tuple[int, int]]]:
+        """name -> def/class ranges for the whole file, from one ast.parse (empty if unparsable)."""
+        if self._defs is None:
+            try:
+                source = self._text if self._text is not None else self._data[:].decode("utf-8", errors="replace")
+                self._defs = _def_table(ast.parse(source))
+            except (SyntaxError, ValueError):
+                self._defs = {}
+        return self._defs
+
+    def def_ranges(self, symbol: str) -> list[tuple[int, int]]:
+        """FunctionDef/AsyncFunctionDef/ClassDef ranges named symbol (empty if unparsable)."""
+        return list(self.def_table().get(symbol, ()))
+
+    def assignment_table(self) -> dict[str, list[int]]:
+        """name -> line numbers of ^\\s*NAME\\s*= for every name without whitespace or "=", from one pass."""
+        if self._assignments is None:
+            self._assignments = {}
+            for i, line in enumerate(self.lines(1, self.n_lines)):
+                m = _ASSIGNMENT.match(line)
+                if m:
+                    self._assignments.setdefault(m.group(1), []).append(i + 1)
+        return self._assignments
+
+    def assignment_lines(self, symbol: str) -> list[int]:
+        """Line numbers matching ^\\s*SYMBOL\\s*= (the assignment form extract_refs --fill windows around)."""
+        if not symbol or any(c.isspace() or c == "=" for c in symbol):
+            pattern = re.compile(r"^\s*" + re.escape(symbol) + r"\s*=")
+            return [i + 1 for i, line in enumerate(self.lines(1, self.n_lines)) if pattern.match(line)]
+        return list(self.assignment_table().get(symbol, ()))
+
+    def substring_lines(self, symbol: str) -> list[int]:
+        """Line numbers (ascending, once each) whose text contains symbol."""
+        if self._lines is not None or not symbol:
+            return [i + 1 for i, line in enumerate(self.lines(1, self.n_lines)) if symbol in line]
+        needle = symbol.encode("utf-8")
+        data = self._data
+        found: list[int] = []
+        pos = data.find(needle)
+        while pos != -1:
+            line = bisect.bisect_right(self._starts, pos)
+            if not found or found[-1] != line:
+                found.append(line)
+            pos = data.find(needle, self._starts[line] if line < self.n_lines else len(data))
+        return found
+
+    @property
+    def blob_id(self) -> str:
+        """Git blob id of the file content (as git hash-object)."""
+        if self._blob_id is None:
+            self._blob_id = hashlib.sha1(b"blob %d\0" % len(self._data) + self._data[:]).hexdigest()
+        return self._blob_id
+
+
+class VendorIndex:
+    """
+    Lazily opened VendorFile per relative path under root; each file is loaded at most once.
+    revision is None for the working tree; subclasses reading another source (vendor_git)
+    set it and override _open.
+    """
+
+    revision: str | None = None
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self._files: dict[str, VendorFile | None] = {}
+        self.files_loaded = 0
+        self.bytes_loaded = 0
+
+    def _open(self, relpath: str) -> VendorFile | None:
+        path = self.root / relpath
+        return VendorFile(relpath, path) if path.is_file() else None
+
+    def get(self, relpath: str) -> VendorFile:
+        """VendorFile for relpath; raises OSError if it is not a readable file."""
+        if relpath not in self._files:
+            try:
+                vf = self._open(relpath)
+            except OSError:
+                vf = None
+            self._files[relpath] = vf
+            if vf is not None:
+                self.files_loaded += 1
+                self.bytes_loaded += len(vf._data)
+        vf = self._files[relpath]
+        if vf is None:
+            raise OSError(f"cannot read vendor file: {relpath}")
+        return vf
+
+    def is_file(self, relpath: str) -> bool:
+        try:
+            self.get(relpath)
+        except OSError:
+            return False
+        return True
+
+    def blob_id(self, relpath: str) -> str:
+        """Git blob id of relpath, or "missing" when it cannot be read."""
+        try:
+            return self.get(relpath).blob_id
+        except OSError:
+            return "missing"
+
+    def close(self) -> None:
+        for vf in self._files.values():
+            if vf is not None:
+                vf.close()
+        self._files.clear()
+
+    def __enter__(self) -> VendorIndex:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()